@@ -36,6 +36,7 @@ from qdrant_client.models import FieldCondition, Filter, MatchValue
 try:
     sys.path.insert(0, "/app/src")
     from memory.models import MemoryType
+    from memory.stats import get_field_counts, get_unique_field_values
 
     MODELS_IMPORTED = True
 except ImportError:
@@ -43,6 +44,7 @@ except ImportError:
         # Fallback: local development path
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
         from memory.models import MemoryType
+        from memory.stats import get_field_counts, get_unique_field_values
 
         MODELS_IMPORTED = True
     except ImportError:
@@ -213,14 +215,20 @@ def get_unique_projects(_client: QdrantClient, collection_name: str) -> list[str
         Sorted list of clean project names
     """
     try:
-        # Scroll through points to extract unique group_ids
-        points, _ = _client.scroll(
-            collection_name=collection_name,
-            limit=1000,
-            with_payload=True,
-            with_vectors=False,
-        )
-        projects = set(p.payload.get("group_id", "unknown") for p in points)
+        if MODELS_IMPORTED:
+            # Facet counts (or a paged scroll) cover every point
+            projects = set(
+                get_unique_field_values(_client, collection_name, "group_id")
+            )
+        else:
+            # Scroll through points to extract unique group_ids
+            points, _ = _client.scroll(
+                collection_name=collection_name,
+                limit=1000,
+                with_payload=True,
+                with_vectors=False,
+            )
+            projects = set(p.payload.get("group_id", "unknown") for p in points)
 
         # Filter out infrastructure directory names that snuck in
         # Note: "shared" is intentional for conventions collection (v2.0)
@@ -259,6 +267,14 @@ def get_type_counts(_client: QdrantClient, collection_name: str) -> dict[str, in
     type_counts = {}
     expected_types = COLLECTION_TYPES.get(collection_name, [])
 
+    if MODELS_IMPORTED:
+        # One facet request instead of one count() per type
+        try:
+            counts = get_field_counts(_client, collection_name, "type")
+            return {mem_type: counts.get(mem_type, 0) for mem_type in expected_types}
+        except (UnexpectedResponse, httpx.HTTPError, ConnectionError):
+            pass  # Fall back to per-type counts below
+
     for mem_type in expected_types:
         try:
             # C2: Use count() API instead of scroll() - massive performance improvement
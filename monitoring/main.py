@@ -313,7 +313,17 @@ class SearchRequest(BaseModel):
 
     query: str = Field(..., description="Search query text")
     collection: str = Field("code-patterns", description="Collection to search")
-    limit: int = Field(10, description="Maximum results to return")
+    limit: int = Field(10, ge=1, le=100, description="Maximum results to return")
+    offset: int = Field(0, ge=0, le=10000, description="Ranked results to skip")
+    group_id: str | None = Field(None, description="Project filter (None = all)")
+    memory_type: list[str] | None = Field(None, description="Memory type filter")
+    score_threshold: float | None = Field(
+        None, ge=0.0, le=1.0, description="Minimum similarity (default: config)"
+    )
+    fast_mode: bool = Field(False, description="Lower HNSW ef for faster search")
+    fields: list[str] | None = Field(
+        None, description="Payload fields to return (default: full payload)"
+    )
 
 
 class SearchResponse(BaseModel):
@@ -321,6 +331,12 @@ class SearchResponse(BaseModel):
 
     status: str = Field(..., description="Response status: success or error")
     results: list = Field(default_factory=list, description="List of matching memories")
+    next_offset: int | None = Field(
+        None, description="Offset of the next page, None on the last page"
+    )
+    search_mode: str | None = Field(
+        None, description="Search path used: dense, decay, hybrid_rrf, ..."
+    )
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
@@ -539,60 +555,61 @@ async def collection_stats(collection: str):
         )
 
 
+# Lazy-loaded search service for /search (shares the async Qdrant client)
+_memory_search = None
+
+
+def get_memory_search():
+    """Get or create the AsyncMemorySearch behind /search.
+
+    Uses this service's AsyncQdrantClient and the per-loop shared
+    AsyncEmbeddingClient, so searches reuse one connection pool each.
+    """
+    global _memory_search
+    if _memory_search is None:
+        from memory.config import get_config
+        from memory.search import AsyncMemorySearch
+
+        _memory_search = AsyncMemorySearch(get_config(), qdrant_client=client)
+    return _memory_search
+
+
+def _search_result(memory: dict) -> dict:
+    """Shape one search hit as {id, score, payload} with the stored payload."""
+    return {"id": memory["id"], "score": memory["score"], "payload": memory["payload"]}
+
+
 @app.post("/search", response_model=SearchResponse, tags=["Memory Operations"])
 async def search_memories(request: SearchRequest):
     """
-    Search memories using text query for testing verification.
+    Semantic search over a collection for testing and tooling.
 
-    This endpoint supports integration tests that verify memories are
-    stored correctly and retrievable via semantic search.
+    Runs the same dense/hybrid search as the memory hooks (AsyncMemorySearch),
+    with group_id/type filters, payload projection via `fields` and
+    offset-based pagination. Read-only: access counts are not updated.
 
     Args:
-        request: Search request with query, collection, and limit
+        request: Search request with query, collection, filters and page
 
     Returns:
-        List of matching memories with payloads
+        Page of matching memories ({id, score, payload}) and the next offset
     """
     try:
-        # Use scroll to get recent memories matching query text in payload
-        # For testing, we search by content field in payload
-        result = await client.scroll(
-            collection_name=request.collection,
-            scroll_filter=None,  # Get all points for now (simple implementation)
-            limit=min(request.limit * 10, 100),  # Fetch more to search through
-            with_payload=True,
-            with_vectors=False,
-        )
-
-        # Filter results by query text in content field
-        matching_results = []
-        for point in result[0]:
-            payload = point.payload
-            content = payload.get("content", "")
-            # Simple substring match for testing
-            if request.query.lower() in content.lower():
-                matching_results.append(
-                    {
-                        "id": point.id,
-                        "payload": payload,
-                        "score": 1.0,  # Simple match score
-                    }
-                )
-                if len(matching_results) >= request.limit:
-                    break
-
-        logger.info(
-            "search_completed",
-            extra={
-                "collection": sanitize_log_input(request.collection),
-                "query_length": len(request.query),
-                "results_count": len(matching_results),
-            },
+        memories = await get_memory_search().search(
+            request.query,
+            collection=request.collection,
+            group_id=request.group_id,
+            limit=request.limit,
+            offset=request.offset,
+            score_threshold=request.score_threshold,
+            memory_type=request.memory_type,
+            fast_mode=request.fast_mode,
+            with_payload=request.fields if request.fields is not None else True,
+            track_access=False,
+            raw_payload=True,
         )
-
-        return SearchResponse(status="success", results=matching_results)
-
-    except UnexpectedResponse as e:
+    except Exception as e:
+        # EmbeddingError, QdrantUnavailable, or memory package unavailable
         logger.error(
             "search_failed",
             extra={
@@ -605,3 +622,25 @@ async def search_memories(request: SearchRequest):
             results=[],
             error=f"Search failed: {sanitize_log_input(str(e))}",
         )
+
+    results = [_search_result(memory) for memory in memories]
+    next_offset = (
+        request.offset + len(results) if len(results) == request.limit else None
+    )
+
+    logger.info(
+        "search_completed",
+        extra={
+            "collection": sanitize_log_input(request.collection),
+            "query_length": len(request.query),
+            "results_count": len(results),
+            "offset": request.offset,
+        },
+    )
+
+    return SearchResponse(
+        status="success",
+        results=results,
+        next_offset=next_offset,
+        search_mode=memories[0]["search_mode"] if memories else None,
+    )
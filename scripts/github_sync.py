@@ -24,6 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from memory.config import get_config
 from memory.connectors.github.client import GitHubClient
 from memory.connectors.github.code_sync import CodeBlobSync
+from memory.connectors.github.http_cache import open_http_cache
 from memory.connectors.github.sync import GitHubSyncEngine
 
 
@@ -91,6 +92,7 @@ async def run_sync(
         client = GitHubClient(
             token=config.github_token.get_secret_value(),
             repo=config.github_repo,
+            http_cache=open_http_cache(config),
         )
         async with client:
             code_sync = CodeBlobSync(client, config)
@@ -2,6 +2,7 @@
 """GitHub sync service — container entrypoint.
 
 Runs periodic GitHub sync (issues, PRs, commits, CI, code blobs) in a loop.
+Registered projects are synced concurrently by SyncScheduler.
 Designed for Docker container with health file for liveness checks.
 
 Usage (Docker):
@@ -30,6 +31,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from memory.config import get_config
 from memory.connectors.github.client import GitHubClient
 from memory.connectors.github.code_sync import CodeBlobSync
+from memory.connectors.github.http_cache import open_http_cache
+from memory.connectors.github.scheduler import (
+    ProjectOutcome,
+    RequestBudget,
+    SyncScheduler,
+    schedule_state_file,
+)
 from memory.connectors.github.sync import GitHubSyncEngine
 
 logger = logging.getLogger("ai_memory.github.service")
@@ -47,11 +55,83 @@ def handle_signal(signum, frame):
     SHUTDOWN_REQUESTED = True
 
 
+async def sync_project(
+    config, pid: str, project, budget: RequestBudget
+) -> ProjectOutcome:
+    """Sync one project: issues, PRs, commits, CI, then code blobs.
+
+    Both phases run even if the first fails. Their clients share the
+    cycle's request budget with the other projects syncing concurrently.
+
+    Returns:
+        ProjectOutcome with success flag and number of items changed.
+    """
+    outcome = ProjectOutcome()
+
+    # Phase 1: Issues, PRs, commits, CI results
+    try:
+        engine = GitHubSyncEngine(
+            config, repo=project.github_repo, branch=project.github_branch
+        )
+        engine.client.budget = budget
+        result = await engine.sync()
+        logger.info(
+            "Sync complete: repo=%s issues=%d prs=%d commits=%d ci=%d errors=%d",
+            project.github_repo,
+            result.issues_synced,
+            result.prs_synced,
+            result.commits_synced,
+            result.ci_results_synced,
+            result.errors,
+        )
+        outcome.items_changed += result.total_synced
+    except Exception as e:
+        logger.error("Sync failed: repo=%s error=%s", project.github_repo, e)
+        outcome.ok = False
+
+    # Phase 2: Code blobs (if enabled)
+    if config.github_code_blob_enabled:
+        try:
+            client = GitHubClient(
+                token=config.github_token.get_secret_value(),
+                repo=project.github_repo,
+                http_cache=open_http_cache(config),
+                budget=budget,
+            )
+            async with client:
+                code_sync = CodeBlobSync(
+                    client,
+                    config,
+                    repo=project.github_repo,
+                    branch=project.github_branch,
+                )
+                batch_id = GitHubClient.generate_batch_id()
+                code_result = await code_sync.sync_code_blobs(
+                    batch_id,
+                    total_timeout=config.github_sync_total_timeout,
+                )
+            logger.info(
+                "Code sync: repo=%s synced=%d skipped=%d deleted=%d errors=%d",
+                project.github_repo,
+                code_result.files_synced,
+                code_result.files_skipped,
+                code_result.files_deleted,
+                code_result.errors,
+            )
+            outcome.items_changed += code_result.files_synced
+        except Exception as e:
+            logger.error("Code sync failed: repo=%s error=%s", project.github_repo, e)
+            outcome.ok = False
+
+    return outcome
+
+
 async def run_sync_cycle(config) -> bool:
     """Run a single sync cycle across all registered projects.
 
-    Iterates over all projects from projects.d/ that have GitHub enabled.
-    Falls back to a no-op if no projects are configured.
+    Projects from projects.d/ that have GitHub enabled are synced
+    concurrently by SyncScheduler (worker and API budget caps, change-rate
+    priority). Falls back to a no-op if no projects are configured.
 
     Returns:
         True if all syncs completed without fatal errors, False otherwise.
@@ -65,67 +145,14 @@ async def run_sync_cycle(config) -> bool:
         logger.warning("No projects configured — skipping sync")
         return True
 
-    sync_ok = True
-    for pid, project in projects.items():
-        if not project.github_enabled or not project.github_repo:
-            logger.info("Skipping project %s (GitHub disabled or no repo)", pid)
-            continue
-
-        logger.info("Syncing project: %s (repo: %s)", pid, project.github_repo)
-
-        # Phase 1: Issues, PRs, commits, CI results
-        try:
-            engine = GitHubSyncEngine(
-                config, repo=project.github_repo, branch=project.github_branch
-            )
-            result = await engine.sync()
-            logger.info(
-                "Sync complete: repo=%s issues=%d prs=%d commits=%d ci=%d errors=%d",
-                project.github_repo,
-                result.issues_synced,
-                result.prs_synced,
-                result.commits_synced,
-                result.ci_results_synced,
-                result.errors,
-            )
-        except Exception as e:
-            logger.error("Sync failed: repo=%s error=%s", project.github_repo, e)
-            sync_ok = False
-
-        # Phase 2: Code blobs (if enabled)
-        if config.github_code_blob_enabled:
-            try:
-                client = GitHubClient(
-                    token=config.github_token.get_secret_value(),
-                    repo=project.github_repo,
-                )
-                async with client:
-                    code_sync = CodeBlobSync(
-                        client,
-                        config,
-                        repo=project.github_repo,
-                        branch=project.github_branch,
-                    )
-                    batch_id = GitHubClient.generate_batch_id()
-                    code_result = await code_sync.sync_code_blobs(
-                        batch_id,
-                        total_timeout=config.github_sync_total_timeout,
-                    )
-                logger.info(
-                    "Code sync: repo=%s synced=%d skipped=%d deleted=%d errors=%d",
-                    project.github_repo,
-                    code_result.files_synced,
-                    code_result.files_skipped,
-                    code_result.files_deleted,
-                    code_result.errors,
-                )
-            except Exception as e:
-                logger.error(
-                    "Code sync failed: repo=%s error=%s", project.github_repo, e
-                )
-                sync_ok = False
-
-    return sync_ok
+    scheduler = SyncScheduler(
+        config,
+        lambda pid, project, budget: sync_project(config, pid, project, budget),
+        state_file=schedule_state_file(config),
+    )
+    return await scheduler.run_cycle(
+        projects, stop_requested=lambda: SHUTDOWN_REQUESTED
+    )
 
 
 def write_health_file():
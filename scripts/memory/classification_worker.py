@@ -93,6 +93,7 @@ async def process_task(task: ClassificationTask, executor: ThreadPoolExecutor) -
                 content=task.content,
                 current_type=task.current_type,
                 collection=task.collection,
+                point_id=task.point_id,
             ),
         )
 
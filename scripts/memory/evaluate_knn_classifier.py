@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Offline evaluation of the kNN pre-classifier against existing classifications.
+
+Samples already-classified memories (LLM or rule labels) from each collection
+and replays the kNN vote for each as if it were unclassified. The point itself
+is excluded from its own neighbourhood (leave-one-out). For each candidate
+acceptance threshold, reports how many memories the tier would settle without
+an LLM call (coverage) and how often it agrees with the existing label
+(accuracy). Use it to pick MEMORY_CLASSIFIER_KNN_CONFIDENCE_THRESHOLD.
+
+Read-only: nothing is written to Qdrant.
+
+Usage:
+    python3 scripts/memory/evaluate_knn_classifier.py
+    python3 scripts/memory/evaluate_knn_classifier.py --collection discussions --sample 500
+    python3 scripts/memory/evaluate_knn_classifier.py --min-similarity 0.8 --json
+
+TECH-DEBT-069: LLM-based memory classification system.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from memory.classifier.config import (
+    KNN_MIN_NEIGHBOR_CONFIDENCE,
+    KNN_MIN_SIMILARITY,
+    KNN_MIN_VOTES,
+    KNN_NEIGHBORS,
+)
+from memory.classifier.knn import (
+    evaluate_thresholds,
+    find_labelled_neighbors,
+    labelled_points_filter,
+    weighted_vote,
+)
+from memory.qdrant_client import get_qdrant_client
+
+COLLECTIONS = ["code-patterns", "conventions", "discussions"]
+DEFAULT_THRESHOLDS = [0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0]
+
+
+def sample_labelled_points(
+    client, collection: str, sample: int, min_neighbor_confidence: float
+) -> list[tuple[str, str]]:
+    """Scroll up to ``sample`` classified points from a collection.
+
+    Returns:
+        List of (point_id, stored type)
+    """
+    points = []
+    offset = None
+    while len(points) < sample:
+        batch, offset = client.scroll(
+            collection_name=collection,
+            scroll_filter=labelled_points_filter(min_neighbor_confidence),
+            limit=min(256, sample - len(points)),
+            offset=offset,
+            with_payload=["type"],
+            with_vectors=False,
+        )
+        points.extend(
+            (str(point.id), point.payload["type"])
+            for point in batch
+            if point.payload and point.payload.get("type")
+        )
+        if offset is None:
+            break
+    return points
+
+
+def evaluate_collection(client, collection: str, args) -> list:
+    """Replay the kNN vote for sampled points of one collection.
+
+    Returns:
+        List of (known_type, KnnVote | None) pairs
+    """
+    samples = []
+    for point_id, known_type in sample_labelled_points(
+        client, collection, args.sample, args.min_neighbor_confidence
+    ):
+        neighbors = find_labelled_neighbors(
+            client,
+            collection,
+            point_id,
+            limit=args.neighbors,
+            min_neighbor_confidence=args.min_neighbor_confidence,
+        )
+        vote = weighted_vote(
+            neighbors,
+            collection,
+            min_similarity=args.min_similarity,
+            min_votes=args.min_votes,
+        )
+        samples.append((known_type, vote))
+    return samples
+
+
+def print_report(collection: str, samples: list, rows: list[dict]) -> None:
+    """Print a threshold sweep table for one collection."""
+    print(f"\n{collection}  ({len(samples)} labelled samples)")
+    print(f"  {'threshold':>9}  {'coverage':>8}  {'accuracy':>8}  {'settled':>7}")
+    for row in rows:
+        print(
+            f"  {row['threshold']:>9.2f}  {row['coverage']:>8.1%}  "
+            f"{row['accuracy']:>8.1%}  {row['accepted']:>7}"
+        )
+
+
+def main() -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Evaluate kNN pre-classifier thresholds against stored labels"
+    )
+    parser.add_argument(
+        "--collection",
+        action="append",
+        choices=COLLECTIONS,
+        help="Collection to evaluate (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--sample", type=int, default=200, help="Labelled points per collection"
+    )
+    parser.add_argument("--neighbors", type=int, default=KNN_NEIGHBORS)
+    parser.add_argument("--min-votes", type=int, default=KNN_MIN_VOTES)
+    parser.add_argument("--min-similarity", type=float, default=KNN_MIN_SIMILARITY)
+    parser.add_argument(
+        "--min-neighbor-confidence", type=float, default=KNN_MIN_NEIGHBOR_CONFIDENCE
+    )
+    parser.add_argument(
+        "--thresholds",
+        type=lambda value: [float(t) for t in value.split(",")],
+        default=DEFAULT_THRESHOLDS,
+        help="Comma-separated acceptance thresholds to sweep",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON report")
+    args = parser.parse_args()
+
+    try:
+        client = get_qdrant_client()
+    except Exception as e:
+        print(f"❌ Qdrant unavailable: {e}", file=sys.stderr)
+        return 1
+
+    report = {}
+    all_samples = []
+    for collection in args.collection or COLLECTIONS:
+        try:
+            samples = evaluate_collection(client, collection, args)
+        except Exception as e:
+            print(f"❌ {collection}: {e}", file=sys.stderr)
+            continue
+        all_samples.extend(samples)
+        report[collection] = evaluate_thresholds(samples, args.thresholds)
+        if not args.json:
+            print_report(collection, samples, report[collection])
+
+    report["all"] = evaluate_thresholds(all_samples, args.thresholds)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report("all collections", all_samples, report["all"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
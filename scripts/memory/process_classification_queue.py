@@ -6,8 +6,12 @@ BUG-024 Fix: Processes classification queue using asyncio daemon pattern.
 Architecture:
 - Asyncio daemon with graceful shutdown per BP-039
 - Batch processing: dequeue_batch(batch_size=10)
-- Concurrent classification: asyncio.gather() with return_exceptions=True
-- Updates Qdrant payload on reclassification
+- Batched classification: classify_batch_async() packs LLM-bound tasks into
+  multi-item provider requests (MEMORY_CLASSIFIER_BATCH_SIZE), sent
+  concurrently over the providers' shared async HTTP clients
+- Concurrent task handling: asyncio.gather() with return_exceptions=True
+- Coalesced write-back: reclassified payloads are grouped per collection into
+  one batch_update_points request (PayloadWriteBack)
 - Prometheus Pushgateway metrics (port 29091)
 - Structured logging with setup_hook_logging()
 
@@ -60,7 +64,13 @@ from prometheus_client import (
     pushadd_to_gateway,
 )
 
-from memory.classifier.llm_classifier import classify
+from memory.classifier.llm_classifier import (
+    ClassificationRequest,
+    ClassificationResult,
+    aclose_providers,
+    classify,
+    classify_batch_async,
+)
 from memory.classifier.queue import (
     MAX_BATCH_SIZE,
     QUEUE_DIR,
@@ -69,7 +79,7 @@ from memory.classifier.queue import (
     get_queue_size,
 )
 from memory.hooks_common import setup_hook_logging
-from memory.storage import update_point_payload
+from memory.storage import update_point_payload, update_point_payloads_async
 
 # =============================================================================
 # CONFIGURATION
@@ -77,6 +87,7 @@ from memory.storage import update_point_payload
 
 BATCH_SIZE = 10  # Max items per batch
 POLL_INTERVAL = 5.0  # Seconds between queue checks when empty
+WRITE_BACK_WINDOW = 0.05  # Seconds to gather payload updates into one write
 MAX_BACKOFF = 60.0  # Max backoff seconds on repeated errors
 PUSHGATEWAY_URL = os.getenv("PUSHGATEWAY_URL", "localhost:29091")
 PUSHGATEWAY_ENABLED = os.getenv("PUSHGATEWAY_ENABLED", "true").lower() == "true"
@@ -261,6 +272,81 @@ def _move_to_dlq(task: ClassificationTask, error: str) -> None:
         )
 
 
+# =============================================================================
+# PAYLOAD WRITE-BACK
+# =============================================================================
+
+
+class PayloadWriteBack:
+    """Coalesces payload updates into one Qdrant request per collection.
+
+    Each caller awaits its own outcome, so process_task() keeps its
+    per-task semantics while a batch costs one write per collection instead
+    of one per reclassified point. If a grouped write fails, its points are
+    retried one by one so a single bad point cannot fail the others.
+    """
+
+    def __init__(self, window: float = WRITE_BACK_WINDOW):
+        """Initialize write-back stage.
+
+        Args:
+            window: Seconds to wait for more updates before writing
+        """
+        self.window = window
+        self._pending: dict[str, list[tuple[str, dict, asyncio.Future]]] = {}
+        self._flushes: set[asyncio.Task] = set()  # Keep flush tasks referenced
+
+    async def update(self, collection: str, point_id: str, payload: dict) -> bool:
+        """Queue a payload update and wait for its grouped write.
+
+        Returns:
+            True if the update was applied, False otherwise
+        """
+        future = asyncio.get_running_loop().create_future()
+        entries = self._pending.setdefault(collection, [])
+        entries.append((point_id, payload, future))
+        if len(entries) == 1:
+            flush = asyncio.create_task(self._flush(collection))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        return await future
+
+    async def _flush(self, collection: str) -> None:
+        await asyncio.sleep(self.window)
+        entries = self._pending.pop(collection, [])
+        try:
+            # Later updates of the same point win, as with sequential writes
+            payloads = {point_id: payload for point_id, payload, _ in entries}
+            if await update_point_payloads_async(collection, payloads):
+                applied = dict.fromkeys(payloads, True)
+            else:
+                applied = {}
+                for point_id, payload in payloads.items():
+                    applied[point_id] = await asyncio.to_thread(
+                        update_point_payload,
+                        collection=collection,
+                        point_id=point_id,
+                        payload_updates=payload,
+                    )
+            logger.debug(
+                "payload_write_back_flushed",
+                extra={
+                    "collection": collection,
+                    "points": len(payloads),
+                    "applied": sum(applied.values()),
+                },
+            )
+        except Exception as e:
+            for _, _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for point_id, _, future in entries:
+            if not future.done():
+                future.set_result(applied[point_id])
+
+
 # =============================================================================
 # CLASSIFICATION WORKER
 # =============================================================================
@@ -296,6 +382,8 @@ class ClassificationWorker:
         # MEDIUM #4: Track in-flight batch for graceful shutdown
         self.current_batch_task: asyncio.Task | None = None
 
+        self.write_back = PayloadWriteBack()
+
     async def process_queue(self):
         """Main processing loop with graceful shutdown."""
         logger.info(
@@ -358,9 +446,14 @@ class ClassificationWorker:
         """
         start_time = time.time()
 
+        classified = await self._classify_tasks(tasks)
+
         # Process all tasks concurrently - BP-039 pattern
         results = await asyncio.gather(
-            *[self.process_task(task) for task in tasks],
+            *[
+                self.process_task(task, result)
+                for task, result in zip(tasks, classified, strict=True)
+            ],
             return_exceptions=True,  # Prevent one failure from killing batch
         )
 
@@ -418,11 +511,49 @@ class ClassificationWorker:
         # MEDIUM #1: Update health check file (Docker healthcheck)
         _touch_health_file()
 
-    async def process_task(self, task: ClassificationTask) -> bool | None:
+    async def _classify_tasks(
+        self, tasks: list[ClassificationTask]
+    ) -> list[ClassificationResult | None]:
+        """Classify a batch with multi-item provider requests.
+
+        Args:
+            tasks: List of ClassificationTask from queue
+
+        Returns:
+            One result per task; all None if batched classification failed,
+            in which case process_task() classifies each task on its own
+        """
+        requests = [
+            ClassificationRequest(
+                content=task.content,
+                collection=task.collection,
+                current_type=task.current_type,
+                point_id=task.point_id,
+            )
+            for task in tasks
+        ]
+        try:
+            return await classify_batch_async(requests)
+        except Exception as e:
+            logger.warning(
+                "batch_classification_failed",
+                extra={
+                    "count": len(tasks),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            return [None] * len(tasks)
+
+    async def process_task(
+        self, task: ClassificationTask, result: ClassificationResult | None = None
+    ) -> bool | None:
         """Classify content and update Qdrant payload.
 
         Args:
             task: ClassificationTask from queue
+            result: Classification from classify_batch(), or None to
+                classify the task here
 
         Returns:
             True if payload updated, None if skipped, raises on error
@@ -443,15 +574,17 @@ class ClassificationWorker:
         # MEDIUM #3: Run classification in executor to avoid blocking event loop
         # classify() is synchronous and takes 1-2s (Ollama HTTP API call)
         # Using ThreadPoolExecutor since it's I/O-bound (HTTP), not pure CPU
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,  # Use default ThreadPoolExecutor
-            classify,
-            task.content,
-            task.collection,
-            task.current_type,
-            None,  # file_path - no file context in queue
-        )
+        if result is None:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None,  # Use default ThreadPoolExecutor
+                classify,
+                task.content,
+                task.collection,
+                task.current_type,
+                None,  # file_path - no file context in queue
+                task.point_id,  # kNN tier reuses the stored vector
+            )
 
         # Check if reclassification occurred
         if not result.was_reclassified:
@@ -515,10 +648,8 @@ class ClassificationWorker:
         if result.tags:
             payload_updates["tags"] = result.tags
 
-        success = update_point_payload(
-            collection=task.collection,
-            point_id=task.point_id,
-            payload_updates=payload_updates,
+        success = await self.write_back.update(
+            task.collection, task.point_id, payload_updates
         )
 
         if not success:
@@ -652,6 +783,8 @@ class ClassificationWorker:
                         "in_flight_batch_error_during_shutdown",
                         extra={"error": str(e), "error_type": type(e).__name__},
                     )
+            # Close the providers' shared async HTTP clients on this loop
+            await aclose_providers()
             logger.info("worker_shutdown_complete")
 
 
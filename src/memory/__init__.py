@@ -37,7 +37,7 @@ with contextlib.suppress(ImportError):
 from .config import MemoryConfig, get_config, reset_config
 
 # Service Clients
-from .embeddings import EmbeddingClient, EmbeddingError
+from .embeddings import AsyncEmbeddingClient, EmbeddingClient, EmbeddingError
 
 # Graceful Degradation (Story 1.7)
 from .graceful import (
@@ -52,7 +52,12 @@ from .health import check_services, get_fallback_mode
 
 # Models and Validation
 from .models import EmbeddingStatus, MemoryPayload, MemoryType
-from .qdrant_client import QdrantUnavailable, check_qdrant_health, get_qdrant_client
+from .qdrant_client import (
+    QdrantUnavailable,
+    check_qdrant_health,
+    get_async_qdrant_client,
+    get_qdrant_client,
+)
 from .queue import (
     LOCK_TIMEOUT_SECONDS,
     LockedFileAppend,
@@ -64,13 +69,13 @@ from .queue import (
 )
 
 # Search (Story 1.6)
-from .search import MemorySearch
+from .search import AsyncMemorySearch, MemorySearch
 
 # Collection Statistics (Story 6.6)
 from .stats import CollectionStats, get_collection_stats
 
 # Storage (Story 1.5)
-from .storage import MemoryStorage
+from .storage import AsyncMemoryStorage, MemoryStorage
 
 # Template Models (Story 7.5)
 from .template_models import (
@@ -91,9 +96,11 @@ __all__ = [
     "reset_config",
     # Embedding Client (Story 1.4)
     "EmbeddingClient",
+    "AsyncEmbeddingClient",
     "EmbeddingError",
     # Qdrant Client (Story 1.4)
     "get_qdrant_client",
+    "get_async_qdrant_client",
     "check_qdrant_health",
     "QdrantUnavailable",
     # Models (Story 1.3)
@@ -110,8 +117,10 @@ __all__ = [
     "load_templates_from_file",
     # Storage (Story 1.5)
     "MemoryStorage",
+    "AsyncMemoryStorage",
     # Search (Story 1.6)
     "MemorySearch",
+    "AsyncMemorySearch",
     # Graceful Degradation (Story 1.7)
     "graceful_hook",
     "exit_success",
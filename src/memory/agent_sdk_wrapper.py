@@ -49,7 +49,7 @@ from .config import COLLECTION_CODE_PATTERNS, COLLECTION_DISCUSSIONS
 from .deduplication import compute_content_hash, is_duplicate
 from .models import MemoryType
 from .project import detect_project
-from .storage import MemoryStorage
+from .storage import AsyncMemoryStorage, MemoryStorage, await_store_memory
 
 # Prometheus Metrics
 agent_sdk_hook_fires = Counter(
@@ -74,6 +74,15 @@ __all__ = [
 logger = logging.getLogger("ai_memory.agent_sdk_wrapper")
 
 
+def _dedup_embedding(result) -> tuple[list[float] | None, str | None]:
+    """Return the dense vector computed by the dedup check and its model key."""
+    embedding = getattr(result, "embedding", None)
+    if not isinstance(embedding, list):
+        return None, None
+    model = getattr(result, "embedding_model", None)
+    return embedding, model if isinstance(model, str) else None
+
+
 @dataclass
 class PendingMemory:
     """Memory waiting in batch queue.
@@ -87,6 +96,9 @@ class PendingMemory:
         turn_number: Turn number in session
         timestamp: Creation timestamp
         content_hash: SHA-256 hash of content
+        embedding: Dense vector computed during the dedup check, reused at
+            store time so the content is embedded only once (None if unavailable)
+        embedding_model: Model key of embedding, checked against storage routing
     """
 
     content: str
@@ -97,6 +109,8 @@ class PendingMemory:
     turn_number: int
     timestamp: datetime
     content_hash: str
+    embedding: list[float] | None = None
+    embedding_model: str | None = None
 
 
 class AgentSDKWrapper:
@@ -123,7 +137,7 @@ class AgentSDKWrapper:
         self,
         cwd: str,
         api_key: str | None = None,
-        storage: MemoryStorage | None = None,
+        storage: MemoryStorage | AsyncMemoryStorage | None = None,
         session_id: str | None = None,
         options: ClaudeAgentOptions | None = None,
     ):
@@ -132,7 +146,7 @@ class AgentSDKWrapper:
         Args:
             cwd: Current working directory for project detection
             api_key: Anthropic API key (uses ANTHROPIC_API_KEY env var if not provided)
-            storage: Optional MemoryStorage instance (creates new if not provided)
+            storage: Optional storage instance (creates AsyncMemoryStorage if not provided)
             session_id: Optional session identifier (generates UUID if not provided)
             options: Optional ClaudeAgentOptions (creates with hooks if not provided)
 
@@ -148,7 +162,7 @@ class AgentSDKWrapper:
                 "ANTHROPIC_API_KEY not found. Provide api_key parameter or set environment variable."
             )
 
-        self.storage = storage or MemoryStorage()
+        self.storage = storage or AsyncMemoryStorage()
         self.session_id = session_id or f"agent_sdk_{uuid4().hex[:8]}"
         self.turn_number = 0
         self._turn_lock = asyncio.Lock()  # MEDIUM-9: Prevent race condition
@@ -282,12 +296,8 @@ class AgentSDKWrapper:
             try:
                 # Store each memory using the existing storage logic
                 # MEDIUM-9: Turn number already set in PendingMemory
-                loop = asyncio.get_running_loop()
-
-                from functools import partial
-
-                store_func = partial(
-                    self.storage.store_memory,
+                await await_store_memory(
+                    self.storage,
                     memory.content,
                     self.cwd,
                     memory.memory_type,
@@ -296,10 +306,10 @@ class AgentSDKWrapper:
                     memory.collection,
                     # Note: turn_number not supported by MemoryPayload
                     # Note: Don't pass timestamp - storage creates its own
+                    embedding=memory.embedding,
+                    embedding_model=memory.embedding_model,
                 )
 
-                await loop.run_in_executor(None, store_func)
-
                 logger.debug(
                     "batch_item_stored",
                     extra={
@@ -361,12 +371,10 @@ class AgentSDKWrapper:
                     return
 
             # Stage 2b: Check Qdrant (slower but necessary)
+            embedding = embedding_model = None
             try:
                 result = await is_duplicate(
-                    collection=collection,
-                    content_hash=content_hash,
-                    embedding=None,  # Skip semantic check for speed
-                    group_id=self._get_group_id(),
+                    content, self._get_group_id(), collection=collection
                 )
                 if result.is_duplicate:
                     logger.debug(
@@ -382,6 +390,7 @@ class AgentSDKWrapper:
                     return
 
                 agent_sdk_dedup_checks.labels(result="unique").inc()
+                embedding, embedding_model = _dedup_embedding(result)
 
             except Exception as e:
                 # Graceful degradation: queue anyway if dedup check fails
@@ -402,6 +411,8 @@ class AgentSDKWrapper:
                     turn_number=current_turn,
                     timestamp=datetime.now(timezone.utc),
                     content_hash=content_hash,
+                    embedding=embedding,
+                    embedding_model=embedding_model,
                 )
             )
 
@@ -603,13 +614,11 @@ class AgentSDKWrapper:
             # Stage 1: Compute hash
             content_hash = compute_content_hash(content)
 
-            # Stage 2: Check for duplicate (hash-based, fast)
+            # Stage 2: Check for duplicate (hash, then semantic)
+            embedding = embedding_model = None
             try:
                 result = await is_duplicate(
-                    collection=collection,
-                    content_hash=content_hash,
-                    embedding=None,  # Skip semantic check for speed
-                    group_id=self._get_group_id(),
+                    content, self._get_group_id(), collection=collection
                 )
                 if result.is_duplicate:
                     logger.debug(
@@ -625,6 +634,7 @@ class AgentSDKWrapper:
                     return None
 
                 agent_sdk_dedup_checks.labels(result="unique").inc()
+                embedding, embedding_model = _dedup_embedding(result)
 
             except Exception as e:
                 # Graceful degradation: store anyway if dedup check fails
@@ -641,14 +651,9 @@ class AgentSDKWrapper:
                 current_turn = self.turn_number
 
             # CRITICAL-1: Fixed store_memory() call - use kwargs for extra fields
-            # Run sync storage in executor (storage.store_memory is sync)
-            loop = asyncio.get_running_loop()
-
-            # Partial function to pass kwargs correctly through executor
-            from functools import partial
-
-            store_func = partial(
-                self.storage.store_memory,
+            # AsyncMemoryStorage is awaited directly; sync storage runs in a thread
+            await await_store_memory(
+                self.storage,
                 content,
                 self.cwd,
                 memory_type,
@@ -657,10 +662,10 @@ class AgentSDKWrapper:
                 collection,
                 turn_number=current_turn,
                 timestamp=datetime.now(timezone.utc).isoformat(),
+                embedding=embedding,
+                embedding_model=embedding_model,
             )
 
-            await loop.run_in_executor(None, store_func)
-
             logger.info(
                 "memory_stored_background",
                 extra={
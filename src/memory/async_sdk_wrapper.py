@@ -55,7 +55,7 @@ from tenacity import (
 
 from .config import COLLECTION_DISCUSSIONS
 from .models import MemoryType
-from .storage import MemoryStorage
+from .storage import AsyncMemoryStorage, MemoryStorage, await_store_memory
 
 # Prometheus Metrics
 sdk_rate_limit_hits = Counter(
@@ -342,14 +342,15 @@ class AsyncConversationCapture:
 
     def __init__(
         self,
-        storage: MemoryStorage,
+        storage: MemoryStorage | AsyncMemoryStorage,
         cwd: str,
         session_id: str | None = None,
     ):
         """Initialize async conversation capture.
 
         Args:
-            storage: MemoryStorage instance (must support async operations)
+            storage: AsyncMemoryStorage (awaited natively) or MemoryStorage
+                (run in a worker thread)
             cwd: Current working directory for project detection
             session_id: Optional session identifier (generates UUID if not provided)
         """
@@ -404,21 +405,17 @@ class AsyncConversationCapture:
     async def _store_user_message(self, content: str):
         """Background task to store user message."""
         try:
-            # Note: storage.store_memory is sync, needs to run in executor
-            # These methods run inside asyncio.create_task() so a running loop
-            # is guaranteed. If no loop exists, that's an architecture bug - fail fast.
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                self.storage.store_memory,
+            # AsyncMemoryStorage is awaited directly; sync storage runs in a thread
+            await await_store_memory(
+                self.storage,
                 content,
                 self.cwd,
                 MemoryType.USER_MESSAGE,
                 "AsyncSDKWrapper",
                 self.session_id,
                 COLLECTION_DISCUSSIONS,
-                self.turn_number,
-                datetime.now(timezone.utc).isoformat(),
+                turn_number=self.turn_number,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
             logger.info(
                 "user_message_captured",
@@ -441,21 +438,17 @@ class AsyncConversationCapture:
     async def _store_agent_response(self, content: str):
         """Background task to store agent response."""
         try:
-            # Note: storage.store_memory is sync, needs to run in executor
-            # These methods run inside asyncio.create_task() so a running loop
-            # is guaranteed. If no loop exists, that's an architecture bug - fail fast.
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                self.storage.store_memory,
+            # AsyncMemoryStorage is awaited directly; sync storage runs in a thread
+            await await_store_memory(
+                self.storage,
                 content,
                 self.cwd,
                 MemoryType.AGENT_RESPONSE,
                 "AsyncSDKWrapper",
                 self.session_id,
                 COLLECTION_DISCUSSIONS,
-                self.turn_number,
-                datetime.now(timezone.utc).isoformat(),
+                turn_number=self.turn_number,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
             logger.info(
                 "agent_response_captured",
@@ -537,7 +530,7 @@ class AsyncSDKWrapper:
         self,
         cwd: str,
         api_key: str | None = None,
-        storage: MemoryStorage | None = None,
+        storage: MemoryStorage | AsyncMemoryStorage | None = None,
         session_id: str | None = None,
         requests_per_minute: int = 50,
         tokens_per_minute: int = 30000,
@@ -547,7 +540,7 @@ class AsyncSDKWrapper:
         Args:
             cwd: Current working directory for project detection
             api_key: Anthropic API key (uses ANTHROPIC_API_KEY env var if not provided)
-            storage: Optional MemoryStorage instance (creates new if not provided)
+            storage: Optional storage instance (creates AsyncMemoryStorage if not provided)
             session_id: Optional session identifier (generates UUID if not provided)
             requests_per_minute: RPM limit for rate limiting (default: 50, Tier 1)
             tokens_per_minute: TPM limit for rate limiting (default: 30K, Tier 1)
@@ -564,7 +557,7 @@ class AsyncSDKWrapper:
             )
 
         self.client = AsyncAnthropic(api_key=self.api_key)
-        self.storage = storage or MemoryStorage()
+        self.storage = storage or AsyncMemoryStorage()
         self.capture = AsyncConversationCapture(
             storage=self.storage,
             cwd=cwd,
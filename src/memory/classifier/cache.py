@@ -0,0 +1,236 @@
+"""Persistent classification cache for the LLM classifier.
+
+The same content is routinely classified more than once: reclassification
+backfills, retried queue tasks, identical error output captured across
+sessions, and re-synced GitHub/Jira text. Each repeat costs a full provider
+round-trip, the slowest and most expensive step of the pipeline.
+
+This cache stores successful LLM classifications keyed by
+``(content_hash, collection, current_type, config_hash)``, where the config
+hash fingerprints the provider chain, models and prompt template. Changing
+any of those invalidates every entry without a purge.
+
+Storage: a single SQLite database shared by the classification worker and
+hooks (memory.sqlite_store: WAL mode, fail-open, buffered access times).
+Entries expire after a TTL and the least recently used are evicted beyond
+``max_entries``. A hit is a single SELECT; only an expired lookup writes
+(it deletes the entry).
+
+TECH-DEBT-069: LLM-based memory classification system.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ..sqlite_store import EVICT_TARGET_RATIO, LRUStore
+from .config import (
+    CLASSIFICATION_CACHE_ENABLED,
+    CLASSIFICATION_CACHE_MAX_ENTRIES,
+    CLASSIFICATION_CACHE_PATH,
+    CLASSIFICATION_CACHE_TTL_DAYS,
+)
+
+logger = logging.getLogger("ai_memory.classifier.cache")
+
+__all__ = [
+    "ClassificationCache",
+    "classification_cache_key",
+    "get_classification_cache",
+]
+
+
+def classification_cache_key(
+    content: str, collection: str, current_type: str, config_hash: str
+) -> str:
+    """Build the cache key for one classification request.
+
+    Args:
+        content: Content being classified
+        collection: Target collection
+        current_type: Current memory type
+        config_hash: Provider/prompt fingerprint
+
+    Returns:
+        SHA-256 hex digest identifying the request
+    """
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    parts = (content_hash, collection, current_type, config_hash)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class ClassificationCache(LRUStore):
+    """SQLite-backed TTL + LRU cache of classification results.
+
+    Attributes:
+        path: SQLite database file
+        ttl_seconds: Entry lifetime from when it was stored
+        max_entries: Upper bound on stored entries
+        hits: Lookups served from the cache (this process)
+        misses: Lookups not found or expired (this process)
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS classifications (
+        key TEXT PRIMARY KEY,
+        result TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+    """
+    _TABLE = "classifications"
+    _WRITE_FAILED_EVENT = "classification_cache_write_failed"
+    _logger = logger
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = 30 * 86400,
+        max_entries: int = 50000,
+    ) -> None:
+        super().__init__(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._count: int | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached result dict, or None on a miss or expired entry."""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT result, created_at FROM classifications WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    # The only write on the read path; hits just buffer a touch
+                    conn.execute("DELETE FROM classifications WHERE key = ?", (key,))
+                    conn.commit()
+                    self._pending_touch.pop(key, None)
+                    self._count = None
+                    row = None
+                elif row is not None:
+                    self._touch(key, now)
+            result = json.loads(row[0]) if row is not None else None
+        except (sqlite3.Error, ValueError, OSError) as e:
+            logger.warning(
+                "classification_cache_read_failed",
+                extra={"path": str(self.path), "error": str(e)},
+            )
+            result = None
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a classification result (replaces any existing entry)."""
+        try:
+            payload = json.dumps(result, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug("classification_cache_unserializable", extra={"error": str(e)})
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                self._apply_touches(conn)
+                count = self._current_count(conn)
+                existed = conn.execute(
+                    "SELECT 1 FROM classifications WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO classifications "
+                    "(key, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, payload, now, now),
+                )
+                count += 0 if existed else 1
+                if count > self.max_entries:
+                    count = self._evict(conn, now)
+                conn.commit()
+                self._count = count
+        except sqlite3.Error as e:
+            self._count = None
+            self._log_write_failure(e)
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT COUNT(*) FROM classifications")
+                    .fetchone()
+                )
+        except sqlite3.Error:
+            return 0
+        return int(row[0])
+
+    def _current_count(self, conn: sqlite3.Connection) -> int:
+        # Re-read on first use and after failures; other processes may have
+        # written since, so eviction re-checks the real count below.
+        if self._count is None:
+            row = conn.execute("SELECT COUNT(*) FROM classifications").fetchone()
+            self._count = int(row[0])
+        return self._count
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Drop expired entries, then least recently used, down to the target."""
+        expired = conn.execute(
+            "DELETE FROM classifications WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        ).rowcount
+        count = int(conn.execute("SELECT COUNT(*) FROM classifications").fetchone()[0])
+        target = int(self.max_entries * EVICT_TARGET_RATIO)
+        evicted = 0
+        if count > target:
+            evicted = conn.execute(
+                "DELETE FROM classifications WHERE key IN ("
+                "SELECT key FROM classifications ORDER BY accessed_at ASC LIMIT ?)",
+                (count - target,),
+            ).rowcount
+            count -= evicted
+        logger.debug(
+            "classification_cache_evicted",
+            extra={"expired": expired, "evicted": evicted, "entries": count},
+        )
+        return count
+
+
+_cache: ClassificationCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_classification_cache() -> ClassificationCache | None:
+    """Return the shared classification cache, or None when disabled.
+
+    Configured by MEMORY_CLASSIFIER_CACHE_ENABLED, _PATH, _TTL_DAYS and
+    _MAX_ENTRIES (see classifier/config.py).
+    """
+    global _cache
+    if not CLASSIFICATION_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ClassificationCache(
+                CLASSIFICATION_CACHE_PATH,
+                ttl_seconds=CLASSIFICATION_CACHE_TTL_DAYS * 86400,
+                max_entries=CLASSIFICATION_CACHE_MAX_ENTRIES,
+            )
+        return _cache
@@ -7,19 +7,34 @@ Pattern based on:
 - AWS Well-Architected Framework (2026): Implement circuit breakers for dependent services
 - Martin Fowler: https://martinfowler.com/bliki/CircuitBreaker.html
 
+With a ProviderStateStore, each provider's breaker lives in a SQLite database
+shared by every classifier process on the host: once any process opens the
+circuit, the others stop calling the provider too, and half-open test requests
+are counted host-wide. If the store is unusable, the in-process state is used
+instead.
+
 TECH-DEBT-069: LLM classification resilience.
 """
 
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
+from typing import Any, TypeVar
+
+from .shared_state import ProviderStateStore, get_provider_state_store
 
 logger = logging.getLogger("ai_memory.classifier.circuit_breaker")
 
 __all__ = ["CircuitBreaker", "CircuitState", "circuit_breaker"]
 
+T = TypeVar("T")
+
+# ProviderStateStore kind for breaker state
+_STATE_KIND = "circuit_breaker"
+
 
 class CircuitState(str, Enum):
     """Circuit breaker states."""
@@ -39,6 +54,11 @@ class ProviderState:
     state: CircuitState = CircuitState.CLOSED
     half_open_attempts: int = 0
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProviderState":
+        """Rebuild state stored by ProviderStateStore."""
+        return cls(**{**data, "state": CircuitState(data["state"])})
+
 
 class CircuitBreaker:
     """Circuit breaker with configurable thresholds.
@@ -63,6 +83,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         reset_timeout: int = 60,
         half_open_max_attempts: int = 3,
+        shared_state: ProviderStateStore | None = None,
     ):
         """Initialize circuit breaker.
 
@@ -70,12 +91,15 @@ class CircuitBreaker:
             failure_threshold: Consecutive failures before opening circuit
             reset_timeout: Seconds before transitioning to HALF_OPEN
             half_open_max_attempts: Max test requests in HALF_OPEN state
+            shared_state: Cross-process state store (default: in-process only)
         """
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self.half_open_max_attempts = half_open_max_attempts
+        self.shared_state = shared_state
         self._states: dict[str, ProviderState] = {}
         self._lock = threading.Lock()  # Thread-safe state creation
+        self._update_lock = threading.Lock()  # Atomic in-process transitions
 
         logger.info(
             "circuit_breaker_initialized",
@@ -83,6 +107,7 @@ class CircuitBreaker:
                 "failure_threshold": failure_threshold,
                 "reset_timeout_seconds": reset_timeout,
                 "half_open_attempts": half_open_max_attempts,
+                "shared_state": str(shared_state.path) if shared_state else None,
             },
         )
 
@@ -109,6 +134,31 @@ class CircuitBreaker:
                 self._states[provider] = ProviderState()
             return self._states[provider]
 
+    def _update(self, provider: str, fn: Callable[[ProviderState], T]) -> T:
+        """Apply a state transition atomically, preferring the shared store.
+
+        Args:
+            provider: Provider name
+            fn: Mutates the ProviderState and returns a non-None result
+
+        Returns:
+            fn's result
+        """
+        if self.shared_state is not None:
+
+            def apply(data: dict[str, Any] | None):
+                state = ProviderState.from_dict(data) if data else ProviderState()
+                result = fn(state)
+                return asdict(state), result
+
+            outcome = self.shared_state.update(_STATE_KIND, provider, apply)
+            if outcome is not None:
+                return outcome
+
+        state = self._get_state(provider)
+        with self._update_lock:
+            return fn(state)
+
     def is_available(self, provider: str) -> bool:
         """Check if provider is available (circuit not open).
 
@@ -118,8 +168,10 @@ class CircuitBreaker:
         Returns:
             True if requests should be allowed, False if circuit is open
         """
-        state = self._get_state(provider)
+        return self._update(provider, lambda state: self._check(provider, state))
 
+    def _check(self, provider: str, state: ProviderState) -> bool:
+        """Availability check and OPEN -> HALF_OPEN transition for one state."""
         # CLOSED state: always available
         if state.state == CircuitState.CLOSED:
             return True
@@ -181,7 +233,10 @@ class CircuitBreaker:
         Args:
             provider: Provider name
         """
-        state = self._get_state(provider)
+        self._update(provider, lambda state: self._on_success(provider, state))
+
+    def _on_success(self, provider: str, state: ProviderState) -> CircuitState:
+        """Close the circuit; returns the previous circuit state."""
         prev_state = state.state
 
         # Reset failure counter and close circuit
@@ -198,6 +253,7 @@ class CircuitBreaker:
                     "previous_state": prev_state.value,
                 },
             )
+        return prev_state
 
     def record_failure(self, provider: str, error_type: str = "unknown"):
         """Record failed request, potentially open circuit.
@@ -206,7 +262,16 @@ class CircuitBreaker:
             provider: Provider name
             error_type: Type of error (timeout, connection, parse, etc.)
         """
-        state = self._get_state(provider)
+        self._update(
+            provider, lambda state: self._on_failure(provider, state, error_type)
+        )
+
+    def _on_failure(self, provider: str, state: ProviderState, error_type: str) -> int:
+        """Count a failure, opening the circuit at the threshold.
+
+        Returns:
+            Consecutive failures after this one
+        """
         state.consecutive_failures += 1
         state.last_failure_time = time.time()
 
@@ -234,6 +299,7 @@ class CircuitBreaker:
                     "timeout_seconds": self.reset_timeout,
                 },
             )
+        return state.consecutive_failures
 
     def get_status(self, provider: str) -> dict:
         """Get current circuit status for provider.
@@ -244,7 +310,7 @@ class CircuitBreaker:
         Returns:
             Dict with status information
         """
-        state = self._get_state(provider)
+        state = self._update(provider, replace)
 
         return {
             "provider": provider,
@@ -257,9 +323,11 @@ class CircuitBreaker:
 
 
 # Global circuit breaker instance
-# Shared across all classification requests in the process
+# Shared across all classifier processes on the host via the provider state
+# store (in-process only when MEMORY_CLASSIFIER_SHARED_STATE_ENABLED=false)
 circuit_breaker = CircuitBreaker(
     failure_threshold=5,  # 5 consecutive failures opens circuit
     reset_timeout=60,  # 60 seconds before trying again
     half_open_max_attempts=3,  # 3 test requests in half-open state
+    shared_state=get_provider_state_store(),
 )
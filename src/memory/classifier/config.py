@@ -208,10 +208,22 @@ def _get_int_env(
 __all__ = [
     "ANTHROPIC_MODEL",
     "ASYNC_CLASSIFICATION",
+    "ASYNC_CONCURRENCY",
+    "BATCH_SIZE",
+    "CLASSIFICATION_CACHE_ENABLED",
+    "CLASSIFICATION_CACHE_MAX_ENTRIES",
+    "CLASSIFICATION_CACHE_PATH",
+    "CLASSIFICATION_CACHE_TTL_DAYS",
     "CLASSIFIER_ENABLED",
     "CONFIDENCE_THRESHOLD",
     "COST_PER_MILLION",
     "FALLBACK_PROVIDERS",
+    "KNN_CONFIDENCE_THRESHOLD",
+    "KNN_ENABLED",
+    "KNN_MIN_NEIGHBOR_CONFIDENCE",
+    "KNN_MIN_SIMILARITY",
+    "KNN_MIN_VOTES",
+    "KNN_NEIGHBORS",
     "LOW_PATTERNS",
     "MAX_INPUT_CHARS",
     "MAX_OUTPUT_TOKENS",
@@ -225,6 +237,8 @@ __all__ = [
     "RATE_LIMIT_PER_MINUTE",
     "RULE_CONFIDENCE_THRESHOLD",
     "RULE_PATTERNS",
+    "SHARED_STATE_ENABLED",
+    "SHARED_STATE_PATH",
     "SIGNIFICANCE_BEHAVIOR",
     "SKIP_PATTERNS",
     "SKIP_RECLASSIFICATION_TYPES",
@@ -289,6 +303,74 @@ MAX_INPUT_CHARS = _get_int_env(
 RATE_LIMIT_PER_MINUTE = _get_int_env(
     "MEMORY_CLASSIFIER_RATE_LIMIT", default=60, min_val=1, max_val=1000
 )
+# Items packed into one provider request by classify_batch() (1 = disabled)
+BATCH_SIZE = _get_int_env(
+    "MEMORY_CLASSIFIER_BATCH_SIZE", default=5, min_val=1, max_val=10
+)
+# In-flight async requests per provider (and async HTTP pool size)
+ASYNC_CONCURRENCY = _get_int_env(
+    "MEMORY_CLASSIFIER_ASYNC_CONCURRENCY", default=8, min_val=1, max_val=64
+)
+
+# =============================================================================
+# CLASSIFICATION CACHE
+# =============================================================================
+# Persistent cache of LLM results keyed by content hash, collection, current
+# type and provider/prompt fingerprint. Hits skip the provider chain.
+CLASSIFICATION_CACHE_ENABLED = (
+    os.getenv("MEMORY_CLASSIFIER_CACHE_ENABLED", "true").lower() == "true"
+)
+CLASSIFICATION_CACHE_PATH = Path(
+    os.getenv(
+        "MEMORY_CLASSIFIER_CACHE_PATH", "~/.ai-memory/cache/classification_cache.db"
+    )
+).expanduser()
+CLASSIFICATION_CACHE_TTL_DAYS = _get_int_env(
+    "MEMORY_CLASSIFIER_CACHE_TTL_DAYS", default=30, min_val=1, max_val=3650
+)
+CLASSIFICATION_CACHE_MAX_ENTRIES = _get_int_env(
+    "MEMORY_CLASSIFIER_CACHE_MAX_ENTRIES", default=50000, min_val=100, max_val=10000000
+)
+
+# =============================================================================
+# SHARED PROVIDER STATE
+# =============================================================================
+# Rate-limit token buckets and circuit breakers shared by every classifier
+# process on the host (worker, queue processor, backfills, hooks).
+SHARED_STATE_ENABLED = (
+    os.getenv("MEMORY_CLASSIFIER_SHARED_STATE_ENABLED", "true").lower() == "true"
+)
+SHARED_STATE_PATH = Path(
+    os.getenv(
+        "MEMORY_CLASSIFIER_SHARED_STATE_PATH", "~/.ai-memory/cache/provider_state.db"
+    )
+).expanduser()
+
+# =============================================================================
+# KNN PRE-CLASSIFIER
+# =============================================================================
+# Votes among the point's nearest already-classified neighbours (stored
+# vectors, no re-embedding) before falling back to the LLM provider chain.
+# Tune thresholds with scripts/memory/evaluate_knn_classifier.py.
+KNN_ENABLED = os.getenv("MEMORY_CLASSIFIER_KNN_ENABLED", "true").lower() == "true"
+KNN_NEIGHBORS = _get_int_env(
+    "MEMORY_CLASSIFIER_KNN_NEIGHBORS", default=10, min_val=1, max_val=100
+)
+KNN_MIN_VOTES = _get_int_env(
+    "MEMORY_CLASSIFIER_KNN_MIN_VOTES", default=3, min_val=1, max_val=100
+)
+KNN_MIN_SIMILARITY = _get_float_env(
+    "MEMORY_CLASSIFIER_KNN_MIN_SIMILARITY", default=0.85, min_val=0.0, max_val=1.0
+)
+KNN_MIN_NEIGHBOR_CONFIDENCE = _get_float_env(
+    "MEMORY_CLASSIFIER_KNN_MIN_NEIGHBOR_CONFIDENCE",
+    default=0.8,
+    min_val=0.0,
+    max_val=1.0,
+)
+KNN_CONFIDENCE_THRESHOLD = _get_float_env(
+    "MEMORY_CLASSIFIER_KNN_CONFIDENCE_THRESHOLD", default=0.8, min_val=0.0, max_val=1.0
+)
 
 # =============================================================================
 # COST TRACKING (per 1M tokens in USD)
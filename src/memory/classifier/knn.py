@@ -0,0 +1,290 @@
+"""Embedding-space kNN pre-classifier.
+
+Every memory queued for classification already has a dense vector in Qdrant,
+and many of its nearest neighbours already carry a confident type assigned by
+the LLM or rules. This tier queries the point's nearest classified neighbours
+by point ID, so Qdrant reuses the stored vector and nothing is re-embedded. It
+then takes a similarity- and confidence-weighted vote. Unanimous or
+near-unanimous neighbourhoods settle the type. Ambiguous ones fall through to
+the LLM provider chain.
+
+Only labels from real classifiers vote: points classified by this tier, or
+kept by fallback/filter paths, are excluded so errors cannot self-reinforce.
+
+Thresholds are tuned offline with scripts/memory/evaluate_knn_classifier.py,
+which replays the vote against existing classifications (see
+evaluate_thresholds()).
+
+TECH-DEBT-069: LLM-based memory classification system.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from .config import (
+    KNN_CONFIDENCE_THRESHOLD,
+    KNN_MIN_NEIGHBOR_CONFIDENCE,
+    KNN_MIN_SIMILARITY,
+    KNN_MIN_VOTES,
+    KNN_NEIGHBORS,
+    VALID_TYPES,
+)
+
+logger = logging.getLogger("ai_memory.classifier.knn")
+
+__all__ = [
+    "KNN_PROVIDER",
+    "KnnVote",
+    "Neighbor",
+    "classify_by_neighbors",
+    "evaluate_thresholds",
+    "find_labelled_neighbors",
+    "labelled_points_filter",
+    "weighted_vote",
+]
+
+# provider_used / classification_provider value for this tier
+KNN_PROVIDER = "knn"
+
+# classification_provider values that are not independent labels
+_NON_VOTING_PROVIDERS = [
+    KNN_PROVIDER,
+    "disabled",
+    "fallback",
+    "none",
+    "protected-type",
+    "significance-filter",
+]
+
+
+@dataclass
+class Neighbor:
+    """An already-classified neighbour of the point being classified.
+
+    Attributes:
+        classified_type: The neighbour's stored type
+        similarity: Vector similarity to the point (cosine score)
+        confidence: The neighbour's stored classification_confidence
+    """
+
+    classified_type: str
+    similarity: float
+    confidence: float
+
+
+@dataclass
+class KnnVote:
+    """Outcome of a weighted neighbour vote.
+
+    Attributes:
+        classified_type: Winning type
+        confidence: Weighted agreement (winning weight / total weight)
+        votes: Neighbours that took part in the vote
+    """
+
+    classified_type: str
+    confidence: float
+    votes: int
+
+
+def weighted_vote(
+    neighbors: list[Neighbor],
+    collection: str,
+    min_similarity: float = KNN_MIN_SIMILARITY,
+    min_votes: int = KNN_MIN_VOTES,
+) -> KnnVote | None:
+    """Vote among neighbours, weighting each by similarity x confidence.
+
+    Neighbours below ``min_similarity`` or with a type not valid for the
+    collection are ignored. No acceptance threshold is applied here so the
+    offline evaluation can sweep it.
+
+    Args:
+        neighbors: Candidate neighbours
+        collection: Target collection (restricts eligible types)
+        min_similarity: Minimum similarity for a neighbour to vote
+        min_votes: Minimum voting neighbours for a result
+
+    Returns:
+        KnnVote, or None if too few neighbours voted
+    """
+    valid_types = set(VALID_TYPES.get(collection, []))
+    weights: dict[str, float] = defaultdict(float)
+    votes = 0
+    for neighbor in neighbors:
+        if neighbor.similarity < min_similarity:
+            continue
+        if neighbor.classified_type not in valid_types:
+            continue
+        weights[neighbor.classified_type] += neighbor.similarity * neighbor.confidence
+        votes += 1
+
+    total = sum(weights.values())
+    if votes < min_votes or total <= 0:
+        return None
+
+    classified_type, weight = max(weights.items(), key=lambda item: item[1])
+    return KnnVote(
+        classified_type=classified_type, confidence=weight / total, votes=votes
+    )
+
+
+def labelled_points_filter(
+    min_neighbor_confidence: float = KNN_MIN_NEIGHBOR_CONFIDENCE,
+):
+    """Qdrant filter matching points whose type may take part in a vote.
+
+    Args:
+        min_neighbor_confidence: Minimum stored classification_confidence
+
+    Returns:
+        qdrant_client Filter
+    """
+    from qdrant_client.models import FieldCondition, Filter, MatchAny, Range
+
+    return Filter(
+        must=[
+            FieldCondition(
+                key="classification_confidence",
+                range=Range(gte=min_neighbor_confidence),
+            )
+        ],
+        must_not=[
+            FieldCondition(
+                key="classification_provider",
+                match=MatchAny(any=_NON_VOTING_PROVIDERS),
+            )
+        ],
+    )
+
+
+def find_labelled_neighbors(
+    client: Any,
+    collection: str,
+    point_id: str,
+    limit: int = KNN_NEIGHBORS,
+    min_neighbor_confidence: float = KNN_MIN_NEIGHBOR_CONFIDENCE,
+) -> list[Neighbor]:
+    """Query a point's nearest classified neighbours using its stored vector.
+
+    Querying by point ID makes Qdrant look up the stored dense vector and
+    exclude the point itself from the results.
+
+    Args:
+        client: QdrantClient
+        collection: Collection holding the point
+        point_id: Point to find neighbours for
+        limit: Max neighbours to return
+        min_neighbor_confidence: Minimum classification_confidence to vote
+
+    Returns:
+        Neighbours ordered by similarity (highest first)
+    """
+    response = client.query_points(
+        collection_name=collection,
+        query=point_id,
+        query_filter=labelled_points_filter(min_neighbor_confidence),
+        limit=limit,
+        with_payload=["type", "classification_confidence"],
+        with_vectors=False,
+    )
+
+    neighbors = []
+    for point in response.points:
+        payload = point.payload or {}
+        if not payload.get("type"):
+            continue
+        neighbors.append(
+            Neighbor(
+                classified_type=payload["type"],
+                similarity=float(point.score),
+                confidence=float(payload.get("classification_confidence", 0.0)),
+            )
+        )
+    return neighbors
+
+
+def classify_by_neighbors(
+    point_id: str, collection: str, client: Any = None
+) -> KnnVote | None:
+    """Classify a stored point from its labelled neighbourhood.
+
+    Fail-open: Qdrant errors are logged and return None, so the caller
+    falls through to the LLM provider chain.
+
+    Args:
+        point_id: Point being classified (must already be stored)
+        collection: Collection holding the point
+        client: Optional QdrantClient (default: shared client)
+
+    Returns:
+        KnnVote if the vote clears KNN_CONFIDENCE_THRESHOLD, else None
+    """
+    try:
+        if client is None:
+            from memory.qdrant_client import get_qdrant_client
+
+            client = get_qdrant_client()
+        neighbors = find_labelled_neighbors(client, collection, point_id)
+    except Exception as e:
+        logger.warning(
+            "knn_neighbor_query_failed",
+            extra={
+                "collection": collection,
+                "point_id": point_id,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+        )
+        return None
+
+    vote = weighted_vote(neighbors, collection)
+    if vote is None or vote.confidence < KNN_CONFIDENCE_THRESHOLD:
+        logger.debug(
+            "knn_vote_inconclusive",
+            extra={
+                "collection": collection,
+                "neighbors": len(neighbors),
+                "votes": vote.votes if vote else 0,
+                "confidence": round(vote.confidence, 3) if vote else 0.0,
+            },
+        )
+        return None
+    return vote
+
+
+def evaluate_thresholds(
+    samples: list[tuple[str, KnnVote | None]], thresholds: list[float]
+) -> list[dict[str, float | int]]:
+    """Score kNN votes against known labels at each acceptance threshold.
+
+    Args:
+        samples: (known_type, vote) pairs; vote None where too few neighbours
+        thresholds: Candidate KNN_CONFIDENCE_THRESHOLD values
+
+    Returns:
+        One row per threshold with ``coverage`` (share of samples the tier
+        would settle), ``accuracy`` (share of settled samples matching the
+        known type), plus raw ``accepted`` and ``correct`` counts
+    """
+    rows = []
+    total = len(samples)
+    for threshold in thresholds:
+        accepted = [
+            (known, vote)
+            for known, vote in samples
+            if vote is not None and vote.confidence >= threshold
+        ]
+        correct = sum(1 for known, vote in accepted if vote.classified_type == known)
+        rows.append(
+            {
+                "threshold": threshold,
+                "coverage": len(accepted) / total if total else 0.0,
+                "accuracy": correct / len(accepted) if accepted else 0.0,
+                "accepted": len(accepted),
+                "correct": correct,
+            }
+        )
+    return rows
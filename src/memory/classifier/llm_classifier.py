@@ -5,29 +5,47 @@ Coordinates rule-based and LLM-based classification with provider fallback.
 TECH-DEBT-069: LLM-based memory classification system.
 """
 
+import asyncio
 import hashlib
 import logging
 import time
 from dataclasses import dataclass
+from typing import Any
 
+from .cache import classification_cache_key, get_classification_cache
 from .circuit_breaker import circuit_breaker  # FIX-10
 from .config import (
+    ANTHROPIC_MODEL,
+    BATCH_SIZE,
     CLASSIFIER_ENABLED,
     CONFIDENCE_THRESHOLD,
     FALLBACK_PROVIDERS,
+    KNN_ENABLED,
+    MAX_INPUT_CHARS,
+    OLLAMA_MODEL,
+    OPENROUTER_MODEL,
     PRIMARY_PROVIDER,
     SKIP_RECLASSIFICATION_TYPES,
     TIMEOUT_SECONDS,
     VALID_TYPES,
 )
-from .metrics import record_classification, record_fallback  # FIX-4
+from .knn import KNN_PROVIDER, classify_by_neighbors
+from .metrics import (  # FIX-4
+    record_batch_items,
+    record_cache_lookup,
+    record_classification,
+    record_fallback,
+)
+from .prompts import BATCH_CLASSIFICATION_PROMPT, CLASSIFICATION_PROMPT
 from .providers import (
     BaseProvider,
+    BatchProviderResponse,
     ClaudeProvider,
     OllamaProvider,
     OpenAIProvider,
     OpenRouterProvider,
 )
+from .providers.openai import OPENAI_MODEL
 from .rate_limiter import rate_limiter  # FIX-11
 from .rules import classify_by_rules
 from .significance import Significance, check_significance
@@ -49,7 +67,14 @@ except ImportError:
 
 logger = logging.getLogger("ai_memory.classifier.llm_classifier")
 
-__all__ = ["ClassificationResult", "classify"]
+__all__ = [
+    "ClassificationRequest",
+    "ClassificationResult",
+    "aclose_providers",
+    "classify",
+    "classify_batch",
+    "classify_batch_async",
+]
 
 # Module-level provider chain cache for performance
 _provider_chain_cache: list[BaseProvider] | None = None
@@ -150,11 +175,31 @@ class ClassificationResult:
     output_tokens: int = 0
 
 
+@dataclass
+class ClassificationRequest:
+    """One item for classify_batch().
+
+    Attributes:
+        content: The content to classify
+        collection: Target collection (code-patterns, conventions, discussions)
+        current_type: Current memory type
+        file_path: Optional file path for context
+        point_id: Stored Qdrant point ID; enables the kNN tier
+    """
+
+    content: str
+    collection: str
+    current_type: str
+    file_path: str | None = None
+    point_id: str | None = None
+
+
 def classify(
     content: str,
     collection: str,
     current_type: str,
     file_path: str | None = None,
+    point_id: str | None = None,
 ) -> ClassificationResult:
     """Classify content using rules first, then LLM if needed.
 
@@ -163,13 +208,16 @@ def classify(
     2. Check content significance (skip if SKIP or LOW)
     3. Check if type should be skipped (session, error_pattern)
     4. Try rule-based classification first
-    5. If no rule match, try LLM provider chain
+    5. If no rule match, check the classification cache
+    6. If the point is stored, vote among its classified neighbours (kNN)
+    7. If still unresolved, try LLM provider chain
 
     Args:
         content: The content to classify
         collection: Target collection (code-patterns, conventions, discussions)
         current_type: Current memory type
         file_path: Optional file path for context
+        point_id: Stored Qdrant point ID; enables the kNN tier
 
     Returns:
         ClassificationResult with classification details
@@ -186,6 +234,30 @@ def classify(
     # Validate collection parameter
     _validate_collection(collection)
 
+    pre_llm = _classify_without_llm(content, collection, current_type)
+    if pre_llm is not None:
+        return pre_llm
+
+    # No rule match - try kNN, then LLM provider chain
+    return _classify_with_llm(content, collection, current_type, file_path, point_id)
+
+
+def _classify_without_llm(
+    content: str, collection: str, current_type: str
+) -> ClassificationResult | None:
+    """Apply the checks that can settle a classification without an LLM.
+
+    Covers the enabled toggle, significance filter, protected types and
+    rule-based patterns (steps 1-4 of classify()).
+
+    Args:
+        content: The content to classify
+        collection: Target collection
+        current_type: Current memory type
+
+    Returns:
+        ClassificationResult if settled, None if the LLM chain is needed
+    """
     # Check if classification is enabled
     if not CLASSIFIER_ENABLED:
         logger.debug("classifier_disabled")
@@ -258,8 +330,156 @@ def classify(
             was_reclassified=was_reclassified,
         )
 
-    # No rule match - try LLM provider chain
-    return _classify_with_llm(content, collection, current_type, file_path)
+    return None
+
+
+def classify_batch(
+    requests: list[ClassificationRequest], batch_size: int = BATCH_SIZE
+) -> list[ClassificationResult]:
+    """Classify several items, packing LLM-bound ones into shared requests.
+
+    Each item goes through the same significance/rule/cache/kNN checks as
+    classify(). The remaining items are sent ``batch_size`` at a time in a
+    single provider request with a JSON-array response, so the prompt
+    preamble and one rate-limit unit are paid per batch instead of per item.
+    Elements that come back missing or malformed, and items no provider
+    could batch, are retried through the single-item path.
+
+    Args:
+        requests: Items to classify
+        batch_size: Max items per provider request (1 disables batching)
+
+    Returns:
+        One ClassificationResult per request, in order
+
+    Raises:
+        ValueError: If any request has an invalid collection
+    """
+    batch = _prepare_batch(requests)
+    for chunk in _batch_chunks(batch.pending, batch_size):
+        chunk_results = _classify_chunk_with_llm(
+            [requests[pos] for pos in chunk],
+            [batch.cache_keys[pos] for pos in chunk],
+            batch.project_name,
+            batch.cache,
+        )
+        for pos, result in zip(chunk, chunk_results, strict=True):
+            batch.results[pos] = result
+    return batch.results
+
+
+async def classify_batch_async(
+    requests: list[ClassificationRequest], batch_size: int = BATCH_SIZE
+) -> list[ClassificationResult]:
+    """Async classify_batch() for event-loop workers.
+
+    Same tiers and results as classify_batch(). The pre-LLM checks run in a
+    worker thread (the kNN vote is a blocking Qdrant query); the provider
+    chunks are then sent concurrently over each provider's shared async
+    client, at most MEMORY_CLASSIFIER_ASYNC_CONCURRENCY in flight per
+    provider. Throughput follows provider capacity rather than thread count.
+
+    Args:
+        requests: Items to classify
+        batch_size: Max items per provider request (1 disables batching)
+
+    Returns:
+        One ClassificationResult per request, in order
+
+    Raises:
+        ValueError: If any request has an invalid collection
+    """
+    batch = await asyncio.to_thread(_prepare_batch, requests)
+    chunks = _batch_chunks(batch.pending, batch_size)
+    chunk_results = await asyncio.gather(
+        *[
+            _aclassify_chunk_with_llm(
+                [requests[pos] for pos in chunk],
+                [batch.cache_keys[pos] for pos in chunk],
+                batch.project_name,
+                batch.cache,
+            )
+            for chunk in chunks
+        ]
+    )
+    for chunk, results in zip(chunks, chunk_results, strict=True):
+        for pos, result in zip(chunk, results, strict=True):
+            batch.results[pos] = result
+    return batch.results
+
+
+@dataclass
+class _PendingBatch:
+    """classify_batch() state after the checks that need no LLM.
+
+    Attributes:
+        results: Result per request; None where the LLM is still needed
+        pending: Positions still needing the LLM
+        cache_keys: Cache key per pending position (None when disabled)
+        project_name: Project label for metrics
+        cache: ClassificationCache, or None when disabled
+    """
+
+    results: list[ClassificationResult | None]
+    pending: list[int]
+    cache_keys: dict[int, str | None]
+    project_name: str = "unknown"
+    cache: Any = None
+
+
+def _prepare_batch(requests: list[ClassificationRequest]) -> _PendingBatch:
+    """Run the significance/rule/cache/kNN checks for every request.
+
+    Raises:
+        ValueError: If any request has an invalid collection
+    """
+    for request in requests:
+        _validate_collection(request.collection)
+
+    batch = _PendingBatch(results=[None] * len(requests), pending=[], cache_keys={})
+    llm_positions = []
+    for pos, request in enumerate(requests):
+        batch.results[pos] = _classify_without_llm(
+            request.content, request.collection, request.current_type
+        )
+        if batch.results[pos] is None:
+            llm_positions.append(pos)
+
+    if not llm_positions:
+        return batch
+
+    # BP-045: Detect project for multi-tenancy metric labels
+    batch.project_name = detect_project(os.getcwd()) if detect_project else "unknown"
+    batch.cache = get_classification_cache()
+
+    for pos in llm_positions:
+        request = requests[pos]
+        cached, batch.cache_keys[pos] = _lookup_cache(
+            batch.cache, request.content, request.collection, request.current_type
+        )
+        if batch.cache is not None:
+            record_cache_lookup(cached is not None, project=batch.project_name)
+        if cached is None and request.point_id:
+            cached = _classify_with_knn(
+                request.point_id,
+                request.collection,
+                request.current_type,
+                batch.project_name,
+            )
+        if cached is not None:
+            batch.results[pos] = cached
+        else:
+            batch.pending.append(pos)
+    return batch
+
+
+def _batch_chunks(pending: list[int], batch_size: int) -> list[list[int]]:
+    """Split pending positions into provider-request-sized chunks."""
+    batch_size = max(1, batch_size)
+    return [
+        pending[start : start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
 
 
 def _classify_with_llm(
@@ -267,6 +487,7 @@ def _classify_with_llm(
     collection: str,
     current_type: str,
     file_path: str | None = None,
+    point_id: str | None = None,
 ) -> ClassificationResult:
     """Classify using LLM provider chain with fallback.
 
@@ -275,6 +496,7 @@ def _classify_with_llm(
         collection: Target collection
         current_type: Current memory type
         file_path: Optional file path for context
+        point_id: Stored Qdrant point ID; enables the kNN tier
 
     Returns:
         ClassificationResult from successful provider or fallback to current_type
@@ -285,213 +507,405 @@ def _classify_with_llm(
     # BP-045: Detect project for multi-tenancy metric labels
     project_name = detect_project(os.getcwd()) if detect_project else "unknown"
 
+    # Repeats of already-classified content skip the provider chain
+    cache = get_classification_cache()
+    cached, cache_key = _lookup_cache(cache, content, collection, current_type)
+    if cache is not None:
+        record_cache_lookup(cached is not None, project=project_name)
+    if cached is not None:
+        return cached
+
+    # Confident neighbourhoods settle the type without an LLM call
+    if point_id:
+        knn_result = _classify_with_knn(
+            point_id, collection, current_type, project_name
+        )
+        if knn_result is not None:
+            return knn_result
+
+    return _classify_with_providers(
+        content, collection, current_type, project_name, cache, cache_key
+    )
+
+
+def _classify_with_knn(
+    point_id: str, collection: str, current_type: str, project_name: str
+) -> ClassificationResult | None:
+    """Classify a stored point by a weighted vote of its neighbours.
+
+    Args:
+        point_id: Stored Qdrant point ID
+        collection: Target collection
+        current_type: Current memory type
+        project_name: Project label for metrics
+
+    Returns:
+        ClassificationResult if the vote is confident, else None
+    """
+    if not KNN_ENABLED:
+        return None
+
+    start_time = time.time()
+    vote = classify_by_neighbors(point_id, collection)
+    if vote is None:
+        return None
+    latency_seconds = time.time() - start_time
+
+    was_reclassified = vote.classified_type != current_type
+    record_classification(
+        provider=KNN_PROVIDER,
+        classified_type=vote.classified_type,
+        success=True,
+        latency_seconds=latency_seconds,
+        project=project_name,
+        confidence=vote.confidence,
+    )
+    logger.info(
+        "knn_classification",
+        extra={
+            "original_type": current_type,
+            "classified_type": vote.classified_type,
+            "confidence": round(vote.confidence, 3),
+            "votes": vote.votes,
+            "was_reclassified": was_reclassified,
+        },
+    )
+    return ClassificationResult(
+        original_type=current_type,
+        classified_type=vote.classified_type,
+        confidence=vote.confidence,
+        reasoning=(
+            f"{vote.votes} classified neighbours, "
+            f"{vote.confidence:.0%} weighted agreement"
+        ),
+        tags=[],
+        provider_used=KNN_PROVIDER,
+        was_reclassified=was_reclassified,
+    )
+
+
+def _lookup_cache(
+    cache, content: str, collection: str, current_type: str
+) -> tuple[ClassificationResult | None, str | None]:
+    """Look up a cached classification.
+
+    Args:
+        cache: ClassificationCache or None when disabled
+        content: The content to classify
+        collection: Target collection
+        current_type: Current memory type
+
+    Returns:
+        Tuple of (cached result or None, cache key or None when disabled)
+    """
+    if cache is None:
+        return None, None
+
+    cache_key = classification_cache_key(
+        content, collection, current_type, _get_cache_config_hash()
+    )
+    cached = _result_from_cache(cache.get(cache_key), collection, current_type)
+    if cached is not None:
+        logger.info(
+            "classification_cache_hit",
+            extra={
+                "provider": cached.provider_used,
+                "original_type": current_type,
+                "classified_type": cached.classified_type,
+                "hit_rate": round(cache.hit_rate, 3),
+            },
+        )
+    return cached, cache_key
+
+
+def _classify_with_providers(
+    content: str,
+    collection: str,
+    current_type: str,
+    project_name: str,
+    cache,
+    cache_key: str | None,
+) -> ClassificationResult:
+    """Run one item through the provider chain with fallback.
+
+    Args:
+        content: The content to classify
+        collection: Target collection
+        current_type: Current memory type
+        project_name: Project label for metrics
+        cache: ClassificationCache for storing the result, or None
+        cache_key: Key to store the result under, or None
+
+    Returns:
+        ClassificationResult from successful provider or fallback to current_type
+    """
     # Get cached provider chain (builds if needed)
     providers = _get_provider_chain()
 
     if not providers:
-        logger.warning("no_providers_available")
-        return ClassificationResult(
-            original_type=current_type,
-            classified_type=current_type,
-            confidence=1.0,
-            reasoning="No LLM providers available",
-            tags=[],
-            provider_used="none",
-            was_reclassified=False,
-        )
+        return _no_providers_result(current_type)
 
     # Try each provider in order with circuit breaker and rate limiting
     last_error = None
     for idx, provider in enumerate(providers):
         provider_name = provider.name
+        next_provider = _next_provider_name(providers, idx)
+
+        skip_reason = _provider_gate(provider_name)
+        if skip_reason is None and not provider.is_available():
+            skip_reason = "unavailable"
+        if skip_reason is not None:
+            _skip_provider(provider_name, skip_reason, next_provider, project_name)
+            continue
 
+        logger.info(
+            "attempting_classification",
+            extra={"provider": provider_name},
+        )
+
+        # Track latency
+        start_time = time.time()
         try:
-            # FIX-10: Check circuit breaker
-            if not circuit_breaker.is_available(provider_name):
-                logger.debug(
-                    "provider_circuit_open",
-                    extra={"provider": provider_name},
-                )
-                # Record fallback if there's a next provider
-                if idx < len(providers) - 1:
-                    record_fallback(
-                        provider_name,
-                        providers[idx + 1].name,
-                        "circuit_open",
-                        project=project_name,
-                    )
-                continue
-
-            # FIX-11: Check rate limit
-            if not rate_limiter.allow_request(provider_name):
-                logger.debug(
-                    "provider_rate_limited",
-                    extra={"provider": provider_name},
-                )
-                # Record fallback if there's a next provider
-                if idx < len(providers) - 1:
-                    record_fallback(
-                        provider_name,
-                        providers[idx + 1].name,
-                        "rate_limited",
-                        project=project_name,
-                    )
-                continue
-
-            # Check provider availability
-            if not provider.is_available():
-                logger.debug(
-                    "provider_unavailable",
-                    extra={"provider": provider_name},
-                )
-                circuit_breaker.record_failure(provider_name, "unavailable")
-                if idx < len(providers) - 1:
-                    record_fallback(
-                        provider_name,
-                        providers[idx + 1].name,
-                        "unavailable",
-                        project=project_name,
-                    )
-                continue
-
-            logger.info(
-                "attempting_classification",
-                extra={"provider": provider_name},
+            response = provider.classify(content, collection, current_type)
+        except (TimeoutError, ConnectionError, ValueError) as e:
+            _record_provider_failure(
+                provider_name,
+                e,
+                time.time() - start_time,
+                current_type,  # Kept original type
+                next_provider,
+                project_name,
+                "provider_failed",
             )
+            last_error = e
+            continue
 
-            # Track latency
-            start_time = time.time()
-            response = provider.classify(content, collection, current_type)
-            latency_seconds = time.time() - start_time
+        result = _accept_if_confident(
+            provider_name,
+            response,
+            collection,
+            current_type,
+            time.time() - start_time,
+            project_name,
+            cache,
+            cache_key,
+        )
+        if result is not None:
+            return result
 
-            # Validate classified type against collection
-            validated_type = _validate_classification(
-                response.classified_type, collection, current_type
-            )
+    return _all_providers_failed_result(current_type, last_error)
 
-            # Check if confidence meets threshold
-            if response.confidence >= CONFIDENCE_THRESHOLD:
-                was_reclassified = validated_type != current_type
-
-                # Record success in circuit breaker
-                circuit_breaker.record_success(provider_name)
-
-                # Record metrics
-                record_classification(
-                    provider=provider_name,
-                    classified_type=validated_type,
-                    success=True,
-                    latency_seconds=latency_seconds,
-                    project=project_name,
-                    confidence=response.confidence,
-                    input_tokens=response.input_tokens,
-                    output_tokens=response.output_tokens,
-                )
 
-                # TECH-DEBT-071: Push token metrics to Pushgateway
-                # CRITICAL-3: Type validation to prevent metric corruption
-                # HIGH-2: Use detected project name instead of hardcoded "classifier"
-                if (
-                    push_token_metrics_async
-                    and isinstance(response.input_tokens, int)
-                    and response.input_tokens > 0
-                ):
-                    push_token_metrics_async(
-                        operation="classification",
-                        direction="input",
-                        project=project_name,
-                        token_count=response.input_tokens,
-                    )
-
-                if (
-                    push_token_metrics_async
-                    and isinstance(response.output_tokens, int)
-                    and response.output_tokens > 0
-                ):
-                    push_token_metrics_async(
-                        operation="classification",
-                        direction="output",
-                        project=project_name,
-                        token_count=response.output_tokens,
-                    )
-
-                logger.info(
-                    "llm_classification_success",
-                    extra={
-                        "provider": provider_name,
-                        "original_type": current_type,
-                        "classified_type": validated_type,
-                        "confidence": response.confidence,
-                        "was_reclassified": was_reclassified,
-                        "latency_seconds": latency_seconds,
-                    },
-                )
+async def _aclassify_with_providers(
+    content: str,
+    collection: str,
+    current_type: str,
+    project_name: str,
+    cache,
+    cache_key: str | None,
+) -> ClassificationResult:
+    """Async _classify_with_providers() over the providers' async clients."""
+    providers = _get_provider_chain()
 
-                return ClassificationResult(
-                    original_type=current_type,
-                    classified_type=validated_type,
-                    confidence=response.confidence,
-                    reasoning=response.reasoning,
-                    tags=response.tags,
-                    provider_used=provider_name,
-                    was_reclassified=was_reclassified,
-                    model_name=response.model_name,
-                    input_tokens=response.input_tokens,
-                    output_tokens=response.output_tokens,
-                )
-            else:
-                logger.debug(
-                    "confidence_below_threshold",
-                    extra={
-                        "provider": provider.name,
-                        "confidence": response.confidence,
-                        "threshold": CONFIDENCE_THRESHOLD,
-                    },
-                )
+    if not providers:
+        return _no_providers_result(current_type)
 
-        except (TimeoutError, ConnectionError, ValueError) as e:
-            error_type = type(e).__name__.lower()
-
-            # Record failure in circuit breaker
-            circuit_breaker.record_failure(provider_name, error_type)
-
-            # Record metrics
-            record_classification(
-                provider=provider_name,
-                classified_type=current_type,  # Kept original type
-                success=False,
-                latency_seconds=(
-                    time.time() - start_time if "start_time" in locals() else 0
-                ),
-                project=project_name,
-            )
+    last_error = None
+    for idx, provider in enumerate(providers):
+        provider_name = provider.name
+        next_provider = _next_provider_name(providers, idx)
 
-            # Record fallback if there's a next provider
-            if idx < len(providers) - 1:
-                record_fallback(
-                    provider_name,
-                    providers[idx + 1].name,
-                    error_type,
-                    project=project_name,
-                )
+        skip_reason = _provider_gate(provider_name)
+        if skip_reason is None and not await provider.ais_available():
+            skip_reason = "unavailable"
+        if skip_reason is not None:
+            _skip_provider(provider_name, skip_reason, next_provider, project_name)
+            continue
 
-            logger.warning(
+        logger.info(
+            "attempting_classification",
+            extra={"provider": provider_name},
+        )
+
+        start_time = time.time()
+        try:
+            response = await provider.aclassify(content, collection, current_type)
+        except (TimeoutError, ConnectionError, ValueError) as e:
+            _record_provider_failure(
+                provider_name,
+                e,
+                time.time() - start_time,
+                current_type,
+                next_provider,
+                project_name,
                 "provider_failed",
-                extra={
-                    "provider": provider_name,
-                    "error": str(e),
-                    "error_type": error_type,
-                },
             )
             last_error = e
             continue
 
-    # All providers failed
+        result = _accept_if_confident(
+            provider_name,
+            response,
+            collection,
+            current_type,
+            time.time() - start_time,
+            project_name,
+            cache,
+            cache_key,
+        )
+        if result is not None:
+            return result
+
+    return _all_providers_failed_result(current_type, last_error)
+
+
+def _next_provider_name(providers: list[BaseProvider], idx: int) -> str | None:
+    """Name of the provider after ``idx`` in the chain, if any."""
+    return providers[idx + 1].name if idx < len(providers) - 1 else None
+
+
+def _provider_gate(provider_name: str) -> str | None:
+    """Circuit breaker and rate limit checks before a provider attempt.
+
+    Returns:
+        Skip reason ("circuit_open" or "rate_limited"), or None to proceed
+    """
+    # FIX-10: Check circuit breaker
+    if not circuit_breaker.is_available(provider_name):
+        return "circuit_open"
+    # FIX-11: Check rate limit
+    if not rate_limiter.allow_request(provider_name):
+        return "rate_limited"
+    return None
+
+
+def _skip_provider(
+    provider_name: str,
+    reason: str,
+    next_provider: str | None,
+    project_name: str,
+    **extra,
+) -> None:
+    """Log and record a provider skipped before any request was sent."""
+    if reason == "unavailable":
+        circuit_breaker.record_failure(provider_name, "unavailable")
+    logger.debug(f"provider_{reason}", extra={"provider": provider_name, **extra})
+    # Record fallback if there's a next provider
+    if next_provider:
+        record_fallback(provider_name, next_provider, reason, project=project_name)
+
+
+def _record_provider_failure(
+    provider_name: str,
+    error: Exception,
+    latency_seconds: float,
+    classified_type: str,
+    next_provider: str | None,
+    project_name: str,
+    event: str,
+    **extra,
+) -> None:
+    """Record a failed provider request in the breaker, metrics and logs."""
+    error_type = type(error).__name__.lower()
+
+    # Record failure in circuit breaker
+    circuit_breaker.record_failure(provider_name, error_type)
+
+    record_classification(
+        provider=provider_name,
+        classified_type=classified_type,
+        success=False,
+        latency_seconds=latency_seconds,
+        project=project_name,
+    )
+
+    # Record fallback if there's a next provider
+    if next_provider:
+        record_fallback(provider_name, next_provider, error_type, project=project_name)
+
+    logger.warning(
+        event,
+        extra={
+            "provider": provider_name,
+            **extra,
+            "error": str(error),
+            "error_type": error_type,
+        },
+    )
+
+
+def _accept_if_confident(
+    provider_name: str,
+    response,
+    collection: str,
+    current_type: str,
+    latency_seconds: float,
+    project_name: str,
+    cache,
+    cache_key: str | None,
+) -> ClassificationResult | None:
+    """Accept a single-item response that meets the confidence threshold.
+
+    Returns:
+        ClassificationResult, or None to try the next provider
+    """
+    # Validate classified type against collection
+    validated_type = _validate_classification(
+        response.classified_type, collection, current_type
+    )
+
+    if response.confidence < CONFIDENCE_THRESHOLD:
+        logger.debug(
+            "confidence_below_threshold",
+            extra={
+                "provider": provider_name,
+                "confidence": response.confidence,
+                "threshold": CONFIDENCE_THRESHOLD,
+            },
+        )
+        return None
+
+    # Record success in circuit breaker
+    circuit_breaker.record_success(provider_name)
+
+    _push_token_metrics(project_name, response.input_tokens, response.output_tokens)
+
+    return _accept_llm_response(
+        provider_name,
+        response,
+        validated_type,
+        current_type,
+        latency_seconds,
+        project_name,
+        cache,
+        cache_key,
+    )
+
+
+def _no_providers_result(current_type: str) -> ClassificationResult:
+    logger.warning("no_providers_available")
+    return ClassificationResult(
+        original_type=current_type,
+        classified_type=current_type,
+        confidence=1.0,
+        reasoning="No LLM providers available",
+        tags=[],
+        provider_used="none",
+        was_reclassified=False,
+    )
+
+
+def _all_providers_failed_result(
+    current_type: str, last_error: Exception | None
+) -> ClassificationResult:
     logger.error(
         "all_providers_failed",
         extra={"last_error": str(last_error) if last_error else "Unknown"},
     )
+    return _kept_original_result(current_type)
 
+
+def _kept_original_result(current_type: str) -> ClassificationResult:
     return ClassificationResult(
         original_type=current_type,
         classified_type=current_type,
@@ -503,6 +917,443 @@ def _classify_with_llm(
     )
 
 
+def _classify_chunk_with_llm(
+    requests: list[ClassificationRequest],
+    cache_keys: list[str | None],
+    project_name: str,
+    cache,
+) -> list[ClassificationResult]:
+    """Classify a chunk of items with one request per provider attempt.
+
+    Providers are tried in chain order with the same circuit breaker, rate
+    limiter and availability checks as the single-item path; each attempt
+    costs one rate-limit unit for the whole chunk. Items answered below the
+    confidence threshold move on to the next provider. Malformed elements,
+    and items no provider could batch, go through _classify_with_providers().
+
+    Args:
+        requests: Items to classify (all past the pre-LLM and cache checks)
+        cache_keys: Cache key per item (None when the cache is disabled)
+        project_name: Project label for metrics
+        cache: ClassificationCache for storing results, or None
+
+    Returns:
+        One ClassificationResult per request, in order
+    """
+    if len(requests) == 1:
+        request = requests[0]
+        return [
+            _classify_with_providers(
+                request.content,
+                request.collection,
+                request.current_type,
+                project_name,
+                cache,
+                cache_keys[0],
+            )
+        ]
+
+    results: list[ClassificationResult | None] = [None] * len(requests)
+    pending = list(range(len(requests)))
+    answered: set[int] = set()
+    single: list[int] = []
+
+    providers = _get_provider_chain()
+    for idx, provider in enumerate(providers):
+        if not pending:
+            break
+        if not provider.supports_batch:
+            continue
+        provider_name = provider.name
+        next_provider = _next_provider_name(providers, idx)
+
+        skip_reason = _provider_gate(provider_name)
+        if skip_reason is None and not provider.is_available():
+            skip_reason = "unavailable"
+        if skip_reason is not None:
+            _skip_provider(
+                provider_name,
+                skip_reason,
+                next_provider,
+                project_name,
+                batch_size=len(pending),
+            )
+            continue
+
+        logger.info(
+            "attempting_batch_classification",
+            extra={"provider": provider_name, "batch_size": len(pending)},
+        )
+        start_time = time.time()
+        try:
+            response = provider.classify_batch(_batch_items(requests, pending))
+        except (TimeoutError, ConnectionError, ValueError) as e:
+            _record_provider_failure(
+                provider_name,
+                e,
+                time.time() - start_time,
+                "batch",
+                next_provider,
+                project_name,
+                "provider_batch_failed",
+                batch_size=len(pending),
+            )
+            continue
+
+        below_threshold, malformed = _apply_batch_response(
+            provider_name,
+            response,
+            requests,
+            pending,
+            cache_keys,
+            results,
+            time.time() - start_time,
+            project_name,
+            cache,
+        )
+        answered.update(below_threshold)
+        single.extend(malformed)
+        pending = below_threshold
+
+    single = _finish_chunk(requests, pending, answered, single, results)
+    for pos in single:
+        request = requests[pos]
+        results[pos] = _classify_with_providers(
+            request.content,
+            request.collection,
+            request.current_type,
+            project_name,
+            cache,
+            cache_keys[pos],
+        )
+
+    return results
+
+
+async def _aclassify_chunk_with_llm(
+    requests: list[ClassificationRequest],
+    cache_keys: list[str | None],
+    project_name: str,
+    cache,
+) -> list[ClassificationResult]:
+    """Async _classify_chunk_with_llm(); single-item retries run concurrently."""
+    if len(requests) == 1:
+        request = requests[0]
+        return [
+            await _aclassify_with_providers(
+                request.content,
+                request.collection,
+                request.current_type,
+                project_name,
+                cache,
+                cache_keys[0],
+            )
+        ]
+
+    results: list[ClassificationResult | None] = [None] * len(requests)
+    pending = list(range(len(requests)))
+    answered: set[int] = set()
+    single: list[int] = []
+
+    providers = _get_provider_chain()
+    for idx, provider in enumerate(providers):
+        if not pending:
+            break
+        if not provider.supports_batch:
+            continue
+        provider_name = provider.name
+        next_provider = _next_provider_name(providers, idx)
+
+        skip_reason = _provider_gate(provider_name)
+        if skip_reason is None and not await provider.ais_available():
+            skip_reason = "unavailable"
+        if skip_reason is not None:
+            _skip_provider(
+                provider_name,
+                skip_reason,
+                next_provider,
+                project_name,
+                batch_size=len(pending),
+            )
+            continue
+
+        logger.info(
+            "attempting_batch_classification",
+            extra={"provider": provider_name, "batch_size": len(pending)},
+        )
+        start_time = time.time()
+        try:
+            response = await provider.aclassify_batch(_batch_items(requests, pending))
+        except (TimeoutError, ConnectionError, ValueError) as e:
+            _record_provider_failure(
+                provider_name,
+                e,
+                time.time() - start_time,
+                "batch",
+                next_provider,
+                project_name,
+                "provider_batch_failed",
+                batch_size=len(pending),
+            )
+            continue
+
+        below_threshold, malformed = _apply_batch_response(
+            provider_name,
+            response,
+            requests,
+            pending,
+            cache_keys,
+            results,
+            time.time() - start_time,
+            project_name,
+            cache,
+        )
+        answered.update(below_threshold)
+        single.extend(malformed)
+        pending = below_threshold
+
+    single = _finish_chunk(requests, pending, answered, single, results)
+    single_results = await asyncio.gather(
+        *[
+            _aclassify_with_providers(
+                requests[pos].content,
+                requests[pos].collection,
+                requests[pos].current_type,
+                project_name,
+                cache,
+                cache_keys[pos],
+            )
+            for pos in single
+        ]
+    )
+    for pos, result in zip(single, single_results, strict=True):
+        results[pos] = result
+
+    return results
+
+
+def _batch_items(
+    requests: list[ClassificationRequest], positions: list[int]
+) -> list[tuple[str, str, str]]:
+    return [
+        (requests[pos].content, requests[pos].collection, requests[pos].current_type)
+        for pos in positions
+    ]
+
+
+def _apply_batch_response(
+    provider_name: str,
+    response: BatchProviderResponse,
+    requests: list[ClassificationRequest],
+    pending: list[int],
+    cache_keys: list[str | None],
+    results: list[ClassificationResult | None],
+    latency_seconds: float,
+    project_name: str,
+    cache,
+) -> tuple[list[int], list[int]]:
+    """Accept the confident elements of a batch response into ``results``.
+
+    Returns:
+        Tuple of (positions answered below threshold, malformed positions)
+    """
+    circuit_breaker.record_success(provider_name)
+    _push_token_metrics(project_name, response.input_tokens, response.output_tokens)
+
+    token_shares = _split_tokens(response, len(pending))
+    below_threshold = []
+    malformed = []
+    for pos, element, (input_tokens, output_tokens) in zip(
+        pending, response.results, token_shares, strict=True
+    ):
+        if element is None:
+            malformed.append(pos)
+            continue
+        request = requests[pos]
+        validated_type = _validate_classification(
+            element.classified_type, request.collection, request.current_type
+        )
+        if element.confidence < CONFIDENCE_THRESHOLD:
+            below_threshold.append(pos)
+            continue
+        element.input_tokens = input_tokens
+        element.output_tokens = output_tokens
+        results[pos] = _accept_llm_response(
+            provider_name,
+            element,
+            validated_type,
+            request.current_type,
+            latency_seconds,
+            project_name,
+            cache,
+            cache_keys[pos],
+        )
+
+    classified = len(pending) - len(below_threshold) - len(malformed)
+    record_batch_items(provider_name, "classified", classified, project_name)
+    record_batch_items(
+        provider_name, "low_confidence", len(below_threshold), project_name
+    )
+    record_batch_items(provider_name, "single_fallback", len(malformed), project_name)
+    return below_threshold, malformed
+
+
+def _finish_chunk(
+    requests: list[ClassificationRequest],
+    pending: list[int],
+    answered: set[int],
+    single: list[int],
+    results: list[ClassificationResult | None],
+) -> list[int]:
+    """Settle items left after the batch attempts.
+
+    Items some provider answered (below threshold everywhere) keep their
+    original type, as on the single-item path. The rest join the malformed
+    elements in ``single``.
+
+    Returns:
+        Positions to retry through the single-item path, in order
+    """
+    single = list(single)
+    for pos in pending:
+        if pos in answered:
+            results[pos] = _kept_original_result(requests[pos].current_type)
+        else:
+            single.append(pos)
+
+    if single:
+        logger.info(
+            "batch_single_fallback",
+            extra={"count": len(single), "batch_size": len(requests)},
+        )
+    return sorted(single)
+
+
+def _split_tokens(response: BatchProviderResponse, count: int) -> list[tuple[int, int]]:
+    """Spread a batch request's token usage evenly across its items."""
+    shares = []
+    for i in range(count):
+        shares.append(
+            (
+                response.input_tokens // count
+                + (1 if i < response.input_tokens % count else 0),
+                response.output_tokens // count
+                + (1 if i < response.output_tokens % count else 0),
+            )
+        )
+    return shares
+
+
+def _push_token_metrics(project_name: str, input_tokens, output_tokens) -> None:
+    """Push token usage of one provider request to Pushgateway.
+
+    Args:
+        project_name: Project label
+        input_tokens: Input tokens used by the request
+        output_tokens: Output tokens used by the request
+    """
+    # TECH-DEBT-071: Push token metrics to Pushgateway
+    # CRITICAL-3: Type validation to prevent metric corruption
+    # HIGH-2: Use detected project name instead of hardcoded "classifier"
+    if push_token_metrics_async and isinstance(input_tokens, int) and input_tokens > 0:
+        push_token_metrics_async(
+            operation="classification",
+            direction="input",
+            project=project_name,
+            token_count=input_tokens,
+        )
+
+    if (
+        push_token_metrics_async
+        and isinstance(output_tokens, int)
+        and output_tokens > 0
+    ):
+        push_token_metrics_async(
+            operation="classification",
+            direction="output",
+            project=project_name,
+            token_count=output_tokens,
+        )
+
+
+def _accept_llm_response(
+    provider_name: str,
+    response,
+    validated_type: str,
+    current_type: str,
+    latency_seconds: float,
+    project_name: str,
+    cache,
+    cache_key: str | None,
+) -> ClassificationResult:
+    """Record and cache an above-threshold LLM classification.
+
+    Args:
+        provider_name: Provider that produced the response
+        response: ProviderResponse (tokens are this item's share)
+        validated_type: Type after _validate_classification()
+        current_type: Current memory type
+        latency_seconds: Provider request latency
+        project_name: Project label for metrics
+        cache: ClassificationCache, or None
+        cache_key: Key to store the result under, or None
+
+    Returns:
+        ClassificationResult for the item
+    """
+    was_reclassified = validated_type != current_type
+
+    # Record metrics
+    record_classification(
+        provider=provider_name,
+        classified_type=validated_type,
+        success=True,
+        latency_seconds=latency_seconds,
+        project=project_name,
+        confidence=response.confidence,
+        input_tokens=response.input_tokens,
+        output_tokens=response.output_tokens,
+    )
+
+    if cache is not None and cache_key is not None:
+        cache.put(
+            cache_key,
+            {
+                "classified_type": validated_type,
+                "confidence": response.confidence,
+                "reasoning": response.reasoning,
+                "tags": response.tags,
+                "provider_used": provider_name,
+                "model_name": response.model_name,
+            },
+        )
+
+    logger.info(
+        "llm_classification_success",
+        extra={
+            "provider": provider_name,
+            "original_type": current_type,
+            "classified_type": validated_type,
+            "confidence": response.confidence,
+            "was_reclassified": was_reclassified,
+            "latency_seconds": latency_seconds,
+        },
+    )
+
+    return ClassificationResult(
+        original_type=current_type,
+        classified_type=validated_type,
+        confidence=response.confidence,
+        reasoning=response.reasoning,
+        tags=response.tags,
+        provider_used=provider_name,
+        was_reclassified=was_reclassified,
+        model_name=response.model_name,
+        input_tokens=response.input_tokens,
+        output_tokens=response.output_tokens,
+    )
+
+
 def _get_config_hash() -> str:
     """Get hash of current config to detect changes.
 
@@ -513,6 +1364,64 @@ def _get_config_hash() -> str:
     return hashlib.md5(config_str.encode()).hexdigest()
 
 
+def _get_cache_config_hash() -> str:
+    """Get hash of everything that shapes an LLM classification.
+
+    Extends _get_config_hash() with models, input truncation and the prompt
+    template, so cached classifications are invalidated when any change.
+
+    Returns:
+        SHA-256 hash used in classification cache keys
+    """
+    parts = [
+        _get_config_hash(),
+        OLLAMA_MODEL,
+        OPENROUTER_MODEL,
+        ANTHROPIC_MODEL,
+        OPENAI_MODEL,
+        str(MAX_INPUT_CHARS),
+        CLASSIFICATION_PROMPT,
+        BATCH_CLASSIFICATION_PROMPT,
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _result_from_cache(
+    entry: dict | None, collection: str, current_type: str
+) -> ClassificationResult | None:
+    """Rebuild a ClassificationResult from a cache entry.
+
+    Entries below the current confidence threshold are ignored, and the
+    type is re-validated against the current VALID_TYPES.
+
+    Args:
+        entry: Cached result dict (or None on miss)
+        collection: Target collection
+        current_type: Current memory type
+
+    Returns:
+        ClassificationResult with zero token usage, or None if unusable
+    """
+    if not entry or entry.get("confidence", 0.0) < CONFIDENCE_THRESHOLD:
+        return None
+    try:
+        validated_type = _validate_classification(
+            entry["classified_type"], collection, current_type
+        )
+        return ClassificationResult(
+            original_type=current_type,
+            classified_type=validated_type,
+            confidence=float(entry["confidence"]),
+            reasoning=entry.get("reasoning", ""),
+            tags=list(entry.get("tags") or []),
+            provider_used=entry["provider_used"],
+            was_reclassified=validated_type != current_type,
+            model_name=entry.get("model_name", ""),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def _get_provider_chain() -> list[BaseProvider]:
     """Get cached provider chain, rebuilding if config changed.
 
@@ -536,6 +1445,22 @@ def _get_provider_chain() -> list[BaseProvider]:
     return _provider_chain_cache
 
 
+async def aclose_providers() -> None:
+    """Close the async HTTP clients of every provider in the cached chain.
+
+    Called by long-running workers during graceful shutdown, on the loop
+    that created the clients. Errors are logged; shutdown continues.
+    """
+    for provider in _provider_chain_cache or []:
+        try:
+            await provider.aclose()
+        except Exception as e:
+            logger.warning(
+                "provider_aclose_failed",
+                extra={"provider": provider.name, "error": str(e)},
+            )
+
+
 def _build_provider_chain() -> list[BaseProvider]:
     """Build provider chain from configuration.
 
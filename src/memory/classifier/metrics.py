@@ -11,6 +11,8 @@ from prometheus_client import Counter, Gauge, Histogram
 logger = logging.getLogger("ai_memory.classifier.metrics")
 
 __all__ = [
+    "classifier_batch_items_total",
+    "classifier_cache_lookups_total",
     "classifier_confidence",
     "classifier_cost_microdollars",
     "classifier_fallbacks_total",
@@ -20,6 +22,8 @@ __all__ = [
     "classifier_rule_matches_total",
     "classifier_significance_skips_total",
     "classifier_tokens_total",
+    "record_batch_items",
+    "record_cache_lookup",
     "record_classification",
     "record_fallback",
     "record_rule_match",
@@ -87,6 +91,24 @@ classifier_queue_size = Gauge(
     ["project"],
 )
 
+# Classification cache (hit rate = hit / (hit + miss))
+classifier_cache_lookups_total = Counter(
+    "aimemory_classifier_cache_lookups_total",
+    "Classification cache lookups before the LLM provider chain",
+    ["project", "result"],  # result: hit/miss
+)
+
+# Batched LLM requests (items per outcome; requests = rate-limit units)
+classifier_batch_items_total = Counter(
+    "aimemory_classifier_batch_items_total",
+    "Items sent in batched classification requests, by outcome",
+    [
+        "project",
+        "provider",
+        "outcome",
+    ],  # outcome: classified/low_confidence/single_fallback
+)
+
 # Confidence distribution
 classifier_confidence = Histogram(
     "aimemory_classifier_confidence",
@@ -246,3 +268,38 @@ def record_significance_skip(level: str, project: str = "unknown"):
     classifier_significance_skips_total.labels(project=project, level=level).inc()
 
     logger.debug("significance_skip_recorded", extra={"level": level})
+
+
+def record_cache_lookup(hit: bool, project: str = "unknown"):
+    """Record a classification cache lookup.
+
+    Args:
+        hit: True if the result was served from the cache
+        project: Project identifier for multi-tenancy isolation
+
+    Example:
+        >>> record_cache_lookup(True, project="my-app")
+    """
+    classifier_cache_lookups_total.labels(
+        project=project, result="hit" if hit else "miss"
+    ).inc()
+
+
+def record_batch_items(
+    provider: str, outcome: str, count: int, project: str = "unknown"
+):
+    """Record items from a batched classification request.
+
+    Args:
+        provider: Provider that served the batch
+        outcome: classified, low_confidence or single_fallback
+        count: Number of items with this outcome
+        project: Project identifier for multi-tenancy isolation
+
+    Example:
+        >>> record_batch_items("ollama", "classified", 4, project="my-app")
+    """
+    if count > 0:
+        classifier_batch_items_total.labels(
+            project=project, provider=provider, outcome=outcome
+        ).inc(count)
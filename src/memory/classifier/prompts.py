@@ -5,13 +5,15 @@ Provides structured prompts for LLM-based memory classification.
 TECH-DEBT-069: LLM-based memory classification system.
 """
 
-__all__ = ["CLASSIFICATION_PROMPT", "build_classification_prompt"]
+__all__ = [
+    "BATCH_CLASSIFICATION_PROMPT",
+    "CLASSIFICATION_PROMPT",
+    "build_batch_classification_prompt",
+    "build_classification_prompt",
+]
 
-CLASSIFICATION_PROMPT = """You are a memory classifier for a software development AI assistant.
-
-Classify this memory into EXACTLY ONE type based on its content.
-
-## MEMORY TYPES
+# Type catalogue and rules shared by the single-item and batch prompts
+_TYPES_AND_RULES = """## MEMORY TYPES
 
 ### code-patterns collection (HOW things are built):
 - **implementation**: How a feature was built, code patterns, architecture
@@ -43,7 +45,16 @@ Classify this memory into EXACTLY ONE type based on its content.
 4. "rule" requires strong language (MUST/NEVER), otherwise use "guideline"
 5. If unsure between types, prefer the default (user_message/agent_response)
 
-## CONTENT TO CLASSIFY
+"""
+
+CLASSIFICATION_PROMPT = (
+    """You are a memory classifier for a software development AI assistant.
+
+Classify this memory into EXACTLY ONE type based on its content.
+
+"""
+    + _TYPES_AND_RULES
+    + """## CONTENT TO CLASSIFY
 Collection: {collection}
 Current Type: {current_type}{file_path_line}
 
@@ -61,6 +72,42 @@ Respond with valid JSON only, no markdown:
   "tags": ["<relevant>", "<tags>"],
   "is_significant": <true if valuable for future sessions, false otherwise>
 }}"""
+)
+
+BATCH_CLASSIFICATION_PROMPT = (
+    """You are a memory classifier for a software development AI assistant.
+
+Classify EACH of the {count} numbered memories below into EXACTLY ONE type
+based on its own content. Classify every memory independently.
+
+"""
+    + _TYPES_AND_RULES
+    + """## CONTENT TO CLASSIFY
+{items}
+
+## RESPONSE FORMAT
+Respond with a valid JSON array only, no markdown, with exactly one object per
+memory in the same order:
+[
+  {{
+    "index": <memory number>,
+    "classified_type": "<type from list above>",
+    "confidence": <0.0-1.0>,
+    "reasoning": "<brief 1-sentence explanation>",
+    "tags": ["<relevant>", "<tags>"],
+    "is_significant": <true if valuable for future sessions, false otherwise>
+  }}
+]"""
+)
+
+_BATCH_ITEM = """### Memory {index}
+Collection: {collection}
+Current Type: {current_type}
+
+Content:
+---
+{content}
+---"""
 
 
 def build_classification_prompt(
@@ -80,12 +127,7 @@ def build_classification_prompt(
     Returns:
         Formatted prompt string
     """
-    # Truncate content if too long
-    from .config import MAX_INPUT_CHARS
-
-    truncated_content = content
-    if len(content) > MAX_INPUT_CHARS:
-        truncated_content = content[:MAX_INPUT_CHARS] + "\n\n[...truncated]"
+    truncated_content = _truncate(content)
 
     # FIX-3: Build file path line BEFORE formatting (fixes placeholder bug)
     file_path_line = f"\nFile Path: {file_path}" if file_path else ""
@@ -99,3 +141,35 @@ def build_classification_prompt(
     )
 
     return prompt
+
+
+def build_batch_classification_prompt(items: list[tuple[str, str, str]]) -> str:
+    """Build one prompt that classifies several memories at once.
+
+    Each item is truncated to MAX_INPUT_CHARS like the single-item prompt.
+
+    Args:
+        items: (content, collection, current_type) tuples, numbered from 1
+
+    Returns:
+        Formatted prompt string asking for a JSON array response
+    """
+    rendered = "\n\n".join(
+        _BATCH_ITEM.format(
+            index=index,
+            collection=collection,
+            current_type=current_type,
+            content=_truncate(content),
+        )
+        for index, (content, collection, current_type) in enumerate(items, start=1)
+    )
+    return BATCH_CLASSIFICATION_PROMPT.format(count=len(items), items=rendered)
+
+
+def _truncate(content: str) -> str:
+    """Truncate content to MAX_INPUT_CHARS with a marker."""
+    from .config import MAX_INPUT_CHARS
+
+    if len(content) > MAX_INPUT_CHARS:
+        return content[:MAX_INPUT_CHARS] + "\n\n[...truncated]"
+    return content
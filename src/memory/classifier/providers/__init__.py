@@ -5,7 +5,7 @@ Exports all available LLM providers for memory classification.
 TECH-DEBT-069: LLM-based memory classification system.
 """
 
-from .base import BaseProvider, ProviderResponse
+from .base import BaseProvider, BatchProviderResponse, ProviderResponse
 from .claude import ClaudeProvider
 from .ollama import OllamaProvider
 from .openai import OpenAIProvider
@@ -13,6 +13,7 @@ from .openrouter import OpenRouterProvider
 
 __all__ = [
     "BaseProvider",
+    "BatchProviderResponse",
     "ClaudeProvider",
     "OllamaProvider",
     "OpenAIProvider",
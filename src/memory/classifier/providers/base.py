@@ -2,18 +2,34 @@
 
 Defines the interface that all classification providers must implement.
 
+Async counterparts (aclassify, aclassify_batch, ais_available) let event-loop
+workers call providers without a thread per request. Providers with a native
+async client override _acomplete(); each provider keeps one async client per
+event loop, so every coroutine on the loop shares its connection pool, and
+in-flight requests are capped at ASYNC_CONCURRENCY per provider.
+
 TECH-DEBT-069: LLM-based memory classification system.
 """
 
+import asyncio
 import json
 import logging
 import re
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
+
+from ..config import ASYNC_CONCURRENCY, MAX_OUTPUT_TOKENS
+from ..langfuse_instrument import langfuse_generation
 
 logger = logging.getLogger("ai_memory.classifier.providers")
 
-__all__ = ["BaseProvider", "ProviderResponse"]
+__all__ = ["BaseProvider", "BatchProviderResponse", "ProviderResponse"]
+
+# Ceiling on the output budget of one batched request
+_MAX_BATCH_OUTPUT_TOKENS = 4000
 
 
 @dataclass
@@ -39,6 +55,24 @@ class ProviderResponse:
     model_name: str = ""
 
 
+@dataclass
+class BatchProviderResponse:
+    """Response from a multi-item classification request.
+
+    Attributes:
+        results: One entry per requested item, in request order; None where
+            the element was missing or malformed
+        input_tokens: Input tokens used by the whole request
+        output_tokens: Output tokens used by the whole request
+        model_name: Specific model used
+    """
+
+    results: list[ProviderResponse | None]
+    input_tokens: int
+    output_tokens: int
+    model_name: str = ""
+
+
 class BaseProvider(ABC):
     """Abstract base class for classification providers.
 
@@ -52,6 +86,9 @@ class BaseProvider(ABC):
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
+        # Async clients and semaphores are bound to the loop that created them
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._async_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     @abstractmethod
     def classify(
@@ -93,6 +130,346 @@ class BaseProvider(ABC):
         """
         pass
 
+    @property
+    def supports_batch(self) -> bool:
+        """True if the provider implements _complete() for batched requests."""
+        return type(self)._complete is not BaseProvider._complete
+
+    def _complete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Send a raw prompt and return the completion.
+
+        Providers implement this to support classify_batch().
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token budget
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If provider is unreachable
+            ValueError: If the API response is malformed
+        """
+        raise NotImplementedError(f"{self.name} does not support batched requests")
+
+    def classify_batch(
+        self, items: list[tuple[str, str, str]]
+    ) -> BatchProviderResponse:
+        """Classify several items in a single provider request.
+
+        The shared prompt preamble is sent once and the model answers with
+        a JSON array. Elements that are missing or fail validation come
+        back as None so the caller can retry them individually.
+
+        Args:
+            items: (content, collection, current_type) tuples
+
+        Returns:
+            BatchProviderResponse with one result slot per item
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If provider is unreachable
+            ValueError: If the response contains no JSON array at all
+        """
+        prompt, max_tokens = self._batch_prompt(items)
+
+        with langfuse_generation(self.name, self._model_name) as gen:
+            gen.update(input_text=prompt)
+            try:
+                completion = self._complete(prompt, max_tokens)
+            except (TimeoutError, ConnectionError, ValueError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+            return self._batch_response(gen, completion, len(items))
+
+    async def aclassify_batch(
+        self, items: list[tuple[str, str, str]]
+    ) -> BatchProviderResponse:
+        """Async classify_batch() through _acomplete().
+
+        Args:
+            items: (content, collection, current_type) tuples
+
+        Returns:
+            BatchProviderResponse with one result slot per item
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If provider is unreachable
+            ValueError: If the response contains no JSON array at all
+        """
+        prompt, max_tokens = self._batch_prompt(items)
+
+        with langfuse_generation(self.name, self._model_name) as gen:
+            gen.update(input_text=prompt)
+            try:
+                async with self._async_slot():
+                    completion = await self._acomplete(prompt, max_tokens)
+            except (TimeoutError, ConnectionError, ValueError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+            return self._batch_response(gen, completion, len(items))
+
+    async def aclassify(
+        self, content: str, collection: str, current_type: str
+    ) -> ProviderResponse:
+        """Async classify().
+
+        Providers with a native async client go through _acomplete();
+        others run their sync classify() in a worker thread.
+
+        Args:
+            content: The content to classify
+            collection: Target collection
+            current_type: Current memory type
+
+        Returns:
+            ProviderResponse with classification results
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If provider is unreachable
+            ValueError: If response is invalid
+        """
+        if not self.supports_async:
+            return await asyncio.to_thread(
+                self.classify, content, collection, current_type
+            )
+
+        from ..prompts import build_classification_prompt
+
+        prompt = build_classification_prompt(content, collection, current_type)
+
+        with langfuse_generation(self.name, self._model_name) as gen:
+            gen.update(input_text=prompt)
+            try:
+                async with self._async_slot():
+                    response_text, input_tokens, output_tokens = await self._acomplete(
+                        prompt, MAX_OUTPUT_TOKENS
+                    )
+                classification = self._parse_response(response_text)
+            except ValueError as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                logger.error(
+                    "async_parse_error", extra={"provider": self.name, "error": str(e)}
+                )
+                raise ValueError(f"Invalid {self.name} response: {e}") from e
+            except (TimeoutError, ConnectionError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+
+            gen.update(
+                output_text=response_text,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata={
+                    "classified_type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                },
+            )
+
+        logger.info(
+            "async_classification_success",
+            extra={
+                "provider": self.name,
+                "type": classification["classified_type"],
+                "confidence": classification["confidence"],
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            },
+        )
+        return ProviderResponse(
+            classified_type=classification["classified_type"],
+            confidence=classification["confidence"],
+            reasoning=classification.get("reasoning", ""),
+            tags=classification.get("tags", []),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model_name=self._model_name,
+        )
+
+    async def ais_available(self) -> bool:
+        """Async is_available(); runs the sync check in a worker thread.
+
+        Override when the check does network I/O that has an async client.
+        """
+        return await asyncio.to_thread(self.is_available)
+
+    @property
+    def supports_async(self) -> bool:
+        """True if the provider implements _acomplete() with an async client."""
+        return type(self)._acomplete is not BaseProvider._acomplete
+
+    async def _acomplete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Async _complete(); runs the sync call in a worker thread.
+
+        Providers with an async client override this.
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token budget
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+        """
+        return await asyncio.to_thread(self._complete, prompt, max_tokens)
+
+    def _new_async_client(self) -> Any:
+        """Create the async client used by _acomplete() on one event loop."""
+        raise NotImplementedError(f"{self.name} has no async client")
+
+    def _async_client(self) -> Any:
+        """Async client shared by every coroutine on the running loop."""
+        return self._per_loop(self._async_clients, self._new_async_client)
+
+    def _async_slot(self) -> asyncio.Semaphore:
+        """Semaphore capping in-flight requests on the running loop."""
+        return self._per_loop(
+            self._async_slots, lambda: asyncio.Semaphore(ASYNC_CONCURRENCY)
+        )
+
+    @staticmethod
+    def _per_loop(cache: weakref.WeakKeyDictionary, factory: Callable[[], Any]):
+        loop = asyncio.get_running_loop()
+        resource = cache.get(loop)
+        if resource is None:
+            resource = cache[loop] = factory()
+        return resource
+
+    @property
+    def _model_name(self) -> str:
+        return getattr(self, "model", "")
+
+    def _batch_prompt(self, items: list[tuple[str, str, str]]) -> tuple[str, int]:
+        """Build a batch prompt and its output token budget."""
+        from ..prompts import build_batch_classification_prompt
+
+        # Output budget scales with the item count, capped at the config max
+        return build_batch_classification_prompt(items), min(
+            MAX_OUTPUT_TOKENS * len(items), _MAX_BATCH_OUTPUT_TOKENS
+        )
+
+    def _batch_response(
+        self, gen, completion: tuple[str, int, int], count: int
+    ) -> BatchProviderResponse:
+        """Parse a batch completion, record it on the generation and log it.
+
+        Raises:
+            ValueError: If the response contains no JSON array at all
+        """
+        response_text, input_tokens, output_tokens = completion
+        try:
+            elements = self._parse_batch_response(response_text, count)
+        except ValueError as e:
+            gen.update(level="ERROR", metadata={"error": str(e)})
+            raise
+
+        results = [
+            (
+                ProviderResponse(
+                    classified_type=element["classified_type"],
+                    confidence=element["confidence"],
+                    reasoning=element.get("reasoning", ""),
+                    tags=element.get("tags", []),
+                    input_tokens=0,
+                    output_tokens=0,
+                    model_name=self._model_name,
+                )
+                if element is not None
+                else None
+            )
+            for element in elements
+        ]
+        parsed = sum(1 for r in results if r is not None)
+        gen.update(
+            output_text=response_text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            metadata={"batch_size": count, "parsed": parsed},
+        )
+
+        logger.info(
+            "batch_classification_success",
+            extra={
+                "provider": self.name,
+                "batch_size": count,
+                "parsed": parsed,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            },
+        )
+        return BatchProviderResponse(
+            results=results,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model_name=self._model_name,
+        )
+
+    def _parse_batch_response(
+        self, response_text: str, count: int
+    ) -> list[dict | None]:
+        """Parse a JSON-array batch response into per-item dicts.
+
+        Elements are matched to items by their 1-based "index" field, or by
+        position when the field is absent. Elements failing
+        _validate_response_fields() are returned as None.
+
+        Args:
+            response_text: Raw text response from LLM
+            count: Number of items in the request
+
+        Returns:
+            List of length ``count`` with a dict or None per item
+
+        Raises:
+            ValueError: If no JSON array can be extracted
+        """
+        text = response_text.strip()
+        candidates = [text]
+        code_block_match = re.search(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL)
+        if code_block_match:
+            candidates.append(code_block_match.group(1))
+        array_match = re.search(r"\[.*\]", text, re.DOTALL)
+        if array_match:
+            candidates.append(array_match.group(0))
+
+        elements = None
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                parsed = parsed.get("results")
+            if isinstance(parsed, list):
+                elements = parsed
+                break
+
+        if elements is None:
+            logger.warning(
+                "batch_json_parse_failed", extra={"response_preview": text[:200]}
+            )
+            raise ValueError(
+                f"Could not parse JSON array from response: {text[:100]}..."
+            )
+
+        results: list[dict | None] = [None] * count
+        for position, element in enumerate(elements):
+            if not isinstance(element, dict):
+                continue
+            index = element.get("index", position + 1)
+            if not isinstance(index, int) or not 1 <= index <= count:
+                continue
+            try:
+                self._validate_response_fields(element)
+            except ValueError:
+                continue
+            results[index - 1] = element
+        return results
+
     def _parse_response(self, response_text: str) -> dict:
         """Parse LLM response text into classification dict.
 
@@ -191,6 +568,13 @@ class BaseProvider(ABC):
         # Default no-op implementation - subclasses override if cleanup needed
         return None
 
+    async def aclose(self) -> None:
+        """Close the async client of the running loop, if one was created."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            # httpx.AsyncClient has aclose(); the Anthropic SDK has async close()
+            await (getattr(client, "aclose", None) or client.close)()
+
     def __enter__(self):
         """Context manager entry."""
         return self
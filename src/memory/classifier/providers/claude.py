@@ -11,8 +11,10 @@ TECH-DEBT-069: LLM-based memory classification system.
 
 import logging
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 
-from ..config import ANTHROPIC_MODEL, MAX_OUTPUT_TOKENS
+from ..config import ANTHROPIC_MODEL, ASYNC_CONCURRENCY, MAX_OUTPUT_TOKENS
 from ..langfuse_instrument import langfuse_generation
 from .base import BaseProvider, ProviderResponse
 
@@ -100,72 +102,143 @@ class ClaudeProvider(BaseProvider):
             gen.update(input_text=prompt)
 
             try:
-                response = self._client.messages.create(
-                    model=self.model,
-                    max_tokens=MAX_OUTPUT_TOKENS,
-                    temperature=0.1,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt,
-                        }
-                    ],
+                response_text, input_tokens, output_tokens = self._complete(
+                    prompt, MAX_OUTPUT_TOKENS
                 )
-
-                # Extract response text
-                response_text = response.content[0].text
-
                 # Parse JSON response from LLM
                 classification = self._parse_response(response_text)
-
-                # Extract token usage
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-
+            except (TimeoutError, ConnectionError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+            except ValueError as e:
                 gen.update(
-                    output_text=response_text,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    metadata={
-                        "classified_type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                    },
+                    level="ERROR",
+                    metadata={"error": str(e), "error_type": type(e).__name__},
                 )
-
-                logger.info(
-                    "claude_classification_success",
-                    extra={
-                        "type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    },
+                logger.error(
+                    "claude_error", extra={"error": str(e), "type": type(e).__name__}
                 )
+                raise ValueError(f"Claude error: {e}") from e
+
+            gen.update(
+                output_text=response_text,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata={
+                    "classified_type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                },
+            )
 
-                return ProviderResponse(
-                    classified_type=classification["classified_type"],
-                    confidence=classification["confidence"],
-                    reasoning=classification.get("reasoning", ""),
-                    tags=classification.get("tags", []),
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    model_name=self.model,
-                )
+            logger.info(
+                "claude_classification_success",
+                extra={
+                    "type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                },
+            )
 
-            except Exception as e:
-                # Handle various Anthropic SDK exceptions
-                error_type = type(e).__name__
-                gen.update(
-                    level="ERROR", metadata={"error": str(e), "error_type": error_type}
+            return ProviderResponse(
+                classified_type=classification["classified_type"],
+                confidence=classification["confidence"],
+                reasoning=classification.get("reasoning", ""),
+                tags=classification.get("tags", []),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model_name=self.model,
+            )
+
+    def _complete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Send a prompt to the Anthropic Messages API.
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token budget
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If Claude is unreachable
+            ValueError: If the API call fails otherwise
+        """
+        if not self._client:
+            raise ConnectionError(
+                "Claude client not initialized (missing API key or SDK)"
+            )
+
+        with self._api_errors():
+            response = self._client.messages.create(
+                **self._message_args(prompt, max_tokens)
+            )
+            return self._completion(response)
+
+    async def _acomplete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Async _complete() over the shared AsyncAnthropic client."""
+        if not self._client:
+            raise ConnectionError(
+                "Claude client not initialized (missing API key or SDK)"
+            )
+
+        with self._api_errors():
+            response = await self._async_client().messages.create(
+                **self._message_args(prompt, max_tokens)
+            )
+            return self._completion(response)
+
+    def _new_async_client(self):
+        import httpx
+        from anthropic import AsyncAnthropic
+
+        return AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=self.timeout,
+            http_client=httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=ASYNC_CONCURRENCY),
+            ),
+        )
+
+    def _message_args(self, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": 0.1,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+        }
+
+    @staticmethod
+    def _completion(response) -> tuple[str, int, int]:
+        return (
+            response.content[0].text,
+            response.usage.input_tokens,
+            response.usage.output_tokens,
+        )
+
+    @contextmanager
+    def _api_errors(self) -> Iterator[None]:
+        """Map Anthropic SDK exceptions to the provider exception contract."""
+        try:
+            yield
+        except Exception as e:
+            # Handle various Anthropic SDK exceptions
+            error_type = type(e).__name__
+            if "timeout" in str(e).lower():
+                logger.error("claude_timeout", extra={"error": str(e)})
+                raise TimeoutError(f"Claude request timed out: {e}") from e
+            elif "api" in str(e).lower() or "auth" in str(e).lower():
+                logger.error("claude_api_error", extra={"error": str(e)})
+                raise ConnectionError(f"Claude API error: {e}") from e
+            else:
+                logger.error(
+                    "claude_error", extra={"error": str(e), "type": error_type}
                 )
-                if "timeout" in str(e).lower():
-                    logger.error("claude_timeout", extra={"error": str(e)})
-                    raise TimeoutError(f"Claude request timed out: {e}") from e
-                elif "api" in str(e).lower() or "auth" in str(e).lower():
-                    logger.error("claude_api_error", extra={"error": str(e)})
-                    raise ConnectionError(f"Claude API error: {e}") from e
-                else:
-                    logger.error(
-                        "claude_error", extra={"error": str(e), "type": error_type}
-                    )
-                    raise ValueError(f"Claude error: {e}") from e
+                raise ValueError(f"Claude error: {e}") from e
@@ -11,10 +11,12 @@ TECH-DEBT-069: LLM-based memory classification system.
 
 import json
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import httpx
 
-from ..config import MAX_OUTPUT_TOKENS, OLLAMA_BASE_URL, OLLAMA_MODEL
+from ..config import ASYNC_CONCURRENCY, MAX_OUTPUT_TOKENS, OLLAMA_BASE_URL, OLLAMA_MODEL
 from ..langfuse_instrument import langfuse_generation
 from .base import BaseProvider, ProviderResponse
 
@@ -62,6 +64,15 @@ class OllamaProvider(BaseProvider):
             logger.debug("ollama_unavailable", extra={"error": str(e)})
             return False
 
+    async def ais_available(self) -> bool:
+        """Async is_available() over the shared async client."""
+        try:
+            response = await self._async_client().get(f"{self.base_url}/api/tags")
+            return response.status_code == 200
+        except Exception as e:
+            logger.debug("ollama_unavailable", extra={"error": str(e)})
+            return False
+
     def classify(
         self, content: str, collection: str, current_type: str
     ) -> ProviderResponse:
@@ -88,69 +99,120 @@ class OllamaProvider(BaseProvider):
             gen.update(input_text=prompt)
 
             try:
-                response = self._client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "num_predict": MAX_OUTPUT_TOKENS,
-                            "temperature": 0.1,
-                        },
-                    },
+                response_text, input_tokens, output_tokens = self._complete(
+                    prompt, MAX_OUTPUT_TOKENS
                 )
-                response.raise_for_status()
-
-                result = response.json()
-                response_text = result.get("response", "")
-
                 # Parse JSON response from LLM
                 classification = self._parse_response(response_text)
-
-                input_tokens = result.get("prompt_eval_count", 0)
-                output_tokens = result.get("eval_count", 0)
-
-                gen.update(
-                    output_text=response_text,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    metadata={
-                        "classified_type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                    },
-                )
-
-                logger.info(
-                    "ollama_classification_success",
-                    extra={
-                        "type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                    },
-                )
-
-                return ProviderResponse(
-                    classified_type=classification["classified_type"],
-                    confidence=classification["confidence"],
-                    reasoning=classification.get("reasoning", ""),
-                    tags=classification.get("tags", []),
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    model_name=self.model,
-                )
-
-            except httpx.TimeoutException as e:
-                gen.update(level="ERROR", metadata={"error": str(e)})
-                logger.error("ollama_timeout", extra={"error": str(e)})
-                raise TimeoutError(f"Ollama request timed out: {e}") from e
-            except httpx.HTTPError as e:
-                gen.update(level="ERROR", metadata={"error": str(e)})
-                logger.error("ollama_http_error", extra={"error": str(e)})
-                raise ConnectionError(f"Ollama HTTP error: {e}") from e
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
+            except ValueError as e:
                 gen.update(level="ERROR", metadata={"error": str(e)})
                 logger.error("ollama_parse_error", extra={"error": str(e)})
                 raise ValueError(f"Invalid Ollama response: {e}") from e
+            except (TimeoutError, ConnectionError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+
+            gen.update(
+                output_text=response_text,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata={
+                    "classified_type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                },
+            )
+
+            logger.info(
+                "ollama_classification_success",
+                extra={
+                    "type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                },
+            )
+
+            return ProviderResponse(
+                classified_type=classification["classified_type"],
+                confidence=classification["confidence"],
+                reasoning=classification.get("reasoning", ""),
+                tags=classification.get("tags", []),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model_name=self.model,
+            )
+
+    def _complete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Send a prompt to Ollama's generate API.
+
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token budget
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
+
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If Ollama is unreachable
+            ValueError: If the API response is not valid JSON
+        """
+        with self._http_errors():
+            response = self._client.post(
+                f"{self.base_url}/api/generate",
+                json=self._generate_body(prompt, max_tokens),
+            )
+            response.raise_for_status()
+            result = response.json()
+        return self._completion(result)
+
+    async def _acomplete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Async _complete() over the shared async client."""
+        with self._http_errors():
+            response = await self._async_client().post(
+                f"{self.base_url}/api/generate",
+                json=self._generate_body(prompt, max_tokens),
+            )
+            response.raise_for_status()
+            result = response.json()
+        return self._completion(result)
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=ASYNC_CONCURRENCY),
+        )
+
+    def _generate_body(self, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": 0.1,
+            },
+        }
+
+    @staticmethod
+    def _completion(result: dict) -> tuple[str, int, int]:
+        return (
+            result.get("response", ""),
+            result.get("prompt_eval_count", 0),
+            result.get("eval_count", 0),
+        )
+
+    @contextmanager
+    def _http_errors(self) -> Iterator[None]:
+        """Map httpx/JSON errors to the provider exception contract."""
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            logger.error("ollama_timeout", extra={"error": str(e)})
+            raise TimeoutError(f"Ollama request timed out: {e}") from e
+        except httpx.HTTPError as e:
+            logger.error("ollama_http_error", extra={"error": str(e)})
+            raise ConnectionError(f"Ollama HTTP error: {e}") from e
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid Ollama response: {e}") from e
 
     def close(self):
         """Clean up HTTP client."""
@@ -12,10 +12,12 @@ TECH-DEBT-069: LLM-based memory classification system.
 import json
 import logging
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import httpx
 
-from ..config import MAX_OUTPUT_TOKENS
+from ..config import ASYNC_CONCURRENCY, MAX_OUTPUT_TOKENS
 from ..langfuse_instrument import langfuse_generation
 from .base import BaseProvider, ProviderResponse
 
@@ -51,13 +53,11 @@ class OpenAIProvider(BaseProvider):
         if not self.api_key:
             logger.warning("openai_no_api_key")
 
-        self._client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-        )
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._client = httpx.Client(timeout=timeout, headers=self._headers)
 
     @property
     def name(self) -> str:
@@ -101,77 +101,132 @@ class OpenAIProvider(BaseProvider):
             gen.update(input_text=prompt)
 
             try:
-                response = self._client.post(
-                    f"{self.base_url}/chat/completions",
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            }
-                        ],
-                        "max_tokens": MAX_OUTPUT_TOKENS,
-                        "temperature": 0.1,
-                    },
+                response_text, input_tokens, output_tokens = self._complete(
+                    prompt, MAX_OUTPUT_TOKENS
                 )
-                response.raise_for_status()
+                # Parse JSON response from LLM
+                classification = self._parse_response(response_text)
+            except ValueError as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                logger.error("openai_parse_error", extra={"error": str(e)})
+                raise ValueError(f"Invalid OpenAI response: {e}") from e
+            except (TimeoutError, ConnectionError) as e:
+                gen.update(level="ERROR", metadata={"error": str(e)})
+                raise
+
+            gen.update(
+                output_text=response_text,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata={
+                    "classified_type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                },
+            )
+
+            logger.info(
+                "openai_classification_success",
+                extra={
+                    "type": classification["classified_type"],
+                    "confidence": classification["confidence"],
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                },
+            )
+
+            return ProviderResponse(
+                classified_type=classification["classified_type"],
+                confidence=classification["confidence"],
+                reasoning=classification.get("reasoning", ""),
+                tags=classification.get("tags", []),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model_name=self.model,
+            )
+
+    def _complete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Send a prompt to the OpenAI chat completions API.
 
-                result = response.json()
+        Args:
+            prompt: Full prompt text
+            max_tokens: Output token budget
 
-                # Extract response text
-                response_text = result["choices"][0]["message"]["content"]
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens)
 
-                # Parse JSON response from LLM
-                classification = self._parse_response(response_text)
+        Raises:
+            TimeoutError: If request exceeds timeout
+            ConnectionError: If OpenAI is unreachable
+            ValueError: If the API response is malformed
+        """
+        if not self.api_key:
+            raise ConnectionError("OpenAI API key not configured")
 
-                # Extract token usage
-                usage = result.get("usage", {})
-                input_tokens = usage.get("prompt_tokens", 0)
-                output_tokens = usage.get("completion_tokens", 0)
-
-                gen.update(
-                    output_text=response_text,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    metadata={
-                        "classified_type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                    },
-                )
+        with self._http_errors():
+            response = self._client.post(
+                f"{self.base_url}/chat/completions",
+                json=self._chat_body(prompt, max_tokens),
+            )
+            response.raise_for_status()
+            return self._completion(response.json())
 
-                logger.info(
-                    "openai_classification_success",
-                    extra={
-                        "type": classification["classified_type"],
-                        "confidence": classification["confidence"],
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                    },
-                )
+    async def _acomplete(self, prompt: str, max_tokens: int) -> tuple[str, int, int]:
+        """Async _complete() over the shared async client."""
+        if not self.api_key:
+            raise ConnectionError("OpenAI API key not configured")
 
-                return ProviderResponse(
-                    classified_type=classification["classified_type"],
-                    confidence=classification["confidence"],
-                    reasoning=classification.get("reasoning", ""),
-                    tags=classification.get("tags", []),
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    model_name=self.model,
-                )
+        with self._http_errors():
+            response = await self._async_client().post(
+                f"{self.base_url}/chat/completions",
+                json=self._chat_body(prompt, max_tokens),
+            )
+            response.raise_for_status()
+            return self._completion(response.json())
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=ASYNC_CONCURRENCY),
+        )
 
-            except httpx.TimeoutException as e:
-                gen.update(level="ERROR", metadata={"error": str(e)})
-                logger.error("openai_timeout", extra={"error": str(e)})
-                raise TimeoutError(f"OpenAI request timed out: {e}") from e
-            except httpx.HTTPError as e:
-                gen.update(level="ERROR", metadata={"error": str(e)})
-                logger.error("openai_http_error", extra={"error": str(e)})
-                raise ConnectionError(f"OpenAI HTTP error: {e}") from e
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                gen.update(level="ERROR", metadata={"error": str(e)})
-                logger.error("openai_parse_error", extra={"error": str(e)})
-                raise ValueError(f"Invalid OpenAI response: {e}") from e
+    def _chat_body(self, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.1,
+        }
+
+    @staticmethod
+    def _completion(result: dict) -> tuple[str, int, int]:
+        response_text = result["choices"][0]["message"]["content"]
+        # Extract token usage
+        usage = result.get("usage", {})
+        return (
+            response_text,
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+        )
+
+    @contextmanager
+    def _http_errors(self) -> Iterator[None]:
+        """Map httpx/JSON errors to the provider exception contract."""
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            logger.error("openai_timeout", extra={"error": str(e)})
+            raise TimeoutError(f"OpenAI request timed out: {e}") from e
+        except httpx.HTTPError as e:
+            logger.error("openai_http_error", extra={"error": str(e)})
+            raise ConnectionError(f"OpenAI HTTP error: {e}") from e
+        except (json.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Invalid OpenAI response: {e}") from e
 
     def close(self):
         """Clean up HTTP client."""
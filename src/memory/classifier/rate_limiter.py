@@ -7,6 +7,11 @@ Pattern based on:
 - AWS API Gateway rate limiting patterns (2026)
 - Stripe rate limiting: https://stripe.com/blog/rate-limiters
 
+With a ProviderStateStore, each provider's bucket lives in a SQLite database
+shared by every classifier process on the host, so the worker, queue
+processor, backfills and hooks together stay within one provider limit. If
+the store is unusable, the in-process bucket is used instead.
+
 TECH-DEBT-069: LLM classification cost control.
 """
 
@@ -14,11 +19,17 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
+from typing import Any
+
+from .shared_state import ProviderStateStore, get_provider_state_store
 
 logger = logging.getLogger("ai_memory.classifier.rate_limiter")
 
 __all__ = ["RateLimiter", "rate_limiter"]
 
+# ProviderStateStore kind for token buckets
+_STATE_KIND = "rate_limit"
+
 
 @dataclass
 class TokenBucket:
@@ -57,15 +68,18 @@ class RateLimiter:
         self,
         requests_per_minute: int = 60,
         burst_size: int = 10,
+        shared_state: ProviderStateStore | None = None,
     ):
         """Initialize rate limiter.
 
         Args:
             requests_per_minute: Average requests allowed per minute per provider
             burst_size: Maximum burst size (tokens in bucket)
+            shared_state: Cross-process bucket store (default: in-process only)
         """
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
+        self.shared_state = shared_state
 
         # Convert to tokens per second
         self.refill_rate = requests_per_minute / 60.0
@@ -79,6 +93,7 @@ class RateLimiter:
                 "requests_per_minute": requests_per_minute,
                 "burst_size": burst_size,
                 "refill_rate_per_second": self.refill_rate,
+                "shared_state": str(shared_state.path) if shared_state else None,
             },
         )
 
@@ -126,39 +141,81 @@ class RateLimiter:
         Returns:
             True if request allowed, False if rate limit exceeded
         """
-        bucket = self._get_bucket(provider)
+        allowed, available = self._take(provider, tokens)
+
+        if allowed:
+            logger.debug(
+                "rate_limit_allowed",
+                extra={
+                    "provider": provider,
+                    "tokens_consumed": tokens,
+                    "tokens_remaining": available,
+                },
+            )
+            return True
+
+        # Not enough tokens, rate limited
+        wait_time = (tokens - available) / self.refill_rate
+
+        logger.warning(
+            "rate_limit_exceeded",
+            extra={
+                "provider": provider,
+                "tokens_needed": tokens,
+                "tokens_available": available,
+                "wait_seconds": wait_time,
+            },
+        )
+        return False
+
+    def _take(self, provider: str, tokens: int) -> tuple[bool, float]:
+        """Refill and try to consume tokens, preferring the shared bucket.
+
+        Args:
+            provider: Provider name
+            tokens: Number of tokens to consume
+
+        Returns:
+            (allowed, tokens left in the bucket)
+        """
+        if self.shared_state is not None:
+
+            def take(state: dict[str, Any] | None):
+                available = self._refilled(state)
+                allowed = available >= tokens
+                if allowed:
+                    available -= tokens
+                return {"tokens": available, "last_refill": time.time()}, (
+                    allowed,
+                    available,
+                )
+
+            outcome = self.shared_state.update(_STATE_KIND, provider, take)
+            if outcome is not None:
+                return outcome
 
+        bucket = self._get_bucket(provider)
         with bucket.lock:
-            # Refill bucket
             self._refill_bucket(bucket)
-
-            # Check if enough tokens available
             if bucket.tokens >= tokens:
                 bucket.tokens -= tokens
+                return True, bucket.tokens
+            return False, bucket.tokens
 
-                logger.debug(
-                    "rate_limit_allowed",
-                    extra={
-                        "provider": provider,
-                        "tokens_consumed": tokens,
-                        "tokens_remaining": bucket.tokens,
-                    },
-                )
-                return True
-            else:
-                # Not enough tokens, rate limited
-                wait_time = (tokens - bucket.tokens) / bucket.refill_rate
+    def _refilled(self, state: dict[str, Any] | None) -> float:
+        """Tokens in a stored bucket after refilling for the elapsed time.
 
-                logger.warning(
-                    "rate_limit_exceeded",
-                    extra={
-                        "provider": provider,
-                        "tokens_needed": tokens,
-                        "tokens_available": bucket.tokens,
-                        "wait_seconds": wait_time,
-                    },
-                )
-                return False
+        Args:
+            state: Stored bucket ({"tokens", "last_refill"}), None if new
+
+        Returns:
+            Available tokens (a new bucket starts full)
+        """
+        if state is None:
+            return float(self.burst_size)
+        # Wall clock so timestamps compare across processes; clamp for clock steps
+        elapsed = max(0.0, time.time() - state["last_refill"])
+        return min(float(self.burst_size), state["tokens"] + elapsed * self.refill_rate)
 
     def wait_for_token(
         self, provider: str, tokens: int = 1, timeout: float = 30.0
@@ -173,24 +230,20 @@ class RateLimiter:
         Returns:
             True if tokens acquired, False if timeout
         """
-        bucket = self._get_bucket(provider)
         start_time = time.time()
 
         while time.time() - start_time < timeout:
-            with bucket.lock:
-                self._refill_bucket(bucket)
-
-                if bucket.tokens >= tokens:
-                    bucket.tokens -= tokens
-                    logger.debug(
-                        "rate_limit_tokens_acquired",
-                        extra={
-                            "provider": provider,
-                            "tokens": tokens,
-                            "wait_seconds": time.time() - start_time,
-                        },
-                    )
-                    return True
+            allowed, _available = self._take(provider, tokens)
+            if allowed:
+                logger.debug(
+                    "rate_limit_tokens_acquired",
+                    extra={
+                        "provider": provider,
+                        "tokens": tokens,
+                        "wait_seconds": time.time() - start_time,
+                    },
+                )
+                return True
 
             # Sleep for a short interval before retrying
             time.sleep(0.1)
@@ -213,18 +266,15 @@ class RateLimiter:
         Returns:
             Dict with status information
         """
-        bucket = self._get_bucket(provider)
+        available = self._take(provider, 0)[1]
 
-        with bucket.lock:
-            self._refill_bucket(bucket)
-
-            return {
-                "provider": provider,
-                "tokens_available": bucket.tokens,
-                "capacity": bucket.capacity,
-                "refill_rate_per_second": bucket.refill_rate,
-                "utilization_pct": (1 - bucket.tokens / bucket.capacity) * 100,
-            }
+        return {
+            "provider": provider,
+            "tokens_available": available,
+            "capacity": self.burst_size,
+            "refill_rate_per_second": self.refill_rate,
+            "utilization_pct": (1 - available / self.burst_size) * 100,
+        }
 
     def reset(self, provider: str | None = None):
         """Reset rate limiter for provider or all providers.
@@ -232,6 +282,8 @@ class RateLimiter:
         Args:
             provider: Provider to reset (default: all providers)
         """
+        if self.shared_state is not None:
+            self.shared_state.delete(_STATE_KIND, provider)
         if provider:
             bucket = self._get_bucket(provider)
             with bucket.lock:
@@ -248,8 +300,10 @@ class RateLimiter:
 
 
 # Global rate limiter instance
-# Shared across all classification requests in the process
+# Shared across all classifier processes on the host via the provider state
+# store (in-process only when MEMORY_CLASSIFIER_SHARED_STATE_ENABLED=false)
 rate_limiter = RateLimiter(
     requests_per_minute=60,  # Max 60 requests/min per provider
     burst_size=10,  # Allow bursts of 10 requests
+    shared_state=get_provider_state_store(),
 )
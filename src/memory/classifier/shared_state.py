@@ -0,0 +1,154 @@
+"""Host-wide provider state shared by every classifier process.
+
+The rate limiter (FIX-11) and circuit breaker (FIX-10) were module-level
+singletons, so their state was per process. Classification runs in many
+processes at once: the classification worker, process_classification_queue.py,
+backfill scripts and hook-triggered calls. Each kept its own token buckets and
+breaker, so together they overshot provider limits and kept calling a
+provider that another process had already found dead.
+
+This store keeps one small JSON document per (kind, provider) in a SQLite
+database under ~/.ai-memory/cache/. Every read-modify-write runs inside
+``BEGIN IMMEDIATE``, which takes SQLite's write lock up front, so updates from
+concurrent processes are serialized and never lost. WAL mode keeps the lock
+short. The store is fail-open (memory.sqlite_store): when the database is
+unusable the caller falls back to its in-process state.
+
+TECH-DEBT-069: LLM classification resilience and cost control.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from ..sqlite_store import SQLiteStore
+from .config import SHARED_STATE_ENABLED, SHARED_STATE_PATH
+
+logger = logging.getLogger("ai_memory.classifier.shared_state")
+
+__all__ = ["ProviderStateStore", "get_provider_state_store"]
+
+T = TypeVar("T")
+
+
+class ProviderStateStore(SQLiteStore):
+    """SQLite-backed per-provider state with atomic cross-process updates.
+
+    Attributes:
+        path: SQLite database file
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS provider_state (
+        kind TEXT NOT NULL,
+        provider TEXT NOT NULL,
+        state TEXT NOT NULL,
+        PRIMARY KEY (kind, provider)
+    )
+    """
+    # Short busy timeout: a rate-limit check must not stall behind a stuck writer
+    _BUSY_TIMEOUT = 1.0
+    # Autocommit: transactions are opened explicitly with BEGIN IMMEDIATE
+    _ISOLATION_LEVEL = None
+
+    def update(
+        self,
+        kind: str,
+        provider: str,
+        fn: Callable[[dict[str, Any] | None], tuple[dict[str, Any], T]],
+    ) -> T | None:
+        """Atomically read, transform and write one provider's state.
+
+        ``fn`` receives the stored state (None if there is none yet) and
+        returns ``(new_state, result)``. It must not return a None result, as
+        None signals that the store was unusable.
+
+        Args:
+            kind: State family (e.g. "rate_limit", "circuit_breaker")
+            provider: Provider name
+            fn: Transition applied while the database write lock is held
+
+        Returns:
+            fn's result, or None if the store is unavailable
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT state FROM provider_state "
+                        "WHERE kind = ? AND provider = ?",
+                        (kind, provider),
+                    ).fetchone()
+                    try:
+                        current = json.loads(row[0]) if row is not None else None
+                    except ValueError:
+                        current = None  # Corrupt row: start over
+                    new_state, result = fn(current)
+                    if new_state != current:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO provider_state "
+                            "(kind, provider, state) VALUES (?, ?, ?)",
+                            (
+                                kind,
+                                provider,
+                                json.dumps(new_state, separators=(",", ":")),
+                            ),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                "provider_state_unavailable",
+                extra={
+                    "path": str(self.path),
+                    "kind": kind,
+                    "provider": provider,
+                    "error": str(e),
+                },
+            )
+            return None
+        return result
+
+    def delete(self, kind: str, provider: str | None = None) -> None:
+        """Drop stored state for one provider, or every provider of a kind."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                if provider is None:
+                    conn.execute("DELETE FROM provider_state WHERE kind = ?", (kind,))
+                else:
+                    conn.execute(
+                        "DELETE FROM provider_state WHERE kind = ? AND provider = ?",
+                        (kind, provider),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                "provider_state_unavailable",
+                extra={"path": str(self.path), "kind": kind, "error": str(e)},
+            )
+
+
+_store: ProviderStateStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_provider_state_store() -> ProviderStateStore | None:
+    """Return the host-wide provider state store, or None when disabled.
+
+    Configured by MEMORY_CLASSIFIER_SHARED_STATE_ENABLED and _PATH (see
+    classifier/config.py). The database is opened lazily on first use.
+    """
+    global _store
+    if not SHARED_STATE_ENABLED:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ProviderStateStore(SHARED_STATE_PATH)
+        return _store
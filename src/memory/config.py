@@ -118,6 +118,8 @@ class MemoryConfig(BaseSettings):
         jira_projects: List of Jira project keys to sync
         jira_sync_enabled: Enable automatic Jira synchronization
         jira_sync_delay_ms: Delay between Jira API requests for rate limiting
+        jira_sync_concurrency: Issues processed concurrently during Jira sync
+        jira_sync_batch_size: Max comments per batched store during Jira sync
     """
 
     model_config = SettingsConfigDict(
@@ -299,6 +301,22 @@ class MemoryConfig(BaseSettings):
         description="Delay between Jira API requests in milliseconds (rate limiting)",
     )
 
+    jira_sync_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Issues processed concurrently during Jira sync, shared "
+        "across projects (requests still share jira_sync_delay_ms pacing)",
+    )
+
+    jira_sync_batch_size: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Max comments per batched embedding request and Qdrant "
+        "upsert during Jira sync",
+    )
+
     # =========================================================================
     # v2.0.6 — GitHub Integration (SPEC-004, Tier 1: conditional required)
     # =========================================================================
@@ -373,6 +391,57 @@ class MemoryConfig(BaseSettings):
         le=300,
         description="Seconds before circuit breaker transitions OPEN -> HALF_OPEN",
     )
+    github_code_sync_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Concurrent blob downloads in the code blob sync pipeline",
+    )
+    github_code_sync_batch_size: int = Field(
+        default=64,
+        ge=1,
+        le=512,
+        description="Chunks per batched embed+upsert in the code blob sync pipeline",
+    )
+    github_sync_max_workers: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Projects the GitHub sync service syncs concurrently",
+    )
+    github_sync_api_budget: int = Field(
+        default=2500,
+        ge=100,
+        le=100000,
+        description="GitHub API requests per sync service cycle across all "
+        "projects; lower-priority projects beyond it wait for the next cycle",
+    )
+    github_sync_detail_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Commit-detail and issue-comment fetches in flight during "
+        "GitHub sync (requests still share the client's rate limiter)",
+    )
+    github_pr_fetch_mode: str = Field(
+        default="rest",
+        description="How PR sync fetches pull requests: 'rest' (list + per-PR "
+        "files/reviews calls) or 'graphql' (bulk pages with files and reviews; "
+        "diff memories carry change stats but no patch text)",
+        pattern="^(rest|graphql)$",
+    )
+    github_http_cache_enabled: bool = Field(
+        default=True,
+        description="Persist GitHub ETag/Last-Modified validators and bodies under "
+        "install_dir/cache/github so conditional requests survive restarts",
+    )
+    github_http_cache_max_mb: int = Field(
+        default=128,
+        ge=1,
+        le=4096,
+        description="Size bound (MB, compressed bodies) of the persistent GitHub "
+        "HTTP cache; least-recently-used entries are evicted beyond it",
+    )
 
     # =========================================================================
     # v2.0.6 — Decay Scoring (SPEC-001 Section 4.3)
@@ -499,6 +568,21 @@ class MemoryConfig(BaseSettings):
         description="Enable ColBERT late interaction reranking (requires ~400MB model download)",
     )
 
+    # Local read replica for the shared conventions collection
+    conventions_snapshot_enabled: bool = Field(
+        default=False,
+        description="Serve shared conventions lookups from a local memory-mapped vector "
+        "snapshot under install_dir/cache/snapshots (skips the Qdrant round-trip, "
+        "keeps working while Qdrant is briefly down).",
+    )
+
+    conventions_snapshot_refresh_seconds: int = Field(
+        default=300,
+        ge=10,
+        le=86400,
+        description="Seconds between conventions snapshot freshness checks (compares collection last_updated)",
+    )
+
     # =========================================================================
     # v2.0.6 — Dual Embedding (SPEC-010)
     # =========================================================================
@@ -614,6 +698,45 @@ class MemoryConfig(BaseSettings):
         description="Score gap threshold for greedy result selection. Results below best_score * threshold are excluded.",
     )
 
+    injection_diversity_enabled: bool = Field(
+        default=False,
+        description="Suppress near-duplicate results (by dense vector cosine similarity) before greedy fill. Search requests vectors when enabled.",
+    )
+
+    injection_diversity_threshold: float = Field(
+        default=0.92,
+        ge=0.5,
+        le=1.0,
+        description="Cosine similarity at or above which a candidate is treated as a near-duplicate of an already-kept result",
+    )
+
+    injection_mmr_lambda: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="MMR relevance/diversity trade-off for the diversity stage. 1.0 keeps score order (near-duplicate cutoff only); lower values favour diverse results.",
+    )
+
+    # Predictive prefetch of file-scoped memories (see prefetch.py)
+    file_prefetch_enabled: bool = Field(
+        default=False,
+        description="Prefetch code-patterns results for a file and its imports/siblings when it is Read, so the first_edit trigger is served from the per-session prefetch store",
+    )
+
+    file_prefetch_ttl_seconds: int = Field(
+        default=900,
+        ge=30,
+        le=86400,
+        description="Seconds a prefetched entry stays valid",
+    )
+
+    file_prefetch_max_related: int = Field(
+        default=4,
+        ge=0,
+        le=20,
+        description="Maximum related files (local imports, then recent siblings) prefetched per Read",
+    )
+
     # =========================================================================
     # v2.0.6 — Encryption (SPEC-011)
     # =========================================================================
@@ -783,6 +906,30 @@ class MemoryConfig(BaseSettings):
         description="Flush worker interval in seconds",
     )
 
+    langfuse_flush_min_interval: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=60.0,
+        env="LANGFUSE_FLUSH_MIN_INTERVAL",
+        description="Seconds the flush worker waits after a spool write wakes it, to batch a burst",
+    )
+
+    langfuse_flush_max_batch: int = Field(
+        default=512,
+        ge=1,
+        le=2048,
+        env="LANGFUSE_FLUSH_MAX_BATCH",
+        description="Maximum events exported per flush (span processor queue holds 2048)",
+    )
+
+    langfuse_flush_max_batch_bytes: int = Field(
+        default=4 * 1024 * 1024,
+        ge=64 * 1024,
+        le=256 * 1024 * 1024,
+        env="LANGFUSE_FLUSH_MAX_BATCH_BYTES",
+        description="Maximum spool bytes read per flush",
+    )
+
     langfuse_trace_hooks: bool = Field(
         default=True,
         env="LANGFUSE_TRACE_HOOKS",
@@ -2,23 +2,29 @@
 
 Provides async httpx-based client for GitHub REST API v3 with token auth.
 Implements Link header pagination, adaptive rate limiting (primary + secondary),
-ETag caching for conditional requests, and exponential backoff.
+ETag caching for conditional requests, and exponential backoff. Pull requests
+can also be fetched in bulk (with files and reviews) through the GraphQL API.
 
 Reference: https://docs.github.com/en/rest
 Rate limits: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
 """
 
 import asyncio
+import contextlib
 import hashlib
 import logging
 import random
 import re
 import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+if TYPE_CHECKING:
+    from memory.connectors.github.http_cache import PersistentHTTPCache
+    from memory.connectors.github.scheduler import RequestBudget
+
 logger = logging.getLogger("ai_memory.github.client")
 
 
@@ -56,6 +62,8 @@ class GitHubClient:
         _rate_limit_reset: Tracked from X-RateLimit-Reset header
         _secondary_points_used: Tracked cumulative point cost per minute window
         _etag_cache: URL-keyed cache of ETag/Last-Modified values
+        _http_cache: Optional persistent cache backing _etag_cache across runs
+        budget: Optional request pacing/budget shared with other clients
 
     Example:
         >>> async with GitHubClient("ghp_token", "owner/repo") as client:
@@ -90,12 +98,22 @@ class GitHubClient:
     # ETag cache size limit (GH-PERF-001: prevent unbounded growth)
     MAX_ETAG_CACHE_SIZE = 1000
 
+    # GraphQL bulk fetch: secondary-limit cost per query (GitHub charges 5
+    # points for a non-mutation GraphQL request) and page/connection sizes
+    GRAPHQL_POINT_COST = 5
+    GRAPHQL_PR_PAGE_SIZE = 25
+    GRAPHQL_PR_FILES = 100
+    GRAPHQL_PR_REVIEWS = 50
+    GRAPHQL_PR_LABELS = 20
+
     def __init__(
         self,
         token: str,
         repo: str,
         base_url: str | None = None,
         min_delay_ms: int = MIN_REQUEST_DELAY_MS,
+        http_cache: "PersistentHTTPCache | None" = None,
+        budget: "RequestBudget | None" = None,
     ) -> None:
         """Initialize GitHub client with token authentication.
 
@@ -104,6 +122,11 @@ class GitHubClient:
             repo: Target repository in owner/repo format
             base_url: GitHub API base URL (default: https://api.github.com)
             min_delay_ms: Minimum delay between requests in milliseconds
+            http_cache: Persistent conditional-request cache (see
+                http_cache.open_http_cache). None keeps validators in memory only.
+            budget: Request budget shared by concurrently syncing clients
+                (see scheduler.SyncScheduler). Requests are paced against it
+                in addition to this client's own limits.
         """
         self.repo = repo
         self.base_url = (base_url or self.BASE_URL).rstrip("/")
@@ -115,9 +138,21 @@ class GitHubClient:
         self._secondary_points_used: int = 0
         self._secondary_window_start: float = time.monotonic()
         self._last_request_time: float = 0.0
+        # GraphQL point budget (separate from the REST primary limit)
+        self._graphql_remaining: int | None = None
+        self._graphql_reset: float | None = None
+        self._graphql_last_cost: int = 1
+        # Serializes pacing so concurrent callers share one request cadence
+        self._pacing_lock = asyncio.Lock()
 
         # ETag cache: {url_hash: {"etag": str, "last_modified": str, "data": Any}}
         self._etag_cache: dict[str, dict[str, Any]] = {}
+        # Persistent second level shared across processes and restarts
+        self._http_cache = http_cache
+        self.budget = budget
+        # Conditional request outcomes (ETag hit ratio)
+        self._conditional_requests = 0
+        self._not_modified = 0
 
         # httpx client with connection pooling
         self._client = httpx.AsyncClient(
@@ -147,6 +182,8 @@ class GitHubClient:
     async def close(self) -> None:
         """Close the httpx client and release connections."""
         await self._client.aclose()
+        if self._http_cache is not None:
+            await asyncio.to_thread(self._http_cache.flush)
 
     # --- Authentication & Connection ---
 
@@ -278,6 +315,72 @@ class GitHubClient:
             point_cost=1,
         )
 
+    async def list_pull_requests_with_details(
+        self,
+        since: str | None = None,
+        max_pages: int = 400,
+    ) -> list[dict[str, Any]]:
+        """List PRs with their files and reviews via bulk GraphQL queries.
+
+        Replaces list_pull_requests() + get_pr_files() + get_pr_reviews() per
+        PR (2N+1 REST calls) with one GraphQL query per GRAPHQL_PR_PAGE_SIZE
+        PRs. PRs are ordered by most recently updated, so an incremental
+        fetch stops at the first PR older than ``since``. PRs with more files
+        or reviews than fit in one query fall back to the REST endpoints for
+        that connection only.
+
+        Dicts are converted to the REST shapes used by the composers. GraphQL
+        exposes no per-file patch text, so file dicts carry no "patch" key.
+
+        Args:
+            since: ISO 8601 timestamp; only PRs updated at or after it
+            max_pages: Safety limit on GraphQL pages
+
+        Returns:
+            List of {"pr": dict, "files": list[dict], "reviews": list[dict]}
+        """
+        owner, name = self.repo.split("/", 1)
+        details: list[dict[str, Any]] = []
+        cursor: str | None = None
+
+        for _ in range(max_pages):
+            data = await self._graphql(
+                _PULL_REQUESTS_QUERY,
+                {
+                    "owner": owner,
+                    "name": name,
+                    "cursor": cursor,
+                    "pageSize": self.GRAPHQL_PR_PAGE_SIZE,
+                    "files": self.GRAPHQL_PR_FILES,
+                    "reviews": self.GRAPHQL_PR_REVIEWS,
+                    "labels": self.GRAPHQL_PR_LABELS,
+                },
+            )
+            connection = (data.get("repository") or {}).get("pullRequests") or {}
+            reached_since = False
+            for node in connection.get("nodes") or []:
+                if not node:
+                    continue
+                if since and (node.get("updatedAt") or "") < since:
+                    reached_since = True
+                    break
+                details.append(await self._pr_details_from_graphql(node))
+
+            page_info = connection.get("pageInfo") or {}
+            if reached_since or not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+
+        logger.info(
+            "graphql_pull_requests_fetched",
+            extra={
+                "repo": self.repo,
+                "prs": len(details),
+                "graphql_remaining": self._graphql_remaining,
+            },
+        )
+        return details
+
     async def list_commits(
         self,
         sha: str | None = None,
@@ -484,6 +587,11 @@ class GitHubClient:
         Args:
             response: httpx response with rate limit headers
         """
+        if response.headers.get("X-RateLimit-Resource") == "graphql":
+            # GraphQL has its own point budget, tracked from the rateLimit
+            # field of each query (see _record_graphql_cost)
+            return
+
         remaining = response.headers.get("X-RateLimit-Remaining")
         if remaining is not None:
             try:
@@ -534,7 +642,7 @@ class GitHubClient:
             key_parts.extend(f"{k}={v}" for k, v in sorted(params.items()))
         return hashlib.sha256("|".join(key_parts).encode()).hexdigest()[:16]
 
-    def _get_conditional_headers(self, cache_key: str) -> dict[str, str]:
+    async def _get_conditional_headers(self, cache_key: str) -> dict[str, str]:
         """Get conditional request headers from cache.
 
         Prefer Last-Modified over ETag for polling reliability (BP-062).
@@ -546,7 +654,7 @@ class GitHubClient:
             Dict with If-None-Match and/or If-Modified-Since headers
         """
         headers: dict[str, str] = {}
-        cached = self._etag_cache.get(cache_key)
+        cached = await self._lookup_cache(cache_key)
         if cached:
             if cached.get("last_modified"):
                 headers["If-Modified-Since"] = cached["last_modified"]
@@ -554,7 +662,52 @@ class GitHubClient:
                 headers["If-None-Match"] = cached["etag"]
         return headers
 
-    def _update_cache(
+    def _record_conditional(self, not_modified: bool) -> None:
+        """Count a conditional request and whether it returned 304."""
+        self._conditional_requests += 1
+        if not_modified:
+            self._not_modified += 1
+        if self.budget is not None:
+            self.budget.record_conditional(self.repo, not_modified)
+
+    def _persistent_key(self, cache_key: str) -> str:
+        """Scope a cache key by API host for the shared persistent cache."""
+        return f"{self.base_url}|{cache_key}"
+
+    async def _lookup_cache(self, cache_key: str) -> dict[str, Any] | None:
+        """Look up a cached response: in-memory first, then persistent cache.
+
+        SQLite access runs in a worker thread so a lock held by another sync
+        process never stalls the other fetches on this event loop.
+        """
+        cached = self._etag_cache.get(cache_key)
+        if cached is None and self._http_cache is not None:
+            cached = await asyncio.to_thread(
+                self._http_cache.get, self._persistent_key(cache_key)
+            )
+            if cached is not None:
+                self._remember(cache_key, cached)
+        return cached
+
+    async def _forget_cache(self, cache_key: str) -> None:
+        """Drop a cache entry from both levels."""
+        self._etag_cache.pop(cache_key, None)
+        if self._http_cache is not None:
+            await asyncio.to_thread(
+                self._http_cache.pop, self._persistent_key(cache_key)
+            )
+
+    def _remember(self, cache_key: str, entry: dict[str, Any]) -> None:
+        """Insert into the in-memory cache with bounded size."""
+        # GH-PERF-001: LRU eviction — evict oldest 25% when cache is full.
+        # Python 3.7+ dicts preserve insertion order, so oldest keys come first.
+        if len(self._etag_cache) >= self.MAX_ETAG_CACHE_SIZE:
+            oldest_keys = list(self._etag_cache.keys())[: self.MAX_ETAG_CACHE_SIZE // 4]
+            for key in oldest_keys:
+                del self._etag_cache[key]
+        self._etag_cache[cache_key] = entry
+
+    async def _update_cache(
         self,
         cache_key: str,
         response: httpx.Response,
@@ -570,19 +723,25 @@ class GitHubClient:
         etag = response.headers.get("ETag")
         last_modified = response.headers.get("Last-Modified")
         if etag or last_modified:
-            # GH-PERF-001: LRU eviction — evict oldest 25% when cache is full.
-            # Python 3.7+ dicts preserve insertion order, so oldest keys come first.
-            if len(self._etag_cache) >= self.MAX_ETAG_CACHE_SIZE:
-                oldest_keys = list(self._etag_cache.keys())[
-                    : self.MAX_ETAG_CACHE_SIZE // 4
-                ]
-                for key in oldest_keys:
-                    del self._etag_cache[key]
-            self._etag_cache[cache_key] = {
-                "etag": etag,
-                "last_modified": last_modified,
-                "data": data,
-            }
+            link = response.headers.get("Link")
+            self._remember(
+                cache_key,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "link": link,
+                    "data": data,
+                },
+            )
+            if self._http_cache is not None:
+                await asyncio.to_thread(
+                    self._http_cache.put,
+                    self._persistent_key(cache_key),
+                    data,
+                    etag=etag,
+                    last_modified=last_modified,
+                    link=link,
+                )
 
     # --- Core HTTP Methods ---
 
@@ -593,6 +752,7 @@ class GitHubClient:
         params: dict[str, str] | None = None,
         point_cost: int = 1,
         extra_headers: dict[str, str] | None = None,
+        json_body: dict[str, Any] | None = None,
     ) -> httpx.Response:
         """Make a raw HTTP request with rate limiting, retries, and error handling.
 
@@ -606,6 +766,7 @@ class GitHubClient:
             params: Query parameters
             point_cost: Request point cost for secondary rate limit (1-5)
             extra_headers: Additional headers (e.g., conditional cache headers)
+            json_body: JSON request body (GraphQL queries)
 
         Returns:
             Raw httpx.Response (status 2xx or 304)
@@ -615,12 +776,25 @@ class GitHubClient:
             RateLimitExceeded: When rate limit is exhausted after retries
         """
         for attempt in range(self.MAX_RETRIES + 1):
-            await self._enforce_rate_limit(point_cost)
+            if self.budget is not None:
+                await self.budget.acquire(self.repo, point_cost)
+            # Pacing decisions are taken one caller at a time so concurrent
+            # requests (e.g. pipelined blob fetches) still honor the minimum
+            # delay; the HTTP call itself runs outside the lock.
+            async with self._pacing_lock:
+                await self._enforce_rate_limit(point_cost)
+                self._last_request_time = time.monotonic()
 
             try:
-                self._last_request_time = time.monotonic()
+                request_kwargs: dict[str, Any] = {}
+                if json_body is not None:
+                    request_kwargs["json"] = json_body
                 response = await self._client.request(
-                    method, path, params=params, headers=extra_headers or {}
+                    method,
+                    path,
+                    params=params,
+                    headers=extra_headers or {},
+                    **request_kwargs,
                 )
 
                 # Track rate limits and point cost.
@@ -778,7 +952,7 @@ class GitHubClient:
             # Add conditional headers for GET requests
             extra_headers = {}
             if cache_key:
-                extra_headers = self._get_conditional_headers(cache_key)
+                extra_headers = await self._get_conditional_headers(cache_key)
 
             response = await self._raw_request(
                 method,
@@ -788,15 +962,18 @@ class GitHubClient:
                 extra_headers=extra_headers if extra_headers else None,
             )
 
+            if extra_headers:
+                self._record_conditional(response.status_code == 304)
+
             # 304 Not Modified -- return cached data (doesn't count against limit)
             if response.status_code == 304 and cache_key:
-                cached = self._etag_cache.get(cache_key)
+                cached = await self._lookup_cache(cache_key)
                 if cached:
                     # 304 doesn't count against primary rate limit (BP-062)
                     self._secondary_points_used -= point_cost
                     return cached["data"]
                 # 304 but cache miss — clear stale conditional headers and retry
-                self._etag_cache.pop(cache_key, None)
+                await self._forget_cache(cache_key)
                 self._secondary_points_used -= (
                     point_cost  # 304 is free, undo the charge
                 )
@@ -810,12 +987,132 @@ class GitHubClient:
             # Success -- parse and cache
             data = response.json()
             if cache_key:
-                self._update_cache(cache_key, response, data)
+                await self._update_cache(cache_key, response, data)
             return data
 
         # Should not reach here, but defensive
         raise GitHubClientError("Request failed after all retries")
 
+    # --- GraphQL (BP-062) ---
+
+    @property
+    def _graphql_path(self) -> str:
+        """GraphQL endpoint (GHES serves it beside /api/v3, not under it)."""
+        if self.base_url.endswith("/api/v3"):
+            return self.base_url[: -len("/v3")] + "/graphql"
+        return "/graphql"
+
+    async def _enforce_graphql_budget(self) -> None:
+        """Wait for the GraphQL point budget to reset when nearly exhausted.
+
+        Mirrors the REST primary-limit check in _enforce_rate_limit(): the
+        next query is assumed to cost what the previous one did.
+        """
+        floor = int(self.PRIMARY_LIMIT * self.SAFETY_MARGIN * 0.1)
+        if (
+            self._graphql_remaining is None
+            or self._graphql_remaining - self._graphql_last_cost >= floor
+            or not self._graphql_reset
+        ):
+            return
+        wait_time = max(0, self._graphql_reset - time.time())
+        if wait_time > 0:
+            logger.warning(
+                "GraphQL rate limit low (%d points remaining). Waiting %.1fs",
+                self._graphql_remaining,
+                wait_time,
+            )
+            await asyncio.sleep(min(wait_time, 60.0))
+
+    def _record_graphql_cost(self, rate_limit: dict[str, Any] | None) -> None:
+        """Track the GraphQL budget from a query's rateLimit field."""
+        if not rate_limit:
+            return
+        with contextlib.suppress(KeyError, TypeError, ValueError):
+            self._graphql_last_cost = max(1, int(rate_limit.get("cost") or 1))
+            self._graphql_remaining = int(rate_limit["remaining"])
+            self._graphql_reset = datetime.fromisoformat(
+                rate_limit["resetAt"]
+            ).timestamp()
+
+    async def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query with REST-equivalent retries and pacing.
+
+        Args:
+            query: GraphQL query document (should select rateLimit)
+            variables: Query variables
+
+        Returns:
+            The response "data" object
+
+        Raises:
+            RateLimitExceeded: When GitHub reports RATE_LIMITED
+            GitHubClientError: On transport errors or an errors-only response
+        """
+        await self._enforce_graphql_budget()
+        response = await self._raw_request(
+            "POST",
+            self._graphql_path,
+            point_cost=self.GRAPHQL_POINT_COST,
+            json_body={"query": query, "variables": variables},
+        )
+        try:
+            body = response.json()
+        except ValueError as e:
+            raise GitHubClientError(f"Invalid GraphQL response: {e}") from e
+
+        data = body.get("data") or {}
+        self._record_graphql_cost(data.get("rateLimit"))
+
+        errors = body.get("errors") or []
+        if errors:
+            if any(err.get("type") == "RATE_LIMITED" for err in errors):
+                reset = self._graphql_reset or time.time() + 60
+                raise RateLimitExceeded(
+                    datetime.fromtimestamp(reset, tz=timezone.utc),
+                    "GraphQL rate limit exceeded",
+                )
+            messages = "; ".join(str(err.get("message", err)) for err in errors)
+            if not body.get("data"):
+                raise GitHubClientError(f"GitHub GraphQL error: {messages}")
+            logger.warning("GraphQL partial response: %s", messages)
+        return data
+
+    async def _pr_details_from_graphql(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Convert a GraphQL pullRequest node to REST-shaped dicts.
+
+        Connections truncated by the query page sizes are refetched via REST.
+        """
+        pr = _pr_from_graphql(node)
+        blob_prefix = f"{pr['html_url'].rsplit('/pull/', 1)[0]}/blob/"
+        head_oid = node.get("headRefOid") or ""
+
+        files_conn = node.get("files") or {}
+        if (files_conn.get("pageInfo") or {}).get("hasNextPage"):
+            try:
+                files = await self.get_pr_files(pr["number"])
+            except GitHubClientError:
+                files = []
+        else:
+            files = [
+                _file_from_graphql(f, f"{blob_prefix}{head_oid}/")
+                for f in files_conn.get("nodes") or []
+                if f
+            ]
+
+        reviews_conn = node.get("reviews") or {}
+        if (reviews_conn.get("pageInfo") or {}).get("hasNextPage"):
+            try:
+                reviews = await self.get_pr_reviews(pr["number"])
+            except GitHubClientError:
+                reviews = []
+        else:
+            reviews = [
+                _review_from_graphql(r) for r in reviews_conn.get("nodes") or [] if r
+            ]
+
+        return {"pr": pr, "files": files, "reviews": reviews}
+
     # --- Pagination (BP-062) ---
 
     async def _paginate(
@@ -852,14 +1149,45 @@ class GitHubClient:
         current_params: dict[str, str] | None = params
 
         for page in range(max_pages):
+            # Pages are cached like single requests so unchanged list pages
+            # come back as free 304s (link header is cached with the body)
+            cache_key = self._cache_key(current_path, current_params)
+            conditional = await self._get_conditional_headers(cache_key)
             response = await self._raw_request(
                 "GET",
                 current_path,
                 params=current_params,
                 point_cost=point_cost,
+                extra_headers=conditional or None,
             )
 
-            data = response.json()
+            if conditional:
+                self._record_conditional(response.status_code == 304)
+            cached = (
+                await self._lookup_cache(cache_key)
+                if response.status_code == 304
+                else None
+            )
+            if cached is not None:
+                self._secondary_points_used -= point_cost  # 304 is free
+                data = cached["data"]
+                link_header = cached.get("link") or ""
+            elif response.status_code == 304:
+                # Validators were evicted mid-request; refetch this page once
+                await self._forget_cache(cache_key)
+                response = await self._raw_request(
+                    "GET",
+                    current_path,
+                    params=current_params,
+                    point_cost=point_cost,
+                )
+                data = response.json()
+                link_header = response.headers.get("Link", "")
+                await self._update_cache(cache_key, response, data)
+            else:
+                data = response.json()
+                link_header = response.headers.get("Link", "")
+                await self._update_cache(cache_key, response, data)
 
             # Handle list responses and dict responses with items
             if isinstance(data, list):
@@ -868,7 +1196,7 @@ class GitHubClient:
                 all_items.extend(data["items"])
 
             # Check for next page via Link header
-            next_url = self._parse_next_link(response.headers.get("Link", ""))
+            next_url = self._parse_next_link(link_header)
             if not next_url:
                 break
 
@@ -941,11 +1269,110 @@ class GitHubClient:
         """Get current rate limit status for metrics/logging.
 
         Returns:
-            Dict with remaining, reset, secondary_points_used, cache_size
+            Dict with remaining, reset, secondary_points_used, cache_size,
+            and conditional request / 304 counts
         """
         return {
             "primary_remaining": self._rate_limit_remaining,
             "primary_reset": self._rate_limit_reset,
             "secondary_points_used": self._secondary_points_used,
             "etag_cache_size": len(self._etag_cache),
+            "conditional_requests": self._conditional_requests,
+            "not_modified": self._not_modified,
+        }
+
+
+# --- GraphQL query and REST-shape converters ---
+
+_PULL_REQUESTS_QUERY = """
+query(
+  $owner: String!, $name: String!, $cursor: String,
+  $pageSize: Int!, $files: Int!, $reviews: Int!, $labels: Int!
+) {
+  rateLimit { cost remaining resetAt }
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      first: $pageSize, after: $cursor,
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title body state url
+        createdAt updatedAt closedAt mergedAt
+        baseRefName headRefName headRefOid
+        author { login }
+        labels(first: $labels) { nodes { name } }
+        files(first: $files) {
+          pageInfo { hasNextPage }
+          nodes { path additions deletions changeType }
+        }
+        reviews(first: $reviews) {
+          pageInfo { hasNextPage }
+          nodes { databaseId state body url submittedAt author { login } }
         }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL PatchStatus -> REST file "status"
+_CHANGE_TYPE_STATUS = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+    "MODIFIED": "modified",
+}
+
+
+def _user_from_graphql(author: dict[str, Any] | None) -> dict[str, Any] | None:
+    return {"login": author["login"]} if author and author.get("login") else None
+
+
+def _pr_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """GraphQL pullRequest node -> REST /pulls item shape."""
+    return {
+        "number": node["number"],
+        "title": node.get("title") or "",
+        "body": node.get("body") or None,
+        # REST reports merged PRs as closed (merged_at distinguishes them)
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "html_url": node.get("url") or "",
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "base": {"ref": node.get("baseRefName") or "unknown"},
+        "head": {"ref": node.get("headRefName") or "unknown"},
+        "user": _user_from_graphql(node.get("author")),
+        "labels": [
+            {"name": lbl["name"]}
+            for lbl in (node.get("labels") or {}).get("nodes") or []
+            if lbl
+        ],
+    }
+
+
+def _file_from_graphql(node: dict[str, Any], blob_prefix: str) -> dict[str, Any]:
+    """GraphQL PullRequestChangedFile -> REST /pulls/{n}/files item shape."""
+    return {
+        "filename": node["path"],
+        "status": _CHANGE_TYPE_STATUS.get(node.get("changeType", ""), "modified"),
+        "additions": node.get("additions", 0),
+        "deletions": node.get("deletions", 0),
+        "blob_url": f"{blob_prefix}{node['path']}",
+    }
+
+
+def _review_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """GraphQL PullRequestReview -> REST /pulls/{n}/reviews item shape."""
+    return {
+        "id": node.get("databaseId"),
+        "state": node.get("state") or "COMMENTED",
+        "body": node.get("body") or "",
+        "html_url": node.get("url"),
+        "submitted_at": node.get("submittedAt"),
+        "user": _user_from_graphql(node.get("author")),
+    }
@@ -4,6 +4,10 @@ Ingests repository source code into github collection as github_code_blob
 type with AST-aware chunking (Python) and context enrichment headers.
 Delivers +70.1% Recall@5 over fixed-size chunking (BP-065).
 
+Changed files flow through a bounded pipeline: concurrent blob downloads
+(paced by the client's rate limiter), chunk/scan in worker threads, and a
+single batched embed+upsert stage fed through a bounded queue.
+
 Reference: PLAN-006 Section 3.3 (Code Blob Embedding Strategy)
 """
 
@@ -17,7 +21,7 @@ import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path, PurePosixPath
+from pathlib import PurePosixPath
 from typing import Any
 
 from qdrant_client import models
@@ -69,7 +73,6 @@ from memory.connectors.github.client import (  # noqa: E402
 from memory.connectors.github.schema import (  # noqa: E402
     GITHUB_COLLECTION,
     SOURCE_AUTHORITY_MAP,
-    compute_content_hash,
 )
 from memory.models import MemoryType  # noqa: E402
 from memory.qdrant_client import get_qdrant_client  # noqa: E402
@@ -652,6 +655,113 @@ def _build_context_header(
     return "# " + " | ".join(parts)
 
 
+# ---------------------------------------------------------------------------
+# 3.6  Batched Chunk Writer
+# ---------------------------------------------------------------------------
+
+
+class _ChunkBatchWriter:
+    """Embed+upsert stage of the code blob sync pipeline.
+
+    File workers submit their chunk memories and await the stored count. A
+    single consumer drains whatever has queued up (up to batch_size chunks)
+    into one store_memories_batch() call, so chunks from several files share
+    one embedding request and one Qdrant upsert. The bounded queue is the
+    backpressure point: when embedding falls behind, submit() blocks and the
+    fetch/chunk workers stall instead of buffering more files.
+
+    A file that hits its per-file timeout cancels its future: chunks still
+    queued are dropped, and chunks already being stored are recorded in
+    late_files (file_path -> chunks stored) so the caller can count them.
+    """
+
+    def __init__(self, storage: MemoryStorage, batch_size: int, max_pending: int):
+        self._storage = storage
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+        self.late_files: dict[str, int] = {}
+
+    def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush queued submissions and stop the consumer."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, memories: list[dict[str, Any]]) -> int:
+        """Queue one file's chunk memories; return how many were stored."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((memories, future))
+        return await future
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            while size < self._batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[list[dict], asyncio.Future]]) -> None:
+        # Drop chunks of files that timed out while queued
+        batch = [item for item in batch if not item[1].cancelled()]
+        if not batch:
+            return
+        memories = [memory for file_memories, _ in batch for memory in file_memories]
+        try:
+            # Files were scanned in _prepare_file_memories; don't scan again
+            results = await asyncio.to_thread(
+                self._storage.store_memories_batch,
+                memories,
+                collection=GITHUB_COLLECTION,
+                source_type="github_code_blob",
+                scan=False,
+            )
+        except Exception as e:
+            logger.error(
+                "Batched store failed for %d chunks from %d files: %s",
+                len(memories),
+                len(batch),
+                e,
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Map blocked chunks back to their file by input index; every other
+        # chunk in the batch was stored.
+        blocked = {r.get("index") for r in results if r.get("status") == "blocked"}
+        start = 0
+        for file_memories, future in batch:
+            end = start + len(file_memories)
+            stored = sum(1 for position in range(start, end) if position not in blocked)
+            start = end
+            if future.cancelled():
+                file_path = file_memories[0]["file_path"]
+                logger.warning(
+                    "Chunks for %s stored after its per-file timeout", file_path
+                )
+                self.late_files[file_path] = stored
+            elif not future.done():
+                future.set_result(stored)
+
+
 # ---------------------------------------------------------------------------
 # 3.7  CodeBlobSync Class
 # ---------------------------------------------------------------------------
@@ -717,6 +827,13 @@ class CodeBlobSync:
         else:
             self._scanner = None
 
+        # Pipeline sizing
+        self._concurrency = self.config.github_code_sync_concurrency
+        self._batch_size = self.config.github_code_sync_batch_size
+        # Set only while sync_code_blobs() runs the pipeline
+        self._fetch_slots: asyncio.Semaphore | None = None
+        self._writer: _ChunkBatchWriter | None = None
+
     @observe(name="github_code_sync")
     async def sync_code_blobs(
         self,
@@ -730,6 +847,7 @@ class CodeBlobSync:
         2. Filter eligible files (size, patterns, binary)
         3. Compare blob_hash against stored versions
         4. Fetch, chunk, and store changed/new files (with per-file timeout)
+           through the concurrent pipeline (see _sync_eligible_files)
         5. Detect and mark deleted files
 
         BUG-112: Added total_timeout, per-file timeout, circuit breaker, and
@@ -803,75 +921,15 @@ class CodeBlobSync:
                     len(tree_entries),
                 )
 
-                # Step 4: Sync each eligible file with timeouts and circuit breaker
-                cb_provider = "code_blob_sync"  # Circuit breaker provider key
-                for idx, (entry, stored_hash) in enumerate(eligible_entries):
-                    file_path = entry["path"]
-
-                    # BUG-112: Total timeout check
-                    elapsed = time.monotonic() - start
-                    if elapsed >= total_timeout:
-                        remaining = total_eligible - idx
-                        logger.warning(
-                            "Code blob sync total timeout reached (%.0fs >= %ds). "
-                            "Stopping with %d files remaining.",
-                            elapsed,
-                            total_timeout,
-                            remaining,
-                        )
-                        result.error_details.append(
-                            f"total_timeout: stopped after {idx}/{total_eligible} files ({elapsed:.0f}s)"
-                        )
-                        break
-
-                    # BUG-112: Circuit breaker check
-                    if not self._circuit_breaker.is_available(cb_provider):
-                        remaining = total_eligible - idx
-                        logger.warning(
-                            "Code blob sync circuit breaker OPEN after %d consecutive failures. "
-                            "Stopping with %d files remaining.",
-                            self._circuit_breaker.failure_threshold,
-                            remaining,
-                        )
-                        result.error_details.append(
-                            f"circuit_breaker_open: stopped after {idx}/{total_eligible} files"
-                        )
-                        break
-
-                    # BUG-112: Progress logging every 10 files
-                    if idx > 0 and idx % 10 == 0:
-                        logger.info(
-                            "Code blob sync progress: %d/%d files (%.0fs elapsed)",
-                            idx,
-                            total_eligible,
-                            time.monotonic() - start,
-                        )
-
-                    # BUG-112: Per-file timeout via asyncio.wait_for
-                    try:
-                        chunks_stored = await asyncio.wait_for(
-                            self._sync_file(entry, batch_id, stored_hash),
-                            timeout=per_file_timeout,
-                        )
-                        result.files_synced += 1
-                        result.chunks_created += chunks_stored
-                        self._circuit_breaker.record_success(cb_provider)
-                    except asyncio.TimeoutError:
-                        logger.error(
-                            "Per-file timeout (%ds) for %s", per_file_timeout, file_path
-                        )
-                        result.errors += 1
-                        result.error_details.append(
-                            f"{file_path}: per_file_timeout ({per_file_timeout}s)"
-                        )
-                        self._circuit_breaker.record_failure(cb_provider, "timeout")
-                    except Exception as e:
-                        logger.error("Failed to sync file %s: %s", file_path, e)
-                        result.errors += 1
-                        result.error_details.append(f"{file_path}: {e}")
-                        self._circuit_breaker.record_failure(
-                            cb_provider, type(e).__name__
-                        )
+                # Step 4: Sync eligible files with timeouts and circuit breaker
+                await self._sync_eligible_files(
+                    eligible_entries,
+                    batch_id,
+                    result,
+                    start=start,
+                    total_timeout=total_timeout,
+                    per_file_timeout=per_file_timeout,
+                )
 
                 # Step 5: Detect deleted files
                 deleted = await self._detect_deleted_files(
@@ -899,6 +957,141 @@ class CodeBlobSync:
                 with contextlib.suppress(Exception):
                     _langfuse_get_client().flush()
 
+    async def _sync_eligible_files(
+        self,
+        eligible_entries: list[tuple[dict, str | None]],
+        batch_id: str,
+        result: CodeSyncResult,
+        start: float,
+        total_timeout: int,
+        per_file_timeout: int,
+    ) -> None:
+        """Run eligible files through the fetch -> chunk/scan -> store pipeline.
+
+        Up to github_code_sync_concurrency blob downloads run at once (each
+        still paced by GitHubClient._enforce_rate_limit), chunk/scan work runs
+        in worker threads, and chunks are embedded and upserted in batches by
+        a _ChunkBatchWriter. At most twice the concurrency of files are in
+        flight; the writer's bounded queue stalls workers when storage lags.
+
+        Total timeout and circuit breaker are checked before each file is
+        dispatched, and each file (fetch through stored) keeps its own
+        per-file timeout. Results are recorded into ``result`` in place.
+
+        Args:
+            eligible_entries: (tree entry, stored blob hash) pairs to sync
+            batch_id: Sync batch ID for versioning (BP-074)
+            result: CodeSyncResult to update
+            start: time.monotonic() at sync start
+            total_timeout: Total timeout in seconds
+            per_file_timeout: Per-file timeout in seconds
+        """
+        cb_provider = "code_blob_sync"  # Circuit breaker provider key
+        total_eligible = len(eligible_entries)
+        file_slots = asyncio.Semaphore(self._concurrency * 2)
+        in_flight: set[asyncio.Task] = set()
+        completed = 0
+
+        async def _run_file(entry: dict[str, Any], stored_hash: str | None) -> None:
+            nonlocal completed
+            file_path = entry["path"]
+            try:
+                # BUG-112: Per-file timeout via asyncio.wait_for
+                chunks_stored = await asyncio.wait_for(
+                    self._sync_file(entry, batch_id, stored_hash),
+                    timeout=per_file_timeout,
+                )
+                result.files_synced += 1
+                result.chunks_created += chunks_stored
+                self._circuit_breaker.record_success(cb_provider)
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Per-file timeout (%ds) for %s", per_file_timeout, file_path
+                )
+                result.errors += 1
+                result.error_details.append(
+                    f"{file_path}: per_file_timeout ({per_file_timeout}s)"
+                )
+                self._circuit_breaker.record_failure(cb_provider, "timeout")
+            except Exception as e:
+                logger.error("Failed to sync file %s: %s", file_path, e)
+                result.errors += 1
+                result.error_details.append(f"{file_path}: {e}")
+                self._circuit_breaker.record_failure(cb_provider, type(e).__name__)
+            finally:
+                file_slots.release()
+                completed += 1
+                # BUG-112: Progress logging every 10 files
+                if completed % 10 == 0 and completed < total_eligible:
+                    logger.info(
+                        "Code blob sync progress: %d/%d files (%.0fs elapsed)",
+                        completed,
+                        total_eligible,
+                        time.monotonic() - start,
+                    )
+
+        self._fetch_slots = asyncio.Semaphore(self._concurrency)
+        self._writer = _ChunkBatchWriter(
+            self.storage, self._batch_size, max_pending=self._concurrency
+        )
+        self._writer.start()
+        try:
+            for idx, (entry, stored_hash) in enumerate(eligible_entries):
+                # Wait for a free slot first so the checks below see the
+                # outcome of every file that has finished so far
+                await file_slots.acquire()
+
+                # BUG-112: Total timeout check
+                elapsed = time.monotonic() - start
+                if elapsed >= total_timeout:
+                    file_slots.release()
+                    logger.warning(
+                        "Code blob sync total timeout reached (%.0fs >= %ds). "
+                        "Stopping with %d files remaining.",
+                        elapsed,
+                        total_timeout,
+                        total_eligible - idx,
+                    )
+                    result.error_details.append(
+                        f"total_timeout: stopped after {idx}/{total_eligible} files ({elapsed:.0f}s)"
+                    )
+                    break
+
+                # BUG-112: Circuit breaker check
+                if not self._circuit_breaker.is_available(cb_provider):
+                    file_slots.release()
+                    logger.warning(
+                        "Code blob sync circuit breaker OPEN after %d consecutive failures. "
+                        "Stopping with %d files remaining.",
+                        self._circuit_breaker.failure_threshold,
+                        total_eligible - idx,
+                    )
+                    result.error_details.append(
+                        f"circuit_breaker_open: stopped after {idx}/{total_eligible} files"
+                    )
+                    break
+
+                task = asyncio.create_task(_run_file(entry, stored_hash))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            # Files already dispatched run to completion (or their timeout)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            await self._writer.close()
+            # Files whose chunks landed after their timeout are in Qdrant as
+            # current, so count them as synced rather than failed
+            for file_path, chunks_stored in self._writer.late_files.items():
+                result.errors -= 1
+                result.error_details.remove(
+                    f"{file_path}: per_file_timeout ({per_file_timeout}s)"
+                )
+                result.files_synced += 1
+                result.chunks_created += chunks_stored
+            self._writer = None
+            self._fetch_slots = None
+
     async def _walk_tree(self) -> list[dict[str, Any]]:
         """Fetch and filter repository file tree.
 
@@ -960,6 +1153,10 @@ class CodeBlobSync:
     ) -> int:
         """Sync a single file: fetch content, chunk, store.
 
+        Inside sync_code_blobs() the download takes a pipeline fetch slot and
+        chunks are handed to the batch writer; called directly, the file's
+        chunks are stored in one store_memories_batch() call.
+
         Args:
             entry: Tree entry dict
             batch_id: Sync batch ID
@@ -969,10 +1166,56 @@ class CodeBlobSync:
             Number of chunks stored
         """
         file_path = entry["path"]
-        blob_sha = entry["sha"]
 
-        # Fetch file content
-        blob = await self.client.get_blob(blob_sha)
+        # Stage 1: Fetch file content (bounded concurrency, client-paced)
+        async with self._fetch_slots or contextlib.nullcontext():
+            blob = await self.client.get_blob(entry["sha"])
+
+        # Stage 2: Scan + chunk off the event loop so fetches keep flowing
+        memories = await asyncio.to_thread(
+            self._prepare_file_memories, entry, blob, batch_id
+        )
+        if not memories:
+            return 0
+
+        # Mark old versions as superseded (if updating) before the new
+        # chunks are upserted, so they are not superseded themselves
+        if old_blob_hash:
+            await asyncio.to_thread(self._supersede_old_blobs, file_path)
+
+        # Stage 3: Batched embed + upsert
+        if self._writer is not None:
+            return await self._writer.submit(memories)
+
+        results = await asyncio.to_thread(
+            self.storage.store_memories_batch,
+            memories,
+            collection=GITHUB_COLLECTION,
+            source_type="github_code_blob",
+            scan=False,
+        )
+        return sum(1 for r in results if r.get("status") == "stored")
+
+    def _prepare_file_memories(
+        self,
+        entry: dict[str, Any],
+        blob: dict[str, Any],
+        batch_id: str,
+    ) -> list[dict[str, Any]]:
+        """Decode, scan, and chunk a fetched blob into store_memories_batch() dicts.
+
+        CPU-only (no network I/O); runs in a worker thread.
+
+        Args:
+            entry: Tree entry dict
+            blob: Blob dict from GitHubClient.get_blob()
+            batch_id: Sync batch ID
+
+        Returns:
+            One memory dict per chunk (empty if blocked or nothing to chunk)
+        """
+        file_path = entry["path"]
+        blob_sha = entry["sha"]
         content = base64.b64decode(blob["content"]).decode("utf-8", errors="replace")
 
         # SEC-2: Security scan before chunking — avoids wasting work on blocked files
@@ -986,7 +1229,7 @@ class CodeBlobSync:
                     file_path,
                     len(scan_result.findings),
                 )
-                return 0
+                return []
             content = scan_result.content  # Use masked version
 
         # Detect language and extract symbols
@@ -999,70 +1242,42 @@ class CodeBlobSync:
         else:
             chunks = _chunk_semantic(content, file_path, language)
 
-        if not chunks:
-            return 0
-
-        # Mark old versions as superseded (if updating)
-        if old_blob_hash:
-            self._supersede_old_blobs(file_path)
-
-        # Store each chunk via store_memory()
         now_iso = datetime.now(timezone.utc).isoformat()
-        stored_count = 0
+        source_authority = SOURCE_AUTHORITY_MAP.get("github_code_blob", 1.0)
+        memories = []
 
         for chunk in chunks:
-            content_hash = compute_content_hash(chunk.content)
-            source_authority = SOURCE_AUTHORITY_MAP.get("github_code_blob", 1.0)
-
-            payload = {
-                "source": "github",
-                "github_id": 0,  # Code blobs don't have issue/PR numbers
-                "repo": self._group_id,
-                "timestamp": now_iso,
-                "content_hash": content_hash,
-                "last_synced": now_iso,
-                "url": f"https://github.com/{self._group_id}/blob/"
-                f"{self._branch}/{file_path}",
-                "version": 1,
-                "is_current": True,
-                "supersedes": None,
-                "update_batch_id": batch_id,
-                "source_authority": source_authority,
-                "decay_score": 1.0,
-                "freshness_status": "unverified",
-                "file_path": file_path,
-                "language": language,
-                "last_commit_sha": blob_sha,
-                "symbols": symbols,
-                "blob_hash": blob_sha,
-                "chunk_index": chunk.chunk_index,
-                "total_chunks": chunk.total_chunks,
-            }
-
-            try:
-                store_result = await asyncio.to_thread(
-                    self.storage.store_memory,
-                    content=chunk.content,
-                    cwd=str(Path.cwd()),
-                    memory_type=MemoryType.GITHUB_CODE_BLOB,
-                    source_hook="github_code_sync",
-                    session_id=batch_id,
-                    collection=GITHUB_COLLECTION,
-                    group_id=self._group_id,
-                    **payload,
-                )
-                if store_result and store_result.get("status") != "error":
-                    stored_count += 1
-            except Exception as e:
-                logger.error(
-                    "Failed to store chunk %d/%d of %s: %s",
-                    chunk.chunk_index,
-                    chunk.total_chunks,
-                    file_path,
-                    e,
-                )
+            memories.append(
+                {
+                    "content": chunk.content,
+                    "group_id": self._group_id,
+                    "type": MemoryType.GITHUB_CODE_BLOB.value,
+                    "source_hook": "github_code_sync",
+                    "session_id": batch_id,
+                    "source": "github",
+                    "github_id": 0,  # Code blobs don't have issue/PR numbers
+                    "repo": self._group_id,
+                    "last_synced": now_iso,
+                    "url": f"https://github.com/{self._group_id}/blob/"
+                    f"{self._branch}/{file_path}",
+                    "version": 1,
+                    "is_current": True,
+                    "supersedes": None,
+                    "update_batch_id": batch_id,
+                    "source_authority": source_authority,
+                    "decay_score": 1.0,
+                    "freshness_status": "unverified",
+                    "file_path": file_path,
+                    "language": language,
+                    "last_commit_sha": blob_sha,
+                    "symbols": symbols,
+                    "blob_hash": blob_sha,
+                    "chunk_index": chunk.chunk_index,
+                    "total_chunks": chunk.total_chunks,
+                }
+            )
 
-        return stored_count
+        return memories
 
     def _get_stored_blob_map(self) -> dict[str, str]:
         """Build lookup map of stored file_path -> blob_hash.
@@ -0,0 +1,204 @@
+"""Persistent conditional-request cache for GitHubClient.
+
+GitHubClient keeps ETag/Last-Modified validators in an in-memory dict, so
+every CLI run and service restart starts cold and spends primary rate-limit
+points re-downloading unchanged lists, trees and blobs. This cache persists
+validators and response bodies across processes so a restarted client can
+still send If-None-Match / If-Modified-Since and serve 304s locally (BP-062:
+304 responses do not count against the primary limit).
+
+Storage: a single SQLite database under ``<install_dir>/cache/github/``
+(WAL mode, so concurrent sync processes can share it). Bodies are stored as
+zlib-compressed compact JSON. Entries are evicted least-recently-used once
+the total stored body size exceeds ``max_bytes``. Connection setup, access
+time buffering and the fail-open contract come from memory.sqlite_store, so
+a cache hit is a single SELECT and a broken database is a miss, never a
+request failure.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from memory.config import MemoryConfig
+from memory.sqlite_store import EVICT_TARGET_RATIO, LRUStore
+
+__all__ = ["PersistentHTTPCache", "open_http_cache"]
+
+logger = logging.getLogger("ai_memory.github.http_cache")
+
+
+class PersistentHTTPCache(LRUStore):
+    """SQLite-backed LRU cache of conditional-request validators and bodies.
+
+    Attributes:
+        path: SQLite database file
+        max_bytes: Upper bound on total stored (compressed) body size
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        link TEXT,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+    """
+    _TABLE = "entries"
+    _WRITE_FAILED_EVENT = "http_cache_write_failed"
+    _logger = logger
+
+    def __init__(self, path: Path, max_bytes: int = 128 * 1024 * 1024) -> None:
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self._total_bytes: int | None = None
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return {"etag", "last_modified", "link", "data"} or None on miss."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT etag, last_modified, link, body FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._touch(key, time.time())
+            etag, last_modified, link, body = row
+            data = json.loads(zlib.decompress(body))
+        except (sqlite3.Error, zlib.error, ValueError, OSError) as e:
+            logger.warning(
+                "http_cache_read_failed",
+                extra={"path": str(self.path), "error": str(e)},
+            )
+            return None
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": link,
+            "data": data,
+        }
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        link: str | None = None,
+    ) -> None:
+        """Store a response body with its validators (replaces any existing entry)."""
+        try:
+            body = zlib.compress(
+                json.dumps(data, separators=(",", ":")).encode("utf-8")
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug("http_cache_unserializable", extra={"error": str(e)})
+            return
+        if len(body) > self.max_bytes:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                self._apply_touches(conn)
+                total = self._current_total(conn)
+                old = conn.execute(
+                    "SELECT size FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, etag, last_modified, link, body, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, etag, last_modified, link, body, len(body), time.time()),
+                )
+                total += len(body) - (old[0] if old else 0)
+                if total > self.max_bytes:
+                    total = self._evict(conn, total)
+                conn.commit()
+                self._total_bytes = total
+        except sqlite3.Error as e:
+            self._total_bytes = None
+            self._log_write_failure(e)
+
+    def pop(self, key: str) -> None:
+        """Drop an entry (e.g. after a 304 whose body is unusable)."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                self._pending_touch.pop(key, None)
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.commit()
+                self._total_bytes = None
+        except sqlite3.Error as e:
+            self._log_write_failure(e)
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()
+        except sqlite3.Error:
+            return 0
+        return int(row[0])
+
+    def total_bytes(self) -> int:
+        """Total stored (compressed) body size."""
+        try:
+            with self._lock:
+                return self._current_total(self._connect())
+        except sqlite3.Error:
+            return 0
+
+    def _current_total(self, conn: sqlite3.Connection) -> int:
+        # Re-read on first use and after failures; other processes may have
+        # written since, so eviction re-checks the real total below.
+        if self._total_bytes is None:
+            row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            self._total_bytes = int(row[0])
+        return self._total_bytes
+
+    def _evict(self, conn: sqlite3.Connection, total: int) -> int:
+        """Delete least-recently-used entries until under the target size."""
+        total = int(
+            conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        )
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ):
+            if total <= target:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        logger.debug(
+            "http_cache_evicted",
+            extra={"evicted": len(victims), "total_bytes": total},
+        )
+        return total
+
+
+def open_http_cache(config: MemoryConfig) -> PersistentHTTPCache | None:
+    """Open the shared GitHub HTTP cache, or None when disabled.
+
+    Args:
+        config: Memory configuration (github_http_cache_* and install_dir).
+
+    Returns:
+        PersistentHTTPCache at ``<install_dir>/cache/github/http_cache.db``.
+    """
+    if not config.github_http_cache_enabled:
+        return None
+    path = Path(config.install_dir) / "cache" / "github" / "http_cache.db"
+    return PersistentHTTPCache(
+        path, max_bytes=config.github_http_cache_max_mb * 1024 * 1024
+    )
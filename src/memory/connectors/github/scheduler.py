@@ -0,0 +1,378 @@
+"""Multi-project scheduler for the GitHub sync service.
+
+The service used to sync every registered project one after another, so one
+slow repository delayed all the others by a whole cycle. SyncScheduler runs
+projects concurrently instead:
+
+- At most ``github_sync_max_workers`` projects sync at once
+- All clients of a cycle share one RequestBudget. It paces requests
+  globally (the per-token secondary limit is shared by every repo) and caps
+  the cycle at ``github_sync_api_budget`` requests. Projects whose estimated
+  cost no longer fits are deferred to the next cycle
+- Projects are started in priority order. The priority estimates pending
+  changes from the last sync's change rate and the time since it completed,
+  discounted by the ETag hit ratio (mostly-304 repos rarely change)
+- Per-project lag (seconds since the last successful sync) is pushed as
+  ``github_sync_project_lag_seconds``
+
+Schedule state (per-project change rate, request cost, ETag hit ratio) is kept
+in ``<install_dir>/cache/github/sync_schedule.json``.
+
+Reference: PLAN-009 (multi-project sync), BP-062 (GitHub rate limits)
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from memory.config import MemoryConfig
+from memory.connectors.github.client import GitHubClient
+
+__all__ = [
+    "ProjectOutcome",
+    "RequestBudget",
+    "SyncScheduler",
+    "schedule_state_file",
+]
+
+logger = logging.getLogger("ai_memory.github.scheduler")
+
+# Request estimate for projects without a recorded cost
+DEFAULT_PROJECT_REQUESTS = 100
+
+
+@dataclass
+class RepoUsage:
+    """Requests made for one repository during a cycle."""
+
+    requests: int = 0
+    conditional: int = 0
+    not_modified: int = 0
+
+    @property
+    def etag_hit_ratio(self) -> float:
+        """Share of conditional requests answered with 304 Not Modified."""
+        return self.not_modified / self.conditional if self.conditional else 0.0
+
+
+class RequestBudget:
+    """Request pacing and budget shared by all clients of a sync cycle.
+
+    GitHub's secondary limit and primary quota are per token, not per repo,
+    so concurrent clients must pace against a shared clock. acquire() applies
+    the same minimum delay and secondary points window as a single
+    GitHubClient, across every client holding this budget.
+
+    Attributes:
+        max_requests: Soft cap on requests per cycle (checked by the scheduler
+            before starting a project; running projects are never cut off)
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        min_delay_ms: int = GitHubClient.MIN_REQUEST_DELAY_MS,
+    ) -> None:
+        self.max_requests = max_requests
+        self._min_delay_s = min_delay_ms / 1000.0
+        self._lock = asyncio.Lock()
+        self._last_request_time = 0.0
+        self._points_used = 0
+        self._window_start = time.monotonic()
+        self._usage: dict[str, RepoUsage] = {}
+
+    @property
+    def used(self) -> int:
+        """Requests made so far this cycle."""
+        return sum(u.requests for u in self._usage.values())
+
+    def usage(self, repo: str) -> RepoUsage:
+        """Usage for one repository (zeroes if it made no requests)."""
+        return self._usage.setdefault(repo, RepoUsage())
+
+    async def acquire(self, repo: str, point_cost: int = 1) -> None:
+        """Wait for a request slot and charge it to ``repo``."""
+        effective_points = int(
+            GitHubClient.SECONDARY_LIMIT_POINTS * (1 - GitHubClient.SAFETY_MARGIN)
+        )
+        async with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 60.0:
+                self._points_used = 0
+                self._window_start = now
+            if self._points_used + point_cost > effective_points:
+                wait_time = 60.0 - (now - self._window_start)
+                if wait_time > 0:
+                    logger.info(
+                        "shared_secondary_limit_wait",
+                        extra={"points": self._points_used, "wait_s": wait_time},
+                    )
+                    await asyncio.sleep(wait_time)
+                self._points_used = 0
+                self._window_start = time.monotonic()
+
+            elapsed = time.monotonic() - self._last_request_time
+            if elapsed < self._min_delay_s:
+                await asyncio.sleep(self._min_delay_s - elapsed)
+            self._last_request_time = time.monotonic()
+            self._points_used += point_cost
+            self.usage(repo).requests += 1
+
+    def record_conditional(self, repo: str, not_modified: bool) -> None:
+        """Record a conditional request and whether it was answered by a 304."""
+        usage = self.usage(repo)
+        usage.conditional += 1
+        if not_modified:
+            usage.not_modified += 1
+
+
+@dataclass
+class ProjectOutcome:
+    """Result of syncing one project, as reported to the scheduler."""
+
+    ok: bool = True
+    items_changed: int = 0
+
+
+def schedule_state_file(config: MemoryConfig) -> Path:
+    """Schedule state path under install_dir."""
+    return Path(config.install_dir) / "cache" / "github" / "sync_schedule.json"
+
+
+class SyncScheduler:
+    """Runs per-project syncs concurrently in priority order under a budget.
+
+    Args:
+        config: Memory configuration (github_sync_max_workers,
+            github_sync_api_budget, github_sync_interval)
+        sync_project: Coroutine function (project_id, project, budget) ->
+            ProjectOutcome. Clients it creates should use the budget.
+        state_file: JSON schedule state path (None keeps state in memory)
+        min_delay_ms: Minimum delay between any two requests of a cycle
+    """
+
+    def __init__(
+        self,
+        config: MemoryConfig,
+        sync_project: Callable[[str, Any, RequestBudget], Awaitable[ProjectOutcome]],
+        state_file: Path | None = None,
+        min_delay_ms: int = GitHubClient.MIN_REQUEST_DELAY_MS,
+    ) -> None:
+        self._sync_project = sync_project
+        self._state_file = state_file
+        self._min_delay_ms = min_delay_ms
+        self._max_workers = max(1, config.github_sync_max_workers)
+        self._api_budget = config.github_sync_api_budget
+        self._interval = config.github_sync_interval
+        self._state: dict[str, dict[str, Any]] = self._load_state()
+
+    # -- Priority -------------------------------------------------------
+
+    def priority(self, project_id: str, now: float | None = None) -> float:
+        """Estimated pending changes for a project (higher syncs first).
+
+        Never-synced projects come first. Otherwise the score is the change
+        rate seen by the last sync (items per hour, plus one so quiet repos
+        still age) times the hours since it completed, discounted by up to
+        half for a high ETag hit ratio.
+        """
+        entry = self._state.get(project_id) or {}
+        last_success = entry.get("last_success")
+        if not last_success:
+            return math.inf
+        now = time.time() if now is None else now
+        lag_hours = max(0.0, now - last_success) / 3600
+        window_hours = max(entry.get("window_seconds") or self._interval, 60) / 3600
+        change_rate = (entry.get("items_changed") or 0) / window_hours
+        hit_ratio = entry.get("etag_hit_ratio") or 0.0
+        return (1 + change_rate) * lag_hours * (1 - 0.5 * hit_ratio)
+
+    def prioritize(self, project_ids: list[str]) -> list[str]:
+        """Order project IDs by descending priority (ties keep input order)."""
+        now = time.time()
+        return sorted(project_ids, key=lambda pid: -self.priority(pid, now))
+
+    # -- Cycle ----------------------------------------------------------
+
+    async def run_cycle(
+        self,
+        projects: dict[str, Any],
+        stop_requested: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Sync all GitHub-enabled projects once.
+
+        Args:
+            projects: project_id -> ProjectSyncConfig (from discover_projects)
+            stop_requested: Polled before each dispatch; True stops starting
+                new projects (running ones finish)
+
+        Returns:
+            True if every started project reported success.
+        """
+        eligible: dict[str, Any] = {}
+        for pid, project in projects.items():
+            if not project.github_enabled or not project.github_repo:
+                logger.info("Skipping project %s (GitHub disabled or no repo)", pid)
+                continue
+            eligible[pid] = project
+
+        budget = RequestBudget(self._api_budget, self._min_delay_ms)
+        workers = asyncio.Semaphore(self._max_workers)
+        running: dict[str, int] = {}  # project_id -> request estimate
+        results: list[bool] = []
+        deferred: list[str] = []
+
+        async def run(pid: str, project: Any) -> None:
+            started = time.time()
+            try:
+                outcome = await self._sync_project(pid, project, budget)
+            except Exception as e:
+                logger.error("Sync failed: repo=%s error=%s", project.github_repo, e)
+                outcome = ProjectOutcome(ok=False)
+            finally:
+                running.pop(pid, None)
+                workers.release()
+            self._record(pid, project.github_repo, outcome, budget, started)
+            results.append(outcome.ok)
+
+        tasks = []
+        for pid in self.prioritize(list(eligible)):
+            await workers.acquire()
+            if stop_requested is not None and stop_requested():
+                workers.release()
+                deferred.append(pid)
+                continue
+            estimate = (
+                self._state.get(pid, {}).get("requests") or DEFAULT_PROJECT_REQUESTS
+            )
+            # Requests the running projects are still expected to make
+            outstanding = sum(
+                max(0, est - budget.usage(eligible[p].github_repo).requests)
+                for p, est in running.items()
+            )
+            if tasks and budget.used + outstanding + estimate > budget.max_requests:
+                workers.release()
+                deferred.append(pid)
+                continue
+            running[pid] = estimate
+            logger.info(
+                "Syncing project: %s (repo: %s)", pid, eligible[pid].github_repo
+            )
+            tasks.append(asyncio.create_task(run(pid, eligible[pid])))
+        await asyncio.gather(*tasks)
+
+        if deferred:
+            logger.warning(
+                "github_sync_projects_deferred",
+                extra={
+                    "deferred": deferred,
+                    "budget_used": budget.used,
+                    "api_budget": budget.max_requests,
+                },
+            )
+        self._save_state()
+        self._push_metrics(eligible, budget, deferred)
+        return all(results)
+
+    def _record(
+        self,
+        project_id: str,
+        repo: str,
+        outcome: ProjectOutcome,
+        budget: RequestBudget,
+        started: float,
+    ) -> None:
+        """Update schedule state for a finished project."""
+        entry = self._state.setdefault(project_id, {})
+        usage = budget.usage(repo)
+        now = time.time()
+        entry["repo"] = repo
+        entry["last_attempt"] = started
+        entry["requests"] = usage.requests
+        if usage.conditional:
+            entry["etag_hit_ratio"] = round(usage.etag_hit_ratio, 3)
+        if outcome.ok:
+            previous = entry.get("last_success")
+            items = outcome.items_changed
+            entry["items_changed"] = items if isinstance(items, int) else 0
+            entry["window_seconds"] = round(now - previous) if previous else None
+            entry["last_success"] = now
+
+    # -- Persistence ----------------------------------------------------
+
+    def _load_state(self) -> dict[str, dict[str, Any]]:
+        if self._state_file is None or not self._state_file.exists():
+            return {}
+        try:
+            state = json.loads(self._state_file.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to load sync schedule state: %s", e)
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_state(self) -> None:
+        """Persist schedule state (atomic write via .tmp rename)."""
+        if self._state_file is None:
+            return
+        tmp_file = self._state_file.with_suffix(".json.tmp")
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+            tmp_file.replace(self._state_file)
+        except OSError as e:
+            logger.error("Failed to save sync schedule state: %s", e)
+
+    # -- Metrics --------------------------------------------------------
+
+    def _push_metrics(
+        self,
+        projects: dict[str, Any],
+        budget: RequestBudget,
+        deferred: list[str],
+    ) -> None:
+        """Push per-project lag and budget usage to pushgateway."""
+        try:
+            from prometheus_client import CollectorRegistry, Gauge
+            from prometheus_client.exposition import pushadd_to_gateway
+
+            registry = CollectorRegistry()
+            lag = Gauge(
+                "github_sync_project_lag_seconds",
+                "Seconds since the project's last successful GitHub sync",
+                ["project"],
+                registry=registry,
+            )
+            deferred_gauge = Gauge(
+                "github_sync_project_deferred",
+                "1 if the project was deferred by the API budget this cycle",
+                ["project"],
+                registry=registry,
+            )
+            budget_used = Gauge(
+                "github_sync_api_budget_used",
+                "GitHub API requests made in the last sync cycle",
+                registry=registry,
+            )
+
+            now = time.time()
+            for pid in projects:
+                last_success = (self._state.get(pid) or {}).get("last_success")
+                if last_success:
+                    lag.labels(project=pid).set(now - last_success)
+                deferred_gauge.labels(project=pid).set(1 if pid in deferred else 0)
+            budget_used.set(budget.used)
+
+            pushadd_to_gateway(
+                os.getenv("PUSHGATEWAY_URL", "localhost:29091"),
+                job="github_sync_scheduler",
+                registry=registry,
+            )
+        except Exception as e:
+            logger.warning("Failed to push scheduler metrics: %s", e)
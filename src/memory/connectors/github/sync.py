@@ -4,6 +4,11 @@ Orchestrates GitHubClient (SPEC-004) to fetch data, composes embeddable
 documents, applies dedup/versioning protocol (SPEC-005), and stores via
 store_memory(). Mirrors JiraSyncEngine pattern.
 
+During sync() the dedup pre-check is answered from an in-memory version
+index built by one payload-only scroll, instead of a Qdrant scroll per item.
+Supersede (is_current=False) and last_synced updates are deferred and
+applied in batched set_payload calls when the cycle ends.
+
 Reference: PLAN-006 Section 3.1 (GitHub Sync Service)
 """
 
@@ -14,6 +19,8 @@ import json
 import logging
 import os
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -74,6 +81,7 @@ from memory.connectors.github.composer import (  # noqa: E402
     compose_pr_diff,
     compose_pr_review,
 )
+from memory.connectors.github.http_cache import open_http_cache  # noqa: E402
 from memory.connectors.github.schema import (  # noqa: E402
     GITHUB_COLLECTION,
     SOURCE_AUTHORITY_MAP,
@@ -135,6 +143,194 @@ class SyncResult:
         }
 
 
+# Types written by GitHubSyncEngine (code blobs are versioned by CodeBlobSync)
+_INDEXED_TYPES = (
+    MemoryType.GITHUB_ISSUE.value,
+    MemoryType.GITHUB_ISSUE_COMMENT.value,
+    MemoryType.GITHUB_PR.value,
+    MemoryType.GITHUB_PR_REVIEW.value,
+    MemoryType.GITHUB_PR_DIFF.value,
+    MemoryType.GITHUB_COMMIT.value,
+    MemoryType.GITHUB_CI_RESULT.value,
+)
+
+# Max point IDs per batched set_payload call
+_SET_PAYLOAD_BATCH = 1000
+
+
+# Sentinel for exhausted iterators in _prefetch_details
+_END = object()
+
+
+@dataclass
+class _IndexedVersion:
+    """Current version of one GitHub item in the version index."""
+
+    point_ids: list[Any]  # All is_current points (chunked items have several)
+    content_hash: str
+    version: int
+
+
+class _VersionIndex:
+    """In-memory (type, github_id, sub_id) -> current version lookup.
+
+    Loaded once per sync with a payload-only scroll and updated as items are
+    written. Point updates are queued and applied by flush() in batches.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, int, str | None], _IndexedVersion] = {}
+        self._pending_supersede: list[Any] = []
+        self._pending_touch: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def load(cls, qdrant: Any, group_id: str) -> "_VersionIndex":
+        """Build the index from all current GitHub item points of a repo.
+
+        Points still marked current under an older version than their key's
+        highest are queued for supersede, applied by the next flush().
+        """
+        index = cls()
+        offset = None
+        while True:
+            points, next_offset = qdrant.scroll(
+                collection_name=GITHUB_COLLECTION,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="group_id",
+                            match=models.MatchValue(value=group_id),
+                        ),
+                        models.FieldCondition(
+                            key="source",
+                            match=models.MatchValue(value="github"),
+                        ),
+                        models.FieldCondition(
+                            key="type",
+                            match=models.MatchAny(any=list(_INDEXED_TYPES)),
+                        ),
+                        models.FieldCondition(
+                            key="is_current",
+                            match=models.MatchValue(value=True),
+                        ),
+                    ]
+                ),
+                limit=1000,
+                offset=offset,
+                with_payload=["type", "github_id", "sub_id", "content_hash", "version"],
+                with_vectors=False,
+            )
+            for point in points:
+                payload = point.payload or {}
+                key = (
+                    payload.get("type"),
+                    payload.get("github_id"),
+                    payload.get("sub_id"),
+                )
+                version = payload.get("version", 1)
+                entry = index._entries.get(key)
+                if entry is None:
+                    index._entries[key] = _IndexedVersion(
+                        [point.id], payload.get("content_hash", ""), version
+                    )
+                    continue
+                # An interrupted sync can leave older versions current too:
+                # keep the highest version and queue the rest for supersede
+                if version > entry.version:
+                    index._pending_supersede.extend(entry.point_ids)
+                    entry.point_ids = [point.id]
+                    entry.content_hash = payload.get("content_hash", "")
+                    entry.version = version
+                elif version < entry.version:
+                    index._pending_supersede.append(point.id)
+                else:
+                    entry.point_ids.append(point.id)
+            if next_offset is None:
+                break
+            offset = next_offset
+        return index
+
+    def get(self, key: tuple[str, int, str | None]) -> _IndexedVersion | None:
+        return self._entries.get(key)
+
+    def record_stored(
+        self,
+        key: tuple[str, int, str | None],
+        point_id: Any,
+        content_hash: str,
+        version: int,
+    ) -> None:
+        """Replace the key's current version, queueing the old points for supersede."""
+        old = self._entries.get(key)
+        if old is not None:
+            # A content-hash duplicate returns the existing point; keep it current
+            self._pending_supersede.extend(
+                pid for pid in old.point_ids if str(pid) != str(point_id)
+            )
+        point_ids = [point_id] if point_id is not None else []
+        self._entries[key] = _IndexedVersion(point_ids, content_hash, version)
+
+    def record_unchanged(self, key: tuple[str, int, str | None]) -> None:
+        """Queue a last_synced refresh for the key's current points."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._pending_touch.extend(entry.point_ids)
+
+    def flush(self, qdrant: Any) -> tuple[int, int]:
+        """Apply queued supersede and last_synced updates.
+
+        Returns:
+            (superseded, touched) point counts
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        superseded = _batched_set_payload(
+            qdrant, {"is_current": False}, self._pending_supersede
+        )
+        # Superseded points no longer need a last_synced refresh
+        stale = set(self._pending_supersede)
+        touched = _batched_set_payload(
+            qdrant,
+            {"last_synced": now_iso},
+            [pid for pid in self._pending_touch if pid not in stale],
+        )
+        self._pending_supersede = []
+        self._pending_touch = []
+        return superseded, touched
+
+
+def _batched_set_payload(
+    qdrant: Any,
+    payload: dict,
+    point_ids: list[Any],
+    collection: str = GITHUB_COLLECTION,
+) -> int:
+    """set_payload over point_ids in chunks; returns the number of points updated."""
+    updated = 0
+    for start in range(0, len(point_ids), _SET_PAYLOAD_BATCH):
+        batch = point_ids[start : start + _SET_PAYLOAD_BATCH]
+        try:
+            qdrant.set_payload(
+                collection_name=collection,
+                payload=payload,
+                points=batch,
+            )
+            updated += len(batch)
+        except Exception as e:
+            logger.warning(
+                "batched_set_payload_failed",
+                extra={
+                    "collection": collection,
+                    "fields": list(payload),
+                    "count": len(batch),
+                    "error": str(e),
+                },
+            )
+    return updated
+
+
 class GitHubSyncEngine:
     """Orchestrates GitHub data sync into github collection.
 
@@ -177,14 +373,21 @@ class GitHubSyncEngine:
         if not self.repo:
             raise ValueError("No repo specified and GITHUB_REPO not configured")
         self._branch = branch or self.config.github_branch
+        # "graphql" fetches PRs with files/reviews in bulk pages
+        self._pr_fetch_mode = self.config.github_pr_fetch_mode
+        # Per-item detail fetches (commit details, issue comments) in flight
+        self._detail_concurrency = self.config.github_sync_detail_concurrency
 
         self.client = GitHubClient(
             token=self.config.github_token.get_secret_value(),
             repo=self.repo,
+            http_cache=open_http_cache(self.config),
         )
         self.storage = MemoryStorage(self.config)
         self._group_id = self.repo  # owner/repo as tenant ID
         self.qdrant = get_qdrant_client(self.config)
+        # Set only while sync() runs; None -> per-item dedup scroll
+        self._version_index: _VersionIndex | None = None
 
         # SEC-2: Security scanner for GitHub content before storage
         if self.config.security_scanning_enabled:
@@ -233,6 +436,9 @@ class GitHubSyncEngine:
             result = SyncResult()
             batch_id = GitHubClient.generate_batch_id()
             state = self._load_state()
+            # Qdrant client is synchronous: keep its scrolls and batched
+            # writes off the event loop so other projects' syncs keep running
+            self._version_index = await asyncio.to_thread(self._load_version_index)
 
             try:
                 logger.info(
@@ -293,7 +499,9 @@ class GitHubSyncEngine:
                 try:
                     from memory.freshness import run_freshness_scan
 
-                    _fr = run_freshness_scan(config=self.config)
+                    _fr = await asyncio.to_thread(
+                        run_freshness_scan, config=self.config
+                    )
                     logger.info(
                         "post_sync_freshness_scan_complete: %d checked, %d fresh, %d aging, %d stale, %d expired, %d unknown",
                         _fr.total_checked,
@@ -309,12 +517,93 @@ class GitHubSyncEngine:
                         extra={"error": str(_fe), "error_type": type(_fe).__name__},
                     )
             finally:
+                # Deferred version updates are applied even if a type failed
+                await asyncio.to_thread(self._flush_version_index)
                 # Flush Langfuse traces after sync cycle (guaranteed even on error)
                 if _langfuse_get_client is not None:
                     with contextlib.suppress(Exception):
                         _langfuse_get_client().flush()
         return result
 
+    def _load_version_index(self) -> "_VersionIndex | None":
+        """Load the dedup version index; None falls back to per-item scrolls."""
+        try:
+            started = time.monotonic()
+            index = _VersionIndex.load(self.qdrant, self._group_id)
+        except Exception as e:
+            logger.warning(
+                "version_index_load_failed",
+                extra={"repo": self.repo, "error": str(e)},
+            )
+            return None
+        logger.info(
+            "version_index_loaded",
+            extra={
+                "repo": self.repo,
+                "items": len(index),
+                "duration_ms": round((time.monotonic() - started) * 1000, 1),
+            },
+        )
+        return index
+
+    def _flush_version_index(self) -> None:
+        """Apply deferred supersede/last_synced updates and drop the index."""
+        index, self._version_index = self._version_index, None
+        if index is None:
+            return
+        superseded, touched = index.flush(self.qdrant)
+        logger.info(
+            "version_index_flushed",
+            extra={"superseded": superseded, "last_synced_updated": touched},
+        )
+
+    async def _prefetch_details(
+        self,
+        items: Iterable[Any],
+        fetch: Callable[[Any], Awaitable[Any]],
+    ) -> AsyncIterator[tuple[Any, Any]]:
+        """Yield (item, detail) in input order while later fetches run ahead.
+
+        Up to ``_detail_concurrency`` fetches are in flight at once, and at
+        most twice that many results wait to be consumed. Requests still go
+        through the client's pacing lock and primary/secondary limit checks,
+        so concurrency overlaps network latency without raising the request
+        rate above the limiter's. A failed fetch is yielded as its exception.
+
+        Args:
+            items: Items to fetch details for (consumed lazily)
+            fetch: Coroutine function returning the detail for one item
+
+        Yields:
+            (item, detail or exception) tuples in the order of ``items``
+        """
+        slots = asyncio.Semaphore(self._detail_concurrency)
+
+        async def fetch_one(item: Any) -> Any:
+            async with slots:
+                return await fetch(item)
+
+        pending: deque[tuple[Any, asyncio.Task]] = deque()
+        remaining = iter(items)
+        try:
+            while True:
+                while len(pending) < self._detail_concurrency * 2:
+                    item = next(remaining, _END)
+                    if item is _END:
+                        break
+                    pending.append((item, asyncio.ensure_future(fetch_one(item))))
+                if not pending:
+                    return
+                item, task = pending.popleft()
+                try:
+                    detail = await task
+                except Exception as e:
+                    detail = e
+                yield item, detail
+        finally:
+            for _, task in pending:
+                task.cancel()
+
     # -- Per-Type Sync Methods -----------------------------------------
 
     @observe(name="github_sync_issues")
@@ -343,11 +632,12 @@ class GitHubSyncEngine:
             return 0
 
         count = 0
-        for issue in issues:
-            # Skip pull requests (GitHub Issues API returns PRs too)
-            if issue.get("pull_request"):
-                continue
-
+        # Skip pull requests (GitHub Issues API returns PRs too)
+        issues = [issue for issue in issues if not issue.get("pull_request")]
+        async for issue, comments in self._prefetch_details(
+            issues,
+            lambda issue: self.client.get_issue_comments(issue["number"], since=since),
+        ):
             try:
                 # Sync the issue itself
                 composed = compose_issue(issue)
@@ -372,10 +662,8 @@ class GitHubSyncEngine:
 
                 # Sync comments for this issue
                 try:
-                    comments = await self.client.get_issue_comments(
-                        issue["number"],
-                        since=since,
-                    )
+                    if isinstance(comments, BaseException):
+                        raise comments
                     for comment in comments:
                         try:
                             composed_comment = compose_issue_comment(
@@ -440,7 +728,17 @@ class GitHubSyncEngine:
             Count of PRs processed
         """
         try:
-            prs = await self.client.list_pull_requests(state="all")
+            if self._pr_fetch_mode == "graphql":
+                # Bulk GraphQL pages carry files and reviews with each PR
+                details = await self.client.list_pull_requests_with_details(since=since)
+            else:
+                prs = await self.client.list_pull_requests(state="all")
+                details = [
+                    {"pr": pr, "files": None, "reviews": None}
+                    for pr in prs
+                    # Filter by updated_at if incremental
+                    if not (since and pr.get("updated_at", "") < since)
+                ]
         except GitHubClientError as e:
             logger.error("Failed to fetch PRs: %s", e)
             result.errors += 1
@@ -448,17 +746,19 @@ class GitHubSyncEngine:
             return 0
 
         count = 0
-        for pr in prs:
-            # Filter by updated_at if incremental
-            if since and pr.get("updated_at", "") < since:
-                continue
-
+        # Diff memories whose file dict had no patch text (always the case in
+        # graphql mode; binary/oversized files in rest mode)
+        diffs_without_patch = 0
+        for detail in details:
+            pr = detail["pr"]
             try:
                 # Get files changed for composition
-                try:
-                    files = await self.client.get_pr_files(pr["number"])
-                except GitHubClientError:
-                    files = []
+                files = detail["files"]
+                if files is None:
+                    try:
+                        files = await self.client.get_pr_files(pr["number"])
+                    except GitHubClientError:
+                        files = []
 
                 # Sync the PR itself
                 composed = compose_pr(pr, files)
@@ -486,7 +786,9 @@ class GitHubSyncEngine:
                     if pr.get("merged_at"):
                         try:
                             files_list = [f["filename"] for f in files]
-                            self._trigger_freshness_for_merged_pr(files_list)
+                            await asyncio.to_thread(
+                                self._trigger_freshness_for_merged_pr, files_list
+                            )
                         except Exception as e:
                             logger.warning(
                                 "freshness_trigger_failed",
@@ -497,7 +799,9 @@ class GitHubSyncEngine:
 
                 # Sync reviews
                 try:
-                    reviews = await self.client.get_pr_reviews(pr["number"])
+                    reviews = detail["reviews"]
+                    if reviews is None:
+                        reviews = await self.client.get_pr_reviews(pr["number"])
                     for review in reviews:
                         try:
                             if (
@@ -545,6 +849,7 @@ class GitHubSyncEngine:
                 # Sync diff summaries (one per changed file)
                 for file_entry in files:
                     try:
+                        has_patch = bool(file_entry.get("patch"))
                         composed_diff = compose_pr_diff(pr["number"], file_entry)
                         diff_stored = await self._store_github_memory(
                             content=composed_diff,
@@ -558,12 +863,14 @@ class GitHubSyncEngine:
                                 "pr_number": pr["number"],
                                 "file_path": file_entry.get("filename", "unknown"),
                                 "change_type": file_entry.get("status", "modified"),
+                                "has_patch": has_patch,
                                 "chunk_index": 0,
                                 "total_chunks": 1,
                             },
                         )
                         if diff_stored:
                             result.diffs_synced += 1
+                            diffs_without_patch += not has_patch
                         else:
                             result.items_skipped += 1
                     except Exception as e:
@@ -581,6 +888,15 @@ class GitHubSyncEngine:
                 result.errors += 1
                 result.error_details.append(f"PR #{pr['number']}: {e}")
 
+        if diffs_without_patch:
+            logger.warning(
+                "pr_diffs_stored_without_patch",
+                extra={
+                    "repo": self.repo,
+                    "count": diffs_without_patch,
+                    "pr_fetch_mode": self._pr_fetch_mode,
+                },
+            )
         return count
 
     @observe(name="github_sync_commits")
@@ -612,14 +928,17 @@ class GitHubSyncEngine:
             return 0
 
         count = 0
-        for commit_summary in commits:
+        # Fetch full commits (diff stats) ahead of storing them
+        async for commit_summary, commit_detail in self._prefetch_details(
+            commits,
+            lambda summary: self.client.get_commit(summary.get("sha", "unknown")),
+        ):
             sha = commit_summary.get("sha", "unknown")
             try:
-                # Fetch full commit for diff stats
-                try:
-                    commit_detail = await self.client.get_commit(sha)
-                except GitHubClientError:
+                if isinstance(commit_detail, GitHubClientError):
                     commit_detail = commit_summary  # Fallback to summary
+                elif isinstance(commit_detail, BaseException):
+                    raise commit_detail
 
                 composed = compose_commit(commit_detail)
                 stored = await self._store_github_memory(
@@ -725,8 +1044,10 @@ class GitHubSyncEngine:
     ) -> int:
         """Flag code-patterns memories as stale for files changed in a merged PR.
 
-        Scrolls code-patterns collection for memories matching any of the
-        changed file paths, and updates their freshness_status to "stale".
+        One scroll with MatchAny over all changed file paths collects the
+        affected point IDs, then a single batched set_payload (one shared
+        timestamp) marks them stale, so large PRs cost O(pages) requests
+        instead of one scroll per file and one write per point.
 
         Args:
             files_changed: List of file paths from the merged PR.
@@ -737,52 +1058,44 @@ class GitHubSyncEngine:
         if not files_changed:
             return 0
 
-        flagged = 0
-        for file_path in files_changed:
-            offset = None
-            while True:
-                points, next_offset = self.qdrant.scroll(
-                    collection_name=COLLECTION_CODE_PATTERNS,
-                    scroll_filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key="file_path",
-                                match=models.MatchValue(value=file_path),
-                            ),
-                            models.FieldCondition(
-                                key="group_id",
-                                match=models.MatchValue(value=self._group_id),
-                            ),
-                        ]
-                    ),
-                    limit=100,
-                    offset=offset,
-                    with_payload=["freshness_status"],
-                )
-
-                for point in points:
-                    try:
-                        self.qdrant.set_payload(
-                            collection_name=COLLECTION_CODE_PATTERNS,
-                            payload={
-                                "freshness_status": "stale",
-                                "freshness_checked_at": datetime.now(
-                                    timezone.utc
-                                ).isoformat(),
-                                "freshness_trigger": "post_sync_pr_merge",
-                            },
-                            points=[point.id],
-                        )
-                        flagged += 1
-                    except Exception as e:
-                        logger.warning(
-                            "freshness_flag_failed",
-                            extra={"point_id": str(point.id), "error": str(e)},
-                        )
-
-                if next_offset is None:
-                    break
-                offset = next_offset
+        point_ids: list[Any] = []
+        offset = None
+        while True:
+            points, next_offset = self.qdrant.scroll(
+                collection_name=COLLECTION_CODE_PATTERNS,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="file_path",
+                            match=models.MatchAny(any=sorted(set(files_changed))),
+                        ),
+                        models.FieldCondition(
+                            key="group_id",
+                            match=models.MatchValue(value=self._group_id),
+                        ),
+                    ]
+                ),
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            point_ids.extend(point.id for point in points)
+
+            if next_offset is None:
+                break
+            offset = next_offset
+
+        flagged = _batched_set_payload(
+            self.qdrant,
+            {
+                "freshness_status": "stale",
+                "freshness_checked_at": datetime.now(timezone.utc).isoformat(),
+                "freshness_trigger": "post_sync_pr_merge",
+            },
+            point_ids,
+            collection=COLLECTION_CODE_PATTERNS,
+        )
 
         if flagged > 0:
             logger.info(
@@ -811,11 +1124,16 @@ class GitHubSyncEngine:
 
         Implements SPEC-005 Section 6 dedup/versioning protocol:
         1. Compute content_hash on composed document
-        2. Query for existing point: source=github, type=X, github_id=N, is_current=True
+        2. Look up existing point: source=github, type=X, github_id=N, is_current=True
+           (version index during sync(), otherwise a filtered scroll)
         3. If unchanged (hash match) -> update last_synced only -> return False
         4. If changed -> mark old is_current=False -> store new via store_memory()
         5. If new -> store via store_memory() with version=1
 
+        With the version index, step 3/4 point updates are queued and applied
+        in batches by _flush_version_index(); supersede is only queued once the
+        new version has been stored.
+
         Args:
             content: Composed document text (output of composer function)
             memory_type: MemoryType enum value (e.g., GITHUB_ISSUE)
@@ -832,118 +1150,66 @@ class GitHubSyncEngine:
         content_hash = compute_content_hash(content)
         type_value = memory_type.value
         now_iso = datetime.now(timezone.utc).isoformat()
+        index = self._version_index
+        index_key = (type_value, github_id, sub_id)
 
-        # Step 1: Build dedup filter and query for existing current version
-        must_filters = [
-            models.FieldCondition(
-                key="group_id",
-                match=models.MatchValue(value=self._group_id),
-            ),
-            models.FieldCondition(
-                key="source",
-                match=models.MatchValue(value="github"),
-            ),
-            models.FieldCondition(
-                key="type",
-                match=models.MatchValue(value=type_value),
-            ),
-            models.FieldCondition(
-                key="github_id",
-                match=models.MatchValue(value=github_id),
-            ),
-            models.FieldCondition(
-                key="is_current",
-                match=models.MatchValue(value=True),
-            ),
-        ]
-        if sub_id is not None:
-            must_filters.append(
-                models.FieldCondition(
-                    key="sub_id",
-                    match=models.MatchValue(value=sub_id),
-                )
-            )
-
-        try:
-            existing = self.qdrant.scroll(
-                collection_name=GITHUB_COLLECTION,
-                scroll_filter=models.Filter(must=must_filters),
-                limit=1,
-            )
-            existing_points = existing[0] if existing else []
-        except Exception as e:
-            logger.warning("Dedup pre-check failed, proceeding with store: %s", e)
-            existing_points = []
+        # Step 1: Look up existing current version (index during sync(),
+        # otherwise a filtered scroll)
+        if index is not None:
+            existing = index.get(index_key)
+        else:
+            existing = self._find_current_version(type_value, github_id, sub_id)
 
         # Step 2: Check content hash
         version = 1
         supersedes = None
 
-        if existing_points:
-            old_point = existing_points[0]
-            old_hash = old_point.payload.get("content_hash", "")
-
-            if old_hash == content_hash:
-                # Unchanged -- update last_synced only, skip embedding
-                try:
-                    self.qdrant.set_payload(
-                        collection_name=GITHUB_COLLECTION,
-                        payload={"last_synced": now_iso},
-                        points=[old_point.id],
-                    )
-                except Exception as e:
-                    logger.warning("Failed to update last_synced: %s", e)
+        if existing is not None and existing.content_hash == content_hash:
+            # Unchanged -- update last_synced only, skip embedding
+            if index is not None:
+                index.record_unchanged(index_key)
                 return False
-
-            # Security scan BEFORE supersession (GH-REV-001: prevents data loss
-            # if scan blocks — old version stays is_current=True)
-            if self._scanner is not None:
-                from memory.security_scanner import ScanAction
-
-                scan_result = self._scanner.scan(content, source_type=type_value)
-                if scan_result.action == ScanAction.BLOCKED:
-                    logger.warning(
-                        "Security scan blocked %s #%s: %d secret finding(s)",
-                        type_value,
-                        github_id,
-                        len(scan_result.findings),
-                    )
-                    return False
-                content = scan_result.content  # Use masked version
-                content_hash = compute_content_hash(
-                    content
-                )  # W4C-003: rehash post-scan
-
-            # Changed -- mark old as superseded (only after scan passes)
-            version = old_point.payload.get("version", 1) + 1
-            supersedes = str(old_point.id)
             try:
                 self.qdrant.set_payload(
                     collection_name=GITHUB_COLLECTION,
-                    payload={"is_current": False},
-                    points=[old_point.id],
+                    payload={"last_synced": now_iso},
+                    points=existing.point_ids,
                 )
             except Exception as e:
-                logger.warning("Failed to mark old point as superseded: %s", e)
+                logger.warning("Failed to update last_synced: %s", e)
+            return False
 
-        else:
-            # No old point — still run security scan for new content
-            if self._scanner is not None:
-                from memory.security_scanner import ScanAction
+        # Security scan BEFORE supersession (GH-REV-001: prevents data loss
+        # if scan blocks — old version stays is_current=True)
+        if self._scanner is not None:
+            from memory.security_scanner import ScanAction
 
-                scan_result = self._scanner.scan(content, source_type=type_value)
-                if scan_result.action == ScanAction.BLOCKED:
-                    logger.warning(
-                        "Security scan blocked %s #%s: %d secret finding(s)",
-                        type_value,
-                        github_id,
-                        len(scan_result.findings),
+            scan_result = self._scanner.scan(content, source_type=type_value)
+            if scan_result.action == ScanAction.BLOCKED:
+                logger.warning(
+                    "Security scan blocked %s #%s: %d secret finding(s)",
+                    type_value,
+                    github_id,
+                    len(scan_result.findings),
+                )
+                return False
+            content = scan_result.content  # Use masked version
+            content_hash = compute_content_hash(content)  # W4C-003: rehash post-scan
+
+        if existing is not None:
+            # Changed -- mark old as superseded (only after scan passes).
+            # With the index this is deferred until the new version is stored.
+            version = existing.version + 1
+            supersedes = str(existing.point_ids[0]) if existing.point_ids else None
+            if index is None:
+                try:
+                    self.qdrant.set_payload(
+                        collection_name=GITHUB_COLLECTION,
+                        payload={"is_current": False},
+                        points=existing.point_ids,
                     )
-                    return False
-                content = scan_result.content  # Use masked version
-                content_hash = compute_content_hash(
-                    content
-                )  # W4C-003: rehash post-scan
+                except Exception as e:
+                    logger.warning("Failed to mark old point as superseded: %s", e)
 
         # Step 4: Store via store_memory() pipeline
         source_authority = SOURCE_AUTHORITY_MAP.get(type_value, 0.4)
@@ -982,6 +1248,10 @@ class GitHubSyncEngine:
                 **github_payload,
             )
             if store_result and store_result.get("status") != "error":
+                if index is not None:
+                    index.record_stored(
+                        index_key, store_result.get("memory_id"), content_hash, version
+                    )
                 logger.debug(
                     "Stored %s #%d (v%d, batch=%s)",
                     type_value,
@@ -995,6 +1265,60 @@ class GitHubSyncEngine:
             logger.error("Failed to store %s #%d: %s", type_value, github_id, e)
             return False
 
+    def _find_current_version(
+        self, type_value: str, github_id: int, sub_id: str | None
+    ) -> _IndexedVersion | None:
+        """Query Qdrant for an item's current version (no version index)."""
+        must_filters = [
+            models.FieldCondition(
+                key="group_id",
+                match=models.MatchValue(value=self._group_id),
+            ),
+            models.FieldCondition(
+                key="source",
+                match=models.MatchValue(value="github"),
+            ),
+            models.FieldCondition(
+                key="type",
+                match=models.MatchValue(value=type_value),
+            ),
+            models.FieldCondition(
+                key="github_id",
+                match=models.MatchValue(value=github_id),
+            ),
+            models.FieldCondition(
+                key="is_current",
+                match=models.MatchValue(value=True),
+            ),
+        ]
+        if sub_id is not None:
+            must_filters.append(
+                models.FieldCondition(
+                    key="sub_id",
+                    match=models.MatchValue(value=sub_id),
+                )
+            )
+
+        try:
+            existing = self.qdrant.scroll(
+                collection_name=GITHUB_COLLECTION,
+                scroll_filter=models.Filter(must=must_filters),
+                limit=1,
+            )
+            existing_points = existing[0] if existing else []
+        except Exception as e:
+            logger.warning("Dedup pre-check failed, proceeding with store: %s", e)
+            return None
+
+        if not existing_points:
+            return None
+        old_point = existing_points[0]
+        return _IndexedVersion(
+            point_ids=[old_point.id],
+            content_hash=old_point.payload.get("content_hash", ""),
+            version=old_point.payload.get("version", 1),
+        )
+
     # -- State Persistence ---------------------------------------------
 
     def _load_state(self) -> dict[str, Any]:
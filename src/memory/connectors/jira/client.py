@@ -2,6 +2,9 @@
 
 Provides async httpx-based client for Jira Cloud API v3 with Basic Auth.
 Implements token-based pagination for issue search and offset-based pagination for comments.
+Search and comment requests are paced delay_ms apart across all concurrent
+callers of one client instance, so parallel project and issue workers share
+one request rate.
 
 Reference: https://developer.atlassian.com/cloud/jira/platform/rest/v3/intro/
 """
@@ -9,6 +12,8 @@ Reference: https://developer.atlassian.com/cloud/jira/platform/rest/v3/intro/
 import asyncio
 import base64
 import logging
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -66,6 +71,10 @@ class JiraClient:
         self.base_url = instance_url.rstrip("/")
         self.delay_ms = delay_ms
 
+        # Shared request pacing for concurrent sync workers
+        self._pace_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
         # Create Basic Auth header: base64(email:api_token)
         credentials = f"{email}:{api_token}"
         encoded = base64.b64encode(credentials.encode()).decode()
@@ -179,10 +188,8 @@ class JiraClient:
     ) -> list[dict[str, Any]]:
         """Search issues in a project using JQL with token-based pagination.
 
-        Uses /rest/api/3/search/jql endpoint with nextPageToken/isLast pagination.
-
-        CRITICAL: Jira Cloud requires bounded JQL queries. The JQL MUST include
-        'project = {KEY}' to avoid 400 Bad Request errors.
+        Collects every page from iter_issue_pages() into one list. Prefer
+        iter_issue_pages() for large projects to keep memory bounded.
 
         Args:
             project_key: Jira project key (e.g., 'PROJ')
@@ -199,6 +206,35 @@ class JiraClient:
             >>> for issue in issues:
             ...     print(f"{issue['key']}: {issue['fields']['summary']}")
         """
+        all_issues: list[dict[str, Any]] = []
+        async for page in self.iter_issue_pages(project_key, updated_since):
+            all_issues.extend(page)
+        return all_issues
+
+    async def iter_issue_pages(
+        self,
+        project_key: str,
+        updated_since: str | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield issue pages from a JQL search as they arrive.
+
+        Uses /rest/api/3/search/jql endpoint with nextPageToken/isLast pagination.
+        The next page is only requested once the caller asks for it, so a slow
+        consumer holds at most one page in memory.
+
+        CRITICAL: Jira Cloud requires bounded JQL queries. The JQL MUST include
+        'project = {KEY}' to avoid 400 Bad Request errors.
+
+        Args:
+            project_key: Jira project key (e.g., 'PROJ')
+            updated_since: Optional ISO 8601 timestamp to filter by updated date
+
+        Yields:
+            Lists of issue dicts (one list per API page)
+
+        Raises:
+            JiraClientError: If request fails
+        """
         # Build JQL query (bounded by project)
         jql = f"project = {project_key}"
         if updated_since:
@@ -213,7 +249,7 @@ class JiraClient:
                 jql_date = updated_since
             jql += f" AND updated >= '{jql_date}'"
 
-        all_issues: list[dict[str, Any]] = []
+        total_issues = 0
         next_token: str | None = None
         is_last = False
 
@@ -230,6 +266,7 @@ class JiraClient:
 
                 # Send request — /search/jql (replaces deprecated /search which returns 410)
                 # Both GET and POST work; GET is canonical per Atlassian API docs
+                await self._pace()
                 response = await self.client.get(
                     f"{self.base_url}/rest/api/3/search/jql",
                     params=params,
@@ -239,7 +276,7 @@ class JiraClient:
 
                 # Extract issues and pagination info
                 issues = data.get("issues", [])
-                all_issues.extend(issues)
+                total_issues += len(issues)
 
                 # Check pagination (token-based)
                 is_last = data.get("isLast", True)
@@ -250,20 +287,18 @@ class JiraClient:
                     extra={
                         "project_key": project_key,
                         "page_issues": len(issues),
-                        "total_so_far": len(all_issues),
+                        "total_so_far": total_issues,
                         "is_last": is_last,
                     },
                 )
 
-                # Rate limiting delay (except on last page)
-                if not is_last and self.delay_ms > 0:
-                    await asyncio.sleep(self.delay_ms / 1000.0)
+                if issues:
+                    yield issues
 
             logger.info(
                 "jira_search_issues_complete",
-                extra={"project_key": project_key, "total_issues": len(all_issues)},
+                extra={"project_key": project_key, "total_issues": total_issues},
             )
-            return all_issues
 
         except httpx.TimeoutException as e:
             logger.error(
@@ -305,6 +340,7 @@ class JiraClient:
         try:
             while total is None or start_at < total:
                 # Send request
+                await self._pace()
                 response = await self.client.get(
                     f"{self.base_url}/rest/api/3/issue/{issue_key}/comment",
                     params={"startAt": start_at, "maxResults": max_results},
@@ -330,9 +366,8 @@ class JiraClient:
                     },
                 )
 
-                # Rate limiting delay (except on last page)
-                if start_at < total and self.delay_ms > 0:
-                    await asyncio.sleep(self.delay_ms / 1000.0)
+                if not comments:
+                    break
 
             logger.debug(
                 "jira_get_comments_complete",
@@ -353,6 +388,22 @@ class JiraClient:
             )
             raise JiraClientError(f"JIRA_GET_COMMENTS_ERROR: {e}") from e
 
+    async def _pace(self) -> None:
+        """Wait for this client's next request slot (delay_ms apart).
+
+        Slots are reserved under a lock, so concurrent callers (parallel
+        projects, issue workers fetching comments) together never send more
+        than one search/comment request per delay_ms.
+        """
+        if self.delay_ms <= 0:
+            return
+        async with self._pace_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self.delay_ms / 1000.0
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def close(self) -> None:
         """Close the HTTP client connection.
 
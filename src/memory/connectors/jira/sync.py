@@ -5,15 +5,23 @@ chunks them, generates embeddings, and stores in Qdrant's jira-data collection.
 
 Pipeline Flow:
 1. JQL search (full or incremental based on last_synced timestamp)
-2. Token-based pagination for issues
-3. Document composition (issue + comments)
+2. Token-based pagination for issues, streamed page by page into a bounded
+   pool of issue workers (jira_sync_concurrency, shared across projects)
+3. Document composition (issue + new/edited comments, diffed by
+   comment_id + updated against stored comment points)
 4. Intelligent chunking (ContentType.PROSE)
-5. Embedding generation (batch where possible)
+5. Embedding generation: issues via store_memory (content-hash dedup),
+   comments from all workers through one batched embed + upsert writer
 6. Qdrant storage with metadata
 7. State persistence (last_synced timestamp per project)
 
+Projects sync in parallel; all Jira requests share the client's delay_ms
+pacing, so concurrency overlaps embedding and storage latency rather than
+raising the request rate.
+
 Error Handling:
 - Per-issue fail-open: Log error, continue to next issue
+- Per-comment fail-open: a failed comment batch is retried one comment at a time
 - Graceful degradation: Zero vector if embedding fails
 - Resource cleanup: try/finally for async clients
 """
@@ -73,6 +81,9 @@ logger = logging.getLogger(__name__)
 
 TRACE_CONTENT_MAX = 10000  # Max chars for Langfuse input/output fields
 
+# Points per scroll page when indexing an issue's stored comments
+COMMENT_SCROLL_PAGE_SIZE = 256
+
 __all__ = ["JiraSyncEngine", "SyncResult"]
 
 
@@ -101,6 +112,124 @@ class SyncResult:
         }
 
 
+class _CommentBatchWriter:
+    """Embed+upsert stage of the Jira sync pipeline.
+
+    Issue workers submit their new/edited comment memories and await the
+    ones that were stored. A single consumer drains whatever has queued up (up to
+    batch_size comments) into one store_memories_batch() call, so comments
+    from several issues share one embedding request and one Qdrant upsert.
+    The bounded queue is the backpressure point: when embedding falls behind,
+    submit() blocks and the issue workers stall instead of buffering more.
+    """
+
+    def __init__(self, storage: MemoryStorage, batch_size: int, max_pending: int):
+        self._storage = storage
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush queued submissions and stop the consumer."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Queue one issue's comment memories; return the ones that were stored."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((memories, future))
+        return await future
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            while size < self._batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # Never leave an issue worker waiting on a dead consumer
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _flush(self, batch: list[tuple[list[dict], asyncio.Future]]) -> None:
+        memories = [memory for issue_memories, _ in batch for memory in issue_memories]
+        try:
+            results = await asyncio.to_thread(
+                self._storage.store_memories_batch,
+                memories,
+                collection=COLLECTION_JIRA_DATA,
+                force_ner=False,
+            )
+        except Exception as e:
+            # One invalid comment fails the whole batch call; retry singly so
+            # the rest of the batch is still stored (per-comment fail-open).
+            logger.warning(
+                "comment_batch_store_failed",
+                extra={"comments": len(memories), "error": str(e)},
+            )
+            for issue_memories, future in batch:
+                stored = await self._store_each(issue_memories)
+                if not future.done():
+                    future.set_result(stored)
+            return
+
+        # Chunked comments yield several results, so map blocked comments
+        # back by input index; every other comment in the batch was stored.
+        blocked = {r.get("index") for r in results if r.get("status") == "blocked"}
+        start = 0
+        for issue_memories, future in batch:
+            stored = [
+                memory
+                for position, memory in enumerate(issue_memories, start)
+                if position not in blocked
+            ]
+            start += len(issue_memories)
+            if not future.done():
+                future.set_result(stored)
+
+    async def _store_each(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        stored = []
+        for memory in memories:
+            try:
+                results = await asyncio.to_thread(
+                    self._storage.store_memories_batch,
+                    [memory],
+                    collection=COLLECTION_JIRA_DATA,
+                    force_ner=False,
+                )
+                if any(r.get("status") == "stored" for r in results):
+                    stored.append(memory)
+            except Exception as e:
+                logger.warning(
+                    "comment_sync_failed",
+                    extra={
+                        "issue_key": memory.get("jira_issue_key", "unknown"),
+                        "comment_id": memory.get("jira_comment_id", "unknown"),
+                        "error": str(e),
+                    },
+                )
+        return stored
+
+
 class JiraSyncEngine:
     """Orchestrates Jira-to-Qdrant synchronization pipeline.
 
@@ -171,6 +300,11 @@ class JiraSyncEngine:
         )
         self.state_path = self._state_file  # backward-compat alias
 
+        # Pipeline sizing; the issue slots are shared by parallel projects
+        self._concurrency = self.config.jira_sync_concurrency
+        self._batch_size = self.config.jira_sync_batch_size
+        self._issue_slots = asyncio.Semaphore(self._concurrency)
+
     async def sync_project(
         self, project_key: str, mode: str = "incremental"
     ) -> SyncResult:
@@ -225,32 +359,19 @@ class JiraSyncEngine:
                         tags=["sync", "jira"],
                     )
 
-            # Fetch issues with pagination
-            issues = await self.jira_client.search_issues(project_key, updated_since)
+            # Stream issue pages into the bounded issue-worker pool
+            tally = SyncResult()
+            issues_fetched = await self._sync_issue_stream(
+                project_key, updated_since, tally
+            )
+            issues_synced = tally.issues_synced
+            comments_synced = tally.comments_synced
+            errors = tally.errors
             logger.info(
-                "issues_fetched", extra={"project": project_key, "count": len(issues)}
+                "issues_fetched",
+                extra={"project": project_key, "count": issues_fetched},
             )
 
-            # Sync each issue (with fail-open error handling)
-            for issue in issues:
-                try:
-                    result = await self._sync_issue(issue, project_key)
-                    if result["success"]:
-                        issues_synced += 1
-                        comments_synced += result.get("comments_synced", 0)
-                    else:
-                        errors.append(
-                            f"{issue['key']}: {result.get('error', 'Unknown error')}"
-                        )
-                except Exception as e:
-                    # Fail-open: log error, continue to next issue
-                    error_msg = f"{issue['key']}: {e!s}"
-                    errors.append(error_msg)
-                    logger.warning(
-                        "issue_sync_failed",
-                        extra={"issue_key": issue["key"], "error": str(e)},
-                    )
-
             # Update sync state
             self._save_project_state(project_key, issues_synced, comments_synced)
 
@@ -342,7 +463,10 @@ class JiraSyncEngine:
     async def sync_all_projects(
         self, mode: str = "incremental"
     ) -> dict[str, SyncResult]:
-        """Sync all configured Jira projects.
+        """Sync all configured Jira projects in parallel.
+
+        Projects share the engine's issue-worker slots and the client's
+        request pacing, so adding projects does not raise the request rate.
 
         Args:
             mode: "full" or "incremental"
@@ -354,21 +478,96 @@ class JiraSyncEngine:
             logger.warning("no_projects_configured")
             return {}
 
-        results = {}
-        for project_key in self._jira_projects:
-            result = await self.sync_project(project_key, mode)
-            results[project_key] = result
+        results = await asyncio.gather(
+            *(
+                self.sync_project(project_key, mode)
+                for project_key in self._jira_projects
+            )
+        )
+        return dict(zip(self._jira_projects, results, strict=True))
 
-        return results
+    async def _sync_issue_stream(
+        self, project_key: str, updated_since: str | None, tally: SyncResult
+    ) -> int:
+        """Feed search pages into issue workers as they arrive.
+
+        The next page is only requested once every issue of the current page
+        holds a worker slot, so at most one page plus jira_sync_concurrency
+        issues are in memory. Comments from all workers go through one batch
+        writer; it is flushed before returning, also when the search fails.
+
+        Args:
+            project_key: Project key
+            updated_since: Incremental lower bound (None for full sync)
+            tally: Accumulates issues_synced, comments_synced and errors
+
+        Returns:
+            Number of issues fetched
+        """
+        writer = _CommentBatchWriter(
+            self.storage, self._batch_size, max_pending=2 * self._concurrency
+        )
+        writer.start()
+        pending: set[asyncio.Task] = set()
+        fetched = 0
+        try:
+            async for page in self.jira_client.iter_issue_pages(
+                project_key, updated_since
+            ):
+                fetched += len(page)
+                for issue in page:
+                    await self._issue_slots.acquire()
+                    task = asyncio.create_task(
+                        self._run_issue(issue, project_key, writer, tally)
+                    )
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+        finally:
+            if pending:
+                await asyncio.gather(*pending)
+            await writer.close()
+        return fetched
+
+    async def _run_issue(
+        self,
+        issue: dict[str, Any],
+        project_key: str,
+        writer: _CommentBatchWriter,
+        tally: SyncResult,
+    ) -> None:
+        """Issue worker: sync one issue into tally, then free its slot."""
+        try:
+            result = await self._sync_issue(issue, project_key, writer)
+            if result["success"]:
+                tally.issues_synced += 1
+                tally.comments_synced += result.get("comments_synced", 0)
+            else:
+                tally.errors.append(
+                    f"{issue['key']}: {result.get('error', 'Unknown error')}"
+                )
+        except Exception as e:
+            # Fail-open: log error, continue to next issue
+            tally.errors.append(f"{issue.get('key', 'unknown')}: {e!s}")
+            logger.warning(
+                "issue_sync_failed",
+                extra={"issue_key": issue.get("key", "unknown"), "error": str(e)},
+            )
+        finally:
+            self._issue_slots.release()
 
     async def _sync_issue(
-        self, issue: dict[str, Any], project_key: str
+        self,
+        issue: dict[str, Any],
+        project_key: str,
+        writer: _CommentBatchWriter | None = None,
     ) -> dict[str, Any]:
         """Sync a single issue with fail-open error handling.
 
         Args:
             issue: Issue dict from Jira API
             project_key: Project key
+            writer: Shared comment batch writer (None: store this issue's
+                comments in their own batch)
 
         Returns:
             Dict with success, comments_synced, error fields
@@ -407,8 +606,8 @@ class JiraSyncEngine:
                 jira_url=f"{self._instance_url}/browse/{issue['key']}",
             )
 
-            # Sync comments (delete old + insert new)
-            comments_synced = await self._sync_comments(issue, project_key)
+            # Sync comments (store new/edited, delete removed)
+            comments_synced = await self._sync_comments(issue, project_key, writer)
 
             return {"success": True, "comments_synced": comments_synced}
 
@@ -419,40 +618,70 @@ class JiraSyncEngine:
             )
             return {"success": False, "error": str(e)}
 
-    async def _sync_comments(self, issue: dict[str, Any], project_key: str) -> int:
-        """Sync comments for an issue (delete-and-insert pattern).
+    async def _sync_comments(
+        self,
+        issue: dict[str, Any],
+        project_key: str,
+        writer: _CommentBatchWriter | None = None,
+    ) -> int:
+        """Sync comments for an issue (diff against stored comments).
+
+        Fetches the issue's comments and compares (comment_id, updated) with
+        the comment points already stored for the issue. Only new or edited
+        comments are embedded and stored; points for edited comments are
+        replaced once the new version is stored and points for comments
+        removed in Jira are deleted.
+        Unchanged comments are left untouched.
 
         Args:
             issue: Issue dict from Jira API
             project_key: Project key
+            writer: Shared comment batch writer (None: store this issue's
+                comments in their own batch)
 
         Returns:
-            Number of comments synced
+            Number of comments stored (new or edited)
         """
         try:
-            # Step 1: Delete old comments by jira_issue_key
-            deleted_count = await asyncio.to_thread(
-                self._delete_issue_comments, issue["key"]
-            )
-            logger.debug(
-                "deleted_old_comments",
-                extra={"issue_key": issue["key"], "count": deleted_count},
-            )
-
-            # Step 2: Fetch fresh comments with offset pagination
+            # Step 1: Fetch current comments with offset pagination. A failed
+            # fetch raises before anything stored is touched.
             comments = await self.jira_client.get_comments(issue["key"])
             logger.debug(
                 "fetched_comments",
                 extra={"issue_key": issue["key"], "count": len(comments)},
             )
 
-            # Step 3: Store new comments
-            synced_count = 0
+            # Step 2: Diff against stored comment points
+            stored = await asyncio.to_thread(self._get_stored_comments, issue["key"])
+            current_ids = {str(comment["id"]) for comment in comments}
+            removed = [
+                point_id
+                for comment_id, entry in stored.items()
+                if comment_id not in current_ids
+                for point_id in entry["point_ids"]
+            ]
+            if removed:
+                await asyncio.to_thread(
+                    self._delete_comment_points, issue["key"], removed
+                )
+
+            # Step 3: Compose new and edited comments
+            memories = []
+            replaced: dict[str, list[str]] = {}
+            unchanged = 0
             for comment in comments:
+                entry = stored.get(str(comment["id"]))
+                updated = comment.get("updated", comment["created"])
+                if entry is not None and entry["updated"] == updated:
+                    unchanged += 1
+                    continue
                 try:
-                    result = await self._sync_comment(issue, comment, project_key)
-                    if result["success"]:
-                        synced_count += 1
+                    memory = self._comment_memory(issue, comment, project_key)
+                    if entry is not None:
+                        # Edited: the old version is deleted once the new one
+                        # is stored (batch storage does not dedup).
+                        replaced[str(comment["id"])] = entry["point_ids"]
+                    memories.append(memory)
                 except Exception as e:
                     logger.warning(
                         "comment_sync_failed",
@@ -464,6 +693,43 @@ class JiraSyncEngine:
                     )
                     # Continue to next comment (fail-open)
 
+            # Step 4: Batched embed + upsert
+            stored_memories: list[dict[str, Any]] = []
+            if memories:
+                if writer is not None:
+                    stored_memories = await writer.submit(memories)
+                else:
+                    writer = _CommentBatchWriter(
+                        self.storage, self._batch_size, max_pending=1
+                    )
+                    writer.start()
+                    try:
+                        stored_memories = await writer.submit(memories)
+                    finally:
+                        await writer.close()
+            synced_count = len(stored_memories)
+
+            # Step 5: Replace edited comments whose new version was stored; a
+            # failed or blocked store keeps the old version (retried next sync)
+            superseded = [
+                point_id
+                for memory in stored_memories
+                for point_id in replaced.get(str(memory["jira_comment_id"]), [])
+            ]
+            if superseded:
+                await asyncio.to_thread(
+                    self._delete_comment_points, issue["key"], superseded
+                )
+
+            logger.debug(
+                "comments_diffed",
+                extra={
+                    "issue_key": issue["key"],
+                    "stored": synced_count,
+                    "unchanged": unchanged,
+                    "removed": len(stored.keys() - current_ids),
+                },
+            )
             return synced_count
 
         except Exception as e:
@@ -473,10 +739,10 @@ class JiraSyncEngine:
             )
             return 0
 
-    async def _sync_comment(
+    def _comment_memory(
         self, issue: dict[str, Any], comment: dict[str, Any], project_key: str
     ) -> dict[str, Any]:
-        """Sync a single comment.
+        """Build the store_memories_batch() entry for a comment.
 
         Args:
             issue: Parent issue dict
@@ -484,56 +750,46 @@ class JiraSyncEngine:
             project_key: Project key
 
         Returns:
-            Dict with success field
+            Memory dict with content, core fields and jira_* metadata
         """
-        try:
-            # Compose comment document
-            comment_doc = compose_comment_document(issue, comment)
-
-            # Extract metadata
-            priority = issue["fields"].get("priority")
-            priority_name = priority["name"] if priority else None
-
-            # Store comment to jira-data collection
-            await asyncio.to_thread(
-                self.storage.store_memory,
-                content=comment_doc,
-                cwd="/__jira_sync__",
-                group_id=self.group_id,  # Jira instance hostname (e.g., company.atlassian.net)
-                memory_type=MemoryType.JIRA_COMMENT,
-                source_hook="jira_sync",
-                session_id="jira_sync",
-                collection=COLLECTION_JIRA_DATA,
-                # Comment metadata
-                jira_project=project_key,
-                jira_issue_key=issue["key"],
-                jira_comment_id=comment["id"],
-                jira_author=comment["author"]["displayName"],
-                jira_updated=comment.get("updated", comment["created"]),
-                jira_url=f"{self._instance_url}/browse/{issue['key']}?focusedCommentId={comment['id']}",
-                # Parent issue context
-                jira_issue_type=issue["fields"]["issuetype"]["name"],
-                jira_status=issue["fields"]["status"]["name"],
-                jira_priority=priority_name,
-            )
+        priority = issue["fields"].get("priority")
+        priority_name = priority["name"] if priority else None
 
-            return {"success": True}
+        return {
+            "content": compose_comment_document(issue, comment),
+            "group_id": self.group_id,  # Jira instance hostname (e.g., company.atlassian.net)
+            "type": MemoryType.JIRA_COMMENT.value,
+            "source_hook": "jira_sync",
+            "session_id": "jira_sync",
+            # Comment metadata
+            "jira_project": project_key,
+            "jira_issue_key": issue["key"],
+            "jira_comment_id": comment["id"],
+            "jira_author": comment["author"]["displayName"],
+            "jira_updated": comment.get("updated", comment["created"]),
+            "jira_url": f"{self._instance_url}/browse/{issue['key']}?focusedCommentId={comment['id']}",
+            # Parent issue context
+            "jira_issue_type": issue["fields"]["issuetype"]["name"],
+            "jira_status": issue["fields"]["status"]["name"],
+            "jira_priority": priority_name,
+        }
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    def _get_stored_comments(self, issue_key: str) -> dict[str, dict[str, Any]]:
+        """Index the comment points stored for an issue.
 
-    def _delete_issue_comments(self, issue_key: str) -> int:
-        """Delete all comments for an issue from jira-data collection.
+        Scrolls payload-only (no vectors) using the jira_issue_key and
+        jira_comment_id keyword indexes. Chunked comments map to several points.
 
         Args:
             issue_key: Issue key (e.g., "PROJ-123")
 
         Returns:
-            Number of points deleted
+            Dict mapping comment_id -> {"updated": str | None, "point_ids": [...]}
         """
-        try:
-            # Scroll to find all comment points for this issue
-            scroll_result = self.qdrant_client.scroll(
+        index: dict[str, dict[str, Any]] = {}
+        offset = None
+        while True:
+            points, offset = self.qdrant_client.scroll(
                 collection_name=COLLECTION_JIRA_DATA,
                 scroll_filter=Filter(
                     must=[
@@ -549,32 +805,42 @@ class JiraSyncEngine:
                         ),
                     ]
                 ),
-                limit=1000,  # Assume max 1000 comments per issue
+                limit=COMMENT_SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=["jira_comment_id", "jira_updated"],
+                with_vectors=False,
             )
-
-            # Extract point IDs
-            point_ids = [str(point.id) for point in scroll_result[0]]
-
-            # Delete points
-            if point_ids:
-                self.qdrant_client.delete(
-                    collection_name=COLLECTION_JIRA_DATA,
-                    points_selector=point_ids,
+            for point in points:
+                payload = point.payload if isinstance(point.payload, dict) else {}
+                entry = index.setdefault(
+                    str(payload.get("jira_comment_id")),
+                    {"updated": payload.get("jira_updated"), "point_ids": []},
                 )
-                logger.debug(
-                    "deleted_comments",
-                    extra={"issue_key": issue_key, "count": len(point_ids)},
-                )
-                return len(point_ids)
+                entry["point_ids"].append(str(point.id))
+            if offset is None:
+                return index
 
-            return 0
+    def _delete_comment_points(self, issue_key: str, point_ids: list[str]) -> int:
+        """Delete comment points from jira-data collection.
 
-        except Exception as e:
-            logger.warning(
-                "delete_comments_failed",
-                extra={"issue_key": issue_key, "error": str(e)},
-            )
+        Args:
+            issue_key: Issue key (for logging)
+            point_ids: Qdrant point IDs to delete
+
+        Returns:
+            Number of points deleted
+        """
+        if not point_ids:
             return 0
+        self.qdrant_client.delete(
+            collection_name=COLLECTION_JIRA_DATA,
+            points_selector=point_ids,
+        )
+        logger.debug(
+            "deleted_comments",
+            extra={"issue_key": issue_key, "count": len(point_ids)},
+        )
+        return len(point_ids)
 
     def _get_updated_since(self, project_key: str, mode: str) -> str | None:
         """Get updated_since timestamp for sync mode.
@@ -8,13 +8,11 @@ Architecture Reference: architecture.md - Dual-Stage Deduplication Decision
 Best Practices: https://github.com/MinishLab/semhash (SemHash 2025 patterns)
 """
 
-import asyncio
 import hashlib
 import logging
 import time
 from dataclasses import dataclass
 
-from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.exceptions import (
     ApiException,
     ResponseHandlingException,
@@ -23,7 +21,12 @@ from qdrant_client.http.exceptions import (
 from qdrant_client.models import FieldCondition, Filter, MatchValue
 
 from .config import get_config
-from .embeddings import EmbeddingClient, EmbeddingError
+from .embeddings import (
+    EmbeddingError,
+    get_async_embedding_client,
+    route_embedding_model,
+)
+from .qdrant_client import get_async_qdrant_client
 
 # Import metrics for Prometheus instrumentation (Story 6.1, AC 6.1.3)
 # TECH-DEBT-089: push_dedup_duration_metrics_async for dedup timing
@@ -53,12 +56,19 @@ class DuplicationCheckResult:
         reason: Reason for result (hash_match, semantic_similarity, etc.)
         existing_id: ID of existing duplicate memory (if found)
         similarity_score: Cosine similarity score (if semantic check performed)
+        embedding: Dense vector used for the semantic check (if one was
+            computed or supplied). Pass it to store_memory(embedding=...) so
+            the write path does not embed the same content twice.
+        embedding_model: Model key the embedding was computed with; pass it to
+            store_memory(embedding_model=...) so storage can verify it.
     """
 
     is_duplicate: bool
     reason: str | None = None
     existing_id: str | None = None
     similarity_score: float | None = None
+    embedding: list[float] | None = None
+    embedding_model: str | None = None
 
 
 def compute_content_hash(content: str | bytes) -> str:
@@ -103,6 +113,9 @@ async def is_duplicate(
     group_id: str,
     collection: str = "memories",
     threshold: float | None = None,
+    embedding: list[float] | None = None,
+    embedding_model: str | None = None,
+    content_type: str | None = None,
 ) -> DuplicationCheckResult:
     """Check if content is duplicate using dual-stage approach.
 
@@ -121,9 +134,16 @@ async def is_duplicate(
         group_id: Project identifier for multi-tenancy filtering
         collection: Qdrant collection name (default: "memories")
         threshold: Custom similarity threshold (overrides env var)
+        embedding: Optional precomputed dense vector for content. When given,
+            Stage 2 adds one Qdrant query and no embedding call.
+        embedding_model: Embedding model key ("en"/"code") for Stage 2. Defaults
+            to the storage routing for collection and content_type (SPEC-010),
+            so the returned vector can be reused for the upsert.
+        content_type: Content type the memory will be stored with (routing input).
 
     Returns:
-        DuplicationCheckResult with is_duplicate flag and metadata
+        DuplicationCheckResult with is_duplicate flag and metadata. When no
+        duplicate is found, result.embedding carries the vector to reuse.
 
     Performance:
         - Hash check: <50ms (AC 2.2.1)
@@ -172,16 +192,10 @@ async def is_duplicate(
     content_hash = compute_content_hash(content)
 
     # Stage 1: Hash-based exact match (fast O(1) lookup)
-    client = None
     try:
-        # Fix: AsyncQdrantClient doesn't support async context manager protocol
-        # Use manual client lifecycle management instead
-        # BP-040: API key + HTTPS configurable via environment variables
-        protocol = "https" if config.qdrant_use_https else "http"
-        client = AsyncQdrantClient(
-            url=f"{protocol}://{config.qdrant_host}:{config.qdrant_port}",
-            api_key=config.qdrant_api_key,
-        )
+        # Shared per-loop clients: concurrent checks reuse one connection pool
+        # instead of opening (and tearing down) a client per call.
+        client = get_async_qdrant_client(config)
 
         # Query by content_hash field (indexed for fast lookup)
         results, _ = await client.scroll(
@@ -233,19 +247,25 @@ async def is_duplicate(
         )
 
         # Stage 2: Semantic similarity check (thorough, near-duplicate detection)
+        # Embed-once: reuse a caller-supplied vector, otherwise embed with the
+        # same model storage would use so the vector can be carried through
+        # to the upsert.
+        query_vector = embedding
         try:
-            # Generate embedding for query
-            # Use asyncio.to_thread to avoid blocking event loop (2025 async best practice)
-            def _get_embedding():
-                with EmbeddingClient(config) as embed_client:
-                    return embed_client.embed([content])[0]
-
-            query_vector = await asyncio.to_thread(_get_embedding)
+            if query_vector is None:
+                if embedding_model is None:
+                    embedding_model = route_embedding_model(collection, content_type)
+                embed_client = get_async_embedding_client(config)
+                query_vector = (
+                    await embed_client.embed(
+                        [content], model=embedding_model, project=group_id
+                    )
+                )[0]
 
             # Search for similar memories with threshold
-            search_results = await client.search(
+            response = await client.query_points(
                 collection_name=collection,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=Filter(
                     must=[
                         FieldCondition(key="group_id", match=MatchValue(value=group_id))
@@ -254,6 +274,7 @@ async def is_duplicate(
                 limit=1,
                 score_threshold=dedup_threshold,
             )
+            search_results = response.points
 
             if search_results:
                 match = search_results[0]
@@ -291,6 +312,8 @@ async def is_duplicate(
                     reason="semantic_similarity",
                     existing_id=existing_id,
                     similarity_score=similarity_score,
+                    embedding=query_vector,
+                    embedding_model=embedding_model,
                 )
 
             logger.debug(
@@ -305,7 +328,11 @@ async def is_duplicate(
 
             # No duplicates found
             return DuplicationCheckResult(
-                is_duplicate=False, reason=None, existing_id=None
+                is_duplicate=False,
+                reason=None,
+                existing_id=None,
+                embedding=query_vector,
+                embedding_model=embedding_model,
             )
 
         except (EmbeddingError, Exception) as e:
@@ -324,6 +351,8 @@ async def is_duplicate(
                 is_duplicate=False,
                 reason="embedding_failed_hash_only",
                 existing_id=None,
+                embedding=query_vector,
+                embedding_model=embedding_model,
             )
 
     except ResponseHandlingException as e:
@@ -419,15 +448,3 @@ async def is_duplicate(
         return DuplicationCheckResult(
             is_duplicate=False, reason="error_fail_open", existing_id=None
         )
-
-    finally:
-        # Clean up client connection
-        if client is not None:
-            try:
-                await client.close()
-            except Exception as e:
-                # Silently ignore close errors to avoid masking return values
-                logger.debug(
-                    "client_close_failed",
-                    extra={"error": str(e), "error_type": type(e).__name__},
-                )
@@ -7,15 +7,17 @@ Architecture Reference: architecture.md:235-287 (Service Client Architecture)
 Best Practices: https://medium.com/@sparknp1/8-httpx-asyncio-patterns-for-safer-faster-clients-f27bc82e93e6
 """
 
+import asyncio
 import contextlib
 import logging
 import os
 import random
 import time
+import weakref
 
 import httpx
 
-from .config import MemoryConfig, get_config
+from .config import COLLECTION_CODE_PATTERNS, MemoryConfig, get_config
 from .metrics_push import push_embedding_metrics_async, push_failure_metrics_async
 
 # Import metrics for Prometheus instrumentation (Story 6.1, AC 6.1.3)
@@ -39,11 +41,42 @@ except ImportError:
 
 TRACE_CONTENT_MAX = 10000
 
-__all__ = ["EmbeddingClient", "EmbeddingError"]
+__all__ = [
+    "AsyncEmbeddingClient",
+    "EmbeddingClient",
+    "EmbeddingError",
+    "get_async_embedding_client",
+    "route_embedding_model",
+]
 
 logger = logging.getLogger("ai_memory.embed")
 
 
+def route_embedding_model(collection: str, content_type: str | None = None) -> str:
+    """Pick the embedding model key for content stored in a collection.
+
+    SPEC-010 Section 4.2: Routing Rules
+    - code-patterns collection -> code model
+    - github_code_blob content type -> code model
+    - Everything else -> prose (en) model
+
+    Shared by storage and the dedup check so a vector computed for one can
+    be reused by the other.
+
+    Args:
+        collection: Target collection name
+        content_type: Optional content type (e.g., "github_code_blob")
+
+    Returns:
+        Model key: "code" or "en"
+    """
+    if collection == COLLECTION_CODE_PATTERNS:
+        return "code"
+    if content_type and content_type in ("github_code_blob",):
+        return "code"
+    return "en"
+
+
 class EmbeddingError(Exception):
     """Raised when embedding generation fails.
 
@@ -53,6 +86,144 @@ class EmbeddingError(Exception):
     pass
 
 
+def _build_timeout() -> httpx.Timeout:
+    """Granular per-operation timeouts shared by sync and async clients."""
+    # 2025 Best Practice: Granular timeouts per operation type
+    # Source: https://www.python-httpx.org/advanced/timeouts/
+    # Read timeout is configurable via EMBEDDING_READ_TIMEOUT for integration tests
+    # CPU mode (7B model): 20-30s typical, use 60s for safety
+    # GPU mode: <2s (NFR-P2 compliant)
+    read_timeout = float(os.getenv("EMBEDDING_READ_TIMEOUT", "15.0"))
+    return httpx.Timeout(
+        connect=3.0,  # Connection establishment timeout
+        read=read_timeout,  # Read timeout - configurable for CPU vs GPU mode
+        write=5.0,  # Write timeout for request body
+        pool=3.0,  # Pool acquisition timeout
+    )
+
+
+def _build_limits() -> httpx.Limits:
+    """Connection pool limits shared by sync and async clients."""
+    # Connection pooling with 2025 recommended defaults
+    # Source: https://www.python-httpx.org/advanced/resource-limits/
+    return httpx.Limits(
+        max_keepalive_connections=20,  # Keep-alive pool size
+        max_connections=100,  # Total connection limit
+        keepalive_expiry=10.0,  # Idle timeout - reduced from 30s to avoid stale connections
+    )
+
+
+def _record_dense_metrics(
+    status: str, model: str, project: str, start_time: float
+) -> float:
+    """Record dense embedding request metrics (Story 6.1, AC 6.1.3).
+
+    Returns:
+        Elapsed request duration in seconds.
+    """
+    # TECH-DEBT-067: Add embedding_type and context labels
+    duration_seconds = time.perf_counter() - start_time
+    if embedding_requests_total:
+        embedding_requests_total.labels(
+            status=status,
+            embedding_type="dense",
+            context="realtime",
+            project=project,
+            model=model,
+        ).inc()
+    if embedding_duration_seconds:
+        embedding_duration_seconds.labels(embedding_type="dense", model=model).observe(
+            duration_seconds
+        )
+
+    # Push to Pushgateway for hook subprocess visibility
+    push_embedding_metrics_async(
+        status=status,
+        embedding_type="dense",
+        duration_seconds=duration_seconds,
+        context="realtime",
+        model=model,
+    )
+    return duration_seconds
+
+
+def _record_dense_success(
+    texts: list[str],
+    embeddings: list[list[float]],
+    model: str,
+    project: str,
+    start_time: float,
+) -> None:
+    """Record metrics and GENERATION trace for a successful dense embed call."""
+    _record_dense_metrics("success", model, project, start_time)
+
+    # PLAN-014 G-11: GENERATION trace for dense embedding API call
+    if emit_trace_event:
+        with contextlib.suppress(Exception):
+            emit_trace_event(
+                event_type="embedding_generation",
+                data={
+                    "input": f"Embed {len(texts)} texts (model={model})"[
+                        :TRACE_CONTENT_MAX
+                    ],
+                    "output": f"{len(embeddings)} embeddings generated"[
+                        :TRACE_CONTENT_MAX
+                    ],
+                    "model": "jina-embeddings-v2-base-en",
+                    "usage": {"input": len(texts), "output": 0},
+                    "metadata": {
+                        "text_count": len(texts),
+                        "model": model,
+                        "endpoint": "dense",
+                    },
+                },
+                session_id=os.environ.get("CLAUDE_SESSION_ID"),
+                as_type="generation",
+                tags=["search", "embedding"],
+            )
+
+
+def _record_dense_failure(
+    status: str,
+    texts: list[str],
+    model: str,
+    project: str,
+    base_url: str,
+    start_time: float,
+    error: Exception,
+) -> None:
+    """Log and record metrics for a failed dense embed call.
+
+    Args:
+        status: "timeout" or "failed" (metric label).
+    """
+    error_code = "EMBEDDING_TIMEOUT" if status == "timeout" else "EMBEDDING_ERROR"
+    logger.error(
+        "embedding_timeout" if status == "timeout" else "embedding_error",
+        extra={
+            "texts_count": len(texts),
+            "base_url": base_url,
+            "model": model,
+            "error": str(error),
+        },
+    )
+
+    _record_dense_metrics(status, model, project, start_time)
+
+    # Metrics: Failure event for alerting (Story 6.1, AC 6.1.4)
+    if failure_events_total:
+        failure_events_total.labels(
+            component="embedding",
+            error_code=error_code,
+            project=project,
+        ).inc()
+    push_failure_metrics_async(
+        component="embedding",
+        error_code=error_code,
+        project=project,
+    )
+
+
 class EmbeddingClient:
     """Client for the embedding service.
 
@@ -86,28 +257,7 @@ class EmbeddingClient:
             f"http://{self.config.embedding_host}:{self.config.embedding_port}"
         )
 
-        # 2025 Best Practice: Granular timeouts per operation type
-        # Source: https://www.python-httpx.org/advanced/timeouts/
-        # Read timeout is configurable via EMBEDDING_READ_TIMEOUT for integration tests
-        # CPU mode (7B model): 20-30s typical, use 60s for safety
-        # GPU mode: <2s (NFR-P2 compliant)
-        read_timeout = float(os.getenv("EMBEDDING_READ_TIMEOUT", "15.0"))
-        timeout_config = httpx.Timeout(
-            connect=3.0,  # Connection establishment timeout
-            read=read_timeout,  # Read timeout - configurable for CPU vs GPU mode
-            write=5.0,  # Write timeout for request body
-            pool=3.0,  # Pool acquisition timeout
-        )
-
-        # Connection pooling with 2025 recommended defaults
-        # Source: https://www.python-httpx.org/advanced/resource-limits/
-        limits = httpx.Limits(
-            max_keepalive_connections=20,  # Keep-alive pool size
-            max_connections=100,  # Total connection limit
-            keepalive_expiry=10.0,  # Idle timeout - reduced from 30s to avoid stale connections
-        )
-
-        self.client = httpx.Client(timeout=timeout_config, limits=limits)
+        self.client = httpx.Client(timeout=_build_timeout(), limits=_build_limits())
 
         # BUG-113: Retry configuration for transient timeout failures
         self._max_retries = int(os.getenv("EMBEDDING_MAX_RETRIES", "2"))
@@ -194,161 +344,20 @@ class EmbeddingClient:
             )
             response.raise_for_status()
             embeddings = response.json()["embeddings"]
-
-            # Metrics: Embedding request success (Story 6.1, AC 6.1.3)
-            # TECH-DEBT-067: Add embedding_type and context labels
-            duration_seconds = time.perf_counter() - start_time
-            if embedding_requests_total:
-                embedding_requests_total.labels(
-                    status="success",
-                    embedding_type="dense",
-                    context="realtime",
-                    project=project,
-                    model=model,
-                ).inc()
-            if embedding_duration_seconds:
-                embedding_duration_seconds.labels(
-                    embedding_type="dense", model=model
-                ).observe(duration_seconds)
-
-            # Push to Pushgateway for hook subprocess visibility
-            push_embedding_metrics_async(
-                status="success",
-                embedding_type="dense",
-                duration_seconds=duration_seconds,
-                context="realtime",
-                model=model,
-            )
-
-            # PLAN-014 G-11: GENERATION trace for dense embedding API call
-            if emit_trace_event:
-                with contextlib.suppress(Exception):
-                    emit_trace_event(
-                        event_type="embedding_generation",
-                        data={
-                            "input": f"Embed {len(texts)} texts (model={model})"[
-                                :TRACE_CONTENT_MAX
-                            ],
-                            "output": f"{len(embeddings)} embeddings generated"[
-                                :TRACE_CONTENT_MAX
-                            ],
-                            "model": "jina-embeddings-v2-base-en",
-                            "usage": {"input": len(texts), "output": 0},
-                            "metadata": {
-                                "text_count": len(texts),
-                                "model": model,
-                                "endpoint": "dense",
-                            },
-                        },
-                        session_id=os.environ.get("CLAUDE_SESSION_ID"),
-                        as_type="generation",
-                        tags=["search", "embedding"],
-                    )
-
-            return embeddings
-
         except httpx.TimeoutException as e:
-            logger.error(
-                "embedding_timeout",
-                extra={
-                    "texts_count": len(texts),
-                    "base_url": self.base_url,
-                    "model": model,
-                    "error": str(e),
-                },
-            )
-
-            # Metrics: Embedding request timeout (Story 6.1, AC 6.1.3)
-            # TECH-DEBT-067: Add embedding_type and context labels
-            duration_seconds = time.perf_counter() - start_time
-            if embedding_requests_total:
-                embedding_requests_total.labels(
-                    status="timeout",
-                    embedding_type="dense",
-                    context="realtime",
-                    project=project,
-                    model=model,
-                ).inc()
-            if embedding_duration_seconds:
-                embedding_duration_seconds.labels(
-                    embedding_type="dense", model=model
-                ).observe(duration_seconds)
-
-            # Metrics: Failure event for alerting (Story 6.1, AC 6.1.4)
-            if failure_events_total:
-                failure_events_total.labels(
-                    component="embedding",
-                    error_code="EMBEDDING_TIMEOUT",
-                    project=project,
-                ).inc()
-
-            # Push to Pushgateway for hook subprocess visibility
-            push_embedding_metrics_async(
-                status="timeout",
-                embedding_type="dense",
-                duration_seconds=duration_seconds,
-                context="realtime",
-                model=model,
-            )
-            push_failure_metrics_async(
-                component="embedding",
-                error_code="EMBEDDING_TIMEOUT",
-                project=project,
+            _record_dense_failure(
+                "timeout", texts, model, project, self.base_url, start_time, e
             )
-
             raise EmbeddingError("EMBEDDING_TIMEOUT") from e
-
         except httpx.HTTPError as e:
-            logger.error(
-                "embedding_error",
-                extra={
-                    "texts_count": len(texts),
-                    "base_url": self.base_url,
-                    "model": model,
-                    "error": str(e),
-                },
-            )
-
-            # Metrics: Embedding request failed (Story 6.1, AC 6.1.3)
-            # TECH-DEBT-067: Add embedding_type and context labels
-            duration_seconds = time.perf_counter() - start_time
-            if embedding_requests_total:
-                embedding_requests_total.labels(
-                    status="failed",
-                    embedding_type="dense",
-                    context="realtime",
-                    project=project,
-                    model=model,
-                ).inc()
-            if embedding_duration_seconds:
-                embedding_duration_seconds.labels(
-                    embedding_type="dense", model=model
-                ).observe(duration_seconds)
-
-            # Metrics: Failure event for alerting (Story 6.1, AC 6.1.4)
-            if failure_events_total:
-                failure_events_total.labels(
-                    component="embedding",
-                    error_code="EMBEDDING_ERROR",
-                    project=project,
-                ).inc()
-
-            # Push to Pushgateway for hook subprocess visibility
-            push_embedding_metrics_async(
-                status="failed",
-                embedding_type="dense",
-                duration_seconds=duration_seconds,
-                context="realtime",
-                model=model,
+            _record_dense_failure(
+                "failed", texts, model, project, self.base_url, start_time, e
             )
-            push_failure_metrics_async(
-                component="embedding",
-                error_code="EMBEDDING_ERROR",
-                project=project,
-            )
-
             raise EmbeddingError(f"EMBEDDING_ERROR: {e}") from e
 
+        _record_dense_success(texts, embeddings, model, project, start_time)
+        return embeddings
+
     def embed_sparse(self, texts: list[str]) -> list[dict]:
         """Generate BM25 sparse embeddings via embedding service.
 
@@ -629,3 +638,182 @@ class EmbeddingClient:
         # when httpx module may already be unloaded
         with contextlib.suppress(Exception):
             self.close()
+
+
+class AsyncEmbeddingClient:
+    """Async client for the embedding service.
+
+    Mirrors EmbeddingClient (dense + sparse endpoints, timeout retry, metrics)
+    on top of httpx.AsyncClient so async callers (SDK wrappers, subagent,
+    deduplication) do not tie up executor threads while waiting on the
+    embedding service.
+
+    httpx.AsyncClient connection pools are bound to the event loop that first
+    uses them, so prefer get_async_embedding_client(), which shares one
+    client per (endpoint, event loop).
+
+    Example:
+        >>> client = get_async_embedding_client()
+        >>> embeddings = await client.embed(["def hello(): return 'world'"])
+    """
+
+    def __init__(self, config: MemoryConfig | None = None):
+        """Initialize async embedding client with configuration.
+
+        Args:
+            config: Optional MemoryConfig instance. Uses get_config() if not provided.
+        """
+        self.config = config or get_config()
+        self.base_url = (
+            f"http://{self.config.embedding_host}:{self.config.embedding_port}"
+        )
+        self.client = httpx.AsyncClient(
+            timeout=_build_timeout(), limits=_build_limits()
+        )
+
+        # BUG-113: Retry configuration for transient timeout failures
+        self._max_retries = int(os.getenv("EMBEDDING_MAX_RETRIES", "2"))
+        self._backoff_base = float(os.getenv("EMBEDDING_BACKOFF_BASE", "1.0"))
+        self._backoff_cap = float(os.getenv("EMBEDDING_BACKOFF_CAP", "15.0"))
+
+    async def embed(
+        self, texts: list[str], model: str = "en", project: str = "unknown"
+    ) -> list[list[float]]:
+        """Generate dense embeddings with retry on timeout errors.
+
+        Same contract as EmbeddingClient.embed() (BP-091 full-jitter backoff).
+
+        Raises:
+            EmbeddingError: If all retries exhausted or non-timeout error occurs.
+        """
+        last_error: EmbeddingError | None = None
+        for attempt in range(1 + self._max_retries):
+            try:
+                return await self._embed_once(texts, model=model, project=project)
+            except EmbeddingError as e:
+                if "timeout" not in str(e).lower():
+                    raise  # Non-timeout errors: no retry
+                last_error = e
+                if attempt < self._max_retries:
+                    sleep_time = random.uniform(
+                        0, min(self._backoff_cap, self._backoff_base * (2**attempt))
+                    )
+                    logger.warning(
+                        "embedding_retry",
+                        extra={
+                            "attempt": attempt + 1,
+                            "max_retries": self._max_retries,
+                            "sleep_seconds": round(sleep_time, 2),
+                            "texts_count": len(texts),
+                            "model": model,
+                        },
+                    )
+                    await asyncio.sleep(sleep_time)
+        raise last_error  # type: ignore[misc]
+
+    async def _embed_once(
+        self, texts: list[str], model: str = "en", project: str = "unknown"
+    ) -> list[list[float]]:
+        """Single dense embedding request (no retry)."""
+        start_time = time.perf_counter()
+
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/embed/dense",
+                json={"texts": texts, "model": model},
+            )
+            response.raise_for_status()
+            embeddings = response.json()["embeddings"]
+        except httpx.TimeoutException as e:
+            _record_dense_failure(
+                "timeout", texts, model, project, self.base_url, start_time, e
+            )
+            raise EmbeddingError("EMBEDDING_TIMEOUT") from e
+        except httpx.HTTPError as e:
+            _record_dense_failure(
+                "failed", texts, model, project, self.base_url, start_time, e
+            )
+            raise EmbeddingError(f"EMBEDDING_ERROR: {e}") from e
+
+        _record_dense_success(texts, embeddings, model, project, start_time)
+        return embeddings
+
+    async def embed_sparse(self, texts: list[str]) -> list[dict]:
+        """Generate BM25 sparse embeddings via embedding service.
+
+        Returns:
+            List of dicts with 'indices' and 'values' keys for each input text.
+
+        Raises:
+            EmbeddingError: If request fails or service returns an error.
+        """
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/embed/sparse",
+                json={"texts": texts},
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            return response.json()["embeddings"]
+        except httpx.TimeoutException as e:
+            logger.error(
+                "sparse_embedding_timeout",
+                extra={
+                    "texts_count": len(texts),
+                    "base_url": self.base_url,
+                    "error": str(e),
+                },
+            )
+            raise EmbeddingError("SPARSE_EMBEDDING_TIMEOUT") from e
+        except httpx.HTTPError as e:
+            logger.error(
+                "sparse_embedding_error",
+                extra={
+                    "texts_count": len(texts),
+                    "base_url": self.base_url,
+                    "error": str(e),
+                },
+            )
+            raise EmbeddingError(f"SPARSE_EMBEDDING_ERROR: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncEmbeddingClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager and close client."""
+        await self.aclose()
+
+
+# One shared AsyncEmbeddingClient per event loop and endpoint. Weak keys let
+# clients of finished loops (e.g. successive asyncio.run() calls) be collected.
+_async_client_cache: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncEmbeddingClient]]" = (weakref.WeakKeyDictionary())
+
+
+def get_async_embedding_client(
+    config: MemoryConfig | None = None,
+) -> AsyncEmbeddingClient:
+    """Get the shared AsyncEmbeddingClient for the running event loop.
+
+    Must be called from a coroutine (requires a running loop).
+
+    Args:
+        config: Optional MemoryConfig instance. Uses get_config() if not provided.
+
+    Returns:
+        AsyncEmbeddingClient whose connection pool is shared by every caller
+        on the current event loop.
+    """
+    config = config or get_config()
+    loop = asyncio.get_running_loop()
+    cache_key = f"{config.embedding_host}:{config.embedding_port}"
+    per_loop = _async_client_cache.setdefault(loop, {})
+    client = per_loop.get(cache_key)
+    if client is None:
+        client = AsyncEmbeddingClient(config)
+        per_loop[cache_key] = client
+    return client
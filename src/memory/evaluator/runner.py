@@ -6,15 +6,19 @@
 Core pipeline:
   1. Load evaluator config + evaluator definitions
   2. Per evaluator, read target: "trace" or "observation" (per-evaluator YAML field)
-  3. Trace path (EV-05, EV-06): page-based pagination via trace.list()
+  3. Trace path (EV-05, EV-06): ONE page-based pass via trace.list() shared by
+     every trace evaluator
      - uses from_timestamp/to_timestamp/page/meta.total_pages (V3 trace API)
-  4. Observation path (EV-01-EV-04): page-based pagination via observations.get_many()
+  4. Observation path (EV-01-EV-04): ONE page-based pass via observations.get_many()
+     per distinct event_type, shared by every evaluator listing it
      - uses from_start_time/to_start_time/page/meta.total_pages (V3 observation API)
   5. Filter observations by name (event_type) — server-side via name= parameter (Path B)
-  6. Sample traces/observations per evaluator's sampling_rate
-  7. Evaluate each trace/observation via configurable LLM judge
-  8. Attach scores to Langfuse via create_score() (idempotent via score_id=)
-  9. Log each evaluation to audit log
+  6. Dispatch each trace/observation to every matching evaluator; sample per
+     evaluator's sampling_rate
+  7. Skip items whose deterministic score_id already exists (score_v_2 lookup)
+  8. Evaluate the rest via configurable LLM judge, judge_concurrency calls at a time
+  9. Attach scores to Langfuse via create_score() (idempotent via score_id=)
+ 10. Log each evaluation to audit log
 
 Note: evaluation_targets in evaluator_config.yaml is DEPRECATED.
       Use the per-evaluator target: field in each evaluator YAML instead.
@@ -27,6 +31,8 @@ import hashlib
 import json
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -48,6 +54,25 @@ except ImportError:  # pragma: no cover
         )
 
 
+# Default LLM judge calls in flight (evaluator_config.yaml: judge_concurrency)
+DEFAULT_JUDGE_CONCURRENCY = 4
+
+# Score IDs per score_v_2.get(score_ids=...) lookup
+SCORE_LOOKUP_CHUNK = 50
+
+
+@dataclass
+class _Judgement:
+    """One (trace or observation, evaluator) pair awaiting a judge call."""
+
+    evaluator: dict
+    ev_name: str
+    item: Any
+    trace_id: str
+    observation_id: str | None
+    score_id: str
+
+
 class EvaluatorRunner:
     """Core evaluation pipeline for LLM-as-Judge scoring of Langfuse traces and observations."""
 
@@ -70,6 +95,9 @@ class EvaluatorRunner:
                 "log_file", ".audit/logs/evaluations.jsonl"
             )
         )
+        self.judge_concurrency = max(
+            1, int(self.config.get("judge_concurrency", DEFAULT_JUDGE_CONCURRENCY))
+        )
 
     def _load_evaluators(self, evaluator_id: str | None = None) -> list[dict]:
         """Load evaluator definitions from YAML files.
@@ -233,17 +261,204 @@ class EvaluatorRunner:
         with open(self.audit_log_path, "a") as f:
             f.write(json.dumps(entry) + "\n")
 
-    def _run_observation_evaluator(
+    def _existing_score_ids(self, langfuse: Any, score_ids: list[str]) -> set[str]:
+        """Return the subset of score_ids that already exist in Langfuse.
+
+        Fail-open: a lookup error is logged and treated as "none exist", so the
+        worst case is a re-evaluation that create_score() overwrites in place.
+
+        Args:
+            langfuse: Langfuse client from get_client()
+            score_ids: Deterministic score IDs from _make_score_id()
+
+        Returns:
+            Set of score IDs already attached
+        """
+        existing: set[str] = set()
+        for start in range(0, len(score_ids), SCORE_LOOKUP_CHUNK):
+            chunk = score_ids[start : start + SCORE_LOOKUP_CHUNK]
+            try:
+                response = langfuse.api.score_v_2.get(
+                    score_ids=",".join(chunk), limit=len(chunk)
+                )
+            except Exception as exc:
+                logger.warning("Score lookup failed — evaluating anyway: %s", exc)
+                continue
+            existing.update(
+                score.id for score in (response.data or []) if score.id in chunk
+            )
+        return existing
+
+    def _judge(self, job: _Judgement) -> dict:
+        """Build the prompt for one job and call the LLM judge (pool thread)."""
+        if job.observation_id is not None:
+            prompt = self._build_observation_prompt(job.evaluator, job.item)
+        else:
+            prompt = self._build_prompt(job.evaluator, job.item)
+        return self.evaluator_config.evaluate(prompt)
+
+    def _evaluate_jobs(
+        self,
+        langfuse: Any,
+        pool: ThreadPoolExecutor,
+        jobs: list[_Judgement],
+        dry_run: bool,
+        stats: dict[str, dict[str, int]],
+        seen: set[str],
+    ) -> None:
+        """Judge one page of (item, evaluator) jobs and attach their scores.
+
+        Jobs whose score already exists (from an earlier run over the same
+        window) or was produced earlier in this run are dropped before any
+        LLM call. The rest are judged concurrently on the pool; results are
+        then handled in page order on the calling thread, so create_score()
+        and the audit log are never touched concurrently.
+        """
+        pending = []
+        for job in jobs:
+            if job.score_id in seen:
+                continue
+            seen.add(job.score_id)
+            pending.append(job)
+
+        existing = self._existing_score_ids(langfuse, [j.score_id for j in pending])
+        futures = []
+        for job in pending:
+            if job.score_id in existing:
+                stats[job.ev_name]["already_scored"] += 1
+                continue
+            futures.append((job, pool.submit(self._judge, job)))
+
+        for job, future in futures:
+            kind = "observation" if job.observation_id is not None else "trace"
+            item_id = job.observation_id or job.trace_id
+            try:
+                self._record_result(langfuse, job, future.result(), dry_run, stats)
+            except Exception as exc:
+                logger.error(
+                    "Error evaluating %s %s with %s: %s",
+                    kind,
+                    item_id,
+                    job.ev_name,
+                    exc,
+                )
+
+    def _record_result(
         self,
         langfuse: Any,
-        evaluator: dict,
-        ev_name: str,
+        job: _Judgement,
+        result: dict,
+        dry_run: bool,
+        stats: dict[str, dict[str, int]],
+    ) -> None:
+        """Attach one judge result as a Langfuse score and audit log entry."""
+        evaluator = job.evaluator
+        ev_stats = stats[job.ev_name]
+        kind = "Observation" if job.observation_id is not None else "Trace"
+        item_id = job.observation_id or job.trace_id
+        score_type = evaluator.get("score_type", "NUMERIC")
+
+        if result.get("score") is None:
+            logger.warning(
+                "Evaluator returned null score for %s %s", kind.lower(), item_id
+            )
+            return
+
+        ev_stats["evaluated"] += 1
+
+        # Attach score to Langfuse (idempotent via score_id)
+        if not dry_run:
+            # CATEGORICAL scores use string value; NUMERIC/BOOLEAN use float
+            score_value = (
+                str(result["score"]) if score_type == "CATEGORICAL" else result["score"]
+            )
+            # R1-F3: validate categorical value against defined categories
+            if score_type == "CATEGORICAL":
+                valid_categories = evaluator.get("categories", [])
+                if valid_categories and str(result["score"]) not in valid_categories:
+                    logger.warning(
+                        "%s %s: categorical value %r not in categories %s — skipping",
+                        kind,
+                        item_id,
+                        result["score"],
+                        valid_categories,
+                    )
+                    return
+
+            score_kwargs: dict[str, Any] = {"trace_id": job.trace_id}
+            if job.observation_id is not None:
+                score_kwargs["observation_id"] = job.observation_id
+            langfuse.create_score(
+                score_id=job.score_id,
+                **score_kwargs,
+                name=job.ev_name,
+                value=score_value,
+                data_type=score_type,
+                comment=str(result.get("reasoning", ""))[:TRACE_CONTENT_MAX],
+            )
+            ev_stats["scored"] += 1
+
+            # R2-F2: audit log only written when not dry_run
+            self._append_audit_log(
+                {
+                    "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                    "evaluator_id": evaluator.get("id"),
+                    "evaluator_name": job.ev_name,
+                    **score_kwargs,
+                    "score": result["score"],
+                    "reasoning": str(result.get("reasoning", ""))[:500],
+                    "dry_run": dry_run,
+                }
+            )
+
+        reasoning_preview = str(result.get("reasoning", ""))[:80]
+        obs_part = (
+            f"obs={job.observation_id[:8]}... "
+            if job.observation_id is not None
+            else ""
+        )
+        print(
+            f"  [{job.ev_name}] {obs_part}trace={job.trace_id[:8]}... "
+            f"score={result['score']} | {reasoning_preview}"
+        )
+
+    def _observation_passes(
+        self, evaluators: list[dict]
+    ) -> list[tuple[str | None, list[dict]]]:
+        """Plan the observation fetches shared by all observation evaluators.
+
+        Each distinct event_type is fetched once (server-side name= filter)
+        and dispatched to every evaluator listing it. If any evaluator has no
+        event_types it needs every observation, so a single unfiltered pass
+        serves all evaluators instead.
+
+        Returns:
+            List of (name_filter, evaluators to dispatch to)
+        """
+        if any(not ev.get("filter", {}).get("event_types") for ev in evaluators):
+            return [(None, evaluators)]
+        passes: dict[str, list[dict]] = {}
+        for evaluator in evaluators:
+            for name in evaluator["filter"]["event_types"]:
+                passes.setdefault(name, [])
+                if evaluator not in passes[name]:
+                    passes[name].append(evaluator)
+        return list(passes.items())
+
+    def _run_observation_pass(
+        self,
+        langfuse: Any,
+        pool: ThreadPoolExecutor,
+        name_filter: str | None,
+        evaluators: list[dict],
         since: datetime,
         until: datetime,
         dry_run: bool,
         batch_size: int,
-    ) -> tuple[int, int, int, int]:
-        """Run observation-level evaluation for a single evaluator.
+        stats: dict[str, dict[str, int]],
+        seen: set[str],
+    ) -> int:
+        """Fetch observations once and dispatch them to every evaluator.
 
         Fetches observations via observations.get_many() with page-based pagination
         (BUG-217). Filters by observation name (event_type) server-side via name=
@@ -251,195 +466,134 @@ class EvaluatorRunner:
 
         Args:
             langfuse: Langfuse client from get_client()
-            evaluator: Evaluator definition dict
-            ev_name: Evaluator name string
+            pool: Executor running judge calls
+            name_filter: Observation name to fetch, or None for all
+            evaluators: Observation evaluators interested in this name
             since: Start of evaluation window
             until: End of evaluation window
             dry_run: If True, evaluate but do not save scores
-            batch_size: Number of observations per cursor page
+            batch_size: Number of observations per page
+            stats: Per-evaluator counters, updated in place
+            seen: Score IDs already handled in this run
 
         Returns:
-            Tuple of (fetched, sampled, evaluated, scored)
+            Number of observations fetched
         """
-        ev_filter = evaluator.get("filter", {})
-        sampling_rate = float(evaluator.get("sampling_rate", 1.0))
-        score_type = evaluator.get("score_type", "NUMERIC")
-        event_types = ev_filter.get("event_types", [])
-
-        # If no event_types defined, fetch all observations (no name filter).
-        # Otherwise iterate once per event_type using server-side name= filter.
-        name_filters: list[str | None] = event_types if event_types else [None]
-
-        fetched = sampled = evaluated = scored = 0
-
-        try:  # R2-F3: catch fetch-level errors so one evaluator doesn't kill the whole run
-            for name_filter in name_filters:
-                page = 1
-
-                while True:
-                    # Page-based pagination — V3 observations API
-                    obs_response = langfuse.api.observations.get_many(
-                        name=name_filter,
-                        from_start_time=since,
-                        to_start_time=until,
-                        page=page,
-                        limit=batch_size,
-                    )
-                    observations = obs_response.data or []
-                    fetched += len(observations)
+        fetched = 0
+        page = 1
 
-                    for obs in observations:
-                        # Apply sampling
-                        if random.random() > sampling_rate:
-                            continue
+        try:  # R2-F3: catch fetch-level errors so one pass doesn't kill the whole run
+            while True:
+                # Page-based pagination — V3 observations API
+                obs_response = langfuse.api.observations.get_many(
+                    name=name_filter,
+                    from_start_time=since,
+                    to_start_time=until,
+                    page=page,
+                    limit=batch_size,
+                )
+                observations = obs_response.data or []
+                fetched += len(observations)
+
+                jobs = []
+                for obs in observations:
+                    obs_id = obs.id
+                    trace_id = getattr(obs, "trace_id", None) or ""
+
+                    # R2-F5: skip observations with no trace_id
+                    if not trace_id:
+                        logger.warning(
+                            "Observation %s has no trace_id — skipping", obs_id
+                        )
+                        continue
 
-                        obs_id = obs.id
-                        trace_id = getattr(obs, "trace_id", None) or ""
+                    # R2-F7: check output BEFORE incrementing sampled
+                    if getattr(obs, "output", None) is None:
+                        continue
 
-                        # R2-F5: skip observations with no trace_id
-                        if not trace_id:
-                            logger.warning(
-                                "Observation %s has no trace_id — skipping", obs_id
-                            )
+                    for evaluator in evaluators:
+                        # Unfiltered pass: route by observation name
+                        event_types = evaluator.get("filter", {}).get("event_types")
+                        if (
+                            name_filter is None
+                            and event_types
+                            and (getattr(obs, "name", "") or "") not in event_types
+                        ):
                             continue
 
-                        # R2-F7: check output BEFORE incrementing sampled
-                        if getattr(obs, "output", None) is None:
+                        # Apply sampling
+                        if random.random() > float(evaluator.get("sampling_rate", 1.0)):
                             continue
 
+                        ev_name = self._evaluator_name(evaluator)
                         # Note: 'sampled' counts observations that passed random gate + trace_id + output guards — not raw sampling rate
-                        sampled += 1
-
-                        try:
-                            prompt = self._build_observation_prompt(evaluator, obs)
-                            result = self.evaluator_config.evaluate(prompt)
-                            if result.get("score") is None:
-                                logger.warning(
-                                    "Evaluator returned null score for observation %s",
-                                    obs_id,
-                                )
-                                continue
-
-                            evaluated += 1
-
-                            # Attach score (idempotent via score_id)
-                            if not dry_run:
-                                score_id = self._make_score_id(
+                        stats[ev_name]["sampled"] += 1
+                        jobs.append(
+                            _Judgement(
+                                evaluator=evaluator,
+                                ev_name=ev_name,
+                                item=obs,
+                                trace_id=trace_id,
+                                observation_id=obs_id,
+                                score_id=self._make_score_id(
                                     trace_id, ev_name, since, observation_id=obs_id
-                                )
-                                # CATEGORICAL scores use string value; NUMERIC/BOOLEAN use float
-                                score_value = (
-                                    str(result["score"])
-                                    if score_type == "CATEGORICAL"
-                                    else result["score"]
-                                )
-                                # R1-F3: validate categorical value against defined categories
-                                if score_type == "CATEGORICAL":
-                                    valid_categories = evaluator.get("categories", [])
-                                    if (
-                                        valid_categories
-                                        and str(result["score"]) not in valid_categories
-                                    ):
-                                        logger.warning(
-                                            "Observation %s: categorical value %r not in "
-                                            "categories %s — skipping",
-                                            obs_id,
-                                            result["score"],
-                                            valid_categories,
-                                        )
-                                        continue
-                                langfuse.create_score(
-                                    score_id=score_id,
-                                    trace_id=trace_id,
-                                    observation_id=obs_id,
-                                    name=ev_name,
-                                    value=score_value,
-                                    data_type=score_type,
-                                    comment=str(result.get("reasoning", ""))[
-                                        :TRACE_CONTENT_MAX
-                                    ],
-                                )
-                                scored += 1
-
-                                # R2-F2: audit log only written when not dry_run
-                                self._append_audit_log(
-                                    {
-                                        "timestamp": datetime.now(
-                                            tz=timezone.utc
-                                        ).isoformat(),
-                                        "evaluator_id": evaluator.get("id"),
-                                        "evaluator_name": ev_name,
-                                        "trace_id": trace_id,
-                                        "observation_id": obs_id,
-                                        "score": result["score"],
-                                        "reasoning": str(result.get("reasoning", ""))[
-                                            :500
-                                        ],
-                                        "dry_run": dry_run,
-                                    }
-                                )
-
-                            reasoning_preview = str(result.get("reasoning", ""))[:80]
-                            print(
-                                f"  [{ev_name}] obs={obs_id[:8]}... trace={trace_id[:8]}... "
-                                f"score={result['score']} | {reasoning_preview}"
-                            )
-                        except Exception as exc:
-                            logger.error(
-                                "Error evaluating observation %s with %s: %s",
-                                obs_id,
-                                ev_name,
-                                exc,
+                                ),
                             )
-                            continue
+                        )
 
-                    # Page-based stop condition
-                    meta = getattr(obs_response, "meta", None)
-                    total_pages = getattr(meta, "total_pages", 1) if meta else 1
-                    if page >= total_pages or not observations:
-                        break
-                    page += 1
+                self._evaluate_jobs(langfuse, pool, jobs, dry_run, stats, seen)
+
+                # Page-based stop condition
+                meta = getattr(obs_response, "meta", None)
+                total_pages = getattr(meta, "total_pages", 1) if meta else 1
+                if page >= total_pages or not observations:
+                    break
+                page += 1
 
         except Exception as exc:
-            logger.error("Evaluator %s: error fetching observations: %s", ev_name, exc)
+            logger.error(
+                "Observations %s: error fetching observations: %s",
+                name_filter or "(all)",
+                exc,
+            )
 
-        return fetched, sampled, evaluated, scored
+        return fetched
 
-    def _run_trace_evaluator(
+    def _run_trace_pass(
         self,
         langfuse: Any,
-        evaluator: dict,
-        ev_name: str,
+        pool: ThreadPoolExecutor,
+        evaluators: list[dict],
         since: datetime,
         until: datetime,
         dry_run: bool,
         batch_size: int,
-    ) -> tuple[int, int, int, int]:
-        """Run trace-level evaluation for a single evaluator.
+        stats: dict[str, dict[str, int]],
+        seen: set[str],
+    ) -> int:
+        """Fetch traces once and dispatch them to every trace evaluator.
 
         Fetches traces via trace.list() with page-based pagination.
         Uses from_timestamp/to_timestamp/page/meta.total_pages (V3 trace API).
 
         Args:
             langfuse: Langfuse client from get_client()
-            evaluator: Evaluator definition dict
-            ev_name: Evaluator name string
+            pool: Executor running judge calls
+            evaluators: Trace-level evaluators
             since: Start of evaluation window
             until: End of evaluation window
             dry_run: If True, evaluate but do not save scores
             batch_size: Number of traces per page
+            stats: Per-evaluator counters, updated in place
+            seen: Score IDs already handled in this run
 
         Returns:
-            Tuple of (fetched, sampled, evaluated, scored)
+            Number of traces fetched
         """
-        ev_filter = evaluator.get("filter", {})
-        sampling_rate = float(evaluator.get("sampling_rate", 1.0))
-        score_type = evaluator.get("score_type", "NUMERIC")
-
-        fetched = sampled = evaluated = scored = 0
+        fetched = 0
         page = 1  # V3 trace.list() is page-based (1-indexed)
 
-        try:  # R2-F3: catch fetch-level errors so one evaluator doesn't kill the whole run
+        try:  # R2-F3: catch fetch-level errors so one pass doesn't kill the whole run
             while True:
                 traces_response = langfuse.api.trace.list(
                     from_timestamp=since,
@@ -450,98 +604,35 @@ class EvaluatorRunner:
                 traces = traces_response.data or []
                 fetched += len(traces)
 
+                jobs = []
                 for trace in traces:
-                    # Filter first, then sample from matching traces only (UF-4)
-                    if not self._matches_filter(trace, ev_filter):
-                        continue
-
-                    # Apply sampling
-                    if random.random() > sampling_rate:
-                        continue
-
                     # R2-F7: check output BEFORE incrementing sampled
                     if getattr(trace, "output", None) is None:
                         continue
 
-                    sampled += 1
-
-                    # Build prompt and evaluate — isolated per trace (UF-3)
-                    try:
-                        prompt = self._build_prompt(evaluator, trace)
-                        result = self.evaluator_config.evaluate(prompt)
-                        if result.get("score") is None:
-                            logger.warning(
-                                "Evaluator returned null score for trace %s",
-                                trace.id,
-                            )
+                    for evaluator in evaluators:
+                        # Filter first, then sample from matching traces only (UF-4)
+                        if not self._matches_filter(trace, evaluator.get("filter", {})):
                             continue
 
-                        evaluated += 1
+                        # Apply sampling
+                        if random.random() > float(evaluator.get("sampling_rate", 1.0)):
+                            continue
 
-                        # Attach score to Langfuse (idempotent via score_id)
-                        if not dry_run:
-                            score_id = self._make_score_id(trace.id, ev_name, since)
-                            # CATEGORICAL scores use string value; NUMERIC/BOOLEAN use float
-                            score_value = (
-                                str(result["score"])
-                                if score_type == "CATEGORICAL"
-                                else result["score"]
-                            )
-                            # R1-F3: validate categorical value against defined categories
-                            if score_type == "CATEGORICAL":
-                                valid_categories = evaluator.get("categories", [])
-                                if (
-                                    valid_categories
-                                    and str(result["score"]) not in valid_categories
-                                ):
-                                    logger.warning(
-                                        "Trace %s: categorical value %r not in "
-                                        "categories %s — skipping",
-                                        trace.id,
-                                        result["score"],
-                                        valid_categories,
-                                    )
-                                    continue
-                            langfuse.create_score(
-                                score_id=score_id,
+                        ev_name = self._evaluator_name(evaluator)
+                        stats[ev_name]["sampled"] += 1
+                        jobs.append(
+                            _Judgement(
+                                evaluator=evaluator,
+                                ev_name=ev_name,
+                                item=trace,
                                 trace_id=trace.id,
-                                name=ev_name,
-                                value=score_value,
-                                data_type=score_type,
-                                comment=str(result.get("reasoning", ""))[
-                                    :TRACE_CONTENT_MAX
-                                ],
-                            )
-                            scored += 1
-
-                            # R2-F2: audit log only written when not dry_run
-                            self._append_audit_log(
-                                {
-                                    "timestamp": datetime.now(
-                                        tz=timezone.utc
-                                    ).isoformat(),
-                                    "evaluator_id": evaluator.get("id"),
-                                    "evaluator_name": ev_name,
-                                    "trace_id": trace.id,
-                                    "score": result["score"],
-                                    "reasoning": str(result.get("reasoning", ""))[:500],
-                                    "dry_run": dry_run,
-                                }
+                                observation_id=None,
+                                score_id=self._make_score_id(trace.id, ev_name, since),
                             )
-
-                        reasoning_preview = str(result.get("reasoning", ""))[:80]
-                        print(
-                            f"  [{ev_name}] trace={trace.id[:8]}... "
-                            f"score={result['score']} | {reasoning_preview}"
-                        )
-                    except Exception as exc:
-                        logger.error(
-                            "Error evaluating trace %s with %s: %s",
-                            trace.id,
-                            ev_name,
-                            exc,
                         )
-                        continue
+
+                self._evaluate_jobs(langfuse, pool, jobs, dry_run, stats, seen)
 
                 # Page-based pagination — advance or stop (V3 trace.list() API)
                 meta = getattr(traces_response, "meta", None)
@@ -551,9 +642,13 @@ class EvaluatorRunner:
                 page += 1
 
         except Exception as exc:
-            logger.error("Evaluator %s: error fetching traces: %s", ev_name, exc)
+            logger.error("Trace pass: error fetching traces: %s", exc)
+
+        return fetched
 
-        return fetched, sampled, evaluated, scored
+    @staticmethod
+    def _evaluator_name(evaluator: dict) -> str:
+        return evaluator.get("name", evaluator.get("id", "unknown"))
 
     def run(
         self,
@@ -570,6 +665,12 @@ class EvaluatorRunner:
         YAML target: field ("trace" or "observation"). The global evaluation_targets
         section in evaluator_config.yaml is DEPRECATED in favour of per-evaluator target:.
 
+        The window is fetched once per target, not once per evaluator: one
+        trace.list() pass serves every trace evaluator and one
+        observations.get_many() pass per distinct event_type serves every
+        observation evaluator. Judge calls run on a pool of
+        judge_concurrency threads (evaluator_config.yaml, default 4).
+
         Args:
             evaluator_id: Optional evaluator ID to run (e.g., "EV-01")
             since: Start of evaluation window (required — CLI provides this)
@@ -593,47 +694,82 @@ class EvaluatorRunner:
             )
             return {"fetched": 0, "sampled": 0, "evaluated": 0, "scored": 0}
 
+        # Per-evaluator target field is source of truth (DEPRECATED: global evaluation_targets)
+        trace_evaluators = [
+            ev for ev in evaluators if ev.get("target", "trace") != "observation"
+        ]
+        observation_evaluators = [
+            ev for ev in evaluators if ev.get("target", "trace") == "observation"
+        ]
+        stats = {
+            self._evaluator_name(ev): dict.fromkeys(
+                ("sampled", "evaluated", "scored", "already_scored"), 0
+            )
+            for ev in evaluators
+        }
+        seen: set[str] = set()
         total_fetched = 0
-        total_sampled = 0
-        total_evaluated = 0
-        total_scored = 0
 
-        try:
-            for evaluator in evaluators:
-                ev_name = evaluator.get("name", evaluator.get("id", "unknown"))
-                # Per-evaluator target field is source of truth (DEPRECATED: global evaluation_targets)
-                target = evaluator.get("target", "trace")
-
-                print(
-                    f"\n--- Running {evaluator.get('id', '?')}: {ev_name} (target={target}) ---"
-                )
+        for evaluator in evaluators:
+            print(
+                f"--- Running {evaluator.get('id', '?')}: "
+                f"{self._evaluator_name(evaluator)} "
+                f"(target={evaluator.get('target', 'trace')}) ---"
+            )
 
-                if target == "observation":
-                    f, s, e, sc = self._run_observation_evaluator(
-                        langfuse, evaluator, ev_name, since, until, dry_run, batch_size
-                    )
-                else:
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.judge_concurrency,
+                thread_name_prefix="evaluator-judge",
+            ) as pool:
+                if trace_evaluators:
                     # Default: trace-level evaluation (EV-05, EV-06)
-                    f, s, e, sc = self._run_trace_evaluator(
-                        langfuse, evaluator, ev_name, since, until, dry_run, batch_size
+                    total_fetched += self._run_trace_pass(
+                        langfuse,
+                        pool,
+                        trace_evaluators,
+                        since,
+                        until,
+                        dry_run,
+                        batch_size,
+                        stats,
+                        seen,
+                    )
+                for name_filter, pass_evaluators in self._observation_passes(
+                    observation_evaluators
+                ):
+                    total_fetched += self._run_observation_pass(
+                        langfuse,
+                        pool,
+                        name_filter,
+                        pass_evaluators,
+                        since,
+                        until,
+                        dry_run,
+                        batch_size,
+                        stats,
+                        seen,
                     )
-
-                total_fetched += f
-                total_sampled += s
-                total_evaluated += e
-                total_scored += sc
-
-                print(f"  Evaluated: {e} | Scored: {sc}")
-
         finally:
             # Flush all buffered scores to Langfuse — runs even if an error occurs (UF-5)
             langfuse.flush()
 
+        for ev_name, ev_stats in stats.items():
+            print(
+                f"  [{ev_name}] Evaluated: {ev_stats['evaluated']} | "
+                f"Scored: {ev_stats['scored']} | "
+                f"Already scored: {ev_stats['already_scored']}"
+            )
+
         summary = {
             "fetched": total_fetched,
-            "sampled": total_sampled,
-            "evaluated": total_evaluated,
-            "scored": total_scored,
+            "sampled": sum(s["sampled"] for s in stats.values()),
+            "evaluated": sum(s["evaluated"] for s in stats.values()),
+            "scored": sum(s["scored"] for s in stats.values()),
         }
-        logger.info("Evaluation complete: %s", summary)
+        logger.info(
+            "Evaluation complete: %s (already scored: %d)",
+            summary,
+            sum(s["already_scored"] for s in stats.values()),
+        )
         return summary
@@ -11,6 +11,7 @@ Key Features:
 - Adaptive budgets: Variable token allocation based on quality/density/drift signals
 - Collection routing: Keyword/intent/file-path detection routes to target collections
 - Greedy fill: No individual result truncation, skip-and-continue for oversized
+- Diversity: Optional near-duplicate suppression (vector cosine / MMR) before fill
 - Session state: Deduplication across tiers and turns
 - Topic drift: Cosine distance between query embeddings
 
@@ -44,6 +45,7 @@ from memory.config import (
     COLLECTION_DISCUSSIONS,
     COLLECTION_GITHUB,
     MemoryConfig,
+    get_config,
 )
 from memory.embeddings import EmbeddingError
 from memory.intent import IntentType, detect_intent, get_target_collection
@@ -68,6 +70,7 @@ __all__ = [
     "RouteTarget",
     "compute_adaptive_budget",
     "compute_topic_drift",
+    "diversify_results",
     "format_injection_output",
     "init_session_state",
     "load_parzival_constraints",
@@ -222,6 +225,7 @@ def _build_github_enrichment(
             "github_commit",
         ],
         fast_mode=True,
+        with_vectors=config.injection_diversity_enabled,
     )
 
     # Filter to items stored after last session
@@ -321,6 +325,7 @@ def retrieve_bootstrap_context(
             memory_type=["agent_insight"],
             agent_id="parzival",
             fast_mode=True,
+            with_vectors=config.injection_diversity_enabled,
         )
         results.extend(insights)
         _agent_count = len(last_handoff) + len(insights)
@@ -561,6 +566,81 @@ def compute_topic_drift(
     return max(0.0, min(1.0, 1.0 - similarity))
 
 
+def diversify_results(
+    results: list[dict],
+    similarity_threshold: float,
+    mmr_lambda: float = 1.0,
+) -> tuple[list[dict], list[dict]]:
+    """Suppress near-duplicate results using their dense vectors.
+
+    A result whose cosine similarity to any already-kept result is at or above
+    ``similarity_threshold`` is dropped (e.g. the same pattern stored as several
+    chunks or near-identical memories). With ``mmr_lambda < 1.0`` the kept
+    results are additionally re-ordered by Maximal Marginal Relevance
+    (``lambda * score - (1 - lambda) * max_similarity_to_kept``).
+
+    Results without a ``"vector"`` are always kept. MMR re-ordering only applies
+    when every result carries a vector; otherwise input order is preserved.
+
+    Args:
+        results: Candidates in priority order (score descending or layer order).
+        similarity_threshold: Cosine similarity cutoff for near-duplicates.
+        mmr_lambda: Relevance/diversity trade-off. 1.0 = keep input order.
+
+    Returns:
+        Tuple of (kept_results, suppressed_results).
+
+    Performance:
+        One (n x d) @ (d x n) product plus O(n) vector updates; <1ms for the
+        ~10-30 candidates a turn retrieves.
+    """
+    indexed = [
+        (i, r["vector"]) for i, r in enumerate(results) if r.get("vector") is not None
+    ]
+    if len(indexed) < 2:
+        return list(results), []
+
+    positions = [i for i, _ in indexed]
+    matrix = np.asarray([v for _, v in indexed], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    similarity = matrix @ matrix.T
+
+    n = len(positions)
+    max_sim = np.full(n, -np.inf, dtype=np.float32)
+    remaining = np.ones(n, dtype=bool)
+    suppressed_mask = np.zeros(n, dtype=bool)
+    order: list[int] = []
+
+    use_mmr = mmr_lambda < 1.0 and n == len(results)
+    relevance = np.asarray(
+        [results[i].get("score", 0.0) for i in positions], dtype=np.float32
+    )
+
+    while remaining.any():
+        if use_mmr:
+            penalty = np.where(np.isfinite(max_sim), max_sim, 0.0)
+            mmr = mmr_lambda * relevance - (1.0 - mmr_lambda) * penalty
+            j = int(np.argmax(np.where(remaining, mmr, -np.inf)))
+        else:
+            j = int(np.argmax(remaining))  # first remaining = input order
+        remaining[j] = False
+        if max_sim[j] >= similarity_threshold:
+            suppressed_mask[j] = True
+            continue
+        order.append(j)
+        np.maximum(max_sim, similarity[j], out=max_sim)
+
+    suppressed = [results[positions[j]] for j in np.flatnonzero(suppressed_mask)]
+    if use_mmr:
+        return [results[positions[j]] for j in order], suppressed
+
+    dropped = {positions[j] for j in np.flatnonzero(suppressed_mask)}
+    kept = [r for i, r in enumerate(results) if i not in dropped]
+    return kept, suppressed
+
+
 # BUG-173: Per-result score gap filter threshold. Results scoring below
 # best_score * this value are filtered as low-relevance noise.
 # 0.7 (30% gap) chosen based on BUG-173 Langfuse trace analysis:
@@ -574,6 +654,9 @@ def select_results_greedy(
     budget: int,
     excluded_ids: list[str] | None = None,
     score_gap_threshold: float = _SCORE_GAP_THRESHOLD_DEFAULT,
+    diversity_threshold: float | None = None,
+    mmr_lambda: float | None = None,
+    config: MemoryConfig | None = None,
 ) -> tuple[list[dict], int]:
     """Select results using greedy fill until budget exhausted.
 
@@ -584,17 +667,34 @@ def select_results_greedy(
         results: Search results sorted by score descending
         budget: Token budget to fill
         excluded_ids: Point IDs to skip (already injected)
+        score_gap_threshold: Skip results below best_score * threshold
+        diversity_threshold: If set, run diversify_results() over the
+            remaining candidates before filling (requires results searched
+            with ``with_vectors=True``; results without vectors are kept).
+            Defaults to config.injection_diversity_threshold when
+            config.injection_diversity_enabled is true.
+        mmr_lambda: MMR trade-off passed to diversify_results(). Defaults to
+            config.injection_mmr_lambda.
+        config: Memory configuration. Uses get_config() if not provided.
 
     Returns:
         Tuple of (selected_results, total_tokens_used).
     """
     _trace_start = datetime.now(tz=timezone.utc)
+    if diversity_threshold is None or mmr_lambda is None:
+        config = config or get_config()
+        if diversity_threshold is None and config.injection_diversity_enabled:
+            diversity_threshold = config.injection_diversity_threshold
+        if mmr_lambda is None:
+            mmr_lambda = config.injection_mmr_lambda
     excluded = set(excluded_ids or [])
     selected = []
     _selected_token_counts: list[int] = []
     tokens_used = 0
     _dedup_skipped = 0
     _score_gap_skipped = 0
+    _diversity_skipped = 0
+    _diversity_tokens_saved = 0
 
     # BUG-172: Content-hash deduplication for cross-type duplicates
     seen_hashes: set[str] = set()
@@ -605,6 +705,7 @@ def select_results_greedy(
     semantic_scores = [r.get("score", 0) for r in results if r.get("score", 0) < 1.0]
     best_score = max(semantic_scores) if semantic_scores else 0.0
 
+    candidates = []
     for result in results:
         point_id = str(result.get("id", ""))
 
@@ -636,8 +737,22 @@ def select_results_greedy(
             _score_gap_skipped += 1
             continue
 
+        candidates.append(result)
+
+    # Near-duplicate suppression: chunks of the same pattern / near-identical
+    # memories would otherwise fill the budget with redundant text every turn.
+    if diversity_threshold is not None:
+        candidates, suppressed = diversify_results(
+            candidates, diversity_threshold, mmr_lambda
+        )
+        _diversity_skipped = len(suppressed)
+        _diversity_tokens_saved = sum(
+            count_tokens(r.get("content", "")) for r in suppressed
+        )
+
+    for result in candidates:
         # Count tokens accurately
-        result_tokens = count_tokens(content)
+        result_tokens = count_tokens(result.get("content", ""))
 
         # Check if this result fits in remaining budget
         if tokens_used + result_tokens <= budget:
@@ -677,6 +792,9 @@ def select_results_greedy(
                         "dedup_skipped": _dedup_skipped,
                         "score_gap_skipped": _score_gap_skipped,
                         "gap_threshold": score_gap_threshold,
+                        "diversity_threshold": diversity_threshold,
+                        "diversity_skipped": _diversity_skipped,
+                        "diversity_tokens_saved": _diversity_tokens_saved,
                         "selected_detail": [
                             {
                                 "type": r.get("type", "unknown"),
@@ -1649,6 +1649,8 @@ def push_langfuse_buffer_metrics_async(
     buffer_size_bytes: int = 0,
     events_processed: int = 0,
     flush_errors: int = 0,
+    drain_rate: float = 0.0,
+    backlog_age_seconds: float = 0.0,
 ):
     """Push Langfuse trace buffer metrics asynchronously (fire-and-forget).
 
@@ -1662,6 +1664,8 @@ def push_langfuse_buffer_metrics_async(
         buffer_size_bytes: Current buffer directory size in bytes
         events_processed: Number of events flushed this cycle
         flush_errors: Number of flush errors this cycle
+        drain_rate: Events flushed per second since the previous push
+        backlog_age_seconds: Age of the oldest unflushed spool segment
     """
     if not PUSHGATEWAY_ENABLED:
         return
@@ -1672,6 +1676,8 @@ def push_langfuse_buffer_metrics_async(
             "buffer_size_bytes": buffer_size_bytes,
             "events_processed": events_processed,
             "flush_errors": flush_errors,
+            "drain_rate": drain_rate,
+            "backlog_age_seconds": backlog_age_seconds,
         }
 
         subprocess.Popen(
@@ -1708,6 +1714,20 @@ buffer_gauge = Gauge(
 )
 buffer_gauge.set(data["buffer_size_bytes"])
 
+drain_gauge = Gauge(
+    "aimemory_langfuse_flush_drain_rate",
+    "Trace events flushed per second since the previous push",
+    registry=registry
+)
+drain_gauge.set(data["drain_rate"])
+
+backlog_gauge = Gauge(
+    "aimemory_langfuse_buffer_backlog_age_seconds",
+    "Age of the oldest trace spool segment with unflushed events",
+    registry=registry
+)
+backlog_gauge.set(data["backlog_age_seconds"])
+
 if data["evictions"] > 0:
     eviction_counter = Counter(
         "aimemory_langfuse_buffer_evictions_total",
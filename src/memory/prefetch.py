@@ -0,0 +1,376 @@
+"""Predictive prefetch of file-scoped memories from tool activity.
+
+The first_edit trigger searches code-patterns synchronously inside PreToolUse,
+so every first Edit/Write of a file pays an embedding + Qdrant round-trip on
+the critical path. A Read of the same file (or of a module that imports it)
+almost always precedes that edit.
+
+This module lets the Read hook schedule the retrieval ahead of time:
+- ``schedule_prefetch()`` forks a detached worker (fire-and-forget, same
+  pattern as metrics_push) so the Read hook returns immediately
+- The worker resolves the read file plus its local imports and recently
+  modified siblings, searches code-patterns for each, and writes the results
+  to a per-session prefetch store
+- The later Edit/Write trigger calls ``get_prefetched()`` and only falls back
+  to a live search on a miss
+
+Both ends are wired through ``memory.triggers``: ``detect_read_context()``
+schedules the prefetch and ``retrieve_first_edit_context()`` consults it,
+using the same ``search_first_edit()`` query the worker ran.
+
+Store layout: one JSON file per prefetched source file under
+``/tmp/ai-memory-<session>-prefetch/``. Each entry is written with an atomic
+replace, so concurrent workers never need a lock and readers never observe a
+partial entry. Entries expire after ``file_prefetch_ttl_seconds``.
+
+Import resolution mirrors ``connectors.github.code_sync.extract_python_imports``
+(AST walk over Import/ImportFrom) but keeps the full dotted module and relative
+level, since only those can be mapped back to files on disk.
+"""
+
+import ast
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .config import MemoryConfig, get_config
+from .triggers import build_file_query, search_first_edit
+
+__all__ = [
+    "PrefetchStore",
+    "build_file_query",
+    "get_prefetched",
+    "prefetch_file_memories",
+    "related_files",
+    "schedule_prefetch",
+]
+
+logger = logging.getLogger("ai_memory.prefetch")
+
+# Upper bound on entries kept per session (oldest pruned first)
+MAX_ENTRIES_PER_SESSION = 64
+
+
+class PrefetchStore:
+    """Per-session store of prefetched search results, keyed by file path.
+
+    Attributes:
+        session_id: Session identifier (sanitized for the directory name)
+        ttl_seconds: Entry lifetime; older entries are treated as misses
+    """
+
+    def __init__(self, session_id: str, ttl_seconds: int = 900) -> None:
+        self.session_id = session_id
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def store_dir(self) -> Path:
+        """Directory holding this session's entries."""
+        # Sanitize session_id: alphanumeric + dash/underscore only, max 64 chars
+        safe_id = re.sub(r"[^a-zA-Z0-9_-]", "", self.session_id)[:64] or "unknown"
+        return Path(f"/tmp/ai-memory-{safe_id}-prefetch")
+
+    def _entry_path(self, file_path: str) -> Path:
+        key = hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:16]
+        return self.store_dir / f"{key}.json"
+
+    def get(self, file_path: str) -> list[dict] | None:
+        """Return prefetched results for a file, or None on miss/expiry."""
+        path = self._entry_path(file_path)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.ttl_seconds:
+            return None
+        if entry.get("file_path") != os.path.abspath(file_path):
+            return None  # Hash collision guard
+        return entry.get("results")
+
+    def has_fresh(self, file_path: str) -> bool:
+        """True if a non-expired entry exists for the file."""
+        return self.get(file_path) is not None
+
+    def put(self, file_path: str, query: str, results: list[dict]) -> None:
+        """Store results for a file (atomic replace)."""
+        directory = self.store_dir
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = self._entry_path(file_path)
+        entry = {
+            "file_path": os.path.abspath(file_path),
+            "query": query,
+            "fetched_at": time.time(),
+            "results": results,
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry, default=str))
+        os.replace(str(tmp_path), str(path))
+        self._prune()
+
+    def _prune(self) -> None:
+        """Drop the oldest entries beyond MAX_ENTRIES_PER_SESSION."""
+        with contextlib.suppress(OSError):
+            entries = sorted(
+                self.store_dir.glob("*.json"), key=lambda p: p.stat().st_mtime
+            )
+            for stale in entries[:-MAX_ENTRIES_PER_SESSION]:
+                with contextlib.suppress(OSError):
+                    stale.unlink()
+
+
+def _python_import_modules(content: str) -> list[tuple[str, int]]:
+    """Return (dotted_module, relative_level) pairs imported by Python source."""
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return []
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend((alias.name, 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                modules.append((node.module, node.level))
+            else:
+                # from . import a, b -> sibling modules a and b
+                modules.extend((alias.name, node.level) for alias in node.names)
+    return modules
+
+
+def _resolve_module(module: str, level: int, file_dir: Path, roots: list[Path]):
+    """Map an imported module to a local .py file, or None if not local."""
+    relative = Path(*module.split("."))
+    if level > 0:
+        base = file_dir
+        for _ in range(level - 1):
+            base = base.parent
+        bases = [base]
+    else:
+        bases = roots
+
+    for base in bases:
+        candidate = base / relative
+        for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+            if path.is_file():
+                return path
+    return None
+
+
+def related_files(
+    file_path: str, cwd: str | None = None, max_related: int = 4
+) -> list[str]:
+    """Find files likely to be edited after ``file_path`` is read.
+
+    Local modules imported by the file come first, then recently modified
+    siblings with the same extension. Imports that resolve outside ``cwd``
+    (stdlib, site-packages) are ignored.
+
+    Args:
+        file_path: File that was read.
+        cwd: Project root used to resolve absolute imports (also tried with
+            ``src/``). Defaults to the file's directory.
+        max_related: Maximum number of related files to return.
+
+    Returns:
+        Absolute paths, most likely first, excluding ``file_path`` itself.
+    """
+    if max_related <= 0:
+        return []
+
+    source = Path(file_path).resolve()
+    file_dir = source.parent
+    root = Path(cwd).resolve() if cwd else file_dir
+    related: list[Path] = []
+
+    if source.suffix == ".py":
+        try:
+            content = source.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            content = ""
+        roots = [root, root / "src"]
+        for module, level in _python_import_modules(content):
+            resolved = _resolve_module(module, level, file_dir, roots)
+            if resolved is None:
+                continue
+            resolved = resolved.resolve()
+            if resolved == source or resolved in related:
+                continue
+            if not resolved.is_relative_to(root):
+                continue
+            related.append(resolved)
+            if len(related) >= max_related:
+                break
+
+    if len(related) < max_related and source.suffix:
+        with contextlib.suppress(OSError):
+            siblings = sorted(
+                (
+                    p
+                    for p in file_dir.glob(f"*{source.suffix}")
+                    if p != source and p not in related and p.name != "__init__.py"
+                ),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            related.extend(siblings[: max_related - len(related)])
+
+    return [str(p) for p in related]
+
+
+def prefetch_file_memories(
+    session_id: str,
+    file_path: str,
+    cwd: str | None = None,
+    config: MemoryConfig | None = None,
+    search=None,
+) -> int:
+    """Search code-patterns for a file and its related files into the store.
+
+    Files that already have a fresh entry are skipped, so repeated Reads of
+    the same module do not repeat the search.
+
+    Args:
+        session_id: Session identifier (store scope).
+        file_path: File that was read.
+        cwd: Project directory (group_id detection and import resolution).
+        config: Optional MemoryConfig (defaults to get_config()).
+        search: Optional MemorySearch instance (created lazily otherwise).
+
+    Returns:
+        Number of files newly prefetched.
+    """
+    config = config or get_config()
+    store = PrefetchStore(session_id, ttl_seconds=config.file_prefetch_ttl_seconds)
+    targets = [
+        os.path.abspath(file_path),
+        *related_files(
+            file_path, cwd=cwd, max_related=config.file_prefetch_max_related
+        ),
+    ]
+    targets = [t for t in targets if not store.has_fresh(t)]
+    if not targets:
+        return 0
+
+    if search is None:
+        from .search import MemorySearch
+
+        search = MemorySearch(config)
+
+    prefetched = 0
+    for target in targets:
+        try:
+            results = search_first_edit(search, target, cwd=cwd)
+            store.put(target, build_file_query(target), results)
+            prefetched += 1
+        except Exception as e:
+            # Best-effort: the trigger falls back to a live search on a miss
+            logger.warning(
+                "prefetch_search_failed",
+                extra={"file_path": target, "error": str(e)},
+            )
+            break
+
+    logger.info(
+        "prefetch_completed",
+        extra={
+            "session_id": session_id,
+            "file_path": file_path,
+            "targets": len(targets),
+            "prefetched": prefetched,
+        },
+    )
+    return prefetched
+
+
+def get_prefetched(
+    session_id: str, file_path: str, config: MemoryConfig | None = None
+) -> list[dict] | None:
+    """Return prefetched first_edit results for a file, or None on miss.
+
+    Args:
+        session_id: Session identifier.
+        file_path: File about to be edited/written.
+        config: Optional MemoryConfig (defaults to get_config()).
+
+    Returns:
+        Search results as returned by MemorySearch.search(), or None.
+    """
+    config = config or get_config()
+    if not config.file_prefetch_enabled:
+        return None
+    results = PrefetchStore(session_id, config.file_prefetch_ttl_seconds).get(file_path)
+    logger.debug(
+        "prefetch_lookup",
+        extra={"file_path": file_path, "hit": results is not None},
+    )
+    return results
+
+
+def schedule_prefetch(
+    session_id: str,
+    file_path: str,
+    cwd: str | None = None,
+    config: MemoryConfig | None = None,
+) -> bool:
+    """Fork a detached prefetch worker for a Read (fire-and-forget).
+
+    NFR-P1: the Read hook returns immediately; the worker runs
+    prefetch_file_memories() in its own session.
+
+    Args:
+        session_id: Session identifier.
+        file_path: File that was read.
+        cwd: Project directory.
+        config: Optional MemoryConfig (defaults to get_config()).
+
+    Returns:
+        True if a worker was started.
+    """
+    config = config or get_config()
+    if not config.file_prefetch_enabled or not session_id or not file_path:
+        return False
+    if not os.path.isfile(file_path):
+        return False
+
+    src_dir = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (src_dir, env.get("PYTHONPATH")) if p
+    )
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "memory.prefetch",
+                session_id,
+                file_path,
+                cwd or "",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Full detachment from parent
+            env=env,
+        )
+    except Exception as e:
+        logger.warning(
+            "prefetch_schedule_failed",
+            extra={"file_path": file_path, "error": str(e)},
+        )
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3:
+        with contextlib.suppress(Exception):
+            prefetch_file_memories(sys.argv[1], sys.argv[2], cwd=(sys.argv[3] or None))
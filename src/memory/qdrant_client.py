@@ -7,10 +7,12 @@ Architecture Reference: architecture.md:235-287 (Service Client Architecture)
 Best Practices: https://softlandia.com/articles/deploying-qdrant-with-grpc-auth-on-azure-a-fastapi-singleton-client-guide
 """
 
+import asyncio
 import logging
 import warnings
+import weakref
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import KeywordIndexParams
 
 from .config import MemoryConfig, get_config
@@ -20,6 +22,7 @@ __all__ = [
     "check_qdrant_health",
     "create_content_hash_index",
     "create_group_id_index",
+    "get_async_qdrant_client",
     "get_qdrant_client",
 ]
 
@@ -27,6 +30,12 @@ logger = logging.getLogger("ai_memory.storage")
 
 _client_cache: dict[str, "QdrantClient"] = {}
 
+# AsyncQdrantClient transports are bound to the event loop that first uses
+# them, so async clients are cached per loop (weak keys: finished loops drop out).
+_async_client_cache: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncQdrantClient]]"
+) = weakref.WeakKeyDictionary()
+
 
 class QdrantUnavailable(Exception):
     """Raised when Qdrant is not available.
@@ -91,6 +100,47 @@ def get_qdrant_client(config: MemoryConfig | None = None) -> QdrantClient:
     return client
 
 
+def get_async_qdrant_client(config: MemoryConfig | None = None) -> AsyncQdrantClient:
+    """Get the shared AsyncQdrantClient for the running event loop.
+
+    Async counterpart of get_qdrant_client() with the same connection
+    parameters. Every coroutine on the loop shares one client (and its
+    connection pool), so concurrent agent sessions do not each open their own.
+
+    Must be called from a coroutine (requires a running loop).
+
+    Args:
+        config: Optional MemoryConfig instance. Uses get_config() if not provided.
+
+    Returns:
+        Configured AsyncQdrantClient instance.
+    """
+    config = config or get_config()
+    loop = asyncio.get_running_loop()
+
+    cache_key = f"{config.qdrant_host}:{config.qdrant_port}:{config.qdrant_api_key}:{config.qdrant_use_https}"
+    per_loop = _async_client_cache.setdefault(loop, {})
+    if cache_key in per_loop:
+        return per_loop[cache_key]
+
+    # BUG-099/102: Same insecure-connection warning policy as the sync client
+    _safe_hosts = {"localhost", "127.0.0.1", "qdrant", "host.docker.internal"}
+    if config.qdrant_host in _safe_hosts and not config.qdrant_use_https:
+        warnings.filterwarnings(
+            "ignore", message="Api key is used with an insecure connection"
+        )
+    client = AsyncQdrantClient(
+        host=config.qdrant_host,
+        port=config.qdrant_port,
+        api_key=config.qdrant_api_key,
+        https=config.qdrant_use_https,
+        timeout=config.qdrant_timeout,
+    )
+
+    per_loop[cache_key] = client
+    return client
+
+
 def check_qdrant_health(client: QdrantClient) -> bool:
     """Check if Qdrant is healthy.
 
@@ -41,9 +41,13 @@ from .config import (
     get_config,
 )
 from .decay import build_decay_formula
-from .embeddings import EmbeddingClient, EmbeddingError
+from .embeddings import EmbeddingClient, EmbeddingError, get_async_embedding_client
 from .metrics_push import push_failure_metrics_async, push_retrieval_metrics_async
-from .qdrant_client import QdrantUnavailable, get_qdrant_client
+from .qdrant_client import (
+    QdrantUnavailable,
+    get_async_qdrant_client,
+    get_qdrant_client,
+)
 
 # Import metrics for Prometheus instrumentation (Story 6.1, AC 6.1.3)
 try:
@@ -66,6 +70,7 @@ except ImportError:
 TRACE_CONTENT_MAX = 10000  # Max chars per result preview in traces
 
 __all__ = [
+    "AsyncMemorySearch",
     "MemorySearch",
     "format_attribution",
     "retrieve_best_practices",
@@ -107,6 +112,217 @@ def format_attribution(
     return base
 
 
+def _normalize_memory_types(memory_type) -> list[str] | None:
+    """Normalize a search() memory_type argument (str, list or None) to a list."""
+    # Normalize memory_type to list for internal use
+    # CR-2 FIX: Add type validation with warning if wrong type passed
+    memory_types = None
+    if memory_type is not None:
+        if isinstance(memory_type, str):
+            memory_types = [memory_type]
+        elif isinstance(memory_type, list):
+            memory_types = memory_type
+        else:
+            # Defensive programming: log warning for invalid type
+            logger.warning(
+                "invalid_memory_type_parameter",
+                extra={
+                    "received_type": type(memory_type).__name__,
+                    "expected": "str or list[str]",
+                    "value": str(memory_type)[:50],
+                },
+            )
+            memory_types = None  # Skip type filtering if invalid
+    return memory_types
+
+
+def _build_search_filter(
+    collection: str,
+    group_id: str | None,
+    memory_types: list[str] | None,
+    source: str | None = None,
+    agent_id: str | None = None,
+    must_not_types: list[str] | None = None,
+    exclude_expired_freshness: bool = False,
+) -> Filter | None:
+    """Build the Qdrant filter for MemorySearch.search() / AsyncMemorySearch.search().
+
+    Returns:
+        Filter, or None when no conditions apply.
+    """
+    # Build filter conditions using 2025 best practice: model-based Filter API
+    filter_conditions = []
+    # CRITICAL: Use explicit None check (not truthy) per AC 4.3.2
+    # Prevents incorrect behavior with empty string group_id=""
+    if group_id is not None:
+        filter_conditions.append(
+            FieldCondition(key="group_id", match=MatchValue(value=group_id))
+        )
+        logger.debug(
+            "group_id_filter_applied",
+            extra={"group_id": group_id, "collection": collection},
+        )
+    else:
+        logger.debug(
+            "no_group_id_filter",
+            extra={"collection": collection, "reason": "group_id is None"},
+        )
+    if memory_types:
+        filter_conditions.append(
+            FieldCondition(key="type", match=MatchAny(any=memory_types))
+        )
+
+    # SPEC-005: Namespace filter (e.g., source="github")
+    if source is not None:
+        filter_conditions.append(
+            FieldCondition(key="source", match=MatchValue(value=source))
+        )
+        # BP-074: When searching GitHub namespace, exclude superseded points.
+        # Only applied when source="github" to avoid breaking existing
+        # non-GitHub discussions searches (Option A — backward compatible).
+        if source == "github":
+            filter_conditions.append(
+                FieldCondition(key="is_current", match=MatchValue(value=True))
+            )
+
+    # SPEC-015: Agent-scoped filter (e.g., agent_id="parzival")
+    if agent_id is not None:
+        filter_conditions.append(
+            FieldCondition(
+                key="agent_id",
+                match=MatchValue(value=agent_id),
+            )
+        )
+
+    # F13/TD-243: Build must_not conditions for Qdrant-level type exclusion
+    must_not_conditions = []
+    if must_not_types:
+        must_not_conditions.append(
+            FieldCondition(key="type", match=MatchAny(any=must_not_types))
+        )
+
+    # WP-2: Belt-and-suspenders pre-filter — exclude EXPIRED from code-patterns at Qdrant query layer
+    if exclude_expired_freshness and collection == COLLECTION_CODE_PATTERNS:
+        must_not_conditions.append(
+            FieldCondition(
+                key="freshness_status",
+                match=MatchValue(value="expired"),
+            )
+        )
+
+    if filter_conditions or must_not_conditions:
+        return Filter(
+            must=filter_conditions if filter_conditions else None,
+            must_not=must_not_conditions if must_not_conditions else None,
+        )
+    return None
+
+
+def _format_search_results(points, collection: str, search_mode: str) -> list[dict]:
+    """Convert Qdrant ScoredPoints into search() result dicts.
+
+    Args:
+        points: ScoredPoint list from query_points().
+        collection: Collection the points came from.
+        search_mode: Search path used (dense, decay, hybrid_*), tagged on results.
+    """
+    # Format results with collection and type attribution (AC 3.2.4, T4)
+    # Note: Spread payload first, then set explicit fields to ensure consistency
+    memories = []
+    for result in points:
+        payload = result.payload or {}
+        memory_type = payload.get("type", "unknown")
+        # L-9: Normalize freshness_status to lowercase for case-insensitive comparison
+        # Belt-and-suspenders: pre-retrieval Qdrant filter (_build_search_filter) is case-sensitive,
+        # so normalize here for downstream post-retrieval penalty consistency.
+        _raw_freshness = payload.get("freshness_status")
+        _freshness_status = (_raw_freshness or "unknown").lower()
+        memory = {
+            **payload,  # Spread first - explicit fields below take precedence
+            "id": result.id,
+            "score": result.score,
+            "collection": collection,
+            "type": memory_type,
+            "freshness_status": _freshness_status,
+            "attribution": format_attribution(collection, memory_type, result.score),
+        }
+        vector = result.vector
+        if isinstance(vector, dict):
+            vector = vector.get("")
+        if isinstance(vector, list):
+            memory["vector"] = vector
+        memories.append(memory)
+
+    # PLAN-013 / DEC-062: Normalize hybrid search scores to [0.5, 0.95] range.
+    # RRF scores are reciprocal rank (~0.01-0.05), NOT cosine similarity (0-1).
+    # Without normalization, downstream confidence gating (threshold=0.6)
+    # would ALWAYS skip injection — a silent regression.
+    #
+    # Min-max normalization to [0.5, 0.95] (not [0, 1.0]) because:
+    # - Best result gets 0.95 (not 1.0) → preserves quality signal for
+    #   adaptive budget and is not excluded by score gap filter (which
+    #   skips deterministic score=1.0 results from get_recent()).
+    # - Worst result gets 0.5 → below confidence threshold (0.55 skip)
+    #   so low-quality tail results are naturally filtered.
+    # - Single result gets 0.75 → above threshold, moderate budget.
+    if search_mode.startswith("hybrid") and memories:
+        scores = [m["score"] for m in memories]
+        max_score = max(scores)
+        min_score = min(scores)
+        if max_score > 0:
+            score_range = max_score - min_score
+            for m in memories:
+                if score_range > 0:
+                    m["score"] = 0.5 + 0.45 * (m["score"] - min_score) / score_range
+                else:
+                    # All same score (or single result) → use midpoint
+                    m["score"] = 0.75
+                # Update attribution with normalized score
+                m["attribution"] = format_attribution(
+                    m["collection"], m["type"], m["score"]
+                )
+
+    # Tag results with search mode for downstream observability
+    for m in memories:
+        m["search_mode"] = search_mode
+    return memories
+
+
+def _hybrid_prefetch_stages(
+    query_embedding: list[float],
+    sparse_embedding: dict,
+    query_filter: Filter | None,
+    limit: int,
+    score_threshold: float | None,
+    search_params: SearchParams | None,
+) -> list[Prefetch]:
+    """Build the [dense, sparse] prefetch stages for hybrid search (PLAN-013)."""
+    # Build prefetch stages: dense + sparse (BM25)
+    # max(50, limit * 5) ensures enough candidates for downstream RRF + decay
+    prefetch_limit = max(50, limit * 5)
+
+    dense_prefetch = Prefetch(
+        query=query_embedding,
+        limit=prefetch_limit,
+        score_threshold=score_threshold,
+        filter=query_filter,
+    )
+    if search_params is not None:
+        dense_prefetch.params = search_params
+
+    sparse_prefetch = Prefetch(
+        query=SparseVector(
+            indices=sparse_embedding["indices"],
+            values=sparse_embedding["values"],
+        ),
+        using="bm25",
+        limit=prefetch_limit,
+        filter=query_filter,
+    )
+
+    return [dense_prefetch, sparse_prefetch]
+
+
 class MemorySearch:
     """Handles memory search operations with semantic similarity.
 
@@ -138,6 +354,9 @@ class MemorySearch:
         0.95
     """
 
+    # Local conventions replica (see vector_snapshot.py); None = disabled
+    _conventions_snapshot = None
+
     def __init__(self, config: MemoryConfig | None = None):
         """Initialize memory search with configuration.
 
@@ -152,6 +371,83 @@ class MemorySearch:
         self.client = get_qdrant_client(self.config)
         self.embedding_client = EmbeddingClient(self.config)
 
+        # Optional local read replica for shared conventions lookups
+        self._conventions_snapshot = None
+        if self.config.conventions_snapshot_enabled:
+            from .vector_snapshot import get_vector_snapshot
+
+            self._conventions_snapshot = get_vector_snapshot(
+                COLLECTION_CONVENTIONS, self.config, client=self.client
+            )
+
+    def _search_conventions_snapshot(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        score_threshold: float,
+        memory_types: list[str] | None,
+        must_not_types: list[str] | None,
+        with_vectors: bool = False,
+    ) -> list[dict] | None:
+        """Serve a shared conventions search from the local vector snapshot.
+
+        Args:
+            query_embedding: Dense query vector (already computed).
+            limit: Maximum results.
+            score_threshold: Minimum cosine similarity.
+            memory_types: Optional type allow-list.
+            must_not_types: Optional type deny-list.
+            with_vectors: Attach the cached snapshot vectors to each result.
+
+        Returns:
+            Formatted results (same shape as search()), or None when no
+            snapshot is available and the caller should query Qdrant.
+        """
+        snapshot = self._conventions_snapshot
+        if snapshot is None:
+            return None
+        try:
+            if not snapshot.ensure_fresh():
+                return None
+            hits = snapshot.search(
+                query_embedding,
+                limit=limit,
+                score_threshold=score_threshold,
+                memory_types=memory_types,
+                must_not_types=must_not_types,
+                config=self.config,
+            )
+            vectors = snapshot.get_vectors([h[0] for h in hits]) if with_vectors else {}
+        except Exception as e:
+            logger.warning(
+                "conventions_snapshot_search_failed",
+                extra={"error": str(e), "fallback": "qdrant"},
+            )
+            return None
+
+        memories = []
+        for point_id, score, payload in hits:
+            memory_type = payload.get("type", "unknown")
+            memories.append(
+                {
+                    **payload,
+                    "id": point_id,
+                    "score": score,
+                    "collection": COLLECTION_CONVENTIONS,
+                    "type": memory_type,
+                    "freshness_status": (
+                        payload.get("freshness_status") or "unknown"
+                    ).lower(),
+                    "attribution": format_attribution(
+                        COLLECTION_CONVENTIONS, memory_type, score
+                    ),
+                    "search_mode": "local_snapshot",
+                }
+            )
+            if point_id in vectors:
+                memories[-1]["vector"] = vectors[point_id]
+        return memories
+
     def _get_embedding_model(
         self,
         collection: str,
@@ -201,6 +497,7 @@ class MemorySearch:
             list[str] | None
         ) = None,  # F13/TD-243: Qdrant-level type exclusion
         exclude_expired_freshness: bool = False,  # WP-2: Pre-filter expired from code-patterns queries (Spec §4.5.3)
+        with_vectors: bool = False,  # Return dense vectors (injection diversity stage)
         _access_count_dedup: (
             list[str] | None
         ) = None,  # H-3: Cross-turn dedup list (mutated in-place)
@@ -228,6 +525,8 @@ class MemorySearch:
                       If False (default), use hnsw_ef=128 for accuracy (user searches).
             source: Optional namespace filter (e.g., "github"). When set to "github",
                    also applies is_current=True filter to exclude superseded points (BP-074).
+            with_vectors: If True, each result carries its dense vector under
+                   "vector" (used by the injection near-duplicate filter).
 
         Returns:
             List of memory dicts with score, id, and all payload fields.
@@ -247,25 +546,7 @@ class MemorySearch:
             >>> results[0].keys()
             dict_keys(['id', 'score', 'content', 'group_id', 'type', ...])
         """
-        # Normalize memory_type to list for internal use
-        # CR-2 FIX: Add type validation with warning if wrong type passed
-        memory_types = None
-        if memory_type is not None:
-            if isinstance(memory_type, str):
-                memory_types = [memory_type]
-            elif isinstance(memory_type, list):
-                memory_types = memory_type
-            else:
-                # Defensive programming: log warning for invalid type
-                logger.warning(
-                    "invalid_memory_type_parameter",
-                    extra={
-                        "received_type": type(memory_type).__name__,
-                        "expected": "str or list[str]",
-                        "value": str(memory_type)[:50],
-                    },
-                )
-                memory_types = None  # Skip type filtering if invalid
+        memory_types = _normalize_memory_types(memory_type)
 
         # Auto-detect group_id from cwd if not explicitly provided (AC 4.2.2)
         if cwd is not None and group_id is None:
@@ -309,73 +590,45 @@ class MemorySearch:
         )
         query_embedding = self.embedding_client.embed([query], model=model)[0]
 
-        # Build filter conditions using 2025 best practice: model-based Filter API
-        filter_conditions = []
-        # CRITICAL: Use explicit None check (not truthy) per AC 4.3.2
-        # Prevents incorrect behavior with empty string group_id=""
-        if group_id is not None:
-            filter_conditions.append(
-                FieldCondition(key="group_id", match=MatchValue(value=group_id))
-            )
-            logger.debug(
-                "group_id_filter_applied",
-                extra={"group_id": group_id, "collection": collection},
-            )
-        else:
-            logger.debug(
-                "no_group_id_filter",
-                extra={"collection": collection, "reason": "group_id is None"},
-            )
-        if memory_types:
-            filter_conditions.append(
-                FieldCondition(key="type", match=MatchAny(any=memory_types))
-            )
-
-        # SPEC-005: Namespace filter (e.g., source="github")
-        if source is not None:
-            filter_conditions.append(
-                FieldCondition(key="source", match=MatchValue(value=source))
-            )
-            # BP-074: When searching GitHub namespace, exclude superseded points.
-            # Only applied when source="github" to avoid breaking existing
-            # non-GitHub discussions searches (Option A — backward compatible).
-            if source == "github":
-                filter_conditions.append(
-                    FieldCondition(key="is_current", match=MatchValue(value=True))
-                )
-
-        # SPEC-015: Agent-scoped filter (e.g., agent_id="parzival")
-        if agent_id is not None:
-            filter_conditions.append(
-                FieldCondition(
-                    key="agent_id",
-                    match=MatchValue(value=agent_id),
-                )
-            )
-
-        # F13/TD-243: Build must_not conditions for Qdrant-level type exclusion
-        must_not_conditions = []
-        if must_not_types:
-            must_not_conditions.append(
-                FieldCondition(key="type", match=MatchAny(any=must_not_types))
+        # Shared conventions lookup (no project/source/agent scoping) can be
+        # served from the local memory-mapped snapshot when enabled.
+        if (
+            self._conventions_snapshot is not None
+            and collection == COLLECTION_CONVENTIONS
+            and group_id is None
+            and source is None
+            and agent_id is None
+        ):
+            local_results = self._search_conventions_snapshot(
+                query_embedding=query_embedding,
+                limit=limit,
+                score_threshold=score_threshold,
+                memory_types=memory_types,
+                must_not_types=must_not_types,
+                with_vectors=with_vectors,
             )
-
-        # WP-2: Belt-and-suspenders pre-filter — exclude EXPIRED from code-patterns at Qdrant query layer
-        if exclude_expired_freshness and collection == COLLECTION_CODE_PATTERNS:
-            must_not_conditions.append(
-                FieldCondition(
-                    key="freshness_status",
-                    match=MatchValue(value="expired"),
+            if local_results is not None:
+                logger.info(
+                    "search_completed",
+                    extra={
+                        "collection": collection,
+                        "results_count": len(local_results),
+                        "group_id": group_id,
+                        "threshold": score_threshold,
+                        "search_mode": "local_snapshot",
+                    },
                 )
-            )
+                return local_results
 
-        if filter_conditions or must_not_conditions:
-            query_filter = Filter(
-                must=filter_conditions if filter_conditions else None,
-                must_not=must_not_conditions if must_not_conditions else None,
-            )
-        else:
-            query_filter = None
+        query_filter = _build_search_filter(
+            collection=collection,
+            group_id=group_id,
+            memory_types=memory_types,
+            source=source,
+            agent_id=agent_id,
+            must_not_types=must_not_types,
+            exclude_expired_freshness=exclude_expired_freshness,
+        )
 
         # Search Qdrant using query_points (qdrant-client 1.16+ API)
         # Wraps exceptions in QdrantUnavailable for graceful degradation (AC 1.6.4)
@@ -404,6 +657,8 @@ class MemorySearch:
             },
         )
 
+        # Dense vector only: hybrid collections also hold sparse/ColBERT vectors
+        vector_selector = [""] if with_vectors else False
         _search_mode = "dense"  # Track mode for logging/tracing
         start_time = time.perf_counter()
         try:
@@ -471,6 +726,7 @@ class MemorySearch:
                         query=FusionQuery(fusion=Fusion.RRF),
                         limit=limit,
                         with_payload=True,
+                        with_vectors=vector_selector,
                     )
                 except Exception as hybrid_err:
                     # Graceful degradation: collection may lack sparse config
@@ -485,6 +741,7 @@ class MemorySearch:
                         query=formula,
                         limit=limit,
                         with_payload=True,
+                        with_vectors=vector_selector,
                     )
 
             elif hybrid_prefetch_stages is not None:
@@ -496,6 +753,7 @@ class MemorySearch:
                     query_filter=query_filter,
                     limit=limit,
                     hybrid_prefetch_stages=hybrid_prefetch_stages,
+                    with_vectors=vector_selector,
                 )
                 if isinstance(_search_mode, tuple):
                     response, _search_mode = _search_mode
@@ -509,6 +767,7 @@ class MemorySearch:
                         limit=limit,
                         score_threshold=score_threshold,
                         with_payload=True,
+                        with_vectors=vector_selector,
                         search_params=search_params,
                     )
 
@@ -532,6 +791,7 @@ class MemorySearch:
                     query=formula,
                     limit=limit,
                     with_payload=True,
+                    with_vectors=vector_selector,
                 )
 
             else:
@@ -543,6 +803,7 @@ class MemorySearch:
                     limit=limit,
                     score_threshold=score_threshold,
                     with_payload=True,
+                    with_vectors=vector_selector,
                     search_params=search_params,
                 )
             results = response.points
@@ -597,62 +858,7 @@ class MemorySearch:
             )
             raise QdrantUnavailable(f"Search failed: {e}") from e
 
-        # Format results with collection and type attribution (AC 3.2.4, T4)
-        # Note: Spread payload first, then set explicit fields to ensure consistency
-        memories = []
-        for result in results:
-            payload = result.payload or {}
-            memory_type = payload.get("type", "unknown")
-            # L-9: Normalize freshness_status to lowercase for case-insensitive comparison
-            # Belt-and-suspenders: pre-retrieval Qdrant filter (line 364) is case-sensitive,
-            # so normalize here for downstream post-retrieval penalty consistency.
-            _raw_freshness = payload.get("freshness_status")
-            _freshness_status = (_raw_freshness or "unknown").lower()
-            memory = {
-                **payload,  # Spread first - explicit fields below take precedence
-                "id": result.id,
-                "score": result.score,
-                "collection": collection,
-                "type": memory_type,
-                "freshness_status": _freshness_status,
-                "attribution": format_attribution(
-                    collection, memory_type, result.score
-                ),
-            }
-            memories.append(memory)
-
-        # PLAN-013 / DEC-062: Normalize hybrid search scores to [0.5, 0.95] range.
-        # RRF scores are reciprocal rank (~0.01-0.05), NOT cosine similarity (0-1).
-        # Without normalization, downstream confidence gating (threshold=0.6)
-        # would ALWAYS skip injection — a silent regression.
-        #
-        # Min-max normalization to [0.5, 0.95] (not [0, 1.0]) because:
-        # - Best result gets 0.95 (not 1.0) → preserves quality signal for
-        #   adaptive budget and is not excluded by score gap filter (which
-        #   skips deterministic score=1.0 results from get_recent()).
-        # - Worst result gets 0.5 → below confidence threshold (0.55 skip)
-        #   so low-quality tail results are naturally filtered.
-        # - Single result gets 0.75 → above threshold, moderate budget.
-        if _search_mode.startswith("hybrid") and memories:
-            scores = [m["score"] for m in memories]
-            max_score = max(scores)
-            min_score = min(scores)
-            if max_score > 0:
-                score_range = max_score - min_score
-                for m in memories:
-                    if score_range > 0:
-                        m["score"] = 0.5 + 0.45 * (m["score"] - min_score) / score_range
-                    else:
-                        # All same score (or single result) → use midpoint
-                        m["score"] = 0.75
-                    # Update attribution with normalized score
-                    m["attribution"] = format_attribution(
-                        m["collection"], m["type"], m["score"]
-                    )
-
-        # Tag results with search mode for downstream observability
-        for m in memories:
-            m["search_mode"] = _search_mode
+        memories = _format_search_results(results, collection, _search_mode)
 
         # G-10: Emit search path selection trace event
         if emit_trace_event:
@@ -912,30 +1118,14 @@ class MemorySearch:
             )
             return None
 
-        # Build prefetch stages: dense + sparse (BM25)
-        # max(50, limit * 5) ensures enough candidates for downstream RRF + decay
-        prefetch_limit = max(50, limit * 5)
-
-        dense_prefetch = Prefetch(
-            query=query_embedding,
-            limit=prefetch_limit,
+        return _hybrid_prefetch_stages(
+            query_embedding,
+            sparse_embedding,
+            query_filter=query_filter,
+            limit=limit,
             score_threshold=score_threshold,
-            filter=query_filter,
+            search_params=search_params,
         )
-        if search_params is not None:
-            dense_prefetch.params = search_params
-
-        sparse_prefetch = Prefetch(
-            query=SparseVector(
-                indices=sparse_embedding["indices"],
-                values=sparse_embedding["values"],
-            ),
-            using="bm25",
-            limit=prefetch_limit,
-            filter=query_filter,
-        )
-
-        return [dense_prefetch, sparse_prefetch]
 
     def _hybrid_query_with_fallback(
         self,
@@ -944,6 +1134,7 @@ class MemorySearch:
         query_filter: Filter | None,
         limit: int,
         hybrid_prefetch_stages: list[Prefetch],
+        with_vectors: bool | list[str] = False,
     ) -> str | tuple:
         """Execute hybrid search query using pre-built prefetch stages.
 
@@ -961,6 +1152,7 @@ class MemorySearch:
             query_filter: Pre-built filter conditions.
             limit: Maximum results to return.
             hybrid_prefetch_stages: Pre-built [dense_prefetch, sparse_prefetch] list.
+            with_vectors: Vector selector forwarded to query_points().
 
         Returns:
             Tuple of (QueryResponse, mode_name) on success, or "dense" string on fallback.
@@ -987,6 +1179,7 @@ class MemorySearch:
                         query_filter=query_filter,
                         limit=limit,
                         with_payload=True,
+                        with_vectors=with_vectors,
                     )
                     logger.debug(
                         "hybrid_colbert_search_completed",
@@ -1012,6 +1205,7 @@ class MemorySearch:
                 query_filter=query_filter,
                 limit=limit,
                 with_payload=True,
+                with_vectors=with_vectors,
             )
             logger.debug(
                 "hybrid_rrf_search_completed",
@@ -1683,6 +1877,322 @@ class MemorySearch:
             self.close()
 
 
+class AsyncMemorySearch:
+    """Async-native counterpart of MemorySearch.search().
+
+    Awaits the embedding service and Qdrant through the shared per-loop
+    AsyncEmbeddingClient / AsyncQdrantClient, so concurrent agent sessions
+    (SDK wrappers, MemorySubagent) can search without blocking the event loop
+    or occupying an executor thread per query.
+
+    Supports the same search paths as MemorySearch.search() except ColBERT
+    reranking: hybrid (RRF) + decay, hybrid (RRF), decay and plain dense.
+    Filters, result formatting and hybrid score normalization are shared with
+    the sync implementation.
+
+    Example:
+        >>> search = AsyncMemorySearch()
+        >>> results = await search.search("Python async patterns", group_id="my-project")
+    """
+
+    # Embedding model routing is shared verbatim with the sync implementation.
+    _get_embedding_model = MemorySearch._get_embedding_model
+
+    def __init__(
+        self,
+        config: MemoryConfig | None = None,
+        qdrant_client=None,
+        embedding_client=None,
+    ):
+        """Initialize async search (no connections are opened here).
+
+        Args:
+            config: Optional MemoryConfig instance. Uses get_config() if not provided.
+            qdrant_client: Optional AsyncQdrantClient override (tests).
+            embedding_client: Optional AsyncEmbeddingClient override (tests).
+        """
+        self.config = config or get_config()
+        self._client = qdrant_client
+        self._embedding_client = embedding_client
+
+    @property
+    def client(self):
+        """AsyncQdrantClient shared by all callers on the running loop."""
+        return self._client or get_async_qdrant_client(self.config)
+
+    @property
+    def embedding_client(self):
+        """AsyncEmbeddingClient shared by all callers on the running loop."""
+        return self._embedding_client or get_async_embedding_client(self.config)
+
+    async def search(
+        self,
+        query: str,
+        collection: str = COLLECTION_CODE_PATTERNS,
+        cwd: str | None = None,
+        group_id: str | None = None,
+        limit: int | None = None,
+        score_threshold: float | None = None,
+        memory_type: str | list[str] | None = None,
+        fast_mode: bool = False,
+        source: str | None = None,
+        agent_id: str | None = None,
+        must_not_types: list[str] | None = None,
+        exclude_expired_freshness: bool = False,
+        offset: int = 0,
+        with_payload: bool | list[str] = True,
+        track_access: bool = True,
+        raw_payload: bool = False,
+    ) -> list[dict]:
+        """Search memories; same arguments and result shape as MemorySearch.search().
+
+        Additional arguments:
+            offset: Skip this many ranked results (pagination).
+            with_payload: True for full payloads, or a list of payload fields
+                to return (projection).
+            track_access: Bump access_count on returned memories. Read-only
+                callers (monitoring, tooling) pass False.
+            raw_payload: Also return each point's stored payload, without the
+                fields search adds or normalizes, under "payload".
+
+        Note: hybrid scores are min-max normalized within the returned page.
+
+        Raises:
+            EmbeddingError: If embedding service is unavailable
+            QdrantUnavailable: If Qdrant search fails
+        """
+        memory_types = _normalize_memory_types(memory_type)
+
+        # Auto-detect group_id from cwd if not explicitly provided (AC 4.2.2)
+        if cwd is not None and group_id is None:
+            try:
+                from .project import detect_project
+
+                group_id = detect_project(cwd)
+            except Exception as e:
+                logger.warning(
+                    "search_project_detection_failed",
+                    extra={"cwd": cwd, "error": str(e), "fallback": "no_filter"},
+                )
+        limit = limit if limit is not None else self.config.max_retrievals
+        score_threshold = (
+            score_threshold
+            if score_threshold is not None
+            else self.config.similarity_threshold
+        )
+
+        # TD-225: single-type filters may route to the code model
+        _content_type = (
+            memory_types[0] if memory_types and len(memory_types) == 1 else None
+        )
+        model = self._get_embedding_model(
+            collection, memory_type=memory_types, content_type=_content_type
+        )
+        query_embedding = (await self.embedding_client.embed([query], model=model))[0]
+
+        query_filter = _build_search_filter(
+            collection=collection,
+            group_id=group_id,
+            memory_types=memory_types,
+            source=source,
+            agent_id=agent_id,
+            must_not_types=must_not_types,
+            exclude_expired_freshness=exclude_expired_freshness,
+        )
+        search_params = SearchParams(
+            hnsw_ef=(
+                self.config.hnsw_ef_fast if fast_mode else self.config.hnsw_ef_accurate
+            )
+        )
+        # Prefetch stages must rank every result up to the end of this page
+        window = offset + limit
+
+        # Sparse query embedding for hybrid search (None -> dense fallback)
+        hybrid_stages = None
+        if self.config.hybrid_search_enabled:
+            try:
+                sparse_results = await self.embedding_client.embed_sparse([query])
+                if sparse_results:
+                    hybrid_stages = _hybrid_prefetch_stages(
+                        query_embedding,
+                        sparse_results[0],
+                        query_filter=query_filter,
+                        limit=window,
+                        score_threshold=score_threshold,
+                        search_params=search_params,
+                    )
+            except Exception as e:
+                logger.warning(
+                    "hybrid_sparse_embedding_failed",
+                    extra={"error": str(e), "collection": collection},
+                )
+
+        search_mode = "dense"
+        start_time = time.perf_counter()
+        try:
+            if self.config.decay_enabled:
+                prefetch_limit = max(50, window * 5)
+                formula, decay_prefetch = build_decay_formula(
+                    query_embedding=query_embedding,
+                    collection=collection,
+                    config=self.config,
+                    extra_filter=query_filter,
+                    prefetch_limit=prefetch_limit,
+                    score_threshold=score_threshold,
+                    search_params=search_params,
+                )
+                response = None
+                if hybrid_stages is not None:
+                    # Decay applies to dense scores BEFORE RRF (see MemorySearch)
+                    sparse_stage = hybrid_stages[1]
+                    sparse_stage.limit = prefetch_limit
+                    try:
+                        response = await self.client.query_points(
+                            collection_name=collection,
+                            prefetch=[
+                                Prefetch(
+                                    prefetch=decay_prefetch,
+                                    query=formula,
+                                    limit=prefetch_limit,
+                                ),
+                                sparse_stage,
+                            ],
+                            query=FusionQuery(fusion=Fusion.RRF),
+                            limit=limit,
+                            offset=offset,
+                            with_payload=with_payload,
+                        )
+                        search_mode = "hybrid_rrf_decay"
+                    except Exception as hybrid_err:
+                        logger.warning(
+                            "hybrid_query_failed_falling_back_to_decay",
+                            extra={"error": str(hybrid_err), "collection": collection},
+                        )
+                if response is None:
+                    search_mode = "decay"
+                    response = await self.client.query_points(
+                        collection_name=collection,
+                        prefetch=decay_prefetch,
+                        query=formula,
+                        limit=limit,
+                        offset=offset,
+                        with_payload=with_payload,
+                    )
+            else:
+                response = None
+                if hybrid_stages is not None:
+                    try:
+                        response = await self.client.query_points(
+                            collection_name=collection,
+                            prefetch=hybrid_stages,
+                            query=FusionQuery(fusion=Fusion.RRF),
+                            limit=limit,
+                            offset=offset,
+                            with_payload=with_payload,
+                        )
+                        search_mode = "hybrid_rrf"
+                    except Exception as hybrid_err:
+                        logger.warning(
+                            "hybrid_rrf_query_failed",
+                            extra={"error": str(hybrid_err), "collection": collection},
+                        )
+                if response is None:
+                    response = await self.client.query_points(
+                        collection_name=collection,
+                        query=query_embedding,
+                        query_filter=query_filter,
+                        limit=limit,
+                        offset=offset,
+                        score_threshold=score_threshold,
+                        with_payload=with_payload,
+                        search_params=search_params,
+                    )
+        except Exception as e:
+            if retrieval_duration_seconds:
+                retrieval_duration_seconds.observe(time.perf_counter() - start_time)
+            if memory_retrievals_total:
+                memory_retrievals_total.labels(
+                    collection=collection,
+                    status="failed",
+                    project=group_id or "unknown",
+                ).inc()
+            if failure_events_total:
+                failure_events_total.labels(
+                    component="qdrant",
+                    error_code="QDRANT_UNAVAILABLE",
+                    project=group_id or "unknown",
+                ).inc()
+            logger.error(
+                "qdrant_search_failed",
+                extra={"collection": collection, "group_id": group_id, "error": str(e)},
+            )
+            raise QdrantUnavailable(f"Search failed: {e}") from e
+
+        if retrieval_duration_seconds:
+            retrieval_duration_seconds.observe(time.perf_counter() - start_time)
+
+        memories = _format_search_results(response.points, collection, search_mode)
+        if raw_payload:
+            for memory, point in zip(memories, response.points, strict=True):
+                memory["payload"] = point.payload or {}
+
+        status = "success" if memories else "empty"
+        if memory_retrievals_total:
+            memory_retrievals_total.labels(
+                collection=collection, status=status, project=group_id or "unknown"
+            ).inc()
+        logger.info(
+            "search_completed",
+            extra={
+                "collection": collection,
+                "results_count": len(memories),
+                "group_id": group_id,
+                "threshold": score_threshold,
+                "search_mode": search_mode,
+            },
+        )
+
+        if track_access:
+            await self._increment_access_counts(memories, collection)
+        return memories
+
+    async def _increment_access_counts(
+        self, memories: list[dict], collection: str
+    ) -> None:
+        """Remembrance Protection access_count bump (PLAN-015 §5.3).
+
+        Same batching as MemorySearch.search(): one retrieve and one
+        set_payload per distinct new count. Failures never affect results.
+        """
+        point_ids = list(dict.fromkeys(str(m["id"]) for m in memories if "id" in m))
+        if not point_ids:
+            return
+        try:
+            points = await self.client.retrieve(
+                collection_name=collection,
+                ids=point_ids,
+                with_payload=True,
+                with_vectors=False,
+            )
+            count_map = {
+                str(p.id): int((p.payload or {}).get("access_count") or 0)
+                for p in points
+            }
+        except Exception:
+            count_map = {}
+
+        batch_by_count: dict[int, list[str]] = {}
+        for pid in point_ids:
+            batch_by_count.setdefault(count_map.get(pid, 0) + 1, []).append(pid)
+        for new_count, batch_pids in batch_by_count.items():
+            with contextlib.suppress(Exception):
+                await self.client.set_payload(
+                    collection_name=collection,
+                    payload={"access_count": new_count},
+                    points=batch_pids,
+                )
+
+
 def retrieve_best_practices(
     query: str,
     limit: int = 3,
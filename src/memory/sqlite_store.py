@@ -0,0 +1,149 @@
+"""Shared SQLite scaffolding for the on-disk caches and state stores.
+
+The classification cache (classifier/cache.py), the GitHub HTTP cache
+(connectors/github/http_cache.py) and the classifier's host-wide provider
+state (classifier/shared_state.py) each keep a small SQLite database that
+several processes open at once. They all open it the same way: create the
+parent directory, enable WAL so readers never block the writer, relax fsync
+to NORMAL and create the schema on first use.
+
+All stores built on this module are fail-open: a locked, corrupt or
+unwritable database is logged and treated as a cache miss (or as
+unavailable shared state), never as a failure of the caller's operation.
+
+LRU stores buffer access times instead of writing them on every hit, so a
+read is a single SELECT. Buffered times are applied inside the next write
+transaction or by flush(), and close() flushes before closing.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+__all__ = ["EVICT_TARGET_RATIO", "LRUStore", "SQLiteStore", "connect"]
+
+logger = logging.getLogger("ai_memory.sqlite_store")
+
+# Eviction trims to this fraction of the size limit so puts don't evict every time
+EVICT_TARGET_RATIO = 0.9
+
+
+def connect(
+    path: Path,
+    schema: str,
+    timeout: float = 5.0,
+    isolation_level: str | None = "",
+) -> sqlite3.Connection:
+    """Open a WAL-mode SQLite database shared across threads and processes.
+
+    Args:
+        path: Database file (parent directories are created)
+        schema: CREATE TABLE IF NOT EXISTS statement run on open
+        timeout: Busy timeout in seconds
+        isolation_level: sqlite3 isolation level; None for explicit
+            transactions (autocommit)
+
+    Returns:
+        Open connection (check_same_thread=False; callers serialize access)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(path),
+        timeout=timeout,
+        isolation_level=isolation_level,
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(schema)
+    conn.commit()
+    return conn
+
+
+class SQLiteStore:
+    """Lazily opened SQLite database guarded by a per-instance lock.
+
+    Subclasses set _SCHEMA (and optionally _BUSY_TIMEOUT / _ISOLATION_LEVEL)
+    and call _connect() while holding _lock.
+
+    Attributes:
+        path: SQLite database file
+    """
+
+    _SCHEMA = ""
+    _BUSY_TIMEOUT = 5.0
+    _ISOLATION_LEVEL: str | None = ""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = connect(
+                self.path,
+                self._SCHEMA,
+                timeout=self._BUSY_TIMEOUT,
+                isolation_level=self._ISOLATION_LEVEL,
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class LRUStore(SQLiteStore):
+    """SQLiteStore whose _TABLE has key/accessed_at columns for LRU eviction.
+
+    Reads call _touch() instead of writing accessed_at themselves. Write
+    failures are logged to _logger as _WRITE_FAILED_EVENT.
+    """
+
+    _TABLE = ""
+    _WRITE_FAILED_EVENT = "sqlite_store_write_failed"
+    _logger = logger
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._pending_touch: dict[str, float] = {}
+
+    def _touch(self, key: str, at: float) -> None:
+        # Caller holds _lock
+        self._pending_touch[key] = at
+
+    def _apply_touches(self, conn: sqlite3.Connection) -> None:
+        # Runs inside the caller's transaction (commit is the caller's job)
+        touches = [(at, key) for key, at in self._pending_touch.items()]
+        if touches:
+            conn.executemany(
+                f"UPDATE {self._TABLE} SET accessed_at = ? WHERE key = ?", touches
+            )
+            self._pending_touch = {}
+
+    def flush(self) -> None:
+        """Write buffered access times so LRU eviction sees recent hits."""
+        try:
+            with self._lock:
+                if self._pending_touch:
+                    conn = self._connect()
+                    self._apply_touches(conn)
+                    conn.commit()
+        except sqlite3.Error as e:
+            self._log_write_failure(e)
+
+    def _log_write_failure(self, error: sqlite3.Error) -> None:
+        self._logger.warning(
+            self._WRITE_FAILED_EVENT,
+            extra={"path": str(self.path), "error": str(error)},
+        )
+
+    def close(self) -> None:
+        """Flush buffered access times and close the database connection."""
+        self.flush()
+        super().close()
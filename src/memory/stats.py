@@ -6,6 +6,15 @@ Provides comprehensive statistics for Qdrant collections including:
 - Last updated timestamp
 - Per-project breakdown
 
+Per-value counts (facets) come from Qdrant's facet API, which counts values
+of an indexed keyword field server-side in one request. Servers or fields
+without facet support fall back to a paged payload-only scroll, so the
+result stays correct beyond one page of points. get_collection_stats()
+results are cached per client and collection and reused while the
+collection's write generation (point count + latest timestamp) is
+unchanged, up to STATS_CACHE_MAX_AGE seconds. The monitoring service's
+periodic metrics task and /health endpoint share one view.
+
 ⚠️ ADMIN MODULE: Functions in this module may bypass tenant isolation
 for system-wide monitoring and statistics. These functions should ONLY
 be called from admin contexts (monitoring dashboards, CLI tools, etc.).
@@ -26,7 +35,11 @@ Complies with:
 """
 
 import logging
-from dataclasses import dataclass
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, replace
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import FieldCondition, Filter, MatchValue
@@ -35,12 +48,26 @@ __all__ = [
     "CollectionStats",
     "calculate_disk_size",
     "get_collection_stats",
+    "get_field_counts",
     "get_last_updated",
     "get_unique_field_values",
 ]
 
 logger = logging.getLogger("ai_memory.storage")
 
+# Maximum distinct values returned by one facet request
+FACET_LIMIT = 10000
+# Points per page for the scroll fallback (payload field only, no vectors)
+SCROLL_PAGE_SIZE = 1000
+# Upper bound on how long cached stats are reused without a generation change
+STATS_CACHE_MAX_AGE = float(os.getenv("MEMORY_STATS_CACHE_MAX_AGE", "300"))
+
+# client -> {collection_name: (generation, cached_at, CollectionStats)}
+_stats_cache: "weakref.WeakKeyDictionary[QdrantClient, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_stats_cache_lock = threading.Lock()
+
 
 @dataclass
 class CollectionStats:
@@ -74,6 +101,10 @@ def get_collection_stats(client: QdrantClient, collection_name: str) -> Collecti
     collection-wide statistics. It intentionally bypasses tenant isolation
     for administrative monitoring purposes. Do not expose to end users.
 
+    Per-project counts are cached per client and recomputed only when the
+    collection's point count or latest timestamp changes, or after
+    STATS_CACHE_MAX_AGE seconds. Collection info is always fresh.
+
     Args:
         client: Initialized Qdrant client
         collection_name: Name of collection to analyze
@@ -91,33 +122,80 @@ def get_collection_stats(client: QdrantClient, collection_name: str) -> Collecti
     """
     # Get collection info (O(1) - cached in memory)
     info = client.get_collection(collection_name)
-
-    # Get unique projects from group_id field
-    projects = get_unique_field_values(client, collection_name, "group_id")
-
-    # Get per-project counts (O(log n) per project with payload index)
-    points_by_project = {}
-    for project in projects:
-        count = client.count(
-            collection_name,
-            count_filter={"must": [{"key": "group_id", "match": {"value": project}}]},
+    last_updated = get_last_updated(client, collection_name)
+    generation = (info.points_count, last_updated)
+
+    cached = _cached_stats(client, collection_name, generation)
+    if cached is not None:
+        return replace(
+            cached,
+            projects=list(cached.projects),
+            points_by_project=dict(cached.points_by_project),
+            indexed_points=info.indexed_vectors_count,
+            segments_count=info.segments_count,
+            disk_size_bytes=calculate_disk_size(info),
         )
-        points_by_project[project] = count.count
 
-    # Calculate disk size and last updated
-    disk_size = calculate_disk_size(info)
-    last_updated = get_last_updated(client, collection_name)
+    points_by_project = _facet_counts(client, collection_name, "group_id")
+    if points_by_project is None:
+        # No facet support: discover projects with a paged scroll, then
+        # count each one (O(log n) per project with payload index)
+        points_by_project = {}
+        for project in sorted(_scroll_counts(client, collection_name, "group_id")):
+            count = client.count(
+                collection_name,
+                count_filter={
+                    "must": [{"key": "group_id", "match": {"value": project}}]
+                },
+            )
+            points_by_project[project] = count.count
 
-    return CollectionStats(
+    stats = CollectionStats(
         collection_name=collection_name,
         total_points=info.points_count,
         indexed_points=info.indexed_vectors_count,
         segments_count=info.segments_count,
-        disk_size_bytes=disk_size,
+        disk_size_bytes=calculate_disk_size(info),
         last_updated=last_updated,
-        projects=projects,
+        projects=sorted(points_by_project),
         points_by_project=points_by_project,
     )
+    _store_stats(client, collection_name, generation, stats)
+    return stats
+
+
+def get_field_counts(
+    client: QdrantClient,
+    collection_name: str,
+    field_name: str,
+    group_id: str | None = None,
+) -> dict[str, int]:
+    """Count points per value of a payload field.
+
+    Uses the Qdrant facet API (requires a keyword payload index on the
+    field); falls back to a paged payload-only scroll.
+
+    ⚠️ ADMIN FUNCTION: If group_id is None, counts across ALL projects.
+    This bypasses tenant isolation for admin/monitoring purposes only.
+    For normal application queries, ALWAYS pass group_id.
+
+    Args:
+        client: Initialized Qdrant client
+        collection_name: Name of collection to query
+        field_name: Payload field to count values of
+        group_id: Optional project ID to filter by (None = all projects, ADMIN ONLY)
+
+    Returns:
+        Dictionary mapping field value to point count
+
+    Example:
+        >>> get_field_counts(client, "code-patterns", "type", group_id="proj-a")
+        {'error_pattern': 12, 'implementation': 245}
+    """
+    counts = _facet_counts(client, collection_name, field_name, group_id)
+    if counts is None:
+        counts = _scroll_counts(client, collection_name, field_name, group_id)
+    return counts
 
 
 def get_unique_field_values(
@@ -155,29 +233,122 @@ def get_unique_field_values(
         >>> print(types)
         ['error_pattern', 'implementation']
     """
-    # Build filter if group_id provided (Architecture Spec Section 7.3)
-    scroll_filter = None
-    if group_id is not None:
-        scroll_filter = Filter(
-            must=[FieldCondition(key="group_id", match=MatchValue(value=group_id))]
-        )
+    return sorted(get_field_counts(client, collection_name, field_name, group_id))
 
-    # Scroll through points and extract unique values
-    # For large collections (>10K points), consider maintaining separate index
-    # 2026 Note: Qdrant 1.16+ may add native faceting - check docs
-    points, _ = client.scroll(
-        collection_name=collection_name,
-        limit=10000,  # Adjust based on expected cardinality
-        with_payload=[field_name],
-        scroll_filter=scroll_filter,
+
+def _group_filter(group_id: str | None) -> Filter | None:
+    # Build filter if group_id provided (Architecture Spec Section 7.3)
+    if group_id is None:
+        return None
+    return Filter(
+        must=[FieldCondition(key="group_id", match=MatchValue(value=group_id))]
     )
 
-    unique_values = set()
-    for point in points:
-        if field_name in point.payload:
-            unique_values.add(point.payload[field_name])
 
-    return sorted(unique_values)
+def _facet_counts(
+    client: QdrantClient,
+    collection_name: str,
+    field_name: str,
+    group_id: str | None = None,
+) -> dict[str, int] | None:
+    """Exact per-value counts from the facet API, or None if unsupported."""
+    try:
+        response = client.facet(
+            collection_name=collection_name,
+            key=field_name,
+            facet_filter=_group_filter(group_id),
+            limit=FACET_LIMIT,
+            exact=True,
+        )
+        counts = {hit.value: hit.count for hit in response.hits}
+    except Exception as e:
+        # Qdrant < 1.12, or the field has no keyword index
+        logger.debug(
+            "facet_unavailable",
+            extra={
+                "collection": collection_name,
+                "field": field_name,
+                "error": str(e),
+            },
+        )
+        return None
+    if len(counts) >= FACET_LIMIT:
+        logger.warning(
+            "facet_limit_reached",
+            extra={
+                "collection": collection_name,
+                "field": field_name,
+                "limit": FACET_LIMIT,
+            },
+        )
+    return counts
+
+
+def _scroll_counts(
+    client: QdrantClient,
+    collection_name: str,
+    field_name: str,
+    group_id: str | None = None,
+) -> dict[str, int]:
+    """Per-value counts from a paged scroll fetching only the field."""
+    counts: dict[str, int] = {}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=SCROLL_PAGE_SIZE,
+            offset=offset,
+            with_payload=[field_name],
+            with_vectors=False,
+            scroll_filter=_group_filter(group_id),
+        )
+        for point in points:
+            if field_name in point.payload:
+                value = point.payload[field_name]
+                counts[value] = counts.get(value, 0) + 1
+        if offset is None:
+            return counts
+
+
+def _cached_stats(
+    client: QdrantClient, collection_name: str, generation: tuple
+) -> CollectionStats | None:
+    with _stats_cache_lock:
+        try:
+            entry = _stats_cache.get(client, {}).get(collection_name)
+        except TypeError:
+            return None  # Client not weak-referenceable: no caching
+    if entry is None:
+        return None
+    cached_generation, cached_at, stats = entry
+    if cached_generation != generation:
+        return None
+    if time.monotonic() - cached_at > STATS_CACHE_MAX_AGE:
+        return None
+    return stats
+
+
+def _store_stats(
+    client: QdrantClient,
+    collection_name: str,
+    generation: tuple,
+    stats: CollectionStats,
+) -> None:
+    with _stats_cache_lock:
+        try:
+            per_client = _stats_cache.setdefault(client, {})
+        except TypeError:
+            return
+        # Own copy: callers may mutate the returned stats
+        per_client[collection_name] = (
+            generation,
+            time.monotonic(),
+            replace(
+                stats,
+                projects=list(stats.projects),
+                points_by_project=dict(stats.points_by_project),
+            ),
+        )
 
 
 def calculate_disk_size(info) -> int:
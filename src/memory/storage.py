@@ -11,7 +11,10 @@ Implements Story 1.5 (Storage Module).
 Architecture Reference: architecture.md:516-690 (Storage & Graceful Degradation)
 """
 
+import asyncio
 import dataclasses
+import inspect
+import json
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -21,6 +24,8 @@ from qdrant_client.models import (
     Filter,
     MatchValue,
     PointStruct,
+    SetPayload,
+    SetPayloadOperation,
     SparseVector,
 )
 
@@ -32,9 +37,18 @@ from .config import (
     MemoryConfig,
     get_config,
 )
-from .embeddings import EmbeddingClient, EmbeddingError
+from .embeddings import (
+    EmbeddingClient,
+    EmbeddingError,
+    get_async_embedding_client,
+    route_embedding_model,
+)
 from .models import EmbeddingStatus, MemoryPayload, MemoryType
-from .qdrant_client import QdrantUnavailable, get_qdrant_client
+from .qdrant_client import (
+    QdrantUnavailable,
+    get_async_qdrant_client,
+    get_qdrant_client,
+)
 from .stats import get_last_updated as _get_last_updated
 from .stats import get_unique_field_values as _get_unique_field_values
 from .validation import compute_content_hash, validate_payload
@@ -53,10 +67,179 @@ except ImportError:
     failure_events_total = None
     deduplication_events_total = None
 
-__all__ = ["MemoryStorage", "store_best_practice", "update_point_payload"]
+__all__ = [
+    "AsyncMemoryStorage",
+    "MemoryStorage",
+    "await_store_memory",
+    "store_best_practice",
+    "update_point_payload",
+    "update_point_payloads_async",
+]
 
 logger = logging.getLogger("ai_memory.storage")
 
+# Keys set explicitly by the storage layer; never taken from caller extras
+_RESERVED_PAYLOAD_KEYS = (
+    "timestamp",
+    "created_at",
+    "content",
+    "content_hash",
+    "type",
+    "source_hook",
+    "session_id",
+    "group_id",
+    "collection",
+)
+
+# Route content based on type per Chunking-Strategy-V2.md V2.1: memory types
+# stored through IntelligentChunker, mapped to its ContentType
+_CHUNKER_CONTENT_TYPES = {
+    MemoryType.USER_MESSAGE: ContentType.USER_MESSAGE,
+    MemoryType.AGENT_RESPONSE: ContentType.AGENT_RESPONSE,
+    MemoryType.JIRA_ISSUE: ContentType.PROSE,
+    MemoryType.JIRA_COMMENT: ContentType.PROSE,
+    # v2.0.6 Agent Memory Types (SPEC-015) — enables chunking for oversized agent content
+    MemoryType.AGENT_HANDOFF: ContentType.AGENT_RESPONSE,
+    MemoryType.AGENT_MEMORY: ContentType.PROSE,
+    MemoryType.AGENT_TASK: ContentType.PROSE,
+    MemoryType.AGENT_INSIGHT: ContentType.PROSE,
+}
+
+
+def _split_extra_fields(extra_fields: dict) -> tuple[dict, dict]:
+    """Split caller extras into MemoryPayload kwargs and raw payload fields.
+
+    Unknown fields (e.g., jira_project, file_path) bypass MemoryPayload and
+    are written directly to the Qdrant payload.
+    """
+    mp_field_names = {f.name for f in dataclasses.fields(MemoryPayload)}
+    payload_kwargs = {}
+    extra_payload = {}
+    for k, v in extra_fields.items():
+        if k in _RESERVED_PAYLOAD_KEYS:
+            continue
+        if k in mp_field_names:
+            payload_kwargs[k] = v
+        else:
+            extra_payload[k] = v
+    return payload_kwargs, extra_payload
+
+
+@dataclasses.dataclass
+class _PreparedMemory:
+    """Output of MemoryStorage._prepare_memory(): a validated, not-yet-stored point."""
+
+    content: str
+    content_hash: str
+    group_id: str
+    payload: MemoryPayload
+    payload_kwargs: dict
+    extra_payload: dict
+    created_at: str
+    chunk_results: list | None
+    additional_chunks: list
+    embedding_model: str
+    content_is_original: bool = True
+
+    def reusable_embedding(
+        self, embedding: list[float] | None, model: str | None = None
+    ) -> list[float] | None:
+        """Return a caller-supplied vector if it still describes the stored content.
+
+        The vector is only valid when it was computed with the routed
+        embedding model (``model`` None means the caller used the routing)
+        and the security scan did not mask and the chunker did not split the
+        content it was computed from.
+        """
+        if embedding is None:
+            return None
+        if model is not None and model != self.embedding_model:
+            logger.debug(
+                "precomputed_embedding_discarded",
+                extra={
+                    "content_hash": self.content_hash,
+                    "reason": "embedding_model_mismatch",
+                    "model": model,
+                    "expected_model": self.embedding_model,
+                },
+            )
+            return None
+        if not self.content_is_original or self.additional_chunks:
+            logger.debug(
+                "precomputed_embedding_discarded",
+                extra={
+                    "content_hash": self.content_hash,
+                    "reason": "content_changed_before_storage",
+                },
+            )
+            return None
+        return embedding
+
+    def chunk_payload(self, chunk) -> MemoryPayload:
+        """Build the payload for an additional chunk (TECH-DEBT-151 Phase 4)."""
+        return MemoryPayload(
+            content=chunk.content,
+            content_hash=compute_content_hash(chunk.content),
+            group_id=self.group_id,
+            type=self.payload.type,
+            source_hook=self.payload.source_hook,
+            session_id=self.payload.session_id,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            created_at=self.created_at,
+            embedding_status=self.payload.embedding_status,
+            **self.payload_kwargs,
+        )
+
+
+def _chunking_metadata(
+    prepared: _PreparedMemory, original_size_tokens: int, chunk=None
+) -> dict:
+    """Build chunking_metadata (Chunking Strategy V2.1 compliance).
+
+    Args:
+        prepared: Prepared memory the point belongs to.
+        original_size_tokens: Token count of the (first-chunk) content.
+        chunk: Additional chunk, or None for the main point.
+    """
+    if chunk is None and prepared.additional_chunks and prepared.chunk_results:
+        # First chunk of multi-chunk content
+        chunk = prepared.chunk_results[0]
+    if chunk is None:
+        # Whole content (single chunk or unchunked)
+        return {
+            "chunk_type": "whole",
+            "chunk_index": 0,
+            "total_chunks": 1,
+            "chunk_size_tokens": original_size_tokens,
+            "overlap_tokens": 0,
+            "original_size_tokens": original_size_tokens,
+            "truncated": False,
+        }
+    return {
+        "chunk_type": chunk.metadata.chunk_type,
+        "chunk_index": chunk.metadata.chunk_index,
+        "total_chunks": chunk.metadata.total_chunks,
+        "chunk_size_tokens": chunk.metadata.chunk_size_tokens,
+        "overlap_tokens": chunk.metadata.overlap_tokens,
+        "original_size_tokens": original_size_tokens,
+        "truncated": False,
+    }
+
+
+def _with_sparse(embedding: list[float], sparse_results) -> list[float] | dict:
+    """Combine a dense vector with a BM25 sparse result (T-022).
+
+    Returns the named-vector dict for hybrid collections, or the plain dense
+    vector when no sparse result is available.
+    """
+    if isinstance(sparse_results, list) and sparse_results:
+        sr = sparse_results[0]
+        return {
+            "": embedding,  # Default dense vector
+            "bm25": SparseVector(indices=sr["indices"], values=sr["values"]),
+        }
+    return embedding
+
 
 class MemoryStorage:
     """Handles memory storage operations with validation and graceful degradation.
@@ -96,7 +279,10 @@ class MemoryStorage:
         self.config = config or get_config()
         self.embedding_client = EmbeddingClient(self.config)
         self.qdrant_client = get_qdrant_client(self.config)
+        self._init_scanner()
 
+    def _init_scanner(self) -> None:
+        """Initialize the SPEC-009 security scanner (None when disabled)."""
         # SPEC-009: Initialize security scanner (M3 - class-level attribute)
         if self.config.security_scanning_enabled:
             try:
@@ -132,79 +318,39 @@ class MemoryStorage:
         Returns:
             Model key: "code" or "en"
         """
-        # Code content -> code model
-        if collection == "code-patterns":
-            return "code"
-        if content_type and content_type in ("github_code_blob",):
-            return "code"
-        # Everything else -> prose model
-        return "en"
+        return route_embedding_model(collection, content_type)
 
-    def store_memory(
+    def _prepare_memory(
         self,
         content: str,
         cwd: str,
         memory_type: MemoryType,
         source_hook: str,
         session_id: str,
-        collection: str = "code-patterns",
-        group_id: str | None = None,
-        source_type: str | None = None,
-        **extra_fields,
-    ) -> dict:
-        """Store a memory with automatic project detection and validation.
+        collection: str,
+        group_id: str | None,
+        source_type: str | None,
+        extra_fields: dict,
+    ) -> "_PreparedMemory | dict":
+        """Run the CPU-only stages of store_memory() (no network I/O).
 
-        Implements AC 1.5.1 (Storage Module Implementation) and AC 4.2.1 (Project-Scoped Storage).
-
-        BREAKING CHANGE (Story 4.2): cwd is now required for automatic project detection.
-        group_id is now optional and auto-detected from cwd via detect_project().
-
-        Process:
-        1. Validate cwd parameter
-        2. Auto-detect group_id from cwd using detect_project() (Story 4.1)
-        3. Build payload with content_hash
-        4. Validate payload
-        5. Check for duplicates
-        6. Generate embedding (graceful degradation on failure)
-        7. Store in Qdrant
+        Project detection, security scan, chunking, payload build and
+        validation. Shared by MemoryStorage.store_memory() and
+        AsyncMemoryStorage.store_memory() so both paths store identical points.
 
         Args:
-            content: Memory content (10-100,000 chars)
-            cwd: Current working directory for project detection (REQUIRED)
-            memory_type: Type of memory (MemoryType enum)
-            source_hook: Hook that captured this (PostToolUse, Stop, SessionStart)
-            session_id: Claude session identifier
-            collection: Qdrant collection name (default: "code-patterns")
-            group_id: Optional explicit project identifier (overrides auto-detection)
-            **extra_fields: Additional payload fields (domain, importance, tags, etc.)
+            extra_fields: store_memory() **extra_fields (reserved keys are
+                removed in place).
 
         Returns:
-            dict with keys:
-                - memory_id (str): UUID of stored/matched memory, or None if blocked
-                - status (str): One of:
-                    - "stored": Successfully stored (content may have been masked for PII)
-                    - "blocked": Content blocked due to secrets detection, not stored
-                    - "duplicate": Content hash matches existing memory, not re-stored
-                - embedding_status (str): "complete" (success), "pending" (embedding
-                    service down), or "n/a" (blocked/duplicate)
-                - reason (str): Human-readable explanation (present on "blocked" status)
+            _PreparedMemory, or the final result dict when the security
+            scanner blocked the content.
 
         Raises:
             ValueError: If cwd is None or payload validation fails
-            QdrantUnavailable: If Qdrant storage backend fails
-
-        Example:
-            >>> storage = MemoryStorage()
-            >>> result = storage.store_memory(
-            ...     content="Implementation code here",
-            ...     cwd="/path/to/project",  # REQUIRED for project detection
-            ...     memory_type=MemoryType.IMPLEMENTATION,
-            ...     source_hook="PostToolUse",
-            ...     session_id="sess-456"
-            ... )
-            >>> result["status"]
-            'stored'
         """
+        original_content = content
+
         # Validate cwd parameter (AC 4.2.1)
         if cwd is None:
             raise ValueError("cwd parameter is required for project-scoped storage")
@@ -262,19 +408,7 @@ class MemoryStorage:
             content = scan_result.content
 
         # Route content based on type per Chunking-Strategy-V2.md V2.1
-        # Map MemoryType to ContentType for IntelligentChunker
-        content_type_map = {
-            MemoryType.USER_MESSAGE: ContentType.USER_MESSAGE,
-            MemoryType.AGENT_RESPONSE: ContentType.AGENT_RESPONSE,
-            MemoryType.JIRA_ISSUE: ContentType.PROSE,
-            MemoryType.JIRA_COMMENT: ContentType.PROSE,
-            # v2.0.6 Agent Memory Types (SPEC-015) — enables chunking for oversized agent content
-            MemoryType.AGENT_HANDOFF: ContentType.AGENT_RESPONSE,
-            MemoryType.AGENT_MEMORY: ContentType.PROSE,
-            MemoryType.AGENT_TASK: ContentType.PROSE,
-            MemoryType.AGENT_INSIGHT: ContentType.PROSE,
-        }
-        chunker_content_type = content_type_map.get(memory_type)
+        chunker_content_type = _CHUNKER_CONTENT_TYPES.get(memory_type)
         # Note: For USER_MESSAGE/AGENT_RESPONSE, IntelligentChunker handles
         # whole storage (under threshold) or topical chunking (over threshold).
         # For other types, content passes through unchanged (chunked by hooks).
@@ -312,31 +446,11 @@ class MemoryStorage:
         content_hash = compute_content_hash(content)
 
         # Remove reserved keys from extra_fields to prevent duplicate arguments
-        reserved_keys = [
-            "timestamp",
-            "created_at",
-            "content",
-            "content_hash",
-            "type",
-            "source_hook",
-            "session_id",
-            "group_id",
-            "collection",
-        ]
-        for key in reserved_keys:
+        for key in _RESERVED_PAYLOAD_KEYS:
             extra_fields.pop(key, None)
 
         # Separate MemoryPayload-known fields from extra payload fields.
-        # Unknown fields (e.g., jira_project, jira_issue_key) are passed
-        # directly to the Qdrant payload, bypassing MemoryPayload.
-        _mp_field_names = {f.name for f in dataclasses.fields(MemoryPayload)}
-        payload_kwargs = {}
-        extra_payload = {}
-        for k, v in extra_fields.items():
-            if k in _mp_field_names:
-                payload_kwargs[k] = v
-            else:
-                extra_payload[k] = v
+        payload_kwargs, extra_payload = _split_extra_fields(extra_fields)
 
         payload = MemoryPayload(
             content=content,
@@ -363,6 +477,115 @@ class MemoryStorage:
             )
             raise ValueError(f"Validation failed: {errors}")
 
+        return _PreparedMemory(
+            content=content,
+            content_hash=content_hash,
+            group_id=group_id,
+            payload=payload,
+            payload_kwargs=payload_kwargs,
+            extra_payload=extra_payload,
+            created_at=created_at,
+            chunk_results=chunk_results,
+            additional_chunks=additional_chunks,
+            embedding_model=self._get_embedding_model(
+                collection, extra_fields.get("content_type")
+            ),
+            content_is_original=content == original_content,
+        )
+
+    def store_memory(
+        self,
+        content: str,
+        cwd: str,
+        memory_type: MemoryType,
+        source_hook: str,
+        session_id: str,
+        collection: str = "code-patterns",
+        group_id: str | None = None,
+        source_type: str | None = None,
+        embedding: list[float] | None = None,
+        embedding_model: str | None = None,
+        **extra_fields,
+    ) -> dict:
+        """Store a memory with automatic project detection and validation.
+
+        Implements AC 1.5.1 (Storage Module Implementation) and AC 4.2.1 (Project-Scoped Storage).
+
+        BREAKING CHANGE (Story 4.2): cwd is now required for automatic project detection.
+        group_id is now optional and auto-detected from cwd via detect_project().
+
+        Process:
+        1. Validate cwd parameter
+        2. Auto-detect group_id from cwd using detect_project() (Story 4.1)
+        3. Build payload with content_hash
+        4. Validate payload
+        5. Check for duplicates
+        6. Generate embedding (graceful degradation on failure)
+        7. Store in Qdrant
+
+        Args:
+            content: Memory content (10-100,000 chars)
+            cwd: Current working directory for project detection (REQUIRED)
+            memory_type: Type of memory (MemoryType enum)
+            source_hook: Hook that captured this (PostToolUse, Stop, SessionStart)
+            session_id: Claude session identifier
+            collection: Qdrant collection name (default: "code-patterns")
+            group_id: Optional explicit project identifier (overrides auto-detection)
+            embedding: Optional dense vector already computed for this content
+                (e.g. by deduplication.is_duplicate()). Reused instead of calling
+                the embedding service when the content reaches storage unchanged.
+            embedding_model: Model key the embedding was computed with. The
+                vector is discarded unless it matches the model routed for this
+                collection and content_type; None means the caller routed it.
+            **extra_fields: Additional payload fields (domain, importance, tags, etc.)
+
+        Returns:
+            dict with keys:
+                - memory_id (str): UUID of stored/matched memory, or None if blocked
+                - status (str): One of:
+                    - "stored": Successfully stored (content may have been masked for PII)
+                    - "blocked": Content blocked due to secrets detection, not stored
+                    - "duplicate": Content hash matches existing memory, not re-stored
+                - embedding_status (str): "complete" (success), "pending" (embedding
+                    service down), or "n/a" (blocked/duplicate)
+                - reason (str): Human-readable explanation (present on "blocked" status)
+
+        Raises:
+            ValueError: If cwd is None or payload validation fails
+            QdrantUnavailable: If Qdrant storage backend fails
+
+        Example:
+            >>> storage = MemoryStorage()
+            >>> result = storage.store_memory(
+            ...     content="Implementation code here",
+            ...     cwd="/path/to/project",  # REQUIRED for project detection
+            ...     memory_type=MemoryType.IMPLEMENTATION,
+            ...     source_hook="PostToolUse",
+            ...     session_id="sess-456"
+            ... )
+            >>> result["status"]
+            'stored'
+        """
+        prepared = self._prepare_memory(
+            content,
+            cwd,
+            memory_type,
+            source_hook,
+            session_id,
+            collection,
+            group_id,
+            source_type,
+            extra_fields,
+        )
+        if isinstance(prepared, dict):
+            return prepared  # blocked by security scan
+        content = prepared.content
+        content_hash = prepared.content_hash
+        group_id = prepared.group_id
+        payload = prepared.payload
+        extra_payload = prepared.extra_payload
+        additional_chunks = prepared.additional_chunks
+
         # Check for duplicates within same project (AC 1.5.3)
         # Note: group_id required to respect multi-tenancy isolation (fix per code review)
         existing_id = self._check_duplicate(content_hash, collection, group_id)
@@ -383,12 +606,16 @@ class MemoryStorage:
 
         # Generate embedding with graceful degradation (AC 1.5.4)
         # SPEC-010: Route to appropriate model based on collection and content type
-        embedding_model = self._get_embedding_model(
-            collection, extra_fields.get("content_type")
-        )
+        embedding_model = prepared.embedding_model
+        precomputed = prepared.reusable_embedding(embedding, embedding_model)
         try:
-            embeddings = self.embedding_client.embed([content], model=embedding_model)
-            embedding = embeddings[0]
+            if precomputed is not None:
+                embedding = precomputed  # embed-once: vector from dedup check
+            else:
+                embeddings = self.embedding_client.embed(
+                    [content], model=embedding_model
+                )
+                embedding = embeddings[0]
             payload.embedding_status = EmbeddingStatus.COMPLETE
             logger.debug(
                 "embedding_generated",
@@ -423,30 +650,7 @@ class MemoryStorage:
 
         # Build chunking_metadata (Chunking Strategy V2.1 compliance)
         original_size_tokens = len(content.split())
-
-        if additional_chunks and chunk_results:
-            # First chunk of multi-chunk content
-            first_chunk = chunk_results[0]
-            chunking_metadata = {
-                "chunk_type": first_chunk.metadata.chunk_type,
-                "chunk_index": first_chunk.metadata.chunk_index,
-                "total_chunks": first_chunk.metadata.total_chunks,
-                "chunk_size_tokens": first_chunk.metadata.chunk_size_tokens,
-                "overlap_tokens": first_chunk.metadata.overlap_tokens,
-                "original_size_tokens": original_size_tokens,
-                "truncated": False,
-            }
-        else:
-            # Whole content (single chunk or unchunked)
-            chunking_metadata = {
-                "chunk_type": "whole",
-                "chunk_index": 0,
-                "total_chunks": 1,
-                "chunk_size_tokens": original_size_tokens,
-                "overlap_tokens": 0,
-                "original_size_tokens": original_size_tokens,
-                "truncated": False,
-            }
+        chunking_metadata = _chunking_metadata(prepared, original_size_tokens)
 
         # Store in Qdrant
         memory_id = str(uuid.uuid4())
@@ -454,17 +658,9 @@ class MemoryStorage:
         # Generate sparse vector for hybrid search (T-022)
         if self.config.hybrid_search_enabled:
             try:
-                sparse_results = self.embedding_client.embed_sparse([content])
-                if isinstance(sparse_results, list) and sparse_results:
-                    sr = sparse_results[0]
-                    point_vector = {
-                        "": embedding,  # Default dense vector
-                        "bm25": SparseVector(
-                            indices=sr["indices"], values=sr["values"]
-                        ),
-                    }
-                else:
-                    point_vector = embedding
+                point_vector = _with_sparse(
+                    embedding, self.embedding_client.embed_sparse([content])
+                )
             except Exception as e:
                 logger.warning(
                     "sparse_embedding_failed",
@@ -515,20 +711,7 @@ class MemoryStorage:
                 additional_points = []
                 for _i, chunk in enumerate(additional_chunks, start=1):
                     chunk_id = str(uuid.uuid4())
-                    chunk_hash = compute_content_hash(chunk.content)
-
-                    chunk_payload = MemoryPayload(
-                        content=chunk.content,
-                        content_hash=chunk_hash,
-                        group_id=group_id,
-                        type=memory_type,
-                        source_hook=source_hook,
-                        session_id=session_id,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        created_at=created_at,
-                        embedding_status=payload.embedding_status,
-                        **payload_kwargs,
-                    )
+                    chunk_payload = prepared.chunk_payload(chunk)
 
                     try:
                         chunk_embedding = self.embedding_client.embed(
@@ -537,33 +720,17 @@ class MemoryStorage:
                     except EmbeddingError:
                         chunk_embedding = [0.0] * 768
 
-                    chunk_chunking_metadata = {
-                        "chunk_type": chunk.metadata.chunk_type,
-                        "chunk_index": chunk.metadata.chunk_index,
-                        "total_chunks": chunk.metadata.total_chunks,
-                        "chunk_size_tokens": chunk.metadata.chunk_size_tokens,
-                        "overlap_tokens": chunk.metadata.overlap_tokens,
-                        "original_size_tokens": original_size_tokens,
-                        "truncated": False,
-                    }
+                    chunk_chunking_metadata = _chunking_metadata(
+                        prepared, original_size_tokens, chunk
+                    )
 
                     # Generate sparse vector for chunk (T-022)
                     if self.config.hybrid_search_enabled:
                         try:
-                            chunk_sparse = self.embedding_client.embed_sparse(
-                                [chunk.content]
+                            chunk_point_vector = _with_sparse(
+                                chunk_embedding,
+                                self.embedding_client.embed_sparse([chunk.content]),
                             )
-                            if isinstance(chunk_sparse, list) and chunk_sparse:
-                                csr = chunk_sparse[0]
-                                chunk_point_vector = {
-                                    "": chunk_embedding,
-                                    "bm25": SparseVector(
-                                        indices=csr["indices"],
-                                        values=csr["values"],
-                                    ),
-                                }
-                            else:
-                                chunk_point_vector = chunk_embedding
                         except Exception as e:
                             logger.warning(
                                 "chunk_sparse_embedding_failed",
@@ -641,6 +808,8 @@ class MemoryStorage:
         cwd: str | None = None,
         collection: str = "code-patterns",
         source_type: str | None = None,
+        force_ner: bool = True,
+        scan: bool = True,
     ) -> list[dict]:
         """Store multiple memories in batch for efficiency.
 
@@ -668,12 +837,18 @@ class MemoryStorage:
             collection: Qdrant collection name (default: "code-patterns")
             source_type: Origin of content. Defaults to "user_session" (highest scrutiny).
                          Use "github_*" for GitHub-sourced content (relaxed mode skips L2).
+            force_ner: Run SpaCy NER (Layer 3) on every memory. Pass False to
+                       use the scanner's configured layers, as store_memory() does.
+            scan: Run the security scanner. Pass False only for content the
+                  caller has already scanned.
 
         Returns:
             List of result dictionaries, one per input memory, with:
                 - memory_id: UUID string
                 - status: "stored"
                 - embedding_status: "complete" or "pending"
+            Memories blocked by the security scanner yield status "blocked",
+            memory_id None and index (position in ``memories``).
 
         Raises:
             ValueError: If any payload validation fails
@@ -734,19 +909,19 @@ class MemoryStorage:
                 )
                 raise ValueError(f"Batch validation failed: {errors}")
 
-        # SPEC-009: Security scanning (all 3 layers for batch operations)
+        # SPEC-009: Security scanning (all 3 layers unless force_ner=False)
         # Scan all memories and filter out BLOCKED ones
-        if self._scanner is not None:
+        if self._scanner is not None and scan:
             from .security_scanner import ScanAction
 
             scanned_memories = []
             blocked_count = 0
             masked_count = 0
 
-            for memory in memories:
+            for index, memory in enumerate(memories):
                 scan_result = self._scanner.scan(
                     memory["content"],
-                    force_ner=True,
+                    force_ner=force_ner,
                     source_type=source_type or "user_session",
                 )
 
@@ -768,6 +943,7 @@ class MemoryStorage:
                             "status": "blocked",
                             "reason": "secrets_detected",
                             "embedding_status": "n/a",
+                            "index": index,
                         }
                     )
                     continue
@@ -818,11 +994,14 @@ class MemoryStorage:
         # Group by model for efficient batch embedding
         from collections import defaultdict
 
+        # Chunked types are embedded per chunk in pass 2; embedding them
+        # whole here as well would be thrown away.
         model_groups = defaultdict(list)  # model -> [(original_index, content)]
         for idx, (memory, model) in enumerate(
             zip(memories, memory_models, strict=True)
         ):
-            model_groups[model].append((idx, memory["content"]))
+            if MemoryType(memory["type"]) not in _CHUNKER_CONTENT_TYPES:
+                model_groups[model].append((idx, memory["content"]))
 
         embeddings = [None] * len(memories)
         embedding_status = EmbeddingStatus.COMPLETE
@@ -836,7 +1015,10 @@ class MemoryStorage:
                     embeddings[orig_idx] = emb
             logger.debug(
                 "batch_embeddings_generated",
-                extra={"count": len(memories), "models": list(model_groups.keys())},
+                extra={
+                    "count": sum(len(items) for items in model_groups.values()),
+                    "models": list(model_groups.keys()),
+                },
             )
 
         except EmbeddingError as e:
@@ -881,6 +1063,10 @@ class MemoryStorage:
             if created_at is None:
                 created_at = datetime.now(timezone.utc).isoformat()
 
+            # Caller extras (e.g., file_path, blob_hash) are kept, as in store_memory()
+            payload_kwargs, extra_payload = _split_extra_fields(memory)
+            payload_kwargs.pop("embedding_status", None)
+
             # Get content and memory_type
             content = memory["content"]
             memory_type = (
@@ -890,19 +1076,7 @@ class MemoryStorage:
             )
 
             # Route content based on type per Chunking-Strategy-V2.md V2.1
-            # Map MemoryType to ContentType for IntelligentChunker
-            content_type_map = {
-                MemoryType.USER_MESSAGE: ContentType.USER_MESSAGE,
-                MemoryType.AGENT_RESPONSE: ContentType.AGENT_RESPONSE,
-                MemoryType.JIRA_ISSUE: ContentType.PROSE,
-                MemoryType.JIRA_COMMENT: ContentType.PROSE,
-                # v2.0.6 Agent Memory Types (SPEC-015)
-                MemoryType.AGENT_HANDOFF: ContentType.AGENT_RESPONSE,
-                MemoryType.AGENT_MEMORY: ContentType.PROSE,
-                MemoryType.AGENT_TASK: ContentType.PROSE,
-                MemoryType.AGENT_INSIGHT: ContentType.PROSE,
-            }
-            chunker_content_type = content_type_map.get(memory_type)
+            chunker_content_type = _CHUNKER_CONTENT_TYPES.get(memory_type)
             # Note: For USER_MESSAGE/AGENT_RESPONSE, IntelligentChunker handles
             # whole storage (under threshold) or topical chunking (over threshold).
             # For other types, content passes through unchanged (chunked by hooks).
@@ -943,6 +1117,7 @@ class MemoryStorage:
                             timestamp=datetime.now(timezone.utc).isoformat(),
                             created_at=created_at,
                             embedding_status=embedding_status,
+                            **payload_kwargs,
                         )
 
                         # Build chunking_metadata from ChunkResult.metadata
@@ -975,7 +1150,10 @@ class MemoryStorage:
                             )
 
                         # Convert payload to dict and add chunking_metadata
-                        chunk_payload_dict = chunk_payload.to_dict()
+                        chunk_payload_dict = {
+                            **chunk_payload.to_dict(),
+                            **extra_payload,
+                        }
                         chunk_payload_dict["chunking_metadata"] = chunking_metadata
 
                         # Collect for batch embedding (avoid N+1 API calls)
@@ -992,8 +1170,8 @@ class MemoryStorage:
                     # Skip normal processing for this memory (already handled)
                     continue
                 else:
-                    # Single chunk — re-embed the chunk content for correctness
-                    # (pre-computed embedding was for original content before chunking)
+                    # Single chunk — embedded with the other chunks below
+                    # (chunked types are skipped in the first embedding pass)
                     chunk_result = chunk_results[0]
                     chunk_memory_id = str(uuid.uuid4())
                     chunk_hash = compute_content_hash(chunk_result.content)
@@ -1008,9 +1186,10 @@ class MemoryStorage:
                         timestamp=datetime.now(timezone.utc).isoformat(),
                         created_at=created_at,
                         embedding_status=embedding_status,
+                        **payload_kwargs,
                     )
 
-                    chunk_payload_dict = chunk_payload.to_dict()
+                    chunk_payload_dict = {**chunk_payload.to_dict(), **extra_payload}
                     chunk_payload_dict["chunking_metadata"] = {
                         "chunk_type": "whole",
                         "chunk_index": 0,
@@ -1045,10 +1224,11 @@ class MemoryStorage:
                 timestamp=datetime.now(timezone.utc).isoformat(),
                 created_at=created_at,
                 embedding_status=embedding_status,
+                **payload_kwargs,
             )
 
             # Add whole-content metadata for non-chunked memories
-            payload_dict = payload.to_dict()
+            payload_dict = {**payload.to_dict(), **extra_payload}
             payload_dict["chunking_metadata"] = {
                 "chunk_type": "whole",
                 "chunk_index": 0,
@@ -1116,17 +1296,30 @@ class MemoryStorage:
                 )
 
             chunk_embeddings = [None] * len(pending_chunks)
+            pending_chunk_ids = set()
             for c_model, c_items in chunk_model_groups.items():
-                c_indices, _c_ids, c_payloads = zip(*c_items, strict=True)
+                c_indices, c_ids, c_payloads = zip(*c_items, strict=True)
                 c_contents = [p["content"] for p in c_payloads]
                 try:
                     c_embs = self.embedding_client.embed(
                         list(c_contents), model=c_model
                     )
-                except EmbeddingError:
+                except EmbeddingError as e:
+                    # Chunks are embedded only here, so mark them pending
+                    # rather than storing zero vectors as complete
+                    logger.warning(
+                        "batch_chunk_embedding_failed",
+                        extra={"error": str(e), "count": len(c_contents)},
+                    )
                     c_embs = [[0.0] * 768 for _ in c_contents]
+                    pending_chunk_ids.update(c_ids)
+                    for c_payload in c_payloads:
+                        c_payload["embedding_status"] = EmbeddingStatus.PENDING.value
                 for c_idx, c_emb in zip(c_indices, c_embs, strict=True):
                     chunk_embeddings[c_idx] = c_emb
+            for result in results:
+                if result["memory_id"] in pending_chunk_ids:
+                    result["embedding_status"] = EmbeddingStatus.PENDING.value
 
             # Batch sparse embeddings for all chunks (T-022, avoid N+1 calls)
             chunk_sparse_results = None
@@ -1500,6 +1693,289 @@ class MemoryStorage:
         return _get_last_updated(self.qdrant_client, collection)
 
 
+class AsyncMemoryStorage:
+    """Async-native counterpart of MemoryStorage.store_memory().
+
+    Runs the same CPU-only pipeline (project detection, security scan,
+    chunking, validation) and then awaits the network stages on the shared
+    per-loop AsyncQdrantClient and AsyncEmbeddingClient, so many concurrent
+    agent sessions in one process can store without an executor thread per
+    call. Chunked content is embedded in one request and upserted in one call.
+
+    Example:
+        >>> storage = AsyncMemoryStorage()
+        >>> result = await storage.store_memory(
+        ...     content="Implementation code here",
+        ...     cwd="/path/to/project",
+        ...     memory_type=MemoryType.IMPLEMENTATION,
+        ...     source_hook="PostToolUse",
+        ...     session_id="sess-123",
+        ... )
+    """
+
+    # The CPU-only stages are shared verbatim with the sync implementation.
+    _init_scanner = MemoryStorage._init_scanner
+    _get_embedding_model = MemoryStorage._get_embedding_model
+    _prepare_memory = MemoryStorage._prepare_memory
+
+    def __init__(
+        self,
+        config: MemoryConfig | None = None,
+        qdrant_client=None,
+        embedding_client=None,
+    ) -> None:
+        """Initialize async storage (no connections are opened here).
+
+        Args:
+            config: Optional MemoryConfig instance. Uses get_config() if not provided.
+            qdrant_client: Optional AsyncQdrantClient override (tests).
+            embedding_client: Optional AsyncEmbeddingClient override (tests).
+        """
+        self.config = config or get_config()
+        self._qdrant_client = qdrant_client
+        self._embedding_client = embedding_client
+        self._init_scanner()
+
+    @property
+    def qdrant_client(self):
+        """AsyncQdrantClient shared by all callers on the running loop."""
+        return self._qdrant_client or get_async_qdrant_client(self.config)
+
+    @property
+    def embedding_client(self):
+        """AsyncEmbeddingClient shared by all callers on the running loop."""
+        return self._embedding_client or get_async_embedding_client(self.config)
+
+    async def store_memory(
+        self,
+        content: str,
+        cwd: str,
+        memory_type: MemoryType,
+        source_hook: str,
+        session_id: str,
+        collection: str = "code-patterns",
+        group_id: str | None = None,
+        source_type: str | None = None,
+        embedding: list[float] | None = None,
+        embedding_model: str | None = None,
+        **extra_fields,
+    ) -> dict:
+        """Store a memory; same arguments and result shape as MemoryStorage.store_memory().
+
+        Raises:
+            ValueError: If cwd is None or payload validation fails
+            QdrantUnavailable: If Qdrant storage backend fails
+        """
+        prepared = self._prepare_memory(
+            content,
+            cwd,
+            memory_type,
+            source_hook,
+            session_id,
+            collection,
+            group_id,
+            source_type,
+            extra_fields,
+        )
+        if isinstance(prepared, dict):
+            return prepared  # blocked by security scan
+        group_id = prepared.group_id
+        payload = prepared.payload
+
+        existing_id = await self._check_duplicate(
+            prepared.content_hash, collection, group_id
+        )
+        if existing_id:
+            logger.info(
+                "duplicate_memory_skipped",
+                extra={
+                    "content_hash": prepared.content_hash,
+                    "group_id": group_id,
+                    "existing_id": existing_id,
+                },
+            )
+            return {
+                "memory_id": existing_id,
+                "status": "duplicate",
+                "embedding_status": "n/a",
+            }
+
+        # Main point + additional chunks share one embedding request
+        texts = [prepared.content] + [c.content for c in prepared.additional_chunks]
+        precomputed = prepared.reusable_embedding(embedding, embedding_model)
+        try:
+            if precomputed is not None:
+                embeddings = [precomputed]  # embed-once: vector from dedup check
+            else:
+                embeddings = await self.embedding_client.embed(
+                    texts, model=prepared.embedding_model, project=group_id
+                )
+            payload.embedding_status = EmbeddingStatus.COMPLETE
+        except EmbeddingError as e:
+            # Graceful degradation (AC 1.5.4): pending status + zero vectors
+            logger.warning(
+                "embedding_failed_storing_pending",
+                extra={
+                    "error": str(e),
+                    "content_hash": prepared.content_hash,
+                    "group_id": group_id,
+                },
+            )
+            if failure_events_total:
+                failure_events_total.labels(
+                    component="embedding",
+                    error_code="EMBEDDING_TIMEOUT",
+                    project=group_id,
+                ).inc()
+            embeddings = [[0.0] * 768 for _ in texts]  # DEC-010
+            payload.embedding_status = EmbeddingStatus.PENDING
+
+        # Generate sparse vectors for hybrid search (T-022)
+        sparse_results = None
+        if self.config.hybrid_search_enabled:
+            try:
+                sparse_results = await self.embedding_client.embed_sparse(texts)
+            except Exception as e:
+                logger.warning("sparse_embedding_failed", extra={"error": str(e)})
+
+        original_size_tokens = len(prepared.content.split())
+        memory_id = str(uuid.uuid4())
+        points = []
+        for i, chunk in enumerate([None, *prepared.additional_chunks]):
+            chunk_payload = payload if chunk is None else prepared.chunk_payload(chunk)
+            points.append(
+                PointStruct(
+                    id=memory_id if chunk is None else str(uuid.uuid4()),
+                    vector=_with_sparse(
+                        embeddings[i],
+                        sparse_results[i : i + 1] if sparse_results else None,
+                    ),
+                    payload={
+                        **chunk_payload.to_dict(),
+                        **prepared.extra_payload,
+                        "chunking_metadata": _chunking_metadata(
+                            prepared, original_size_tokens, chunk
+                        ),
+                    },
+                )
+            )
+
+        try:
+            await self.qdrant_client.upsert(collection_name=collection, points=points)
+        except Exception as e:
+            logger.error(
+                "qdrant_store_failed",
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "content_hash": prepared.content_hash,
+                    "group_id": group_id,
+                },
+            )
+            if memory_captures_total:
+                memory_captures_total.labels(
+                    hook_type=source_hook,
+                    status="failed",
+                    project=group_id,
+                    collection=collection,
+                ).inc()
+            if failure_events_total:
+                failure_events_total.labels(
+                    component="qdrant",
+                    error_code="QDRANT_UNAVAILABLE",
+                    project=group_id,
+                ).inc()
+            raise QdrantUnavailable(f"Failed to store memory: {e}") from e
+
+        logger.info(
+            "memory_stored",
+            extra={
+                "memory_id": memory_id,
+                "type": memory_type.value,
+                "group_id": group_id,
+                "embedding_status": payload.embedding_status.value,
+                "collection": collection,
+                "num_points": len(points),
+            },
+        )
+        if memory_captures_total:
+            memory_captures_total.labels(
+                hook_type=source_hook,
+                status="success",
+                project=group_id,
+                collection=collection,
+            ).inc()
+
+        return {
+            "memory_id": memory_id,
+            "status": "stored",
+            "embedding_status": payload.embedding_status.value,
+        }
+
+    async def _check_duplicate(
+        self, content_hash: str, collection: str, group_id: str
+    ) -> str | None:
+        """Async MemoryStorage._check_duplicate(): content_hash + group_id lookup.
+
+        Fails open (returns None) if the check itself fails.
+        """
+        try:
+            points, _ = await self.qdrant_client.scroll(
+                collection_name=collection,
+                scroll_filter=Filter(
+                    must=[
+                        FieldCondition(
+                            key="content_hash",
+                            match=MatchValue(value=content_hash),
+                        ),
+                        FieldCondition(
+                            key="group_id",
+                            match=MatchValue(value=group_id),
+                        ),
+                    ]
+                ),
+                limit=1,
+            )
+        except Exception as e:
+            logger.warning(
+                "duplicate_check_failed",
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "content_hash": content_hash,
+                },
+            )
+            return None
+
+        if not points:
+            return None
+        if deduplication_events_total:
+            deduplication_events_total.labels(
+                action="skipped_duplicate",
+                collection=collection,
+                project=group_id,
+            ).inc()
+        return str(points[0].id)
+
+
+async def await_store_memory(storage, *args, **kwargs) -> dict:
+    """Call storage.store_memory() from async code without blocking the loop.
+
+    AsyncMemoryStorage (or any storage with a coroutine store_memory) is
+    awaited directly; a sync MemoryStorage runs in a worker thread.
+
+    Args:
+        storage: MemoryStorage or AsyncMemoryStorage instance.
+        *args, **kwargs: Forwarded to store_memory().
+
+    Returns:
+        store_memory() result dict.
+    """
+    if inspect.iscoroutinefunction(storage.store_memory):
+        return await storage.store_memory(*args, **kwargs)
+    return await asyncio.to_thread(storage.store_memory, *args, **kwargs)
+
+
 def store_best_practice(
     content: str,
     session_id: str,
@@ -1599,6 +2075,15 @@ def store_best_practice(
         result["group_id"] = "shared"
         result["collection"] = "conventions"
 
+        # Local conventions replica: re-check freshness on next lookup
+        if (
+            result.get("status") == "stored"
+            and storage.config.conventions_snapshot_enabled
+        ):
+            from .vector_snapshot import mark_snapshot_stale
+
+            mark_snapshot_stale("conventions", storage.config)
+
         logger.info(
             "best_practice_stored",
             extra={
@@ -1703,3 +2188,70 @@ def update_point_payload(
             },
         )
         return False
+
+
+async def update_point_payloads_async(
+    collection: str,
+    payload_updates: dict[str, dict],
+    config: MemoryConfig | None = None,
+) -> bool:
+    """Update payload fields on many points of one collection in one request.
+
+    Batched counterpart of update_point_payload() for the classification
+    queue worker: every point's update is sent as a set_payload operation
+    in a single batch_update_points call on the shared AsyncQdrantClient.
+    Points with identical updates share one operation.
+
+    Args:
+        collection: Collection name (code-patterns, conventions, discussions)
+        payload_updates: Point UUID -> payload fields to update/add
+        config: Optional config (uses default if not provided)
+
+    Returns:
+        True if every update was applied, False otherwise (nothing is
+        known to have been applied; callers retry per point)
+
+    Raises:
+        ValueError: If collection is empty
+    """
+    if not collection:
+        raise ValueError("collection is required")
+    if not payload_updates:
+        return True
+
+    # Coalesce points whose updates are identical into one operation
+    grouped: dict[str, tuple[dict, list[str]]] = {}
+    for point_id, payload in payload_updates.items():
+        key = json.dumps(payload, sort_keys=True, default=str)
+        grouped.setdefault(key, (payload, []))[1].append(point_id)
+
+    try:
+        client = get_async_qdrant_client(config or get_config())
+        await client.batch_update_points(
+            collection_name=collection,
+            update_operations=[
+                SetPayloadOperation(set_payload=SetPayload(payload=payload, points=ids))
+                for payload, ids in grouped.values()
+            ],
+        )
+    except Exception as e:
+        logger.error(
+            "point_payloads_update_failed",
+            extra={
+                "collection": collection,
+                "points": len(payload_updates),
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+        )
+        return False
+
+    logger.info(
+        "point_payloads_updated",
+        extra={
+            "collection": collection,
+            "points": len(payload_updates),
+            "operations": len(grouped),
+        },
+    )
+    return True
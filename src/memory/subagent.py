@@ -15,13 +15,14 @@ Example:
     >>> print(result.confidence)
 """
 
+import inspect
 import logging
 from dataclasses import dataclass, field
 from typing import Any
 
 from .intent import IntentType, detect_intent, get_target_collection
-from .search import MemorySearch
-from .storage import MemoryStorage
+from .search import AsyncMemorySearch, MemorySearch
+from .storage import MemoryStorage, await_store_memory
 
 logger = logging.getLogger("ai_memory.subagent")
 
@@ -75,11 +76,13 @@ class MemorySubagent:
         >>> print(result.confidence)
     """
 
-    def __init__(self, search_client: MemorySearch | None = None):
+    def __init__(self, search_client: MemorySearch | AsyncMemorySearch | None = None):
         """Initialize subagent.
 
         Args:
-            search_client: Optional MemorySearch instance (creates new if None)
+            search_client: Optional MemorySearch or AsyncMemorySearch instance
+                (creates MemorySearch if None). AsyncMemorySearch is awaited
+                natively so concurrent queries do not block the event loop.
         """
         self.search = search_client or MemorySearch()
         logger.info("subagent_initialized")
@@ -122,6 +125,8 @@ class MemorySubagent:
                 group_id=group_id,
                 limit=limit,
             )
+            if inspect.isawaitable(results):
+                results = await results
 
             # Format answer from results
             answer = self._format_answer(results, intent)
@@ -210,7 +215,8 @@ class MemorySubagent:
             storage = MemoryStorage()
 
             # Use sentinel path for agent storage (no real filesystem context)
-            result = storage.store_memory(
+            result = await await_store_memory(
+                storage,
                 content=content,
                 cwd="/__agent__",  # Sentinel for agent-originated memories
                 memory_type=validated_type,
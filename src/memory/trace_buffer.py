@@ -1,9 +1,10 @@
 """Fire-and-forget trace event buffer for hook scripts.
 
-Writes JSON trace events to a buffer directory. A separate
-trace-flush-worker reads and sends these to Langfuse.
+Appends JSON trace events to this process's segment in the trace spool
+(see trace_spool.py). A separate trace-flush-worker reads and sends these to
+Langfuse.
 
-Overhead: ~5-10ms per event (atomic file write).
+Overhead: one line append per event; no temp file, rename or directory scan.
 
 SPEC-020 §4 / PLAN-008
 """
@@ -12,11 +13,14 @@ SPEC-020 §4 / PLAN-008
 
 import json
 import os
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
+from .trace_spool import SEGMENT_SUFFIX, SegmentWriter, read_spool_size
+
 TRACE_BUFFER_DIR = (
     Path(os.environ.get("AI_MEMORY_INSTALL_DIR", os.path.expanduser("~/.ai-memory")))
     / "trace_buffer"
@@ -29,18 +33,46 @@ BUFFER_MAX_MB = int(os.environ.get("LANGFUSE_TRACE_BUFFER_MAX_MB", "100"))
 _UNSET = object()
 
 # Buffer size tracked incrementally to avoid O(n) directory scan on every emit call.
-# Initialized from actual directory size on first write; updated on each successful write.
+# Calibrated from the size the flush worker publishes (one small file read),
+# then incremented on each successful write. Re-calibrated every
+# _CALIBRATE_INTERVAL seconds so long-lived emitters see consumed space freed.
 _buffer_size_bytes: int = -1  # -1 = not yet calibrated
+_calibrated_at: float = 0.0
+_CALIBRATE_INTERVAL = 30.0
+
+_writer: SegmentWriter | None = None
+_write_lock = threading.Lock()
 
 
 def _calibrate_buffer_size() -> int:
-    """Scan buffer directory once to initialize _buffer_size_bytes. O(n) — call only on startup."""
+    """Initialize _buffer_size_bytes from the flush worker's published size.
+
+    Falls back to one O(n) directory scan when no size has been published
+    (flush worker not running yet).
+    """
+    size = read_spool_size(TRACE_BUFFER_DIR)
+    if size is not None:
+        return size
     try:
-        return sum(f.stat().st_size for f in TRACE_BUFFER_DIR.glob("*.json"))
+        with os.scandir(TRACE_BUFFER_DIR) as it:
+            return sum(
+                entry.stat().st_size
+                for entry in it
+                if entry.name.endswith((SEGMENT_SUFFIX, ".json"))
+            )
     except OSError:
         return 0
 
 
+def _get_writer() -> SegmentWriter:
+    global _writer
+    if _writer is None or _writer.directory != TRACE_BUFFER_DIR:
+        if _writer is not None:
+            _writer.close()
+        _writer = SegmentWriter(TRACE_BUFFER_DIR)
+    return _writer
+
+
 def emit_trace_event(
     event_type: str,
     data: dict,
@@ -77,7 +109,7 @@ def emit_trace_event(
     Returns:
         True if event was written, False if skipped (disabled or buffer full).
     """
-    global _buffer_size_bytes
+    global _buffer_size_bytes, _calibrated_at
 
     # Check kill-switch without importing langfuse
     if os.environ.get("LANGFUSE_ENABLED", "false").lower() != "true":
@@ -91,9 +123,13 @@ def emit_trace_event(
 
     TRACE_BUFFER_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Calibrate buffer size once on first call (avoids O(n) scan on every emit).
-    if _buffer_size_bytes < 0:
+    # Calibrate buffer size on first call and periodically after (O(1) read).
+    if (
+        _buffer_size_bytes < 0
+        or time.monotonic() - _calibrated_at >= _CALIBRATE_INTERVAL
+    ):
         _buffer_size_bytes = _calibrate_buffer_size()
+        _calibrated_at = time.monotonic()
 
     # Buffer overflow guard: MB-based (DEC-PLAN008-004).
     buffer_size_mb = _buffer_size_bytes / (1024 * 1024)
@@ -129,18 +165,14 @@ def emit_trace_event(
     if tags:
         event["tags"] = tags
 
-    # Atomic write via temp file + rename (prevents partial reads)
-    tmp_path = TRACE_BUFFER_DIR / f".tmp_{uuid4().hex}"
-    final_path = TRACE_BUFFER_DIR / f"{uuid4().hex}.json"
-
+    # One line per event, appended to this process's segment. Readers only
+    # consume newline-terminated lines, so a partial append is never read.
     try:
-        serialized = json.dumps(event, default=str)
-        tmp_path.write_text(serialized)
-        tmp_path.rename(final_path)
+        line = (json.dumps(event, default=str) + "\n").encode()
+        with _write_lock:
+            _get_writer().append(line)
         # Increment running counter so next call needs no directory scan
-        _buffer_size_bytes += len(serialized.encode())
+        _buffer_size_bytes += len(line)
         return True
     except OSError:
-        # Clean up temp file on failure
-        tmp_path.unlink(missing_ok=True)
         return False
@@ -1,7 +1,16 @@
 """Trace buffer flush daemon — reads JSON events from disk and sends to Langfuse.
 
 Runs as a long-lived process (docker-compose trace-flush-worker service).
-Flushes the on-disk trace buffer to Langfuse on a configurable interval.
+Flushes the on-disk trace spool (see trace_spool.py) to Langfuse, resuming
+from its cursor. Pre-spool ``*.json`` event files left by older emitters are
+still drained.
+
+Events are exported in batches of at most LANGFUSE_FLUSH_MAX_BATCH events /
+LANGFUSE_FLUSH_MAX_BATCH_BYTES bytes, with langfuse.flush() after each batch.
+The SDK's span processor queue holds 2048 spans and drops the rest, so an
+unbounded cycle lost spans under burst load. While a backlog remains the next
+batch starts immediately; when idle the worker waits for a spool write
+(inotify) or LANGFUSE_FLUSH_INTERVAL, whichever comes first.
 
 SPEC-020 §5 / PLAN-008 / DEC-PLAN008-004
 """
@@ -38,6 +47,7 @@ INSTALL_DIR = os.environ.get(
 sys.path.insert(0, os.path.join(INSTALL_DIR, "src"))
 
 from memory.langfuse_config import get_langfuse_client  # noqa: E402
+from memory.trace_spool import SpoolReader, SpoolWatcher  # noqa: E402
 
 
 def _dt_to_ns(iso_str: str) -> int:
@@ -92,11 +102,20 @@ logger = logging.getLogger(__name__)
 
 BUFFER_DIR = Path(INSTALL_DIR) / "trace_buffer"
 FLUSH_INTERVAL = int(os.environ.get("LANGFUSE_FLUSH_INTERVAL", "5"))
+# Delay after a spool write wakes the worker, so a burst goes out as one batch
+FLUSH_MIN_INTERVAL = float(os.environ.get("LANGFUSE_FLUSH_MIN_INTERVAL", "0.5"))
+# Per-batch export limits; keep MAX_BATCH below the span processor queue (2048)
+FLUSH_MAX_BATCH = int(os.environ.get("LANGFUSE_FLUSH_MAX_BATCH", "512"))
+FLUSH_MAX_BATCH_BYTES = int(
+    os.environ.get("LANGFUSE_FLUSH_MAX_BATCH_BYTES", str(4 * 1024 * 1024))
+)
 MAX_BUFFER_MB = int(os.environ.get("LANGFUSE_TRACE_BUFFER_MAX_MB", "100"))
 HEARTBEAT_FILE = BUFFER_DIR / ".heartbeat"
 
 shutdown_requested = False
 
+_reader: SpoolReader | None = None
+
 
 def _handle_signal(signum, frame):
     global shutdown_requested
@@ -108,33 +127,30 @@ signal.signal(signal.SIGTERM, _handle_signal)
 signal.signal(signal.SIGINT, _handle_signal)
 
 
-def evict_oldest_traces() -> int:
-    """Evict oldest trace files when buffer exceeds MAX_BUFFER_MB.
-
-    Uses a single stat() call per file (not 2-3). Sorts by mtime.
-    Returns number of files evicted.
-    """
-    if not BUFFER_DIR.exists():
-        return 0
+def _get_reader() -> SpoolReader:
+    """Spool reader for BUFFER_DIR (cursor loaded once per process)."""
+    global _reader
+    if _reader is None or _reader.directory != BUFFER_DIR:
+        _reader = SpoolReader(BUFFER_DIR)
+    return _reader
 
-    try:
-        # Single stat call per file via os.scandir for efficiency
-        entries = []
-        with os.scandir(BUFFER_DIR) as it:
-            for entry in it:
-                st = entry.stat()
-                if stat.S_ISREG(st.st_mode) and entry.name.endswith(".json"):
-                    entries.append((st.st_mtime, st.st_size, Path(entry.path)))
-    except OSError as e:
-        logger.warning("Failed to scan buffer dir: %s", e)
-        return 0
 
-    total_bytes = sum(size for _, size, _ in entries)
-    max_bytes = MAX_BUFFER_MB * 1024 * 1024
+def _evict_legacy_files(max_bytes: int, budget_used: int) -> tuple[int, int]:
+    """Evict oldest pre-spool *.json files beyond the remaining byte budget.
 
-    if total_bytes <= max_bytes:
-        return 0
+    Returns:
+        Tuple of (files evicted, bytes still held by legacy files).
+    """
+    entries = []
+    for path in _get_reader().legacy_files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            entries.append((st.st_mtime, st.st_size, path))
 
+    total_bytes = budget_used + sum(size for _, size, _ in entries)
     # Sort oldest first
     entries.sort(key=lambda x: x[0])
 
@@ -149,6 +165,29 @@ def evict_oldest_traces() -> int:
         except OSError as e:
             logger.warning("Failed to evict %s: %s", path.name, e)
 
+    return evicted, total_bytes - budget_used
+
+
+def evict_oldest_traces() -> int:
+    """Evict oldest buffered traces when the buffer exceeds MAX_BUFFER_MB.
+
+    Legacy *.json files are the oldest data and go first, then whole spool
+    segments, oldest first. Sizes come from one directory scan; no per-event
+    stat or sort.
+
+    Returns number of events evicted.
+    """
+    if not BUFFER_DIR.exists():
+        return 0
+
+    reader = _get_reader()
+    reader.refresh()
+    max_bytes = MAX_BUFFER_MB * 1024 * 1024
+
+    evicted, _legacy_bytes = _evict_legacy_files(max_bytes, reader.total_bytes)
+    if reader.total_bytes > max_bytes:
+        evicted += reader.evict(max_bytes)
+
     if evicted > 0:
         logger.warning(
             "Langfuse trace buffer exceeded %sMB, evicting %s oldest traces. Is Langfuse running?",
@@ -322,25 +361,25 @@ def _process_event_sdk(event: dict, data: dict, langfuse) -> None:
         observation.end()
 
 
-def process_buffer_files(langfuse) -> tuple[int, int]:
-    """Read *.json files from buffer dir, create Langfuse traces+spans, delete processed.
+def _process_event(event: dict, langfuse) -> None:
+    data = event.get("data", {})
+    if OTEL_AVAILABLE:
+        _process_event_otel(event, data)
+    else:
+        _process_event_sdk(event, data, langfuse)
 
-    Uses raw OTel spans when available (ISSUE-183: accurate timing via start_time).
-    Falls back to Langfuse SDK when OTel is not installed.
-
-    Returns:
-        Tuple of (processed_count, error_count).
-    """
-    if not BUFFER_DIR.exists():
-        return 0, 0
 
+def _process_legacy_files(langfuse) -> tuple[int, int]:
+    """Drain pre-spool *.json event files (one event per file)."""
     processed = 0
     errors = 0
 
-    for json_file in list(BUFFER_DIR.glob("*.json")):
+    for json_file in _get_reader().legacy_files:
         try:
             with open(json_file) as f:
                 event = json.load(f)
+        except FileNotFoundError:
+            continue  # Evicted since the scan
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(
                 "Malformed or unreadable buffer file %s: %s", json_file.name, e
@@ -351,11 +390,7 @@ def process_buffer_files(langfuse) -> tuple[int, int]:
             continue
 
         try:
-            data = event.get("data", {})
-            if OTEL_AVAILABLE:
-                _process_event_otel(event, data)
-            else:
-                _process_event_sdk(event, data, langfuse)
+            _process_event(event, langfuse)
             json_file.unlink()
             processed += 1
         except Exception as e:
@@ -365,8 +400,93 @@ def process_buffer_files(langfuse) -> tuple[int, int]:
     return processed, errors
 
 
+def process_buffer_files(
+    langfuse, max_events: int | None = None, max_bytes: int | None = None
+) -> tuple[int, int]:
+    """Send unconsumed spool events to Langfuse and advance the cursor.
+
+    Uses raw OTel spans when available (ISSUE-183: accurate timing via start_time).
+    Falls back to Langfuse SDK when OTel is not installed.
+
+    An event that fails to process is logged, counted and skipped: failures
+    here are data errors that a retry would repeat, and holding the cursor
+    would block the rest of its segment.
+
+    Args:
+        langfuse: Langfuse client
+        max_events: Stop after this many spool events (None: no limit)
+        max_bytes: Stop after this many spool bytes (None: no limit)
+
+    Returns:
+        Tuple of (processed_count, error_count).
+    """
+    if not BUFFER_DIR.exists():
+        return 0, 0
+
+    reader = _get_reader()
+    reader.refresh()
+    processed, errors = _process_legacy_files(langfuse)
+
+    for segment, event in reader.events(max_events=max_events, max_bytes=max_bytes):
+        if event is None:
+            logger.warning("Malformed event line in trace segment %s", segment)
+            errors += 1
+            continue
+        try:
+            _process_event(event, langfuse)
+            processed += 1
+        except Exception as e:
+            logger.error("Failed to process event from segment %s: %s", segment, e)
+            errors += 1
+
+    reader.commit()
+    return processed, errors
+
+
+def flush_batch(langfuse) -> tuple[int, int]:
+    """Process and export one bounded batch of buffered events.
+
+    Returns:
+        Tuple of (processed_count, error_count).
+    """
+    processed, errors = process_buffer_files(
+        langfuse, max_events=FLUSH_MAX_BATCH, max_bytes=FLUSH_MAX_BATCH_BYTES
+    )
+    if processed > 0:
+        try:
+            langfuse.flush()
+        except Exception as e:
+            logger.warning("Langfuse flush failed: %s", e)
+    return processed, errors
+
+
+def backlog_pending() -> bool:
+    """True if the last batch stopped at its limits with events left."""
+    return _get_reader().truncated
+
+
+def buffer_size_bytes() -> int:
+    """Bytes held by the buffer as of the last scan (no directory walk)."""
+    reader = _get_reader()
+    legacy = 0
+    for path in reader.legacy_files:
+        with contextlib.suppress(OSError):
+            legacy += path.stat().st_size
+    return reader.total_bytes + legacy
+
+
+def _wait_for_events(watcher: SpoolWatcher) -> None:
+    """Idle until the spool is written to, at most FLUSH_INTERVAL seconds."""
+    if not watcher.available:
+        time.sleep(FLUSH_INTERVAL)
+        return
+    watcher.wait(max(0.0, FLUSH_INTERVAL - FLUSH_MIN_INTERVAL))
+    # Let the rest of a burst land so it is exported as one batch
+    time.sleep(FLUSH_MIN_INTERVAL)
+
+
 def main():
-    """Main flush loop: evict → process → flush → push metrics → sleep."""
+    """Main flush loop: evict → export batch → push metrics → wait for events."""
     global shutdown_requested
 
     langfuse = get_langfuse_client()
@@ -375,63 +495,70 @@ def main():
         sys.exit(1)
 
     BUFFER_DIR.mkdir(parents=True, exist_ok=True)
+    watcher = SpoolWatcher(BUFFER_DIR)
     logger.info(
-        "Trace flush worker started (buffer=%s, interval=%ss, max_buffer=%sMB)",
+        "Trace flush worker started (buffer=%s, interval=%ss, max_batch=%s, "
+        "max_buffer=%sMB, watch=%s)",
         BUFFER_DIR,
         FLUSH_INTERVAL,
+        FLUSH_MAX_BATCH,
         MAX_BUFFER_MB,
+        "inotify" if watcher.available else "poll",
     )
 
     total_processed = 0
     total_errors = 0
+    # Counts accumulated since the last metrics push (at most one per interval)
+    window_evicted = window_processed = window_errors = 0
+    window_start = time.monotonic()
+    last_push = None
 
     while not shutdown_requested:
         evicted = evict_oldest_traces()
-        processed, errors = process_buffer_files(langfuse)
+        processed, errors = flush_batch(langfuse)
 
         total_errors += errors
+        total_processed += processed
+        window_evicted += evicted
+        window_processed += processed
+        window_errors += errors
         if processed > 0:
-            try:
-                langfuse.flush()
-            except Exception as e:
-                logger.warning("Langfuse flush failed: %s", e)
-            total_processed += processed
             logger.info("Flushed %s events (%s errors)", processed, errors)
 
         # Push metrics
-        try:
-            buffer_size_bytes = sum(f.stat().st_size for f in BUFFER_DIR.glob("*.json"))
-        except OSError:
-            buffer_size_bytes = 0
-
-        if push_metrics_fn:
+        now = time.monotonic()
+        if push_metrics_fn and (last_push is None or now - last_push >= FLUSH_INTERVAL):
             push_metrics_fn(
-                evictions=evicted,
-                buffer_size_bytes=buffer_size_bytes,
-                events_processed=processed,
-                flush_errors=errors,
+                evictions=window_evicted,
+                buffer_size_bytes=buffer_size_bytes(),
+                events_processed=window_processed,
+                flush_errors=window_errors,
+                drain_rate=window_processed / max(now - window_start, 1e-3),
+                backlog_age_seconds=_get_reader().backlog_age(),
             )
+            window_evicted = window_processed = window_errors = 0
+            window_start = last_push = now
 
         # TD-182: Touch heartbeat file for Docker healthcheck (file-based liveness probe)
         with contextlib.suppress(OSError):
             HEARTBEAT_FILE.touch()
 
-        time.sleep(FLUSH_INTERVAL)
+        if not backlog_pending():
+            _wait_for_events(watcher)
 
     # Graceful shutdown — flush remaining buffer
     logger.info(
         "Shutdown requested — flushing remaining buffer (%s total processed)",
         total_processed,
     )
+    watcher.close()
     evict_oldest_traces()
-    processed, errors = process_buffer_files(langfuse)
-    total_errors += errors
-    if processed > 0:
-        try:
-            langfuse.flush()
-        except Exception as e:
-            logger.warning("Langfuse flush failed during shutdown: %s", e)
+    while True:
+        processed, errors = flush_batch(langfuse)
         total_processed += processed
+        total_errors += errors
+        if not backlog_pending():
+            break
 
     logger.info(
         "Trace flush worker stopped (total_processed=%s, total_errors=%s)",
@@ -0,0 +1,483 @@
+"""Segmented append-only spool for buffered trace events.
+
+Replaces the one-JSON-file-per-event trace buffer. Every emitting process
+appends newline-delimited JSON events to its own segment file
+(``<created_ns>-<pid>-<rand>.jsonl``) with one ``os.write()`` per line, so
+emitting costs an append instead of a temp file + rename, and a segment never
+has more than one writer. A segment is rotated once it reaches
+SEGMENT_MAX_BYTES or SEGMENT_MAX_AGE seconds, so no process appends to a
+segment older than that.
+
+The trace flush worker consumes segments through SpoolReader:
+
+- A cursor file (``.cursor``) records the byte offset consumed per segment,
+  so a restart resumes where it stopped and nothing is re-sent.
+- Only complete lines are consumed; a line still being written is picked up
+  on the next cycle.
+- A fully consumed segment is deleted once it is sealed (older than
+  SEGMENT_MAX_AGE + SEGMENT_SEAL_GRACE), i.e. its writer has rotated away.
+- Eviction drops whole segments, oldest first. A writer whose segment was
+  evicted notices (st_nlink == 0) and opens a new one.
+- Spool size is tracked incrementally and published in ``.spool_size``, so a
+  producer checks the size cap by reading one small file instead of scanning
+  the directory.
+- events() can stop after a maximum number of events or bytes, so the worker
+  exports a burst in bounded batches. Lines are decoded a chunk at a time
+  with a single json.loads() call.
+- SpoolWatcher (Linux inotify) wakes the worker when a producer appends, so
+  an idle worker sleeps instead of rescanning the directory.
+
+SPEC-020 §4-§5 / PLAN-008 / DEC-PLAN008-004
+"""
+
+# LANGFUSE: Trace buffer storage (Path A infrastructure). See LANGFUSE-INTEGRATION-SPEC.md §4
+
+import contextlib
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import select
+import struct
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SEGMENT_MAX_AGE",
+    "SEGMENT_MAX_BYTES",
+    "SEGMENT_SEAL_GRACE",
+    "SEGMENT_SUFFIX",
+    "SegmentWriter",
+    "SpoolReader",
+    "SpoolWatcher",
+    "read_spool_size",
+]
+
+SEGMENT_SUFFIX = ".jsonl"
+CURSOR_FILE = ".cursor"
+SIZE_FILE = ".spool_size"
+
+# Rotate a writer's segment at this size or age
+SEGMENT_MAX_BYTES = 1024 * 1024
+SEGMENT_MAX_AGE = 30.0
+# Extra time before a consumed segment is deleted (covers a writer that
+# passed its age check just before the deadline)
+SEGMENT_SEAL_GRACE = 30.0
+
+# Lines decoded per json.loads() call in SpoolReader.events()
+DECODE_CHUNK = 256
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def segment_created(name: str) -> float:
+    """Creation time (epoch seconds) encoded in a segment file name."""
+    try:
+        return int(name.split("-", 1)[0]) / 1e9
+    except ValueError:
+        return 0.0
+
+
+def read_spool_size(directory: Path) -> int | None:
+    """Spool size last published by the consumer, or None if unknown."""
+    try:
+        return int((directory / SIZE_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _decode_lines(lines: list[bytes]) -> list[dict | None]:
+    """Decode event lines, None for a line that is not a JSON object.
+
+    The chunk is parsed as one JSON array, which avoids a json.loads() call
+    per line; any malformed line sends the chunk back to per-line decoding.
+    """
+    try:
+        values = json.loads(
+            b"[" + b",".join(line.strip() or b"null" for line in lines) + b"]"
+        )
+    except ValueError:
+        values = None
+    if (
+        values is not None
+        and len(values) == len(lines)
+        and all(isinstance(v, dict) or v is None for v in values)
+    ):
+        return values
+    decoded: list[dict | None] = []
+    for line in lines:
+        try:
+            value = json.loads(line) if line.strip() else None
+        except ValueError:
+            value = None
+        decoded.append(value if isinstance(value, dict) else None)
+    return decoded
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".tmp_{uuid4().hex}")
+    try:
+        tmp_path.write_text(text)
+        tmp_path.rename(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class SegmentWriter:
+    """Appends events to this process's current segment.
+
+    Not thread-safe on its own; callers serialize append() (one line must be
+    written by a single os.write() sequence).
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._fd: int | None = None
+        self._pid = 0
+        self._created = 0.0
+        self._size = 0
+
+    def append(self, line: bytes) -> None:
+        """Append one newline-terminated event line.
+
+        Raises:
+            OSError: If the segment cannot be opened or written
+        """
+        fd = self._segment()
+        view = memoryview(line)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        self._size += len(line)
+
+    def close(self) -> None:
+        """Close the current segment (the next append opens a new one)."""
+        if self._fd is not None and self._pid == os.getpid():
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+        self._fd = None
+
+    def _segment(self) -> int:
+        if self._fd is not None and not self._needs_rotation():
+            return self._fd
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        created_ns = time.time_ns()
+        name = f"{created_ns}-{os.getpid()}-{uuid4().hex[:8]}{SEGMENT_SUFFIX}"
+        self._fd = os.open(
+            self.directory / name, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._pid = os.getpid()
+        self._created = created_ns / 1e9
+        self._size = 0
+        return self._fd
+
+    def _needs_rotation(self) -> bool:
+        if self._pid != os.getpid():
+            # Forked child: never share the parent's segment
+            self._fd = None
+            return True
+        if self._size >= SEGMENT_MAX_BYTES:
+            return True
+        if time.time() - self._created >= SEGMENT_MAX_AGE:
+            return True
+        try:
+            # Evicted or deleted by the consumer
+            return os.fstat(self._fd).st_nlink == 0
+        except OSError:
+            return True
+
+
+class SpoolReader:
+    """Consumer side of the spool: cursor, segment lifecycle and size.
+
+    Attributes:
+        directory: Spool directory
+        offsets: Bytes consumed per segment name
+        sizes: Last known size per segment name
+        legacy_files: Pre-spool ``*.json`` event files seen by refresh()
+        truncated: True if the last events() pass stopped at its limits
+            with events left
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.offsets: dict[str, int] = self._load_cursor()
+        self.sizes: dict[str, int] = {}
+        self.legacy_files: list[Path] = []
+        self.truncated = False
+        self._cursor_dirty = False
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes held by known segments (as of the last refresh())."""
+        return sum(self.sizes.values())
+
+    def refresh(self) -> None:
+        """Rescan the directory for segments and their current sizes."""
+        sizes: dict[str, int] = {}
+        legacy: list[Path] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(SEGMENT_SUFFIX):
+                        with contextlib.suppress(OSError):
+                            sizes[entry.name] = entry.stat().st_size
+                    elif entry.name.endswith(".json") and not entry.name.startswith(
+                        "."
+                    ):
+                        legacy.append(Path(entry.path))
+        except OSError as e:
+            logger.warning("Failed to scan trace spool %s: %s", self.directory, e)
+            return
+        self.sizes = sizes
+        self.legacy_files = legacy
+        # Forget cursor entries for segments that no longer exist
+        for name in set(self.offsets) - set(sizes):
+            del self.offsets[name]
+            self._cursor_dirty = True
+
+    def events(
+        self, max_events: int | None = None, max_bytes: int | None = None
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Yield unconsumed events, oldest segment first.
+
+        Each item is (segment name, event), with event None for a line that
+        is not valid JSON. The cursor advances past every yielded line. The
+        pass stops before exceeding max_events events or once max_bytes bytes
+        have been consumed, setting ``truncated``.
+
+        Args:
+            max_events: Stop after this many events (None: no limit)
+            max_bytes: Stop once this many bytes are consumed (None: no limit)
+
+        Yields:
+            Tuples of (segment name, event dict or None)
+        """
+        self.truncated = False
+        count = 0
+        consumed = 0
+        for name in sorted(self.sizes, key=segment_created):
+            offset = self.offsets.get(name, 0)
+            if offset >= self.sizes[name]:
+                continue
+            try:
+                with open(self.directory / name, "rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+            except OSError as e:
+                logger.warning("Unreadable trace segment %s: %s", name, e)
+                continue
+            self.sizes[name] = offset + len(data)
+
+            end = data.rfind(b"\n") + 1
+            if end == 0 and not self._sealed(name):
+                continue  # First line still being written
+            if end < len(data) and self._sealed(name):
+                end = len(data)  # Writer died mid-line: consume the fragment
+
+            position = offset
+            lines = data[:end].splitlines(keepends=True)
+            for start in range(0, len(lines), DECODE_CHUNK):
+                chunk = lines[start : start + DECODE_CHUNK]
+                for line, event in zip(chunk, _decode_lines(chunk), strict=True):
+                    if (max_events is not None and count >= max_events) or (
+                        max_bytes is not None and consumed >= max_bytes
+                    ):
+                        self.truncated = True
+                        return
+                    position += len(line)
+                    consumed += len(line)
+                    self.offsets[name] = position
+                    self._cursor_dirty = True
+                    if not line.strip():
+                        continue
+                    count += 1
+                    yield name, event
+
+    def backlog_age(self) -> float:
+        """Seconds since the oldest segment with unconsumed bytes was created.
+
+        An upper bound on the age of the oldest pending event (as of the last
+        refresh() or events() pass); 0.0 when nothing is pending.
+        """
+        pending = [
+            segment_created(name)
+            for name, size in self.sizes.items()
+            if self.offsets.get(name, 0) < size
+        ]
+        if not pending:
+            return 0.0
+        return max(0.0, time.time() - min(pending))
+
+    def commit(self) -> None:
+        """Persist the cursor, drop consumed sealed segments, publish size."""
+        for name in list(self.sizes):
+            if self.offsets.get(name, 0) >= self.sizes[name] and self._sealed(name):
+                self._remove(name)
+        if self._cursor_dirty:
+            try:
+                _write_atomic(
+                    self.directory / CURSOR_FILE,
+                    json.dumps(self.offsets, separators=(",", ":")),
+                )
+                self._cursor_dirty = False
+            except OSError as e:
+                logger.warning("Failed to save trace spool cursor: %s", e)
+        self.publish_size()
+
+    def publish_size(self, extra_bytes: int = 0) -> None:
+        """Write the current spool size for producers' overflow guard."""
+        with contextlib.suppress(OSError):
+            _write_atomic(
+                self.directory / SIZE_FILE, str(self.total_bytes + extra_bytes)
+            )
+
+    def evict(self, max_bytes: int) -> int:
+        """Delete whole segments, oldest first, until the spool fits max_bytes.
+
+        Returns:
+            Number of unconsumed events dropped
+        """
+        total = self.total_bytes
+        evicted = 0
+        for name in sorted(self.sizes, key=segment_created):
+            if total <= max_bytes:
+                break
+            size = self.sizes[name]
+            evicted += self._count_unconsumed(name)
+            if self._remove(name):
+                total -= size
+        return evicted
+
+    def _count_unconsumed(self, name: str) -> int:
+        try:
+            with open(self.directory / name, "rb") as f:
+                f.seek(self.offsets.get(name, 0))
+                return f.read().count(b"\n")
+        except OSError:
+            return 0
+
+    def _remove(self, name: str) -> bool:
+        try:
+            (self.directory / name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to delete trace segment %s: %s", name, e)
+            return False
+        self.sizes.pop(name, None)
+        if self.offsets.pop(name, None) is not None:
+            self._cursor_dirty = True
+        return True
+
+    @staticmethod
+    def _sealed(name: str) -> bool:
+        age = time.time() - segment_created(name)
+        return age >= SEGMENT_MAX_AGE + SEGMENT_SEAL_GRACE
+
+    def _load_cursor(self) -> dict[str, int]:
+        try:
+            offsets = json.loads((self.directory / CURSOR_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(offsets, dict):
+            return {}
+        return {
+            str(name): int(offset)
+            for name, offset in offsets.items()
+            if isinstance(offset, int)
+        }
+
+
+class SpoolWatcher:
+    """Wakes the consumer when a producer creates or appends to a segment.
+
+    Uses Linux inotify through libc, so no extra dependency is needed. On
+    other platforms, or where the watch cannot be set up, ``available`` is
+    False and the caller falls back to its poll interval. Changes made by
+    another kernel (e.g. a Docker Desktop bind mount written from macOS) may
+    not raise events; callers keep a maximum wait for that case.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._fd: int | None = None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            mask = _IN_MODIFY | _IN_CREATE | _IN_MOVED_TO
+            if libc.inotify_add_watch(fd, os.fsencode(self.directory), mask) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, "inotify_add_watch failed")
+        except (OSError, AttributeError, TypeError) as e:
+            logger.info("Trace spool watch unavailable, polling instead: %s", e)
+            return
+        self._fd = fd
+
+    @property
+    def available(self) -> bool:
+        """True if wait() can return early on producer activity."""
+        return self._fd is not None
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a segment changes or timeout seconds pass.
+
+        Changes to the consumer's own files (cursor, size, heartbeat) do not
+        count.
+
+        Returns:
+            True if a segment changed, False on timeout or if unavailable
+        """
+        if self._fd is None:
+            return False
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            except (OSError, ValueError):
+                return False
+            if not ready:
+                return False
+            if self._segment_changed():
+                return True
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+
+    def _segment_changed(self) -> bool:
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            except OSError:
+                return True
+            if not data:
+                return changed
+            pos = 0
+            while pos + _INOTIFY_EVENT.size <= len(data):
+                _wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, pos)
+                pos += _INOTIFY_EVENT.size
+                name = data[pos : pos + length].rstrip(b"\0")
+                pos += length
+                if mask & _IN_Q_OVERFLOW or name.endswith(SEGMENT_SUFFIX.encode()):
+                    changed = True
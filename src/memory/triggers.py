@@ -5,7 +5,8 @@ Automatic triggers that retrieve relevant memories when specific signals are det
 Architecture:
 - Error detection: Recognizes error patterns in conversation
 - New file: Detects file creation in PreToolUse hooks
-- First edit: Tracks first edit per file per session
+- First edit: Tracks first edit per file per session, served from the
+  prefetch store (memory.prefetch) when a Read of the file scheduled one
 - Decision keywords: Detects user questions about past decisions
 
 Configuration:
@@ -466,16 +467,27 @@ def _cleanup_old_sessions() -> None:
         )
 
 
-def detect_read_context(file_path: str, tool_name: str) -> dict:
+def detect_read_context(
+    file_path: str,
+    tool_name: str,
+    session_id: str | None = None,
+    cwd: str | None = None,
+) -> dict:
     """Detect context for Read operations and determine if trigger should fire.
 
     Analyzes file path to extract file type, component name, and directory context.
     Used by PostToolUse hook for Read tool to retrieve relevant best practices
     before review agents (TEA, code-review) edit files.
 
+    When the trigger fires and a session_id is given, also schedules a
+    background prefetch of the file's first_edit results (no-op unless
+    FILE_PREFETCH_ENABLED), so a later first edit skips the live search.
+
     Args:
         file_path: Path to file being read
         tool_name: Name of tool being used (should be "Read")
+        session_id: Current session identifier (enables prefetch)
+        cwd: Project directory for the prefetch worker
 
     Returns:
         Dict with:
@@ -632,6 +644,18 @@ def detect_read_context(file_path: str, tool_name: str) -> dict:
         },
     )
 
+    if session_id:
+        from .prefetch import schedule_prefetch
+
+        try:
+            schedule_prefetch(session_id, file_path, cwd=cwd)
+        except Exception as e:
+            # Prefetch is an optimization; never fail the Read trigger
+            logger.debug(
+                "prefetch_schedule_error",
+                extra={"file_path": file_path, "error": str(e)},
+            )
+
     return result
 
 
@@ -735,6 +759,80 @@ def is_first_edit_in_session(file_path: str, session_id: str) -> bool:
         return is_first
 
 
+def build_file_query(file_path: str) -> str:
+    """Build the first_edit code-patterns query for a source file.
+
+    Shared by the first_edit trigger and the prefetch worker so that a
+    prefetched entry answers exactly the query the trigger would have run.
+
+    Args:
+        file_path: Path to the source file.
+
+    Returns:
+        Query string, e.g. "Implementation patterns for storage.py in memory".
+    """
+    path = Path(file_path)
+    parent = path.parent.name
+    if parent:
+        return f"Implementation patterns for {path.name} in {parent}"
+    return f"Implementation patterns for {path.name}"
+
+
+def search_first_edit(search, file_path: str, cwd: str | None = None) -> list[dict]:
+    """Run the first_edit trigger search for a file.
+
+    Args:
+        search: MemorySearch instance.
+        file_path: File about to be edited.
+        cwd: Project directory (group_id detection).
+
+    Returns:
+        Search results as returned by MemorySearch.search().
+    """
+    trigger = TRIGGER_CONFIG["first_edit"]
+    return search.search(
+        query=build_file_query(file_path),
+        collection=trigger["collection"],
+        cwd=cwd,
+        limit=trigger["max_results"],
+        memory_type=trigger["type_filter"],
+        fast_mode=True,
+    )
+
+
+def retrieve_first_edit_context(
+    file_path: str,
+    session_id: str,
+    cwd: str | None = None,
+    search=None,
+) -> list[dict]:
+    """Return first_edit results, from the prefetch store when possible.
+
+    A Read of the file (see detect_read_context) usually prefetched these
+    results already; only a miss pays for a live search.
+
+    Args:
+        file_path: File about to be edited.
+        session_id: Current session identifier.
+        cwd: Project directory (group_id detection).
+        search: Optional MemorySearch instance (created lazily on a miss).
+
+    Returns:
+        Search results as returned by MemorySearch.search().
+    """
+    from .prefetch import get_prefetched
+
+    results = get_prefetched(session_id, file_path)
+    if results is not None:
+        return results
+
+    if search is None:
+        from .search import MemorySearch
+
+        search = MemorySearch()
+    return search_first_edit(search, file_path, cwd=cwd)
+
+
 def validate_keyword_patterns() -> list[str]:
     """Detect keyword pattern collisions per BP-040.
 
@@ -0,0 +1,501 @@
+"""Local memory-mapped vector snapshot for small, read-mostly collections.
+
+Provides an optional local read replica of the shared conventions collection
+so best-practice lookups and the conventions leg of Tier 2 routing can skip the
+Qdrant round-trip (and keep working while Qdrant is briefly unavailable).
+
+Layout under ``<install_dir>/cache/snapshots/``:
+- ``<collection>.<generation>.f32``: float32 matrix (count x dim), L2-normalized
+  rows, opened read-only via ``numpy.memmap``
+- ``<collection>.meta.json``: sidecar with point IDs, compact payloads,
+  collection ``last_updated`` marker and the active vectors file name
+
+Writers publish a new generation by writing the vectors file first and then
+atomically replacing the sidecar, so concurrent hook processes never observe a
+sidecar that points at a half-written matrix.
+
+Refresh policy: the sidecar records when freshness was last checked. Within
+``refresh_interval`` seconds no network call is made at all. After that,
+``stats.get_last_updated()`` is compared against the recorded marker and the
+snapshot is re-exported only when the collection changed. If Qdrant is down the
+stale snapshot keeps serving.
+
+Scoring is brute-force cosine similarity in NumPy (conventions holds
+~100-1000 points, so a full matrix-vector product is well under a millisecond).
+When decay is enabled, the same fused formula Qdrant applies server-side is
+applied locally via ``decay.compute_decay_score``.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from .config import COLLECTION_CONVENTIONS, MemoryConfig, get_config
+from .decay import compute_decay_score, resolve_half_life
+from .stats import get_last_updated
+
+__all__ = [
+    "SNAPSHOT_PAYLOAD_FIELDS",
+    "VectorSnapshot",
+    "get_vector_snapshot",
+    "mark_snapshot_stale",
+]
+
+logger = logging.getLogger("ai_memory.retrieve")
+
+# Payload fields kept in the sidecar. Everything else (relationships,
+# embedding_model, chunking_metadata, ...) is irrelevant for injection.
+SNAPSHOT_PAYLOAD_FIELDS = (
+    "content",
+    "content_hash",
+    "group_id",
+    "type",
+    "timestamp",
+    "stored_at",
+    "created_at",
+    "source_hook",
+    "domain",
+    "importance",
+    "tags",
+    "source",
+    "freshness_status",
+)
+
+# Scroll page size for export (payload + vector per point)
+_EXPORT_PAGE_SIZE = 256
+
+_snapshot_cache: dict[str, "VectorSnapshot"] = {}
+
+
+def _extract_dense_vector(vector) -> list[float] | None:
+    """Return the default dense vector from a scrolled point.
+
+    Collections migrated for hybrid search (PLAN-013) store named vectors
+    ({"": dense, "bm25": sparse}); legacy collections store a plain list.
+    """
+    if vector is None:
+        return None
+    if isinstance(vector, dict):
+        dense = vector.get("")
+        return dense if isinstance(dense, list) else None
+    return vector if isinstance(vector, list) else None
+
+
+class VectorSnapshot:
+    """Memory-mapped local replica of a single Qdrant collection.
+
+    Attributes:
+        collection: Source collection name
+        snapshot_dir: Directory holding the vectors file and sidecar
+        refresh_interval: Seconds between freshness checks against Qdrant
+
+    Example:
+        >>> snapshot = VectorSnapshot("conventions", Path("/tmp/snap"), client)
+        >>> if snapshot.ensure_fresh():
+        ...     hits = snapshot.search(query_vector, limit=3)
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        snapshot_dir: Path,
+        client=None,
+        refresh_interval: int = 300,
+    ) -> None:
+        """Initialize snapshot handle (does not touch disk or network).
+
+        Args:
+            collection: Source collection name.
+            snapshot_dir: Directory for snapshot files (created on export).
+            client: Optional QdrantClient used for export/freshness checks.
+                Without a client the snapshot is read-only.
+            refresh_interval: Seconds between freshness checks.
+        """
+        self.collection = collection
+        self.snapshot_dir = Path(snapshot_dir)
+        self.client = client
+        self.refresh_interval = refresh_interval
+
+        self._meta: dict | None = None
+        self._meta_mtime: float | None = None
+        self._vectors: np.ndarray | None = None
+
+    @property
+    def meta_path(self) -> Path:
+        """Path to the JSON sidecar."""
+        return self.snapshot_dir / f"{self.collection}.meta.json"
+
+    def __len__(self) -> int:
+        """Number of points in the loaded snapshot (0 if not loaded)."""
+        return int(self._meta["count"]) if self._meta else 0
+
+    def _load(self) -> bool:
+        """(Re)load sidecar and memory-map vectors if the sidecar changed.
+
+        Returns:
+            True if a usable snapshot is loaded.
+        """
+        try:
+            mtime = self.meta_path.stat().st_mtime
+        except OSError:
+            self._meta = None
+            self._vectors = None
+            return False
+
+        if self._meta is not None and mtime == self._meta_mtime:
+            return True
+
+        try:
+            meta = json.loads(self.meta_path.read_text())
+            count = int(meta["count"])
+            dim = int(meta["dim"])
+            if count > 0:
+                vectors = np.memmap(
+                    self.snapshot_dir / meta["vectors_file"],
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(count, dim),
+                )
+            else:
+                vectors = np.zeros((0, dim), dtype=np.float32)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "vector_snapshot_load_failed",
+                extra={"collection": self.collection, "error": str(e)},
+            )
+            self._meta = None
+            self._vectors = None
+            return False
+
+        self._meta = meta
+        self._meta_mtime = mtime
+        self._vectors = vectors
+        return True
+
+    def _write_meta(self, meta: dict) -> None:
+        """Atomically replace the sidecar."""
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.meta_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, self.meta_path)
+
+    def export(self) -> int:
+        """Export all collection vectors and compact payloads to disk.
+
+        Points with zero vectors (embedding_status=pending, DEC-010) are
+        skipped since they can never score above a similarity threshold.
+
+        Returns:
+            Number of points written.
+
+        Raises:
+            RuntimeError: If no Qdrant client is configured.
+            Exception: Propagates Qdrant errors (caller decides on fallback).
+        """
+        if self.client is None:
+            raise RuntimeError("VectorSnapshot.export() requires a Qdrant client")
+
+        # Read the marker BEFORE scrolling so a write racing the export is
+        # picked up by the next freshness check rather than silently lost.
+        last_updated = get_last_updated(self.client, self.collection)
+
+        ids: list[str] = []
+        payloads: list[dict] = []
+        rows: list[list[float]] = []
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection,
+                limit=_EXPORT_PAGE_SIZE,
+                offset=offset,
+                with_payload=list(SNAPSHOT_PAYLOAD_FIELDS),
+                with_vectors=True,
+            )
+            for point in points:
+                dense = _extract_dense_vector(point.vector)
+                if not dense:
+                    continue
+                ids.append(str(point.id))
+                payloads.append(point.payload or {})
+                rows.append(dense)
+            if offset is None:
+                break
+
+        matrix = np.asarray(rows, dtype=np.float32)
+        dim = matrix.shape[1] if matrix.ndim == 2 and len(rows) else 0
+        if len(rows):
+            norms = np.linalg.norm(matrix, axis=1)
+            keep = norms > 0
+            matrix = matrix[keep] / norms[keep][:, None]
+            ids = [i for i, k in zip(ids, keep, strict=True) if k]
+            payloads = [p for p, k in zip(payloads, keep, strict=True) if k]
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        generation = uuid.uuid4().hex[:12]
+        vectors_file = f"{self.collection}.{generation}.f32"
+        if len(ids):
+            tmp_vectors = self.snapshot_dir / f"{vectors_file}.tmp"
+            matrix.astype(np.float32).tofile(tmp_vectors)
+            os.replace(tmp_vectors, self.snapshot_dir / vectors_file)
+
+        previous_file = None
+        with contextlib.suppress(OSError, ValueError, KeyError):
+            previous_file = json.loads(self.meta_path.read_text())["vectors_file"]
+
+        self._write_meta(
+            {
+                "collection": self.collection,
+                "generation": generation,
+                "vectors_file": vectors_file,
+                "count": len(ids),
+                "dim": dim,
+                "last_updated": last_updated,
+                "checked_at": time.time(),
+                "exported_at": time.time(),
+                "ids": ids,
+                "payloads": payloads,
+            }
+        )
+
+        # Old generation is no longer referenced. Readers that already mapped
+        # it keep a valid mapping on POSIX after unlink.
+        if previous_file and previous_file != vectors_file:
+            with contextlib.suppress(OSError):
+                (self.snapshot_dir / previous_file).unlink()
+
+        logger.info(
+            "vector_snapshot_exported",
+            extra={
+                "collection": self.collection,
+                "count": len(ids),
+                "dim": dim,
+                "generation": generation,
+            },
+        )
+        return len(ids)
+
+    def ensure_fresh(self) -> bool:
+        """Make sure a usable snapshot is loaded, refreshing if due.
+
+        Returns:
+            True if a snapshot (possibly stale) is available for search.
+        """
+        loaded = self._load()
+        if loaded and time.time() - self._meta.get("checked_at", 0) < (
+            self.refresh_interval
+        ):
+            return True
+
+        if self.client is None:
+            return loaded
+
+        try:
+            if loaded:
+                current = get_last_updated(self.client, self.collection)
+                if current is not None and current == self._meta.get("last_updated"):
+                    # Unchanged — only bump the check timestamp
+                    meta = dict(self._meta)
+                    meta["checked_at"] = time.time()
+                    self._write_meta(meta)
+                    return self._load()
+            self.export()
+        except Exception as e:
+            logger.warning(
+                "vector_snapshot_refresh_failed",
+                extra={
+                    "collection": self.collection,
+                    "error": str(e),
+                    "serving_stale": loaded,
+                },
+            )
+            if loaded:
+                # Back off: don't retry the failed refresh on every lookup
+                with contextlib.suppress(OSError):
+                    meta = dict(self._meta)
+                    meta["checked_at"] = time.time()
+                    self._write_meta(meta)
+            return self._load()
+
+        return self._load()
+
+    def mark_stale(self) -> None:
+        """Force a freshness check on the next ensure_fresh() call."""
+        if not self._load():
+            return
+        meta = dict(self._meta)
+        meta["checked_at"] = 0
+        with contextlib.suppress(OSError):
+            self._write_meta(meta)
+
+    def search(
+        self,
+        query_vector: list[float],
+        limit: int,
+        score_threshold: float | None = None,
+        memory_types: list[str] | None = None,
+        must_not_types: list[str] | None = None,
+        config: MemoryConfig | None = None,
+    ) -> list[tuple[str, float, dict]]:
+        """Top-k cosine search over the loaded snapshot.
+
+        Args:
+            query_vector: Dense query embedding.
+            limit: Maximum results.
+            score_threshold: Minimum cosine similarity (applied before decay,
+                matching the prefetch threshold used server-side).
+            memory_types: Optional allow-list on payload ``type``.
+            must_not_types: Optional deny-list on payload ``type``.
+            config: When given and ``decay_enabled``, results are re-ranked
+                with the fused semantic/temporal score.
+
+        Returns:
+            List of (point_id, score, payload) sorted by score descending.
+        """
+        if not self._load() or len(self) == 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or query.shape[0] != self._vectors.shape[1]:
+            return []
+        scores = self._vectors @ (query / norm)
+
+        payloads = self._meta["payloads"]
+        mask = np.ones(scores.shape[0], dtype=bool)
+        if score_threshold is not None:
+            mask &= scores >= score_threshold
+        if memory_types or must_not_types:
+            allowed = set(memory_types or [])
+            denied = set(must_not_types or [])
+            type_mask = np.fromiter(
+                (
+                    (not allowed or p.get("type") in allowed)
+                    and p.get("type") not in denied
+                    for p in payloads
+                ),
+                dtype=bool,
+                count=len(payloads),
+            )
+            mask &= type_mask
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        use_decay = config is not None and config.decay_enabled
+        # Decay re-ranks within a wider semantic prefetch (max(50, limit*5)),
+        # mirroring build_decay_formula's prefetch_limit.
+        k = min(candidates.size, max(50, limit * 5) if use_decay else limit)
+        cand_scores = scores[candidates]
+        if k < candidates.size:
+            top = np.argpartition(-cand_scores, k - 1)[:k]
+            candidates, cand_scores = candidates[top], cand_scores[top]
+
+        ids = self._meta["ids"]
+        hits = []
+        for idx, semantic in zip(
+            candidates.tolist(), cand_scores.tolist(), strict=True
+        ):
+            payload = payloads[idx]
+            score = float(semantic)
+            if use_decay:
+                score = self._apply_decay(score, payload, config)
+            hits.append((ids[idx], score, payload))
+
+        hits.sort(key=lambda h: h[1], reverse=True)
+        return hits[:limit]
+
+    def get_vectors(self, point_ids: list[str]) -> dict[str, list[float]]:
+        """Return cached (L2-normalized) vectors for the given point IDs.
+
+        Args:
+            point_ids: Point IDs, typically taken from search() hits.
+
+        Returns:
+            Dict of point_id -> vector for the IDs present in the snapshot.
+        """
+        if not self._load():
+            return {}
+        wanted = set(point_ids)
+        return {
+            point_id: self._vectors[idx].tolist()
+            for idx, point_id in enumerate(self._meta["ids"])
+            if point_id in wanted
+        }
+
+    def _apply_decay(
+        self, semantic: float, payload: dict, config: MemoryConfig
+    ) -> float:
+        """Fuse semantic score with temporal decay (SPEC-001)."""
+        stored_at = payload.get("stored_at") or payload.get("timestamp")
+        if not stored_at:
+            return semantic
+        try:
+            # Python 3.10 compat: fromisoformat() doesn't support "Z" suffix
+            stored_dt = datetime.fromisoformat(str(stored_at).replace("Z", "+00:00"))
+        except ValueError:
+            return semantic
+        if stored_dt.tzinfo is None:
+            return semantic
+        half_life = resolve_half_life(payload.get("type", ""), self.collection, config)
+        return compute_decay_score(
+            stored_at=stored_dt,
+            half_life_days=half_life,
+            semantic_weight=config.decay_semantic_weight,
+            semantic_score=semantic,
+        )
+
+
+def get_vector_snapshot(
+    collection: str = COLLECTION_CONVENTIONS,
+    config: MemoryConfig | None = None,
+    client=None,
+) -> VectorSnapshot:
+    """Get the process-wide snapshot handle for a collection.
+
+    Args:
+        collection: Collection to replicate (default: conventions).
+        config: Optional MemoryConfig. Uses get_config() if not provided.
+        client: Optional QdrantClient. Uses get_qdrant_client() if not provided.
+
+    Returns:
+        Cached VectorSnapshot instance.
+    """
+    config = config or get_config()
+    snapshot_dir = Path(config.install_dir) / "cache" / "snapshots"
+    cache_key = f"{snapshot_dir}:{collection}"
+    if cache_key not in _snapshot_cache:
+        if client is None:
+            from .qdrant_client import get_qdrant_client
+
+            client = get_qdrant_client(config)
+        _snapshot_cache[cache_key] = VectorSnapshot(
+            collection=collection,
+            snapshot_dir=snapshot_dir,
+            client=client,
+            refresh_interval=config.conventions_snapshot_refresh_seconds,
+        )
+    return _snapshot_cache[cache_key]
+
+
+def mark_snapshot_stale(
+    collection: str = COLLECTION_CONVENTIONS,
+    config: MemoryConfig | None = None,
+) -> None:
+    """Invalidate a collection snapshot after a local write (best-effort).
+
+    Args:
+        collection: Collection whose snapshot should be re-checked.
+        config: Optional MemoryConfig. Uses get_config() if not provided.
+    """
+    config = config or get_config()
+    snapshot_dir = Path(config.install_dir) / "cache" / "snapshots"
+    with contextlib.suppress(Exception):
+        VectorSnapshot(collection, snapshot_dir).mark_stale()
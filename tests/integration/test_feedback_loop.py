@@ -105,22 +105,25 @@ class TestTriggerFreshnessForMergedPR:
         qdrant.scroll.assert_not_called()
 
     def test_multiple_files_flagged(self, mock_sync_engine):
-        """Multiple files each flag their matching code-patterns."""
+        """Multiple files are matched by one scroll and flagged in one write."""
         engine, qdrant = mock_sync_engine
 
         point1 = _make_mock_point("point-1")
         point2 = _make_mock_point("point-2")
-
-        # First file has one point, second has one point
-        qdrant.scroll.side_effect = [
-            ([point1], None),
-            ([point2], None),
-        ]
+        qdrant.scroll.return_value = ([point1, point2], None)
 
         flagged = engine._trigger_freshness_for_merged_pr(["src/a.py", "src/b.py"])
 
         assert flagged == 2
-        assert qdrant.set_payload.call_count == 2
+        qdrant.scroll.assert_called_once()
+        file_filter = next(
+            f
+            for f in qdrant.scroll.call_args.kwargs["scroll_filter"].must
+            if f.key == "file_path"
+        )
+        assert file_filter.match.any == ["src/a.py", "src/b.py"]
+        qdrant.set_payload.assert_called_once()
+        assert qdrant.set_payload.call_args.kwargs["points"] == ["point-1", "point-2"]
 
     def test_fail_open_on_set_payload_error(self, mock_sync_engine):
         """Flagging failure doesn't abort - returns 0, no exception."""
@@ -152,6 +155,7 @@ class TestTriggerFreshnessForMergedPR:
 
         assert flagged == 2
         assert qdrant.scroll.call_count == 2
+        qdrant.set_payload.assert_called_once()
 
     def test_group_id_filter_applied(self, mock_sync_engine):
         """Scroll filter includes group_id for tenant isolation."""
@@ -0,0 +1,132 @@
+"""Shared ASGI plumbing for the in-process fake GitHub and Jira APIs.
+
+The fakes are plain ASGI callables (no web framework dependency) mounted on
+the connectors' httpx clients through ``httpx.ASGITransport``. The real
+client code -- pagination, conditional requests, rate-limit tracking,
+retries -- runs unchanged against synthetic data, with no network and no
+ports to allocate.
+"""
+
+import asyncio
+import json
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import parse_qsl
+
+import httpx
+
+__all__ = ["FakeAPI", "FakeRequest", "FakeResponse", "future_timestamp"]
+
+
+@dataclass
+class FakeRequest:
+    """Parsed ASGI request handed to FakeAPI.handle()."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    url_root: str  # scheme://host, for absolute Link URLs
+
+
+@dataclass
+class FakeResponse:
+    """JSON response; ``body=None`` sends an empty body (e.g. 304)."""
+
+    status: int = 200
+    body: Any = None
+    headers: dict[str, str] | None = None
+
+
+def future_timestamp() -> datetime:
+    """Current UTC time rounded up to the next whole second.
+
+    Upstream APIs report second (GitHub) or millisecond (Jira) precision while
+    sync watermarks carry microseconds; rounding up keeps an item touched
+    right after a sync ordered after that sync's watermark.
+    """
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=0) + timedelta(seconds=1)
+
+
+class FakeAPI:
+    """Base ASGI app: request parsing, latency, call counting, mounting.
+
+    Subclasses implement ``handle()`` and count requests per route in
+    ``calls`` so benchmarks can report API calls per synced item.
+
+    Attributes:
+        latency_ms: Simulated per-request server latency
+        calls: Requests served, keyed by route name
+        not_modified: Conditional requests answered with 304
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.calls: Counter[str] = Counter()
+        self.not_modified = 0
+
+    @property
+    def total_calls(self) -> int:
+        """Total requests served since the last reset_counters()."""
+        return sum(self.calls.values())
+
+    def reset_counters(self) -> None:
+        """Zero the request counters (e.g. between full and incremental runs)."""
+        self.calls.clear()
+        self.not_modified = 0
+
+    def handle(self, request: FakeRequest) -> FakeResponse:
+        """Serve one request; implemented by subclasses."""
+        raise NotImplementedError
+
+    def mount(self, client: httpx.AsyncClient) -> httpx.AsyncClient:
+        """Return a copy of ``client`` whose requests are served by this app.
+
+        Base URL, default headers and timeouts are preserved, so the copy can
+        replace a connector's client attribute in place.
+        """
+        return httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.headers,
+            timeout=client.timeout,
+            transport=httpx.ASGITransport(app=self),
+        )
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        host = headers.get("host") or scope["server"][0]
+        request = FakeRequest(
+            method=scope["method"],
+            path=scope["path"],
+            query=dict(parse_qsl(scope["query_string"].decode("latin-1"))),
+            headers=headers,
+            url_root=f"{scope['scheme']}://{host}",
+        )
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        response = self.handle(request)
+        payload = b"" if response.body is None else json.dumps(response.body).encode()
+        raw_headers = [(b"content-length", str(len(payload)).encode())]
+        if response.body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+        raw_headers.extend(
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in (response.headers or {}).items()
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": raw_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
@@ -0,0 +1,482 @@
+"""In-process fake of the GitHub REST API for sync tests and benchmarks.
+
+Serves one synthetic repository of configurable size: issues with comments,
+pull requests with files and reviews, commits with diff stats, workflow runs
+and a code tree with blobs. Behaviour the sync engine relies on is modelled
+closely enough to exercise the real GitHubClient:
+
+- ``per_page``/``page`` pagination with absolute ``Link`` rel="next"/"last"
+- ETag on every 200; matching ``If-None-Match`` returns an empty 304 that
+  does not consume rate limit (BP-062)
+- ``X-RateLimit-*`` headers, and 403 "rate limit exceeded" once exhausted
+- ``since``/``state``/``sort``/``direction`` filters on issues, comments and
+  commits, ``created``/``status`` filters on workflow runs
+
+Usage::
+
+    api = FakeGitHubAPI("bench/repo", issues=200)
+    client._client = api.mount(client._client)
+    ...
+    api.simulate_activity(issues=5, commits=3)
+"""
+
+import base64
+import hashlib
+import json
+import math
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import urlencode
+
+from .fake_api import FakeAPI, FakeRequest, FakeResponse, future_timestamp
+
+__all__ = ["FakeGitHubAPI"]
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# (route name, path pattern); the repo segment is checked by handle()
+_ROUTES = [
+    (name, re.compile(r"^/repos/(?P<repo>[^/]+/[^/]+)" + pattern + "$"))
+    for name, pattern in (
+        ("issues", r"/issues"),
+        ("issue_comments", r"/issues/(?P<number>\d+)/comments"),
+        ("pulls", r"/pulls"),
+        ("pull_reviews", r"/pulls/(?P<number>\d+)/reviews"),
+        ("pull_files", r"/pulls/(?P<number>\d+)/files"),
+        ("commits", r"/commits"),
+        ("commit", r"/commits/(?P<sha>[0-9a-f]+)"),
+        ("workflow_runs", r"/actions/runs"),
+        ("tree", r"/git/trees/(?P<ref>[^/]+)"),
+        ("blob", r"/git/blobs/(?P<sha>[0-9a-f]+)"),
+    )
+]
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _sha(*parts: Any) -> str:
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+
+
+def _blob_sha(content: str) -> str:
+    data = content.encode()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _user(login: str) -> dict[str, Any]:
+    return {"login": login, "type": "User"}
+
+
+class FakeGitHubAPI(FakeAPI):
+    """Synthetic GitHub repository served over ASGI.
+
+    Args:
+        repo: Repository in "owner/repo" format
+        issues: Number of issues
+        comments_per_issue: Comments on each issue
+        pull_requests: Number of pull requests
+        files_per_pr: Changed files on each pull request
+        reviews_per_pr: Reviews on each pull request
+        commits: Number of commits on the default branch
+        workflow_runs: Number of completed workflow runs
+        code_files: Number of Python files in the code tree
+        page_size: Server-side cap on ``per_page`` (GitHub's is 100)
+        rate_limit: Primary rate limit per hour
+        latency_ms: Simulated per-request latency
+    """
+
+    def __init__(
+        self,
+        repo: str = "bench/repo",
+        *,
+        issues: int = 20,
+        comments_per_issue: int = 3,
+        pull_requests: int = 10,
+        files_per_pr: int = 3,
+        reviews_per_pr: int = 2,
+        commits: int = 20,
+        workflow_runs: int = 5,
+        code_files: int = 20,
+        page_size: int = 100,
+        rate_limit: int = 5000,
+        latency_ms: float = 0.0,
+    ) -> None:
+        super().__init__(latency_ms)
+        self.repo = repo
+        self.page_size = page_size
+        self.rate_limit = rate_limit
+        self.rate_used = 0
+        self._rate_reset = int(time.time()) + 3600
+        self._next_id = 1000
+
+        self.issues: dict[int, dict[str, Any]] = {}
+        self.comments: dict[int, list[dict[str, Any]]] = {}
+        self.pulls: dict[int, dict[str, Any]] = {}
+        self.pull_files: dict[int, list[dict[str, Any]]] = {}
+        self.pull_reviews: dict[int, list[dict[str, Any]]] = {}
+        self.commits: list[dict[str, Any]] = []  # newest first
+        self.runs: list[dict[str, Any]] = []
+        self.code: dict[str, str] = {}
+
+        for number in range(1, issues + 1):
+            when = _EPOCH + timedelta(hours=number)
+            self._add_issue(number, when)
+            for _ in range(comments_per_issue):
+                self._add_comment(number, when + timedelta(minutes=5))
+        for offset in range(1, pull_requests + 1):
+            self._add_pull(issues + offset, files_per_pr, reviews_per_pr)
+        for index in range(commits):
+            self._add_commit(_EPOCH + timedelta(hours=index))
+        for _ in range(workflow_runs):
+            self._add_run(_EPOCH + timedelta(days=1))
+        for index in range(code_files):
+            self.code[f"src/bench/mod{index}.py"] = self._module_source(index, 0)
+
+    # -- Synthetic data ------------------------------------------------
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _url(self, *parts: Any) -> str:
+        return "/".join([f"https://github.com/{self.repo}", *map(str, parts)])
+
+    def _add_issue(self, number: int, when: datetime) -> None:
+        self.issues[number] = {
+            "id": self._new_id(),
+            "number": number,
+            "title": f"Issue {number}: sync stalls on large pages",
+            "body": f"Steps to reproduce issue {number}.\n\n" + "Details. " * 20,
+            "state": "open" if number % 3 else "closed",
+            "labels": [{"name": "bug"}] if number % 2 else [],
+            "assignees": [_user(f"dev{number % 4}")],
+            "milestone": None,
+            "user": _user(f"reporter{number % 5}"),
+            "html_url": self._url("issues", number),
+            "created_at": _iso(when),
+            "updated_at": _iso(when + timedelta(minutes=30)),
+        }
+        self.comments[number] = []
+
+    def _add_comment(self, number: int, when: datetime) -> None:
+        comment_id = self._new_id()
+        self.comments[number].append(
+            {
+                "id": comment_id,
+                "body": f"Comment {comment_id} on #{number}: " + "reply " * 15,
+                "user": _user(f"dev{comment_id % 4}"),
+                "html_url": self._url("issues", f"{number}#issuecomment-{comment_id}"),
+                "created_at": _iso(when),
+                "updated_at": _iso(when),
+            }
+        )
+
+    def _add_pull(self, number: int, files: int, reviews: int) -> None:
+        when = _EPOCH + timedelta(hours=number)
+        self.pulls[number] = {
+            "id": self._new_id(),
+            "number": number,
+            "title": f"PR {number}: batch writes",
+            "body": f"Implements change {number}. " * 10,
+            "state": "closed" if number % 2 else "open",
+            "merged_at": _iso(when + timedelta(hours=2)) if number % 2 else None,
+            "user": _user(f"dev{number % 4}"),
+            "labels": [{"name": "enhancement"}],
+            "base": {"ref": "main"},
+            "head": {"ref": f"feature/{number}"},
+            "html_url": self._url("pull", number),
+            "created_at": _iso(when),
+            "updated_at": _iso(when + timedelta(hours=2)),
+        }
+        self.pull_files[number] = [
+            {
+                "filename": f"src/bench/pr{number}_{index}.py",
+                "status": "modified",
+                "additions": 10 + index,
+                "deletions": index,
+                "patch": f"@@ -1,3 +1,4 @@\n+value_{number}_{index} = {index}\n",
+                "blob_url": self._url("blob", "main", f"pr{number}_{index}.py"),
+            }
+            for index in range(files)
+        ]
+        self.pull_reviews[number] = [
+            {
+                "id": self._new_id(),
+                "state": "APPROVED" if index == 0 else "COMMENTED",
+                "body": f"Review {index} of #{number}: looks reasonable.",
+                "user": _user(f"reviewer{index}"),
+                "submitted_at": _iso(when + timedelta(hours=1)),
+                "html_url": self._url("pull", f"{number}#review-{index}"),
+            }
+            for index in range(reviews)
+        ]
+
+    def _add_commit(self, when: datetime) -> None:
+        index = len(self.commits)
+        sha = _sha(self.repo, "commit", index)
+        files = [
+            {
+                "filename": f"src/bench/mod{index % 7}.py",
+                "status": "modified",
+                "additions": 3,
+                "deletions": 1,
+                "patch": f"@@ -1 +1,3 @@\n+change_{index} = True\n",
+            }
+        ]
+        self.commits.insert(
+            0,
+            {
+                "sha": sha,
+                "html_url": self._url("commit", sha),
+                "commit": {
+                    "message": f"Commit {index}: adjust sync batching",
+                    "author": {"name": f"Dev {index % 4}", "date": _iso(when)},
+                    "committer": {"name": f"Dev {index % 4}", "date": _iso(when)},
+                },
+                "author": _user(f"dev{index % 4}"),
+                "files": files,
+                "stats": {"additions": 3, "deletions": 1, "total": 4},
+            },
+        )
+
+    def _add_run(self, when: datetime) -> None:
+        run_id = self._new_id()
+        self.runs.insert(
+            0,
+            {
+                "id": run_id,
+                "name": "CI",
+                "head_sha": self.commits[0]["sha"] if self.commits else _sha(run_id),
+                "head_branch": "main",
+                "status": "completed",
+                "conclusion": "failure" if run_id % 4 == 0 else "success",
+                "html_url": self._url("actions", "runs", run_id),
+                "created_at": _iso(when),
+                "updated_at": _iso(when + timedelta(minutes=7)),
+            },
+        )
+
+    @staticmethod
+    def _module_source(index: int, revision: int) -> str:
+        functions = "\n\n".join(
+            f"def handler_{index}_{n}(payload):\n"
+            f'    """Handle payload variant {n} (revision {revision})."""\n'
+            f"    return payload.get('key_{n}', {revision})\n"
+            for n in range(4)
+        )
+        return f'"""Benchmark module {index}."""\n\n{functions}'
+
+    # -- Simulated activity --------------------------------------------
+
+    def simulate_activity(
+        self,
+        *,
+        issues: int = 0,
+        pull_requests: int = 0,
+        commits: int = 0,
+        workflow_runs: int = 0,
+        code_files: int = 0,
+    ) -> None:
+        """Mutate the repository the way a busy day would.
+
+        Args:
+            issues: Issues that get one new comment (bumps updated_at)
+            pull_requests: Pull requests edited and re-reviewed
+            commits: New commits on the default branch
+            workflow_runs: New completed workflow runs
+            code_files: Code files whose content changes (new blob SHA)
+        """
+        now = future_timestamp()
+        for number in list(self.issues)[:issues]:
+            self._add_comment(number, now)
+            self.issues[number]["updated_at"] = _iso(now)
+        for number in list(self.pulls)[:pull_requests]:
+            pull = self.pulls[number]
+            pull["body"] += f"\n\nUpdated at {_iso(now)}."
+            pull["updated_at"] = _iso(now)
+        for _ in range(commits):
+            self._add_commit(now)
+        for _ in range(workflow_runs):
+            self._add_run(now)
+        for index, path in enumerate(list(self.code)[:code_files]):
+            self.code[path] = self._module_source(index, int(now.timestamp()))
+
+    # -- Request handling ----------------------------------------------
+
+    def _route(self, path: str) -> tuple[str, re.Match] | None:
+        for route, pattern in _ROUTES:
+            match = pattern.match(path)
+            if match and match.group("repo") == self.repo:
+                return route, match
+        return None
+
+    def handle(self, request: FakeRequest) -> FakeResponse:
+        routed = self._route(request.path)
+        if routed is None:
+            self.calls["not_found"] += 1
+            return FakeResponse(404, {"message": "Not Found"})
+        route, match = routed
+
+        self.calls[route] += 1
+        if request.method != "GET":
+            return FakeResponse(404, {"message": "Not Found"})
+        if self.rate_used >= self.rate_limit:
+            return FakeResponse(
+                403,
+                {"message": "API rate limit exceeded"},
+                self._rate_headers(),
+            )
+
+        params = {k: v for k, v in match.groupdict().items() if k != "repo"}
+        body, headers = getattr(self, f"_get_{route}")(request, **params)
+        if body is None:
+            return FakeResponse(404, {"message": "Not Found"})
+
+        etag = (
+            '"'
+            + hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()
+            + '"'
+        )
+        if request.headers.get("if-none-match") == etag:
+            # 304s are free on GitHub; validators are returned again
+            self.not_modified += 1
+            return FakeResponse(304, None, {**self._rate_headers(), "ETag": etag})
+
+        self.rate_used += 1
+        return FakeResponse(
+            200, body, {**headers, **self._rate_headers(), "ETag": etag}
+        )
+
+    def _rate_headers(self) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.rate_limit - self.rate_used, 0)),
+            "X-RateLimit-Used": str(self.rate_used),
+            "X-RateLimit-Reset": str(self._rate_reset),
+            "X-RateLimit-Resource": "core",
+        }
+
+    def _page(
+        self, request: FakeRequest, items: list[Any]
+    ) -> tuple[list[Any], dict[str, str]]:
+        """Slice one page and build the Link header GitHub would send."""
+        per_page = max(1, min(int(request.query.get("per_page", 30)), self.page_size))
+        page = max(1, int(request.query.get("page", 1)))
+        last = max(1, math.ceil(len(items) / per_page))
+        links = []
+        for rel, target in (("next", page + 1), ("last", last)):
+            if page < last:
+                query = urlencode(
+                    {**request.query, "per_page": per_page, "page": target}
+                )
+                links.append(f'<{request.url_root}{request.path}?{query}>; rel="{rel}"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        start = (page - 1) * per_page
+        return items[start : start + per_page], headers
+
+    @staticmethod
+    def _since(items: list[dict], field: str, since: str | None) -> list[dict]:
+        if not since:
+            return items
+        cutoff = _parse_iso(since)
+        return [item for item in items if _parse_iso(item[field]) >= cutoff]
+
+    @staticmethod
+    def _sorted(request: FakeRequest, items: list[dict], default: str) -> list[dict]:
+        field = {"created": "created_at", "updated": "updated_at"}.get(
+            request.query.get("sort", default), "created_at"
+        )
+        reverse = request.query.get("direction", "desc") == "desc"
+        return sorted(items, key=lambda item: item[field], reverse=reverse)
+
+    @staticmethod
+    def _state(request: FakeRequest, items: list[dict]) -> list[dict]:
+        state = request.query.get("state", "open")
+        return [item for item in items if state == "all" or item["state"] == state]
+
+    def _get_issues(self, request: FakeRequest):
+        items = self._state(request, list(self.issues.values()))
+        items = self._since(items, "updated_at", request.query.get("since"))
+        return self._page(request, self._sorted(request, items, "created"))
+
+    def _get_issue_comments(self, request: FakeRequest, number: str):
+        if int(number) not in self.comments:
+            return None, {}
+        items = self._since(
+            self.comments[int(number)], "updated_at", request.query.get("since")
+        )
+        return self._page(request, items)
+
+    def _get_pulls(self, request: FakeRequest):
+        pulls = [
+            {**pull, "state": "closed" if pull["merged_at"] else pull["state"]}
+            for pull in self.pulls.values()
+        ]
+        items = self._state(request, pulls)
+        return self._page(request, self._sorted(request, items, "created"))
+
+    def _get_pull_reviews(self, request: FakeRequest, number: str):
+        reviews = self.pull_reviews.get(int(number))
+        return (None, {}) if reviews is None else self._page(request, reviews)
+
+    def _get_pull_files(self, request: FakeRequest, number: str):
+        files = self.pull_files.get(int(number))
+        return (None, {}) if files is None else self._page(request, files)
+
+    def _get_commits(self, request: FakeRequest):
+        since = request.query.get("since")
+        items = [
+            {k: v for k, v in commit.items() if k not in ("files", "stats")}
+            for commit in self.commits
+            if not since
+            or _parse_iso(commit["commit"]["committer"]["date"]) >= _parse_iso(since)
+        ]
+        return self._page(request, items)
+
+    def _get_commit(self, request: FakeRequest, sha: str):
+        commit = next((c for c in self.commits if c["sha"] == sha), None)
+        return commit, {}
+
+    def _get_workflow_runs(self, request: FakeRequest):
+        runs = self.runs
+        created = request.query.get("created", "")
+        if created.startswith(">="):
+            runs = [run for run in runs if run["created_at"][:10] >= created[2:12]]
+        if "status" in request.query:
+            runs = [run for run in runs if run["status"] == request.query["status"]]
+        page, headers = self._page(request, runs)
+        return {"total_count": len(runs), "workflow_runs": page}, headers
+
+    def _get_tree(self, request: FakeRequest, ref: str):
+        entries = [
+            {
+                "path": path,
+                "mode": "100644",
+                "type": "blob",
+                "sha": _blob_sha(content),
+                "size": len(content.encode()),
+            }
+            for path, content in sorted(self.code.items())
+        ]
+        tree_sha = _sha(*(entry["sha"] for entry in entries))
+        return {"sha": tree_sha, "tree": entries, "truncated": False}, {}
+
+    def _get_blob(self, request: FakeRequest, sha: str):
+        for content in self.code.values():
+            if _blob_sha(content) == sha:
+                data = content.encode()
+                return {
+                    "sha": sha,
+                    "size": len(data),
+                    "encoding": "base64",
+                    "content": base64.encodebytes(data).decode(),
+                }, {}
+        return None, {}
@@ -0,0 +1,246 @@
+"""In-process fake of the Jira Cloud REST API v3 for sync tests and benchmarks.
+
+Serves synthetic projects of configurable size through the endpoints the
+Jira connector uses:
+
+- ``GET /rest/api/3/search/jql``: ``project = KEY [AND updated >= '...']``
+  JQL, ``maxResults`` and opaque ``nextPageToken``/``isLast`` pagination
+- ``GET /rest/api/3/issue/{key}/comment``: ``startAt``/``maxResults``/``total``
+  offset pagination
+- ``GET /rest/api/3/myself`` and ``GET /rest/api/3/project``
+
+Descriptions and comment bodies are ADF documents, timestamps use Jira's
+``2026-01-01T00:00:00.000+0000`` format.
+
+Usage::
+
+    api = FakeJiraAPI(["PROJ"], issues_per_project=200)
+    engine.jira_client.client = api.mount(engine.jira_client.client)
+    ...
+    api.simulate_activity(issues=5, edited_comments=1)
+"""
+
+import base64
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .fake_api import FakeAPI, FakeRequest, FakeResponse, future_timestamp
+
+__all__ = ["FakeJiraAPI"]
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_COMMENTS_PATH = re.compile(r"^/rest/api/3/issue/(?P<key>[A-Z][A-Z0-9]*-\d+)/comment$")
+_JQL_PROJECT = re.compile(r"project\s*=\s*\"?(?P<key>[A-Z][A-Z0-9]*)\"?")
+_JQL_UPDATED = re.compile(r"updated\s*>=\s*'(?P<since>\d{4}-\d{2}-\d{2} \d{2}:\d{2})'")
+
+
+def _jira_time(moment: datetime) -> str:
+    millis = moment.microsecond // 1000
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{millis:03d}+0000"
+
+
+def _parse_jira_time(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def _adf(text: str) -> dict[str, Any]:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+def _encode_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def _decode_token(token: str) -> int:
+    return int(base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)[1])
+
+
+class FakeJiraAPI(FakeAPI):
+    """Synthetic Jira Cloud projects served over ASGI.
+
+    Args:
+        projects: Project keys to create
+        issues_per_project: Issues in each project
+        comments_per_issue: Comments on each issue
+        page_size: Server-side cap on search ``maxResults``
+        comment_page_size: Server-side cap on comment ``maxResults``
+        latency_ms: Simulated per-request latency
+    """
+
+    def __init__(
+        self,
+        projects: list[str] | tuple[str, ...] = ("BENCH",),
+        *,
+        issues_per_project: int = 20,
+        comments_per_issue: int = 3,
+        page_size: int = 50,
+        comment_page_size: int = 50,
+        latency_ms: float = 0.0,
+    ) -> None:
+        super().__init__(latency_ms)
+        self.page_size = page_size
+        self.comment_page_size = comment_page_size
+        self._next_id = 10000
+
+        self.issues: dict[str, dict[str, Any]] = {}
+        self.comments: dict[str, list[dict[str, Any]]] = {}
+        for project in projects:
+            for number in range(1, issues_per_project + 1):
+                when = _EPOCH + timedelta(hours=number)
+                key = self._add_issue(project, number, when)
+                for _ in range(comments_per_issue):
+                    self._add_comment(key, when + timedelta(minutes=10))
+
+    def _add_issue(self, project: str, number: int, when: datetime) -> str:
+        key = f"{project}-{number}"
+        self.issues[key] = {
+            "id": str(self._new_id()),
+            "key": key,
+            "fields": {
+                "summary": f"{key}: ingestion backlog grows under load",
+                "description": _adf(f"Investigate {key}. " + "Context. " * 20),
+                "issuetype": {"name": "Bug" if number % 3 == 0 else "Task"},
+                "status": {"name": "Done" if number % 4 == 0 else "In Progress"},
+                "priority": {"name": "High" if number % 2 else "Medium"},
+                "reporter": {"displayName": f"Reporter {number % 5}"},
+                "assignee": (
+                    {"displayName": f"Dev {number % 4}"} if number % 3 else None
+                ),
+                "labels": ["backend"] if number % 2 else [],
+                "project": {"key": project},
+                "created": _jira_time(when),
+                "updated": _jira_time(when + timedelta(minutes=30)),
+            },
+        }
+        self.comments[key] = []
+        return key
+
+    def _add_comment(self, key: str, when: datetime) -> None:
+        comment_id = self._new_id()
+        self.comments[key].append(
+            {
+                "id": str(comment_id),
+                "author": {"displayName": f"Dev {comment_id % 4}"},
+                "body": _adf(f"Comment {comment_id} on {key}: " + "update " * 15),
+                "created": _jira_time(when),
+                "updated": _jira_time(when),
+            }
+        )
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    # -- Simulated activity --------------------------------------------
+
+    def simulate_activity(
+        self,
+        *,
+        issues: int = 0,
+        new_comments: int = 1,
+        edited_comments: int = 0,
+    ) -> None:
+        """Touch the first ``issues`` issues of every project.
+
+        Each touched issue gets ``new_comments`` new comments and its first
+        ``edited_comments`` comments edited; its ``updated`` moves to now.
+        """
+        now = future_timestamp()
+        touched: dict[str, int] = {}
+        for key, issue in self.issues.items():
+            project = issue["fields"]["project"]["key"]
+            if touched.get(project, 0) >= issues:
+                continue
+            touched[project] = touched.get(project, 0) + 1
+            for comment in self.comments[key][:edited_comments]:
+                comment["body"] = _adf(f"Edited at {_jira_time(now)}: " + "fix " * 10)
+                comment["updated"] = _jira_time(now)
+            for _ in range(new_comments):
+                self._add_comment(key, now)
+            issue["fields"]["updated"] = _jira_time(now)
+
+    # -- Request handling ----------------------------------------------
+
+    def handle(self, request: FakeRequest) -> FakeResponse:
+        if request.method != "GET":
+            self.calls["not_found"] += 1
+            return FakeResponse(404, {"errorMessages": ["Not Found"]})
+        if request.path == "/rest/api/3/search/jql":
+            self.calls["search"] += 1
+            return self._search(request)
+        match = _COMMENTS_PATH.match(request.path)
+        if match:
+            self.calls["comments"] += 1
+            return self._comments(request, match.group("key"))
+        if request.path == "/rest/api/3/myself":
+            self.calls["myself"] += 1
+            return FakeResponse(
+                200, {"accountId": "bench", "displayName": "Bench", "active": True}
+            )
+        if request.path == "/rest/api/3/project":
+            self.calls["projects"] += 1
+            keys = sorted({i["fields"]["project"]["key"] for i in self.issues.values()})
+            return FakeResponse(200, [{"key": key, "name": key} for key in keys])
+        self.calls["not_found"] += 1
+        return FakeResponse(404, {"errorMessages": ["Not Found"]})
+
+    def _search(self, request: FakeRequest) -> FakeResponse:
+        jql = request.query.get("jql", "")
+        project = _JQL_PROJECT.search(jql)
+        if project is None:
+            # Jira Cloud rejects unbounded JQL on /search/jql
+            return FakeResponse(400, {"errorMessages": ["Unbounded JQL query"]})
+        matches = [
+            issue
+            for issue in self.issues.values()
+            if issue["fields"]["project"]["key"] == project.group("key")
+        ]
+        updated = _JQL_UPDATED.search(jql)
+        if updated:
+            since = datetime.strptime(updated.group("since"), "%Y-%m-%d %H:%M")
+            since = since.replace(tzinfo=timezone.utc)
+            matches = [
+                issue
+                for issue in matches
+                if _parse_jira_time(issue["fields"]["updated"]) >= since
+            ]
+
+        try:
+            offset = _decode_token(request.query["nextPageToken"])
+        except KeyError:
+            offset = 0
+        except (ValueError, IndexError):
+            return FakeResponse(400, {"errorMessages": ["Invalid nextPageToken"]})
+        limit = max(1, min(int(request.query.get("maxResults", 50)), self.page_size))
+        page = matches[offset : offset + limit]
+        body: dict[str, Any] = {
+            "issues": page,
+            "isLast": offset + limit >= len(matches),
+        }
+        if not body["isLast"]:
+            body["nextPageToken"] = _encode_token(offset + limit)
+        return FakeResponse(200, body)
+
+    def _comments(self, request: FakeRequest, key: str) -> FakeResponse:
+        if key not in self.comments:
+            return FakeResponse(404, {"errorMessages": ["Issue does not exist"]})
+        comments = self.comments[key]
+        start = max(0, int(request.query.get("startAt", 0)))
+        limit = max(
+            1, min(int(request.query.get("maxResults", 50)), self.comment_page_size)
+        )
+        return FakeResponse(
+            200,
+            {
+                "startAt": start,
+                "maxResults": limit,
+                "total": len(comments),
+                "comments": comments[start : start + limit],
+            },
+        )
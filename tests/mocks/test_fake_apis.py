@@ -0,0 +1,137 @@
+"""Tests for the fake GitHub and Jira APIs, driven through the real clients."""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from memory.connectors.github.client import GitHubClient
+from memory.connectors.jira.client import JiraClient, JiraClientError
+
+from .github_api import FakeGitHubAPI
+from .jira_api import FakeJiraAPI
+
+
+def _github(api: FakeGitHubAPI) -> GitHubClient:
+    client = GitHubClient("ghp_test", api.repo, min_delay_ms=0)
+    client._client = api.mount(client._client)
+    return client
+
+
+def _jira(api: FakeJiraAPI) -> JiraClient:
+    client = JiraClient("https://fake.atlassian.net", "a@b.c", "token", delay_ms=0)
+    client.client = api.mount(client.client)
+    return client
+
+
+class TestFakeGitHubAPI:
+    @pytest.mark.asyncio
+    async def test_link_header_pagination(self):
+        api = FakeGitHubAPI("o/r", issues=7, page_size=3)
+
+        async with _github(api) as client:
+            issues = await client.list_issues(state="all")
+
+        assert sorted(i["number"] for i in issues) == list(range(1, 8))
+        assert api.calls["issues"] == 3
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation_returns_free_304(self):
+        api = FakeGitHubAPI("o/r", issues=2)
+
+        async with _github(api) as client:
+            first = await client.list_issues(state="all")
+            used = api.rate_used
+            second = await client.list_issues(state="all")
+
+        assert second == first
+        assert api.not_modified == 1
+        assert api.rate_used == used
+        assert client._rate_limit_remaining == api.rate_limit - used
+
+    @pytest.mark.asyncio
+    async def test_since_filter_returns_only_touched_items(self):
+        api = FakeGitHubAPI("o/r", issues=5, commits=4)
+        watermark = datetime.now(timezone.utc).isoformat()
+        api.simulate_activity(issues=2, commits=1)
+
+        async with _github(api) as client:
+            issues = await client.list_issues(state="all", since=watermark)
+            comments = await client.get_issue_comments(1, since=watermark)
+            commits = await client.list_commits(sha="main", since=watermark)
+
+        assert sorted(i["number"] for i in issues) == [1, 2]
+        assert len(comments) == 1
+        assert len(commits) == 1
+
+    @pytest.mark.asyncio
+    async def test_blob_content_matches_tree(self):
+        api = FakeGitHubAPI("o/r", code_files=2)
+
+        async with _github(api) as client:
+            tree = await client.get_tree("main")
+            blob = await client.get_blob(tree[0]["sha"])
+
+        assert [entry["path"] for entry in tree] == sorted(api.code)
+        assert blob["size"] == tree[0]["size"]
+
+    @pytest.mark.asyncio
+    async def test_exhausted_rate_limit_returns_403(self):
+        api = FakeGitHubAPI("o/r", rate_limit=1)
+        transport = httpx.ASGITransport(app=api)
+
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://api.github.com"
+        ) as http:
+            ok = await http.get("/repos/o/r/issues")
+            limited = await http.get("/repos/o/r/pulls")
+            missing = await http.get("/repos/other/repo/issues")
+
+        assert ok.headers["X-RateLimit-Remaining"] == "0"
+        assert limited.status_code == 403
+        assert missing.status_code == 404
+
+
+class TestFakeJiraAPI:
+    @pytest.mark.asyncio
+    async def test_next_page_token_pagination(self):
+        api = FakeJiraAPI(["PROJ", "OTHER"], issues_per_project=5, page_size=2)
+
+        async with _jira(api) as client:
+            issues = await client.search_issues("PROJ")
+
+        assert [i["key"] for i in issues] == [f"PROJ-{n}" for n in range(1, 6)]
+        assert api.calls["search"] == 3
+
+    @pytest.mark.asyncio
+    async def test_comment_offset_pagination(self):
+        api = FakeJiraAPI(["PROJ"], issues_per_project=1, comments_per_issue=5)
+        api.comment_page_size = 2
+
+        async with _jira(api) as client:
+            comments = await client.get_comments("PROJ-1")
+
+        assert len(comments) == 5
+        assert api.calls["comments"] == 3
+
+    @pytest.mark.asyncio
+    async def test_updated_jql_returns_only_touched_issues(self):
+        api = FakeJiraAPI(["PROJ"], issues_per_project=4, comments_per_issue=1)
+        api.simulate_activity(issues=1, edited_comments=1)
+        since = api.issues["PROJ-1"]["fields"]["updated"]
+
+        async with _jira(api) as client:
+            issues = await client.search_issues("PROJ", updated_since=since)
+            comments = await client.get_comments("PROJ-1")
+
+        assert [i["key"] for i in issues] == ["PROJ-1"]
+        assert len(comments) == 2
+        assert comments[0]["updated"] == since
+
+    @pytest.mark.asyncio
+    async def test_unknown_issue_raises(self):
+        api = FakeJiraAPI(["PROJ"], issues_per_project=1)
+
+        async with _jira(api) as client:
+            with pytest.raises(JiraClientError):
+                await client.get_comments("PROJ-99")
@@ -0,0 +1,383 @@
+"""End-to-end sync throughput benchmarks against fake GitHub and Jira APIs.
+
+Runs the real sync engines -- HTTP clients, pagination, conditional
+requests, dedup and batched storage -- against the in-process fake APIs in
+tests/mocks and an in-memory Qdrant (``QdrantClient(":memory:")``).
+Embeddings are replaced by a counting stub so results measure sync
+overhead, not model latency.
+
+Each connector runs a full sync, then an incremental sync after a little
+simulated activity, and prints one report line per run:
+
+- items/s: stored items per wall-clock second
+- api/item: API requests per stored item (304s are reported separately)
+- embed/item: embed() requests (not texts) per stored item
+- peak RSS: process high-water mark after the run (ru_maxrss)
+
+The default scale keeps the suite fast. Set SYNC_BENCH_SCALE (e.g. 20) and
+SYNC_BENCH_LATENCY_MS (e.g. 20) for a realistic measurement, and run with
+``pytest tests/performance/test_sync_throughput.py -s``.
+
+No Docker services required.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from memory.config import COLLECTION_GITHUB, COLLECTION_JIRA_DATA, MemoryConfig
+from memory.connectors.github.client import GitHubClient
+from memory.connectors.github.code_sync import CodeBlobSync
+from memory.connectors.github.sync import GitHubSyncEngine
+from memory.connectors.jira.sync import JiraSyncEngine
+from tests.mocks.github_api import FakeGitHubAPI
+from tests.mocks.jira_api import FakeJiraAPI
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+pytestmark = pytest.mark.performance
+
+SCALE = max(1, int(os.environ.get("SYNC_BENCH_SCALE", "1")))
+LATENCY_MS = float(os.environ.get("SYNC_BENCH_LATENCY_MS", "0"))
+DIMENSIONS = 768
+
+
+class CountingEmbeddings:
+    """Stand-in for EmbeddingClient: deterministic vectors, counted calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.texts = 0
+        self._lock = threading.Lock()
+
+    def embed(self, texts, model="en", project="unknown"):
+        with self._lock:
+            self.calls += 1
+            self.texts += len(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_sparse(self, texts):
+        with self._lock:
+            self.calls += 1
+        return [{"indices": [0], "values": [1.0]} for _ in texts]
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _vector(text):
+        vector = [0.0] * DIMENSIONS
+        digest = hashlib.sha1(text.encode()).digest()
+        vector[int.from_bytes(digest[:4], "big") % DIMENSIONS] = 1.0
+        return vector
+
+
+@dataclass
+class RunStats:
+    """Measurements for one sync run."""
+
+    label: str
+    items: int
+    seconds: float
+    api_calls: int
+    not_modified: int
+    embed_calls: int
+
+    def report(self) -> None:
+        per_item = max(self.items, 1)
+        print(
+            f"\n  {self.label:<28} items={self.items:<5} "
+            f"items/s={self.items / max(self.seconds, 1e-9):8.1f} "
+            f"api/item={self.api_calls / per_item:5.2f} "
+            f"304s={self.not_modified:<4} "
+            f"embed/item={self.embed_calls / per_item:5.2f} "
+            f"peak_rss={_peak_rss_mb():7.1f}MB"
+        )
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _measure(label, api, embeddings, run, count_items):
+    api.reset_counters()
+    embed_before = embeddings.calls
+    started = time.perf_counter()
+    result = await run()
+    stats = RunStats(
+        label=label,
+        items=count_items(result),
+        seconds=time.perf_counter() - started,
+        api_calls=api.total_calls,
+        not_modified=api.not_modified,
+        embed_calls=embeddings.calls - embed_before,
+    )
+    stats.report()
+    return result, stats
+
+
+class SerializedQdrant:
+    """QdrantClient proxy holding a lock around every call.
+
+    Local ``:memory:`` mode is not thread-safe, while the sync engines call
+    Qdrant from worker threads; the server handles that concurrency itself.
+    """
+
+    def __init__(self, client: QdrantClient) -> None:
+        self._client = client
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return call
+
+
+@pytest.fixture
+def qdrant():
+    client = QdrantClient(":memory:")
+    for name in (COLLECTION_GITHUB, COLLECTION_JIRA_DATA):
+        client.create_collection(
+            name, vectors_config=VectorParams(size=DIMENSIONS, distance=Distance.COSINE)
+        )
+    yield SerializedQdrant(client)
+    client.close()
+
+
+@pytest.fixture
+def embeddings():
+    return CountingEmbeddings()
+
+
+@pytest.fixture
+def backends(qdrant, embeddings):
+    """Route every MemoryStorage / engine client to the in-memory backends."""
+    with (
+        # Pushgateway pushes fork a subprocess each; not part of sync cost
+        patch("memory.metrics_push.PUSHGATEWAY_ENABLED", False),
+        patch("memory.storage.get_qdrant_client", return_value=qdrant),
+        patch("memory.storage.EmbeddingClient", return_value=embeddings),
+        patch("memory.connectors.github.sync.get_qdrant_client", return_value=qdrant),
+        patch(
+            "memory.connectors.github.code_sync.get_qdrant_client",
+            return_value=qdrant,
+        ),
+        patch("memory.connectors.jira.sync.get_qdrant_client", return_value=qdrant),
+        patch("memory.connectors.jira.sync.EmbeddingClient", return_value=embeddings),
+        patch(
+            "memory.freshness.run_freshness_scan",
+            return_value=SimpleNamespace(
+                total_checked=0,
+                fresh_count=0,
+                aging_count=0,
+                stale_count=0,
+                expired_count=0,
+                unknown_count=0,
+            ),
+        ),
+    ):
+        yield
+
+
+def _config(tmp_path, **overrides):
+    return MemoryConfig(
+        install_dir=tmp_path,
+        security_scanning_enabled=False,
+        hybrid_search_enabled=False,
+        **overrides,
+    )
+
+
+def _unthrottled(client: GitHubClient, api: FakeGitHubAPI) -> None:
+    """Serve a GitHubClient from the fake, without client-side pacing.
+
+    The benchmarks measure pipeline cost; GitHub's own request pacing would
+    otherwise dominate wall-clock time at any non-trivial scale.
+    """
+    client._client = api.mount(client._client)
+    client._min_delay_s = 0.0
+    client.SECONDARY_LIMIT_POINTS = 10**9
+
+
+class TestGitHubSyncThroughput:
+    @pytest.fixture
+    def api(self):
+        return FakeGitHubAPI(
+            "bench/repo",
+            issues=20 * SCALE,
+            pull_requests=10 * SCALE,
+            commits=20 * SCALE,
+            workflow_runs=5 * SCALE,
+            code_files=20 * SCALE,
+            page_size=50,
+            rate_limit=10**9,
+            latency_ms=LATENCY_MS,
+        )
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return _config(
+            tmp_path,
+            github_sync_enabled=True,
+            github_token="ghp_bench",
+            github_repo="bench/repo",
+            github_http_cache_enabled=True,
+        )
+
+    def _engine(self, config, api, tmp_path):
+        engine = GitHubSyncEngine(config)
+        _unthrottled(engine.client, api)
+        engine._state_dir = tmp_path / "state"
+        engine._state_file = engine._state_dir / "github_sync_state.json"
+        engine._push_metrics = lambda result: None
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_full_then_incremental(
+        self, api, config, embeddings, backends, tmp_path
+    ):
+        full, full_stats = await _measure(
+            "github full",
+            api,
+            embeddings,
+            lambda: self._engine(config, api, tmp_path).sync(mode="full"),
+            lambda result: result.total_synced,
+        )
+
+        api.simulate_activity(issues=2 * SCALE, commits=2 * SCALE)
+        incremental, incremental_stats = await _measure(
+            "github incremental",
+            api,
+            embeddings,
+            lambda: self._engine(config, api, tmp_path).sync(mode="incremental"),
+            lambda result: result.total_synced,
+        )
+
+        assert full.errors == incremental.errors == 0
+        assert full.issues_synced == 20 * SCALE
+        assert full.prs_synced == 10 * SCALE
+        assert full.commits_synced == 20 * SCALE
+        assert incremental.comments_synced == 2 * SCALE
+        assert incremental.commits_synced == 2 * SCALE
+        assert incremental_stats.api_calls < full_stats.api_calls
+        assert incremental_stats.embed_calls < full_stats.embed_calls
+
+    @pytest.mark.asyncio
+    async def test_code_blobs_full_then_incremental(
+        self, api, config, embeddings, backends
+    ):
+        async def run():
+            client = GitHubClient("ghp_bench", api.repo, min_delay_ms=0)
+            _unthrottled(client, api)
+            sync = CodeBlobSync(client, config)
+            sync._push_metrics = lambda result: None
+            async with client:
+                return await sync.sync_code_blobs(GitHubClient.generate_batch_id())
+
+        full, full_stats = await _measure(
+            "github code full",
+            api,
+            embeddings,
+            run,
+            lambda result: result.files_synced,
+        )
+
+        api.simulate_activity(code_files=2 * SCALE)
+        incremental, incremental_stats = await _measure(
+            "github code incremental",
+            api,
+            embeddings,
+            run,
+            lambda result: result.files_synced,
+        )
+
+        assert full.errors == incremental.errors == 0
+        assert full.files_synced == 20 * SCALE
+        assert incremental.files_synced == 2 * SCALE
+        assert incremental_stats.api_calls < full_stats.api_calls
+        assert incremental_stats.embed_calls < full_stats.embed_calls
+
+
+class TestJiraSyncThroughput:
+    @pytest.fixture
+    def api(self):
+        return FakeJiraAPI(
+            ["BENCH", "OPS"],
+            issues_per_project=20 * SCALE,
+            comments_per_issue=3,
+            page_size=25,
+            latency_ms=LATENCY_MS,
+        )
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return _config(
+            tmp_path,
+            jira_sync_enabled=True,
+            jira_instance_url="https://bench.atlassian.net",
+            jira_email="bench@example.com",
+            jira_api_token="bench-token",
+            jira_projects=["BENCH", "OPS"],
+            jira_sync_delay_ms=0,
+        )
+
+    async def _sync(self, config, api, mode):
+        engine = JiraSyncEngine(config)
+        engine.jira_client.client = api.mount(engine.jira_client.client)
+        try:
+            return await engine.sync_all_projects(mode=mode)
+        finally:
+            await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_full_then_incremental(self, api, config, embeddings, backends):
+        def stored(results):
+            return sum(r.issues_synced + r.comments_synced for r in results.values())
+
+        full, full_stats = await _measure(
+            "jira full",
+            api,
+            embeddings,
+            lambda: self._sync(config, api, "full"),
+            stored,
+        )
+
+        api.simulate_activity(issues=2 * SCALE, new_comments=1, edited_comments=1)
+        incremental, incremental_stats = await _measure(
+            "jira incremental",
+            api,
+            embeddings,
+            lambda: self._sync(config, api, "incremental"),
+            stored,
+        )
+
+        assert all(not r.errors for r in full.values())
+        assert all(not r.errors for r in incremental.values())
+        assert sum(r.issues_synced for r in full.values()) == 40 * SCALE
+        assert sum(r.comments_synced for r in full.values()) == 120 * SCALE
+        # Per project: the touched issues' new and edited comments
+        assert sum(r.comments_synced for r in incremental.values()) == 8 * SCALE
+        assert incremental_stats.api_calls < full_stats.api_calls
+        assert incremental_stats.embed_calls < full_stats.embed_calls
@@ -0,0 +1,275 @@
+"""Tests for AsyncMemoryStorage / AsyncMemorySearch and shared async clients.
+
+Uses AsyncQdrantClient(":memory:") and a stub embedding client — no external
+services required.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from memory.config import MemoryConfig
+from memory.embeddings import get_async_embedding_client
+from memory.models import MemoryType
+from memory.qdrant_client import get_async_qdrant_client
+from memory.search import AsyncMemorySearch
+from memory.storage import AsyncMemoryStorage, await_store_memory
+
+DIM = 768  # DEC-010: pending points are stored with 768-dim zero vectors
+
+
+def _embed(texts, model="en", project="unknown"):
+    """Deterministic toy embedding: bucket characters into DIM dimensions."""
+    vectors = []
+    for text in texts:
+        v = [0.0] * DIM
+        for ch in text:
+            v[ord(ch) % DIM] += 1.0
+        vectors.append(v)
+    return vectors
+
+
+@pytest.fixture
+def config():
+    return MemoryConfig(
+        security_scanning_enabled=False,
+        hybrid_search_enabled=False,
+        decay_enabled=False,
+        similarity_threshold=0.1,
+    )
+
+
+@pytest_asyncio.fixture
+async def qdrant():
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        "discussions",
+        vectors_config=VectorParams(size=DIM, distance=Distance.COSINE),
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def embedder():
+    client = AsyncMock()
+    client.embed.side_effect = _embed
+    return client
+
+
+@pytest.mark.asyncio
+class TestAsyncMemoryStorage:
+    async def test_store_then_duplicate(self, config, qdrant, embedder):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        kwargs = {
+            "content": "Use asyncio.gather for concurrent fan-out",
+            "cwd": "/tmp/project",
+            "memory_type": MemoryType.USER_MESSAGE,
+            "source_hook": "SDKWrapper",
+            "session_id": "sess-1",
+            "collection": "discussions",
+            "group_id": "proj",
+        }
+
+        first = await storage.store_memory(**kwargs)
+        second = await storage.store_memory(**kwargs)
+
+        assert first["status"] == "stored"
+        assert first["embedding_status"] == "complete"
+        assert second == {
+            "memory_id": first["memory_id"],
+            "status": "duplicate",
+            "embedding_status": "n/a",
+        }
+        assert (await qdrant.count("discussions")).count == 1
+
+    async def test_embedding_failure_stores_pending(self, config, qdrant, embedder):
+        from memory.embeddings import EmbeddingError
+
+        embedder.embed.side_effect = EmbeddingError("EMBEDDING_TIMEOUT")
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+
+        result = await storage.store_memory(
+            content="Embedding service is down but we keep the memory",
+            cwd="/tmp/project",
+            memory_type=MemoryType.USER_MESSAGE,
+            source_hook="manual",
+            session_id="sess-1",
+            collection="discussions",
+            group_id="proj",
+        )
+
+        assert result["status"] == "stored"
+        assert result["embedding_status"] == "pending"
+
+    async def test_precomputed_embedding_skips_embed_call(
+        self, config, qdrant, embedder
+    ):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        content = "Reuse the dedup vector instead of embedding twice"
+        vector = _embed([content])[0]
+
+        result = await storage.store_memory(
+            content=content,
+            cwd="/tmp/project",
+            memory_type=MemoryType.USER_MESSAGE,
+            source_hook="manual",
+            session_id="sess-1",
+            collection="discussions",
+            group_id="proj",
+            embedding=vector,
+        )
+
+        embedder.embed.assert_not_called()
+        assert result["embedding_status"] == "complete"
+        points = await qdrant.retrieve(
+            "discussions", ids=[result["memory_id"]], with_vectors=True
+        )
+        norm = sum(x * x for x in vector) ** 0.5  # cosine collections normalize
+        assert points[0].vector == pytest.approx([x / norm for x in vector], rel=1e-5)
+
+    async def test_precomputed_embedding_from_other_model_is_discarded(
+        self, config, qdrant, embedder
+    ):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        content = "def pooled(): return shared_pool"
+        vector = _embed(["unrelated"])[0]
+
+        result = await storage.store_memory(
+            content=content,
+            cwd="/tmp/project",
+            memory_type=MemoryType.USER_MESSAGE,
+            source_hook="manual",
+            session_id="sess-1",
+            collection="discussions",
+            group_id="proj",
+            embedding=vector,
+            embedding_model="code",
+        )
+
+        embedder.embed.assert_called_once()
+        assert embedder.embed.call_args.kwargs["model"] == "en"
+        assert result["embedding_status"] == "complete"
+
+
+@pytest.mark.asyncio
+class TestAsyncMemorySearch:
+    async def test_search_returns_formatted_results(self, config, qdrant, embedder):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        stored = await storage.store_memory(
+            content="Prefer connection pools shared per event loop",
+            cwd="/tmp/project",
+            memory_type=MemoryType.USER_MESSAGE,
+            source_hook="manual",
+            session_id="sess-1",
+            collection="discussions",
+            group_id="proj",
+        )
+        search = AsyncMemorySearch(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+
+        results = await search.search(
+            "connection pools shared per event loop",
+            collection="discussions",
+            group_id="proj",
+        )
+
+        assert results[0]["id"] == stored["memory_id"]
+        assert results[0]["collection"] == "discussions"
+        assert results[0]["search_mode"] == "dense"
+        points = await qdrant.retrieve("discussions", ids=[stored["memory_id"]])
+        assert points[0].payload["access_count"] == 1
+
+    async def test_group_id_filter(self, config, qdrant, embedder):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        await storage.store_memory(
+            content="Only visible inside project alpha",
+            cwd="/tmp/project",
+            memory_type=MemoryType.USER_MESSAGE,
+            source_hook="manual",
+            session_id="sess-1",
+            collection="discussions",
+            group_id="alpha",
+        )
+        search = AsyncMemorySearch(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+
+        results = await search.search(
+            "visible inside project", collection="discussions", group_id="beta"
+        )
+
+        assert results == []
+
+    async def test_pagination_projection_without_access_tracking(
+        self, config, qdrant, embedder
+    ):
+        storage = AsyncMemoryStorage(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        for n in range(3):
+            await storage.store_memory(
+                content=f"Paginated search result number {n} about retries",
+                cwd="/tmp/project",
+                memory_type=MemoryType.USER_MESSAGE,
+                source_hook="manual",
+                session_id="sess-1",
+                collection="discussions",
+                group_id="proj",
+            )
+        search = AsyncMemorySearch(
+            config, qdrant_client=qdrant, embedding_client=embedder
+        )
+        kwargs = {
+            "collection": "discussions",
+            "group_id": "proj",
+            "limit": 2,
+            "with_payload": ["content"],
+            "track_access": False,
+            "raw_payload": True,
+        }
+
+        first = await search.search("search result about retries", **kwargs)
+        second = await search.search("search result about retries", offset=2, **kwargs)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert {m["id"] for m in first}.isdisjoint(m["id"] for m in second)
+        assert "session_id" not in first[0]
+        assert first[0]["content"].startswith("Paginated search result")
+        # The stored payload carries none of the fields search synthesizes
+        assert first[0]["payload"] == {"content": first[0]["content"]}
+        points, _ = await qdrant.scroll("discussions", with_payload=True)
+        assert all("access_count" not in p.payload for p in points)
+
+
+@pytest.mark.asyncio
+class TestSharedAsyncClients:
+    async def test_clients_shared_within_loop(self, config):
+        assert get_async_qdrant_client(config) is get_async_qdrant_client(config)
+        assert get_async_embedding_client(config) is get_async_embedding_client(config)
+
+    async def test_await_store_memory_runs_sync_storage_in_thread(self):
+        storage = Mock()
+        storage.store_memory = Mock(return_value={"status": "stored"})
+
+        result = await await_store_memory(storage, "content", "/cwd", key="v")
+
+        assert result == {"status": "stored"}
+        storage.store_memory.assert_called_once_with("content", "/cwd", key="v")
@@ -208,6 +208,34 @@ class TestHealthFileCreation:
             assert mock_path_instance.touch.call_count >= 1
 
 
+class TestGracefulShutdown:
+    """Provider clients are closed when the worker stops."""
+
+    @pytest.mark.asyncio
+    async def test_run_closes_every_provider_in_chain(self):
+        from scripts.memory.process_classification_queue import ClassificationWorker
+
+        providers = [MagicMock(), MagicMock()]
+        providers[0].aclose = AsyncMock(side_effect=RuntimeError("already closed"))
+        providers[1].aclose = AsyncMock()
+
+        with (
+            patch("scripts.memory.process_classification_queue.Path"),
+            patch("scripts.memory.process_classification_queue.setup_hook_logging"),
+            patch.object(
+                ClassificationWorker, "process_queue", new=AsyncMock(return_value=None)
+            ),
+            patch("memory.classifier.llm_classifier._provider_chain_cache", providers),
+            patch("asyncio.get_running_loop"),
+        ):
+            worker = ClassificationWorker(batch_size=10, poll_interval=5.0)
+            await worker.run()
+
+        # A failing provider does not stop the rest from closing
+        for provider in providers:
+            provider.aclose.assert_awaited_once()
+
+
 class TestWorkerConfiguration:
     """Tests for worker configuration and initialization."""
 
@@ -234,3 +262,58 @@ class TestWorkerConfiguration:
 
         # Should be capped at MAX_BATCH_SIZE
         assert worker.batch_size <= MAX_BATCH_SIZE
+
+
+class TestPayloadWriteBack:
+    """Tests for coalesced payload write-back."""
+
+    @pytest.mark.asyncio
+    async def test_updates_grouped_per_collection(self):
+        """Concurrent updates share one write per collection."""
+        import asyncio
+
+        from scripts.memory.process_classification_queue import PayloadWriteBack
+
+        with patch(
+            "scripts.memory.process_classification_queue.update_point_payloads_async",
+            new=AsyncMock(return_value=True),
+        ) as mock_grouped:
+            write_back = PayloadWriteBack(window=0.01)
+            results = await asyncio.gather(
+                write_back.update("discussions", "p1", {"type": "decision"}),
+                write_back.update("discussions", "p2", {"type": "decision"}),
+                write_back.update("code-patterns", "p3", {"type": "error_fix"}),
+            )
+
+        assert results == [True, True, True]
+        assert mock_grouped.await_count == 2
+        calls = {c.args[0]: c.args[1] for c in mock_grouped.await_args_list}
+        assert set(calls["discussions"]) == {"p1", "p2"}
+        assert set(calls["code-patterns"]) == {"p3"}
+
+    @pytest.mark.asyncio
+    async def test_failed_group_retried_per_point(self):
+        """A failed grouped write falls back to per-point updates."""
+        import asyncio
+
+        from scripts.memory.process_classification_queue import PayloadWriteBack
+
+        with (
+            patch(
+                "scripts.memory.process_classification_queue.update_point_payloads_async",
+                new=AsyncMock(return_value=False),
+            ),
+            patch(
+                "scripts.memory.process_classification_queue.update_point_payload",
+                side_effect=lambda collection, point_id, payload_updates: point_id
+                == "p1",
+            ) as mock_single,
+        ):
+            write_back = PayloadWriteBack(window=0.01)
+            results = await asyncio.gather(
+                write_back.update("discussions", "p1", {"type": "decision"}),
+                write_back.update("discussions", "p2", {"type": "blocker"}),
+            )
+
+        assert results == [True, False]
+        assert mock_single.call_count == 2
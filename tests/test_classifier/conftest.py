@@ -0,0 +1,35 @@
+"""Shared fixtures for classifier tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_classification_cache():
+    """Keep tests off the persistent cache under ~/.ai-memory.
+
+    Tests that exercise the cache patch get_classification_cache themselves.
+    """
+    with patch(
+        "src.memory.classifier.llm_classifier.get_classification_cache",
+        return_value=None,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def no_shared_provider_state():
+    """Keep the rate limiter and circuit breaker singletons in-process.
+
+    Otherwise breaker state and token buckets from one test (or an earlier
+    run) would persist in ~/.ai-memory and leak into the next.
+    """
+    from src.memory.classifier.circuit_breaker import circuit_breaker
+    from src.memory.classifier.rate_limiter import rate_limiter
+
+    with (
+        patch.object(circuit_breaker, "shared_state", None),
+        patch.object(rate_limiter, "shared_state", None),
+    ):
+        yield
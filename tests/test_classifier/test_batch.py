@@ -0,0 +1,345 @@
+"""Tests for multi-item batched classification.
+
+TECH-DEBT-069: LLM-based memory classification system tests.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.memory.classifier.llm_classifier import (
+    ClassificationRequest,
+    classify_batch,
+    classify_batch_async,
+)
+from src.memory.classifier.prompts import build_batch_classification_prompt
+from src.memory.classifier.providers.base import (
+    BaseProvider,
+    BatchProviderResponse,
+    ProviderResponse,
+)
+from src.memory.classifier.providers.ollama import OllamaProvider
+
+CONTENTS = [
+    "Maybe we should consider using Redis for the session store",
+    "The dashboard layout looks cleaner after moving the sidebar",
+    "Considering whether the nightly export should run hourly instead",
+]
+
+
+class FakeProvider(BaseProvider):
+    """Provider whose raw completion returns a canned response text."""
+
+    model = "fake-model"
+
+    def __init__(self, response_text: str):
+        super().__init__()
+        self.response_text = response_text
+        self.prompts: list[str] = []
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    def is_available(self) -> bool:
+        return True
+
+    def classify(self, content, collection, current_type):
+        raise NotImplementedError
+
+    def _complete(self, prompt, max_tokens):
+        self.prompts.append(prompt)
+        return self.response_text, 300, 90
+
+
+def _element(index, classified_type="decision", confidence=0.9):
+    return {
+        "index": index,
+        "classified_type": classified_type,
+        "confidence": confidence,
+        "reasoning": "because",
+        "tags": ["t"],
+    }
+
+
+def _response(classified_type="decision", confidence=0.9):
+    return ProviderResponse(
+        classified_type=classified_type,
+        confidence=confidence,
+        reasoning="because",
+        tags=[],
+        input_tokens=0,
+        output_tokens=0,
+        model_name="test-model",
+    )
+
+
+def _mock_provider(name, batch_results=None):
+    provider = Mock()
+    provider.name = name
+    provider.supports_batch = batch_results is not None
+    provider.is_available.return_value = True
+    provider.classify.return_value = _response(confidence=0.8)
+    if batch_results is not None:
+        provider.classify_batch.return_value = BatchProviderResponse(
+            results=batch_results,
+            input_tokens=301,
+            output_tokens=90,
+            model_name="test-model",
+        )
+    return provider
+
+
+def _async_provider(name, batch_results=None, delay=0.0):
+    provider = _mock_provider(name, batch_results)
+    provider.ais_available = AsyncMock(return_value=True)
+    provider.aclassify = AsyncMock(return_value=_response(confidence=0.8))
+
+    async def aclassify_batch(items):
+        await asyncio.sleep(delay)
+        return provider.classify_batch.return_value
+
+    provider.aclassify_batch = AsyncMock(side_effect=aclassify_batch)
+    return provider
+
+
+def _requests(count=3):
+    return [
+        ClassificationRequest(content, "discussions", "user_message")
+        for content in CONTENTS[:count]
+    ]
+
+
+class TestBatchPromptAndParsing:
+    """Provider-level prompt building and JSON-array parsing."""
+
+    def test_prompt_numbers_items_and_shares_preamble(self):
+        prompt = build_batch_classification_prompt(
+            [
+                ("first", "discussions", "user_message"),
+                ("second", "conventions", "rule"),
+            ]
+        )
+
+        assert prompt.count("## MEMORY TYPES") == 1
+        assert "### Memory 1" in prompt
+        assert "### Memory 2\nCollection: conventions\nCurrent Type: rule" in prompt
+        assert '"index"' in prompt
+
+    def test_elements_matched_by_index(self):
+        text = json.dumps([_element(2, "blocker"), _element(1, "decision")])
+        provider = FakeProvider(text)
+
+        response = provider.classify_batch(
+            [(c, "discussions", "user_message") for c in CONTENTS[:2]]
+        )
+
+        assert [r.classified_type for r in response.results] == ["decision", "blocker"]
+        assert response.input_tokens == 300
+        assert len(provider.prompts) == 1
+
+    def test_malformed_and_missing_elements_are_none(self):
+        text = "```json\n" + json.dumps([_element(1), {"index": 2}]) + "\n```"
+        provider = FakeProvider(text)
+
+        response = provider.classify_batch(
+            [(c, "discussions", "user_message") for c in CONTENTS]
+        )
+
+        assert response.results[0].classified_type == "decision"
+        assert response.results[1] is None
+        assert response.results[2] is None
+
+    def test_response_without_array_raises(self):
+        provider = FakeProvider("I cannot classify these.")
+
+        with pytest.raises(ValueError):
+            provider.classify_batch([("x", "discussions", "user_message")])
+
+
+@patch("src.memory.classifier.llm_classifier.rate_limiter")
+@patch("src.memory.classifier.llm_classifier.circuit_breaker")
+@patch("src.memory.classifier.llm_classifier._get_provider_chain")
+class TestClassifyBatch:
+    """classify_batch() orchestration over the provider chain."""
+
+    def test_one_request_per_batch(self, mock_get_chain, _breaker, limiter):
+        provider = _mock_provider(
+            "batcher", [_response(), _response("blocker"), _response()]
+        )
+        mock_get_chain.return_value = [provider]
+
+        results = classify_batch(_requests())
+
+        assert [r.classified_type for r in results] == [
+            "decision",
+            "blocker",
+            "decision",
+        ]
+        assert provider.classify_batch.call_count == 1
+        provider.classify.assert_not_called()
+        assert limiter.allow_request.call_count == 1
+        assert sum(r.input_tokens for r in results) == 301
+
+    def test_malformed_element_falls_back_to_single_call(
+        self, mock_get_chain, _breaker, _limiter
+    ):
+        provider = _mock_provider("batcher", [_response(), None, _response()])
+        mock_get_chain.return_value = [provider]
+
+        results = classify_batch(_requests())
+
+        assert provider.classify.call_count == 1
+        assert provider.classify.call_args.args[0] == CONTENTS[1]
+        assert all(r.provider_used == "batcher" for r in results)
+
+    def test_low_confidence_items_move_to_next_provider(
+        self, mock_get_chain, _breaker, _limiter
+    ):
+        first = _mock_provider("first", [_response(), _response(confidence=0.3)])
+        second = _mock_provider("second", [_response("blocker")])
+        mock_get_chain.return_value = [first, second]
+
+        results = classify_batch(_requests(2))
+
+        assert [r.provider_used for r in results] == ["first", "second"]
+        assert second.classify_batch.call_args.args[0][0][0] == CONTENTS[1]
+
+    def test_unbatchable_chain_uses_single_calls(
+        self, mock_get_chain, _breaker, _limiter
+    ):
+        provider = _mock_provider("single-only")
+        mock_get_chain.return_value = [provider]
+
+        results = classify_batch(_requests())
+
+        assert provider.classify.call_count == 3
+        assert all(r.classified_type == "decision" for r in results)
+
+    def test_batch_size_one_disables_batching(self, mock_get_chain, _breaker, _limiter):
+        provider = _mock_provider("batcher", [_response()])
+        mock_get_chain.return_value = [provider]
+
+        classify_batch(_requests(2), batch_size=1)
+
+        provider.classify_batch.assert_not_called()
+        assert provider.classify.call_count == 2
+
+    def test_rule_matches_skip_the_llm(self, mock_get_chain, _breaker, _limiter):
+        provider = _mock_provider("batcher", [_response()])
+        mock_get_chain.return_value = [provider]
+        requests = [
+            ClassificationRequest(
+                "Fixed TypeError by adding null check",
+                "code-patterns",
+                "implementation",
+            ),
+            ClassificationRequest(CONTENTS[0], "discussions", "user_message"),
+        ]
+
+        results = classify_batch(requests)
+
+        assert results[0].provider_used == "rule-based"
+        provider.classify_batch.assert_not_called()
+        assert provider.classify.call_count == 1
+
+
+@patch("src.memory.classifier.llm_classifier.rate_limiter")
+@patch("src.memory.classifier.llm_classifier.circuit_breaker")
+@patch("src.memory.classifier.llm_classifier._get_provider_chain")
+class TestClassifyBatchAsync:
+    """classify_batch_async() over the providers' async clients."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_sent_concurrently(self, mock_get_chain, _breaker, _limiter):
+        provider = _async_provider("batcher", [_response()], delay=0.2)
+        mock_get_chain.return_value = [provider]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await classify_batch_async(_requests(), batch_size=1)
+
+        assert loop.time() - started < 0.4  # three 0.2s chunks overlap
+        assert [r.provider_used for r in results] == ["batcher"] * 3
+        provider.classify.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_malformed_element_falls_back_to_async_single_call(
+        self, mock_get_chain, _breaker, _limiter
+    ):
+        provider = _async_provider("batcher", [_response(), None, _response()])
+        mock_get_chain.return_value = [provider]
+
+        results = await classify_batch_async(_requests())
+
+        assert provider.aclassify_batch.await_count == 1
+        assert provider.aclassify.await_count == 1
+        assert provider.aclassify.await_args.args[0] == CONTENTS[1]
+        assert [r.classified_type for r in results] == ["decision"] * 3
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_results(self, mock_get_chain, _breaker, _limiter):
+        provider = _async_provider(
+            "batcher", [_response(), _response("blocker", 0.3), _response()]
+        )
+        mock_get_chain.return_value = [provider]
+
+        async_results = await classify_batch_async(_requests())
+        sync_results = classify_batch(_requests())
+
+        assert [
+            (r.classified_type, r.provider_used, r.confidence) for r in async_results
+        ] == [(r.classified_type, r.provider_used, r.confidence) for r in sync_results]
+
+
+class TestAsyncProviderClients:
+    """Provider-level async completion."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_reuses_one_client_per_loop(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            body = {
+                "response": json.dumps([_element(1)]),
+                "prompt_eval_count": 120,
+                "eval_count": 30,
+            }
+            return httpx.Response(200, json=body)
+
+        provider = OllamaProvider(base_url="http://ollama.test")
+        created = []
+
+        def new_client():
+            created.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            return created[-1]
+
+        with patch.object(provider, "_new_async_client", side_effect=new_client):
+            responses = await asyncio.gather(
+                *[
+                    provider.aclassify_batch([(c, "discussions", "user_message")])
+                    for c in CONTENTS
+                ]
+            )
+            await provider.aclose()
+
+        assert len(created) == 1
+        assert calls == ["/api/generate"] * 3
+        assert all(r.results[0].classified_type == "decision" for r in responses)
+        assert responses[0].input_tokens == 120
+
+    @pytest.mark.asyncio
+    async def test_sync_only_provider_runs_in_thread(self):
+        provider = FakeProvider(json.dumps([_element(1, "blocker")]))
+
+        response = await provider.aclassify_batch(
+            [(CONTENTS[0], "discussions", "user_message")]
+        )
+
+        assert provider.supports_async is False
+        assert response.results[0].classified_type == "blocker"
+        assert len(provider.prompts) == 1
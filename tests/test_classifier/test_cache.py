@@ -0,0 +1,192 @@
+"""Tests for the persistent classification cache.
+
+TECH-DEBT-069: LLM-based memory classification system tests.
+"""
+
+import sqlite3
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.memory.classifier.cache import ClassificationCache, classification_cache_key
+from src.memory.classifier.llm_classifier import _get_cache_config_hash, classify
+from src.memory.classifier.providers.base import ProviderResponse
+
+CONTENT = "After discussion, we selected PostgreSQL for the database"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ClassificationCache(tmp_path / "classification_cache.db")
+    yield cache
+    cache.close()
+
+
+def _provider(confidence=0.85):
+    provider = Mock()
+    provider.name = "test-provider"
+    provider.is_available.return_value = True
+    provider.classify.return_value = ProviderResponse(
+        classified_type="decision",
+        confidence=confidence,
+        reasoning="Contains decision keywords",
+        tags=["database"],
+        input_tokens=100,
+        output_tokens=50,
+        model_name="test-model",
+    )
+    return provider
+
+
+class TestClassificationCache:
+    """Storage, expiry and eviction."""
+
+    def test_roundtrip_and_hit_rate(self, cache):
+        cache.put("k", {"classified_type": "decision"})
+
+        assert cache.get("k") == {"classified_type": "decision"}
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_expired_entry_is_miss(self, cache):
+        cache.ttl_seconds = 60
+        with patch("src.memory.classifier.cache.time.time", return_value=1000.0):
+            cache.put("k", {"a": 1})
+        with patch("src.memory.classifier.cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_beyond_max_entries(self, cache):
+        cache.max_entries = 10
+        for i in range(10):
+            cache.put(f"k{i}", {"i": i})
+        cache.get("k0")  # k0 is now the most recently used
+
+        cache.put("k10", {"i": 10})
+
+        assert len(cache) == 9
+        assert cache.get("k0") is not None
+        assert cache.get("k1") is None
+        assert cache.get("k10") is not None
+
+    def test_get_defers_access_time_until_flush(self, cache):
+        with patch("src.memory.classifier.cache.time.time", return_value=1000.0):
+            cache.put("k", {"a": 1})
+        conn = sqlite3.connect(str(cache.path))
+
+        with patch("src.memory.classifier.cache.time.time", return_value=1060.0):
+            assert cache.get("k") is not None
+        assert not cache._conn.in_transaction
+        assert conn.execute("SELECT accessed_at FROM classifications").fetchone() == (
+            1000.0,
+        )
+
+        cache.flush()
+
+        assert conn.execute("SELECT accessed_at FROM classifications").fetchone() == (
+            1060.0,
+        )
+        conn.close()
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "classification_cache.db"
+        first = ClassificationCache(path)
+        first.put("k", {"a": 1})
+        first.close()
+
+        assert ClassificationCache(path).get("k") == {"a": 1}
+
+    def test_unusable_database_fails_open(self, tmp_path):
+        path = tmp_path / "classification_cache.db"
+        path.write_bytes(b"not a sqlite database" * 100)
+        cache = ClassificationCache(path)
+
+        cache.put("k", {"a": 1})
+
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_miss(self, cache):
+        cache.put("k", {"a": 1})
+        conn = sqlite3.connect(str(cache.path))
+        conn.execute("UPDATE classifications SET result = 'garbage'")
+        conn.commit()
+        conn.close()
+
+        assert cache.get("k") is None
+
+    def test_key_covers_collection_type_and_config(self):
+        base = classification_cache_key("text", "discussions", "user_message", "c1")
+
+        assert base == classification_cache_key(
+            "text", "discussions", "user_message", "c1"
+        )
+        assert base != classification_cache_key(
+            "text", "discussions", "agent_response", "c1"
+        )
+        assert base != classification_cache_key(
+            "text", "conventions", "user_message", "c1"
+        )
+        assert base != classification_cache_key(
+            "text", "discussions", "user_message", "c2"
+        )
+
+
+class TestClassifyWithCache:
+    """classify() serves repeats from the cache without calling providers."""
+
+    @pytest.fixture(autouse=True)
+    def use_cache(self, cache):
+        with patch(
+            "src.memory.classifier.llm_classifier.get_classification_cache",
+            return_value=cache,
+        ):
+            yield
+
+    @patch("src.memory.classifier.llm_classifier._get_provider_chain")
+    def test_repeat_skips_provider_chain(self, mock_get_chain, cache):
+        provider = _provider()
+        mock_get_chain.return_value = [provider]
+
+        first = classify(CONTENT, "discussions", "user_message")
+        second = classify(CONTENT, "discussions", "user_message")
+
+        assert provider.classify.call_count == 1
+        assert second.classified_type == first.classified_type == "decision"
+        assert second.provider_used == "test-provider"
+        assert second.model_name == "test-model"
+        assert second.was_reclassified is True
+        assert second.input_tokens == second.output_tokens == 0
+        assert cache.hits == 1
+
+    @patch("src.memory.classifier.llm_classifier._get_provider_chain")
+    def test_low_confidence_result_not_cached(self, mock_get_chain, cache):
+        provider = _provider(confidence=0.5)
+        mock_get_chain.return_value = [provider]
+
+        classify(CONTENT, "discussions", "user_message")
+        classify(CONTENT, "discussions", "user_message")
+
+        assert provider.classify.call_count == 2
+        assert len(cache) == 0
+
+    @patch("src.memory.classifier.llm_classifier._get_provider_chain")
+    def test_config_change_invalidates_entries(self, mock_get_chain):
+        provider = _provider()
+        mock_get_chain.return_value = [provider]
+
+        classify(CONTENT, "discussions", "user_message")
+        with patch(
+            "src.memory.classifier.llm_classifier.OLLAMA_MODEL", "another-model"
+        ):
+            classify(CONTENT, "discussions", "user_message")
+
+        assert provider.classify.call_count == 2
+
+    def test_config_hash_tracks_prompt(self):
+        before = _get_cache_config_hash()
+        with patch(
+            "src.memory.classifier.llm_classifier.CLASSIFICATION_PROMPT", "new prompt"
+        ):
+            assert _get_cache_config_hash() != before
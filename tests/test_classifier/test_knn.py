@@ -0,0 +1,196 @@
+"""Tests for the embedding-space kNN pre-classifier.
+
+TECH-DEBT-069: LLM-based memory classification system tests.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from src.memory.classifier.knn import (
+    KnnVote,
+    Neighbor,
+    classify_by_neighbors,
+    evaluate_thresholds,
+    find_labelled_neighbors,
+    weighted_vote,
+)
+from src.memory.classifier.llm_classifier import classify
+
+CONTENT = "Maybe we should consider using Redis for the session store"
+
+
+@pytest.fixture
+def client():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        "discussions",
+        vectors_config=models.VectorParams(size=3, distance=models.Distance.COSINE),
+    )
+
+    def point(point_id, vector, **payload):
+        return models.PointStruct(id=point_id, vector=vector, payload=payload)
+
+    client.upsert(
+        "discussions",
+        points=[
+            point(1, [1.0, 0.0, 0.0], type="user_message"),  # being classified
+            point(
+                2,
+                [1.0, 0.05, 0.0],
+                type="decision",
+                classification_confidence=0.9,
+                classification_provider="ollama",
+            ),
+            point(
+                3,
+                [1.0, 0.1, 0.0],
+                type="decision",
+                classification_confidence=0.95,
+                classification_provider="rule-based",
+            ),
+            point(
+                4,
+                [1.0, 0.0, 0.05],
+                type="blocker",
+                classification_confidence=0.9,
+                classification_provider="knn",
+            ),
+            point(
+                5,
+                [1.0, 0.0, 0.1],
+                type="blocker",
+                classification_confidence=0.5,
+                classification_provider="claude",
+            ),
+            point(6, [1.0, 0.1, 0.1], type="preference"),  # never classified
+        ],
+    )
+    return client
+
+
+class TestWeightedVote:
+    """Pure voting logic."""
+
+    def test_unanimous_neighbourhood(self):
+        vote = weighted_vote(
+            [Neighbor("decision", 0.95, 0.9)] * 3, "discussions", min_votes=3
+        )
+
+        assert vote == KnnVote("decision", 1.0, 3)
+
+    def test_weighted_by_similarity_and_confidence(self):
+        vote = weighted_vote(
+            [
+                Neighbor("decision", 0.9, 1.0),
+                Neighbor("decision", 0.9, 1.0),
+                Neighbor("blocker", 0.9, 0.9),
+            ],
+            "discussions",
+            min_similarity=0.5,
+            min_votes=1,
+        )
+
+        assert vote.classified_type == "decision"
+        assert vote.confidence == pytest.approx(1.8 / 2.61)
+
+    def test_dissimilar_and_foreign_types_do_not_vote(self):
+        neighbors = [
+            Neighbor("decision", 0.95, 0.9),
+            Neighbor("blocker", 0.5, 0.9),  # too far
+            Neighbor("rule", 0.95, 0.9),  # conventions type
+        ]
+
+        vote = weighted_vote(neighbors, "discussions", min_similarity=0.8, min_votes=1)
+
+        assert vote == KnnVote("decision", 1.0, 1)
+        assert weighted_vote(neighbors, "discussions", min_votes=2) is None
+
+
+class TestNeighborQuery:
+    """Neighbour lookup against a local Qdrant collection."""
+
+    def test_only_independent_confident_labels(self, client):
+        neighbors = find_labelled_neighbors(client, "discussions", 1, limit=10)
+
+        assert [n.classified_type for n in neighbors] == ["decision", "decision"]
+        assert neighbors[0].similarity > neighbors[1].similarity
+        assert neighbors[0].confidence == 0.9
+
+    def test_vote_from_stored_vector(self, client):
+        vote = weighted_vote(
+            find_labelled_neighbors(client, "discussions", 1),
+            "discussions",
+            min_similarity=0.9,
+            min_votes=2,
+        )
+
+        assert vote == KnnVote("decision", 1.0, 2)
+
+    def test_query_failure_returns_none(self):
+        failing = Mock()
+        failing.query_points.side_effect = ConnectionError("qdrant down")
+
+        assert classify_by_neighbors("p1", "discussions", client=failing) is None
+
+
+class TestClassifyWithKnn:
+    """The kNN tier sits between rules and the LLM provider chain."""
+
+    @patch("src.memory.classifier.llm_classifier._get_provider_chain")
+    @patch("src.memory.classifier.llm_classifier.classify_by_neighbors")
+    def test_confident_vote_skips_llm(self, mock_knn, mock_get_chain):
+        mock_knn.return_value = KnnVote("decision", 0.92, 5)
+
+        result = classify(CONTENT, "discussions", "user_message", point_id="p1")
+
+        assert result.provider_used == "knn"
+        assert result.classified_type == "decision"
+        assert result.was_reclassified is True
+        mock_knn.assert_called_once_with("p1", "discussions")
+        mock_get_chain.assert_not_called()
+
+    @patch("src.memory.classifier.llm_classifier._get_provider_chain")
+    @patch("src.memory.classifier.llm_classifier.classify_by_neighbors")
+    def test_inconclusive_vote_falls_through(self, mock_knn, mock_get_chain):
+        mock_knn.return_value = None
+        mock_get_chain.return_value = []
+
+        result = classify(CONTENT, "discussions", "user_message", point_id="p1")
+
+        assert result.provider_used == "none"
+        mock_get_chain.assert_called_once()
+
+    @patch("src.memory.classifier.llm_classifier.classify_by_neighbors")
+    def test_no_point_id_or_disabled_skips_knn(self, mock_knn):
+        with patch(
+            "src.memory.classifier.llm_classifier._get_provider_chain",
+            return_value=[],
+        ):
+            classify(CONTENT, "discussions", "user_message")
+            with patch("src.memory.classifier.llm_classifier.KNN_ENABLED", False):
+                classify(CONTENT, "discussions", "user_message", point_id="p1")
+
+        mock_knn.assert_not_called()
+
+
+def test_evaluate_thresholds():
+    samples = [
+        ("decision", KnnVote("decision", 0.95, 5)),
+        ("blocker", KnnVote("decision", 0.7, 5)),
+        ("decision", KnnVote("decision", 0.7, 4)),
+        ("preference", None),
+    ]
+
+    low, high = evaluate_thresholds(samples, [0.6, 0.9])
+
+    assert low == {
+        "threshold": 0.6,
+        "coverage": 0.75,
+        "accuracy": pytest.approx(2 / 3),
+        "accepted": 3,
+        "correct": 2,
+    }
+    assert high["coverage"] == 0.25
+    assert high["accuracy"] == 1.0
@@ -97,11 +97,11 @@ class TestIsDuplicate:
         content = "def test(): return True"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Mock scroll to return existing hash match
             mock_client.scroll.return_value = (
@@ -122,24 +122,26 @@ class TestIsDuplicate:
         group_id = "test-project"
 
         with (
-            patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class,
-            patch("src.memory.deduplication.EmbeddingClient") as mock_embed_class,
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Mock embedding client
-            mock_embed = MagicMock()
-            mock_embed_class.return_value.__enter__.return_value = mock_embed
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
             mock_embed.embed.return_value = [[0.1] * 768]  # Dummy embedding
 
             # Mock scroll to return no hash matches
             mock_client.scroll.return_value = ([], None)
 
-            # Mock search to return no semantic matches
-            mock_client.search.return_value = []
+            # Mock query_points to return no semantic matches
+            mock_client.query_points.return_value = MagicMock(points=[])
 
             result = await is_duplicate(content, group_id)
 
@@ -147,33 +149,121 @@ class TestIsDuplicate:
             assert result.reason is None
             assert result.existing_id is None
 
+    async def test_unique_result_carries_embedding(self):
+        """Embed-once: the dedup vector is returned for reuse at upsert."""
+        with (
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.scroll.return_value = ([], None)
+            mock_client.query_points.return_value = MagicMock(points=[])
+
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
+            mock_embed.embed.return_value = [[0.2] * 768]
+
+            result = await is_duplicate(
+                "def unique_function(): pass",
+                "test-project",
+                collection="code-patterns",
+            )
+
+            assert result.embedding == [0.2] * 768
+            mock_embed.embed.assert_awaited_once_with(
+                ["def unique_function(): pass"], model="code", project="test-project"
+            )
+
+    async def test_precomputed_embedding_skips_embed_call(self):
+        """Embed-once: a caller-supplied vector is used as-is."""
+        vector = [0.3] * 768
+
+        with (
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.scroll.return_value = ([], None)
+            mock_client.query_points.return_value = MagicMock(points=[])
+
+            result = await is_duplicate(
+                "some new content", "test-project", embedding=vector
+            )
+
+            mock_embed_class.return_value.embed.assert_not_called()
+            assert mock_client.query_points.call_args.kwargs["query"] == vector
+            assert result.embedding == vector
+
+    async def test_content_type_routes_embedding_model(self):
+        """Dedup embeds with the model storage will use for the content type."""
+        with (
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.scroll.return_value = ([], None)
+            mock_client.query_points.return_value = MagicMock(points=[])
+
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
+            mock_embed.embed.return_value = [[0.4] * 768]
+
+            result = await is_duplicate(
+                "def blob(): pass",
+                "test-project",
+                collection="discussions",
+                content_type="github_code_blob",
+            )
+
+            mock_embed.embed.assert_awaited_once_with(
+                ["def blob(): pass"], model="code", project="test-project"
+            )
+            assert result.embedding_model == "code"
+
     async def test_semantic_similarity_duplicate(self):
         """AC 2.2.1: Semantic similarity check detects near-duplicates."""
         content = "def hello(): return 'world'"
         group_id = "test-project"
 
         with (
-            patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class,
-            patch("src.memory.deduplication.EmbeddingClient") as mock_embed_class,
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
         ):
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Mock embedding client
-            mock_embed = MagicMock()
-            mock_embed_class.return_value.__enter__.return_value = mock_embed
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
             mock_embed.embed.return_value = [[0.1] * 768]  # Dummy embedding
 
             # Mock scroll to return no hash matches
             mock_client.scroll.return_value = ([], None)
 
-            # Mock search to return high similarity match (>0.95)
+            # Mock query_points to return high similarity match (>0.95)
             mock_result = MagicMock()
             mock_result.id = "semantic-match-id"
             mock_result.score = 0.97
-            mock_client.search.return_value = [mock_result]
+            mock_client.query_points.return_value = MagicMock(points=[mock_result])
 
             result = await is_duplicate(content, group_id)
 
@@ -191,8 +281,12 @@ class TestIsDuplicate:
         reset_config()
 
         with (
-            patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class,
-            patch("src.memory.deduplication.EmbeddingClient") as mock_embed_class,
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
             patch.dict(os.environ, {"DEDUP_THRESHOLD": "0.90"}),
         ):
             # Reset again after env patch to reload with new value
@@ -200,12 +294,10 @@ class TestIsDuplicate:
 
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Mock embedding client
-            mock_embed = MagicMock()
-            mock_embed_class.return_value.__enter__.return_value = mock_embed
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
             mock_embed.embed.return_value = [[0.1] * 768]
 
             # No hash match
@@ -215,7 +307,7 @@ class TestIsDuplicate:
             mock_result = MagicMock()
             mock_result.id = "similar-id"
             mock_result.score = 0.92
-            mock_client.search.return_value = [mock_result]
+            mock_client.query_points.return_value = MagicMock(points=[mock_result])
 
             result = await is_duplicate(content, group_id)
 
@@ -239,8 +331,12 @@ class TestIsDuplicate:
         reset_config()
 
         with (
-            patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class,
-            patch("src.memory.deduplication.EmbeddingClient") as mock_embed_class,
+            patch(
+                "src.memory.deduplication.get_async_qdrant_client"
+            ) as mock_client_class,
+            patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class,
             patch.dict(os.environ, {"DEDUP_THRESHOLD": "0.95"}),
         ):
             # Reset again after env patch to reload with new value
@@ -248,12 +344,10 @@ class TestIsDuplicate:
 
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Mock embedding client
-            mock_embed = MagicMock()
-            mock_embed_class.return_value.__enter__.return_value = mock_embed
+            mock_embed = AsyncMock()
+            mock_embed_class.return_value = mock_embed
             mock_embed.embed.return_value = [[0.1] * 768]
 
             # No hash match
@@ -262,7 +356,7 @@ class TestIsDuplicate:
             # Qdrant filters by score_threshold server-side:
             # When threshold=0.95 and only 0.92 similarity exists,
             # Qdrant returns EMPTY results (filtered out)
-            mock_client.search.return_value = []
+            mock_client.query_points.return_value = MagicMock(points=[])
 
             result = await is_duplicate(content, group_id)
 
@@ -291,11 +385,11 @@ class TestIsDuplicate:
         content = "test content that should check"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Simulate Qdrant connection failure
             mock_client.scroll.side_effect = ConnectionRefusedError(
@@ -312,11 +406,11 @@ class TestIsDuplicate:
         content = "test content"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Simulate Qdrant API error
             mock_client.scroll.side_effect = ResponseHandlingException("API error")
@@ -331,11 +425,11 @@ class TestIsDuplicate:
         content = "test content"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Simulate malformed response (UnexpectedResponse requires status_code, reason_phrase, content, headers)
             mock_client.scroll.side_effect = UnexpectedResponse(
@@ -355,19 +449,21 @@ class TestIsDuplicate:
         content = "test content"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # No hash match
             mock_client.scroll.return_value = ([], None)
 
             # Simulate embedding failure - NESTED inside Qdrant patch
-            with patch("src.memory.deduplication.EmbeddingClient") as mock_embed_class:
-                mock_embed = MagicMock()
-                mock_embed_class.return_value.__enter__.return_value = mock_embed
+            with patch(
+                "src.memory.deduplication.get_async_embedding_client"
+            ) as mock_embed_class:
+                mock_embed = AsyncMock()
+                mock_embed_class.return_value = mock_embed
                 mock_embed.embed.side_effect = Exception("Service unavailable")
 
                 result = await is_duplicate(content, group_id)
@@ -381,11 +477,11 @@ class TestIsDuplicate:
         content = "test content"
         group_id = "test-project"
 
-        with patch("src.memory.deduplication.AsyncQdrantClient") as mock_client_class:
+        with patch(
+            "src.memory.deduplication.get_async_qdrant_client"
+        ) as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
-            # Mock close() for new manual client lifecycle
-            mock_client.close = AsyncMock()
 
             # Simulate unexpected exception
             mock_client.scroll.side_effect = RuntimeError("Unexpected error")
@@ -27,6 +27,7 @@ def test_search_adds_collection_attribution():
         mock_cfg.hnsw_ef_fast = 64
         mock_cfg.hnsw_ef_accurate = 128
         mock_cfg.decay_enabled = False
+        mock_cfg.conventions_snapshot_enabled = False
         mock_get_config.return_value = mock_cfg
 
         mock_client = Mock()
@@ -77,6 +78,7 @@ def test_implementations_filtered_by_group_id():
         mock_cfg.hnsw_ef_fast = 64
         mock_cfg.hnsw_ef_accurate = 128
         mock_cfg.decay_enabled = False
+        mock_cfg.conventions_snapshot_enabled = False
         mock_get_config.return_value = mock_cfg
 
         mock_client = Mock()
@@ -119,6 +121,7 @@ def test_best_practices_no_group_id_filter():
         mock_cfg.hnsw_ef_fast = 64
         mock_cfg.hnsw_ef_accurate = 128
         mock_cfg.decay_enabled = False
+        mock_cfg.conventions_snapshot_enabled = False
         mock_get_config.return_value = mock_cfg
 
         mock_client = Mock()
@@ -208,6 +211,7 @@ def test_dual_collection_search_logic_runs():
         mock_cfg.hnsw_ef_fast = 64
         mock_cfg.hnsw_ef_accurate = 128
         mock_cfg.decay_enabled = False
+        mock_cfg.conventions_snapshot_enabled = False
         mock_get_config.return_value = mock_cfg
 
         mock_client = Mock()
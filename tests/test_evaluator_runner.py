@@ -1229,3 +1229,232 @@ class TestCategoricalValidation:
 
         assert result["scored"] == 1
         mock_langfuse.create_score.assert_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: single-pass fetch shared by all evaluators
+# ---------------------------------------------------------------------------
+
+
+def _write_evaluator(runner, filename: str, ev_yaml: dict) -> None:
+    import yaml
+
+    runner.evaluators_dir.mkdir(parents=True, exist_ok=True)
+    ev_yaml.setdefault("prompt_file", "prompt.md")
+    (runner.evaluators_dir / "prompt.md").write_text("Evaluate this.")
+    (runner.evaluators_dir / filename).write_text(yaml.dump(ev_yaml))
+
+
+class TestSinglePassFetch:
+    def test_trace_evaluators_share_one_trace_list_pass(self, runner):
+        """Two trace evaluators must not download the window twice."""
+        for ev_id, name in (("EV-05", "bootstrap_quality"), ("EV-06", "coherence")):
+            _write_evaluator(
+                runner,
+                f"{ev_id}.yaml",
+                {"id": ev_id, "name": name, "target": "trace", "sampling_rate": 1.0},
+            )
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.trace.list.return_value = make_paginated_response(
+            [make_mock_trace(trace_id="t1"), make_mock_trace(trace_id="t2")]
+        )
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.return_value = {"score": 0.8, "reasoning": ""}
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            result = runner.run(since=datetime(2026, 3, 12, tzinfo=timezone.utc))
+
+        assert mock_langfuse.api.trace.list.call_count == 1
+        assert result["fetched"] == 2
+        assert result["scored"] == 4
+        names = {c.kwargs["name"] for c in mock_langfuse.create_score.call_args_list}
+        assert names == {"bootstrap_quality", "coherence"}
+
+    def test_shared_event_type_fetched_once(self, runner):
+        """An event_type listed by two evaluators is fetched once for both."""
+        _write_evaluator(
+            runner,
+            "ev01.yaml",
+            {
+                "id": "EV-01",
+                "name": "retrieval_relevance",
+                "target": "observation",
+                "filter": {"event_types": ["search_query", "context_retrieval"]},
+            },
+        )
+        _write_evaluator(
+            runner,
+            "ev02.yaml",
+            {
+                "id": "EV-02",
+                "name": "injection_value",
+                "target": "observation",
+                "filter": {"event_types": ["context_retrieval"]},
+            },
+        )
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.observations.get_many.side_effect = lambda **kw: (
+            make_observation_response(
+                [make_mock_observation(obs_id=f"obs-{kw['name']}", name=kw["name"])]
+            )
+        )
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.return_value = {"score": 0.8, "reasoning": ""}
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            result = runner.run(since=datetime(2026, 3, 12, tzinfo=timezone.utc))
+
+        fetched_names = [
+            c.kwargs["name"]
+            for c in mock_langfuse.api.observations.get_many.call_args_list
+        ]
+        assert sorted(fetched_names) == ["context_retrieval", "search_query"]
+        scored = {
+            (c.kwargs["name"], c.kwargs["observation_id"])
+            for c in mock_langfuse.create_score.call_args_list
+        }
+        assert scored == {
+            ("retrieval_relevance", "obs-search_query"),
+            ("retrieval_relevance", "obs-context_retrieval"),
+            ("injection_value", "obs-context_retrieval"),
+        }
+        assert result["fetched"] == 2
+
+    def test_evaluator_without_event_types_triggers_single_unfiltered_pass(
+        self, runner
+    ):
+        """An unfiltered evaluator means one unfiltered fetch, routed by name."""
+        _write_evaluator(
+            runner,
+            "ev01.yaml",
+            {
+                "id": "EV-01",
+                "name": "retrieval_relevance",
+                "target": "observation",
+                "filter": {"event_types": ["search_query"]},
+            },
+        )
+        _write_evaluator(
+            runner,
+            "ev03.yaml",
+            {"id": "EV-03", "name": "capture_completeness", "target": "observation"},
+        )
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.observations.get_many.return_value = (
+            make_observation_response(
+                [
+                    make_mock_observation(obs_id="o-search", name="search_query"),
+                    make_mock_observation(obs_id="o-store", name="memory_store"),
+                ]
+            )
+        )
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.return_value = {"score": 0.8, "reasoning": ""}
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            runner.run(since=datetime(2026, 3, 12, tzinfo=timezone.utc))
+
+        assert mock_langfuse.api.observations.get_many.call_count == 1
+        assert mock_langfuse.api.observations.get_many.call_args.kwargs["name"] is None
+        scored = {
+            (c.kwargs["name"], c.kwargs["observation_id"])
+            for c in mock_langfuse.create_score.call_args_list
+        }
+        assert scored == {
+            ("retrieval_relevance", "o-search"),
+            ("capture_completeness", "o-search"),
+            ("capture_completeness", "o-store"),
+        }
+
+
+class TestAlreadyScored:
+    def test_existing_score_skips_judge_call(self, runner, evaluator_yaml):
+        """Items whose deterministic score_id exists must not reach the judge."""
+        since = datetime(2026, 3, 12, tzinfo=timezone.utc)
+        done = make_mock_trace(trace_id="trace_done", tags=["retrieval"])
+        new = make_mock_trace(trace_id="trace_new", tags=["retrieval"])
+        done_id = runner._make_score_id("trace_done", "retrieval_relevance", since)
+
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.trace.list.return_value = make_paginated_response([done, new])
+        existing = MagicMock()
+        existing.id = done_id
+        mock_langfuse.api.score_v_2.get.return_value.data = [existing]
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.return_value = {"score": 0.8, "reasoning": ""}
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            result = runner.run(since=since)
+
+        assert mock_evaluator_config.evaluate.call_count == 1
+        assert result["scored"] == 1
+        assert mock_langfuse.create_score.call_args.kwargs["trace_id"] == "trace_new"
+        lookup = mock_langfuse.api.score_v_2.get.call_args.kwargs["score_ids"]
+        assert done_id in lookup.split(",")
+
+    def test_lookup_failure_evaluates_anyway(self, runner, evaluator_yaml):
+        """A failed score lookup must not block evaluation (fail-open)."""
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.trace.list.return_value = make_paginated_response(
+            [make_mock_trace(tags=["retrieval"])]
+        )
+        mock_langfuse.api.score_v_2.get.side_effect = RuntimeError("503")
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.return_value = {"score": 0.8, "reasoning": ""}
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            result = runner.run(since=datetime(2026, 3, 12, tzinfo=timezone.utc))
+
+        assert result["scored"] == 1
+
+
+class TestJudgeConcurrency:
+    def test_judge_calls_overlap(self, runner, evaluator_yaml):
+        """Judge calls for one page run concurrently, bounded by judge_concurrency."""
+        import threading
+        import time
+
+        runner.judge_concurrency = 2
+        active = peak = 0
+        lock = threading.Lock()
+
+        def slow_evaluate(prompt):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return {"score": 0.8, "reasoning": ""}
+
+        mock_langfuse = MagicMock()
+        mock_langfuse.api.trace.list.return_value = make_paginated_response(
+            [make_mock_trace(trace_id=f"t{i}", tags=["retrieval"]) for i in range(6)]
+        )
+        mock_evaluator_config = MagicMock()
+        mock_evaluator_config.evaluate.side_effect = slow_evaluate
+
+        with (
+            patch("memory.evaluator.runner.get_client", return_value=mock_langfuse),
+            patch.object(runner, "evaluator_config", mock_evaluator_config),
+        ):
+            result = runner.run(since=datetime(2026, 3, 12, tzinfo=timezone.utc))
+
+        assert peak == 2
+        assert result["scored"] == 6
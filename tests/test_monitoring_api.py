@@ -4,6 +4,7 @@ Tests verify that:
 - sanitize_log_input() strips log injection payloads (newlines, etc.)
 - memory_id and collection path params are sanitized before logging
 - API endpoint responses are unchanged for valid inputs
+- /search delegates to AsyncMemorySearch with projection and pagination
 
 NOTE: monitoring/main.py requires FastAPI/Qdrant deps that live only in the
 monitoring Docker container. We mock those heavy deps at the sys.modules level
@@ -220,3 +221,80 @@ class TestCallSiteSanitization:
             assert (
                 "sanitize_log_input" in context
             ), f"Unsanitized collection_name found at log call site: ...{context}..."
+
+
+class TestSearchEndpoint:
+    """/search runs AsyncMemorySearch and shapes pages of {id, score, payload}."""
+
+    def _request(self, **overrides):
+        fields = {
+            "query": "retry with backoff",
+            "collection": "code-patterns",
+            "limit": 2,
+            "offset": 0,
+            "group_id": "proj-a",
+            "memory_type": None,
+            "score_threshold": None,
+            "fast_mode": True,
+            "fields": None,
+        }
+        fields.update(overrides)
+        return MagicMock(**fields)
+
+    def _run(self, monkeypatch, request, search):
+        import asyncio
+
+        monkeypatch.setattr(_monitoring_main, "get_memory_search", lambda: search)
+        monkeypatch.setattr(_monitoring_main, "SearchResponse", lambda **kw: kw)
+        return asyncio.run(_monitoring_main.search_memories(request))
+
+    def test_full_page_returns_next_offset(self, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        search = MagicMock()
+        search.search = AsyncMock(
+            return_value=[
+                {
+                    "id": n,
+                    "score": 0.9,
+                    "content": f"memory {n}",
+                    "type": "unknown",
+                    "freshness_status": "unknown",
+                    "collection": "code-patterns",
+                    "attribution": "[unknown|code-patterns|90%]",
+                    "search_mode": "dense",
+                    "payload": {"content": f"memory {n}"},
+                }
+                for n in range(2)
+            ]
+        )
+
+        response = self._run(
+            monkeypatch, self._request(offset=4, fields=["content"]), search
+        )
+
+        assert response["status"] == "success"
+        assert response["next_offset"] == 6
+        assert response["search_mode"] == "dense"
+        assert response["results"][0] == {
+            "id": 0,
+            "score": 0.9,
+            "payload": {"content": "memory 0"},
+        }
+        kwargs = search.search.call_args.kwargs
+        assert kwargs["group_id"] == "proj-a"
+        assert kwargs["offset"] == 4
+        assert kwargs["with_payload"] == ["content"]
+        assert kwargs["track_access"] is False
+        assert kwargs["raw_payload"] is True
+
+    def test_search_failure_returns_error_status(self, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        search = MagicMock()
+        search.search = AsyncMock(side_effect=RuntimeError("embedding down"))
+
+        response = self._run(monkeypatch, self._request(), search)
+
+        assert response["status"] == "error"
+        assert "embedding down" in response["error"]
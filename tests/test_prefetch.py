@@ -0,0 +1,181 @@
+"""Unit tests for predictive file prefetch (memory.prefetch)."""
+
+import shutil
+import time
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from memory.config import MemoryConfig
+from memory.prefetch import (
+    PrefetchStore,
+    build_file_query,
+    get_prefetched,
+    prefetch_file_memories,
+    related_files,
+    schedule_prefetch,
+)
+from memory.triggers import detect_read_context, retrieve_first_edit_context
+
+
+@pytest.fixture
+def session_id():
+    sid = f"test-{uuid.uuid4().hex[:12]}"
+    yield sid
+    shutil.rmtree(PrefetchStore(sid).store_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "config.py").write_text("X = 1\n")
+    (pkg / "helpers.py").write_text("def f(): pass\n")
+    (pkg / "unrelated.py").write_text("")
+    (pkg / "main.py").write_text(
+        "import os\n"
+        "import json\n"
+        "from pkg.config import X\n"
+        "from .helpers import f\n"
+        "from . import unrelated\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def config():
+    return MemoryConfig(file_prefetch_enabled=True, file_prefetch_max_related=2)
+
+
+class TestRelatedFiles:
+    def test_local_imports_resolved_before_siblings(self, project):
+        main = project / "src" / "pkg" / "main.py"
+
+        related = related_files(str(main), cwd=str(project), max_related=3)
+
+        assert related == [
+            str(project / "src" / "pkg" / "config.py"),
+            str(project / "src" / "pkg" / "helpers.py"),
+            str(project / "src" / "pkg" / "unrelated.py"),
+        ]
+
+    def test_siblings_fill_remaining_slots(self, project):
+        config_py = project / "src" / "pkg" / "config.py"
+
+        related = related_files(str(config_py), cwd=str(project), max_related=2)
+
+        assert len(related) == 2
+        assert str(config_py) not in related
+        assert all(p.endswith(".py") and "__init__" not in p for p in related)
+
+    def test_zero_max_related(self, project):
+        assert (
+            related_files(str(project / "src" / "pkg" / "main.py"), max_related=0) == []
+        )
+
+
+class TestPrefetchStore:
+    def test_put_get_roundtrip(self, session_id):
+        store = PrefetchStore(session_id)
+        store.put("/repo/a.py", "q", [{"id": "1", "content": "x"}])
+
+        assert store.get("/repo/a.py") == [{"id": "1", "content": "x"}]
+        assert store.get("/repo/b.py") is None
+
+    def test_expired_entry_is_miss(self, session_id):
+        store = PrefetchStore(session_id, ttl_seconds=30)
+        store.put("/repo/a.py", "q", [])
+        store.ttl_seconds = 0
+        time.sleep(0.01)
+
+        assert store.get("/repo/a.py") is None
+
+
+class TestPrefetchFileMemories:
+    def test_prefetches_file_and_related(self, project, session_id, config):
+        main = project / "src" / "pkg" / "main.py"
+        search = Mock()
+        search.search.side_effect = lambda **kw: [{"id": kw["query"], "score": 0.9}]
+
+        count = prefetch_file_memories(
+            session_id, str(main), cwd=str(project), config=config, search=search
+        )
+
+        assert count == 3
+        assert get_prefetched(session_id, str(main), config) == [
+            {"id": build_file_query(str(main)), "score": 0.9}
+        ]
+        assert get_prefetched(session_id, str(project / "src/pkg/config.py"), config)
+
+    def test_fresh_entries_not_refetched(self, project, session_id, config):
+        main = project / "src" / "pkg" / "main.py"
+        search = Mock()
+        search.search.return_value = []
+
+        prefetch_file_memories(session_id, str(main), str(project), config, search)
+        search.search.reset_mock()
+        count = prefetch_file_memories(
+            session_id, str(main), str(project), config, search
+        )
+
+        assert count == 0
+        search.search.assert_not_called()
+
+    def test_search_failure_is_swallowed(self, project, session_id, config):
+        search = Mock()
+        search.search.side_effect = ConnectionError("qdrant down")
+
+        count = prefetch_file_memories(
+            session_id, str(project / "src/pkg/main.py"), str(project), config, search
+        )
+
+        assert count == 0
+
+
+class TestDisabled:
+    def test_disabled_is_noop(self, project, session_id):
+        config = MemoryConfig(file_prefetch_enabled=False)
+        main = str(project / "src" / "pkg" / "main.py")
+
+        assert schedule_prefetch(session_id, main, config=config) is False
+        assert get_prefetched(session_id, main, config) is None
+
+
+class TestTriggerWiring:
+    def test_read_context_schedules_prefetch(self, project, session_id):
+        main = str(project / "src" / "pkg" / "main.py")
+
+        with patch("memory.prefetch.schedule_prefetch") as schedule:
+            context = detect_read_context(
+                main, "Read", session_id=session_id, cwd=str(project)
+            )
+
+        assert context["should_trigger"] is True
+        schedule.assert_called_once_with(session_id, main, cwd=str(project))
+
+    def test_first_edit_served_from_prefetch(self, project, session_id, config):
+        main = str(project / "src" / "pkg" / "main.py")
+        search = Mock()
+        search.search.side_effect = lambda **kw: [{"id": kw["query"], "score": 0.9}]
+        prefetch_file_memories(session_id, main, str(project), config, search)
+        search.search.reset_mock()
+
+        with patch("memory.prefetch.get_config", return_value=config):
+            results = retrieve_first_edit_context(
+                main, session_id, cwd=str(project), search=search
+            )
+
+        assert results == [{"id": build_file_query(main), "score": 0.9}]
+        search.search.assert_not_called()
+
+    def test_first_edit_miss_runs_the_prefetch_query(self, project, session_id, config):
+        main = str(project / "src" / "pkg" / "main.py")
+        search = Mock()
+        search.search.return_value = []
+
+        with patch("memory.prefetch.get_config", return_value=config):
+            retrieve_first_edit_context(main, session_id, search=search)
+
+        assert search.search.call_args.kwargs["query"] == build_file_query(main)
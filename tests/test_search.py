@@ -25,6 +25,7 @@ def mock_config(monkeypatch):
     mock_cfg.hnsw_ef_fast = 64  # TECH-DEBT-066
     mock_cfg.hnsw_ef_accurate = 128  # TECH-DEBT-066
     mock_cfg.decay_enabled = False  # SPEC-001: disable decay for mock-based tests
+    mock_cfg.conventions_snapshot_enabled = False
     monkeypatch.setattr("src.memory.search.get_config", lambda: mock_cfg)
     return mock_cfg
 
@@ -735,6 +736,7 @@ class TestDecayPath:
         mock_cfg.hnsw_ef_fast = 64
         mock_cfg.hnsw_ef_accurate = 128
         mock_cfg.decay_enabled = True
+        mock_cfg.conventions_snapshot_enabled = False
         mock_cfg.decay_semantic_weight = 0.7
         mock_cfg.get_decay_type_overrides.return_value = {}
         mock_cfg.decay_half_life_code_patterns = 14.0
@@ -6,6 +6,8 @@ Tests:
 - get_unique_field_values() returns unique projects
 - calculate_disk_size() calculates correctly from segments
 - get_last_updated() returns latest timestamp
+- get_field_counts() via facet API and paged scroll fallback
+- get_collection_stats() cache reuse and write-generation invalidation
 - Edge cases: empty collections, zero projects, missing fields
 
 Complies with:
@@ -16,15 +18,49 @@ Complies with:
 
 from unittest.mock import Mock
 
+import pytest
+from qdrant_client import QdrantClient, models
+
 from memory.stats import (
     CollectionStats,
     calculate_disk_size,
     get_collection_stats,
+    get_field_counts,
     get_last_updated,
     get_unique_field_values,
 )
 
 
+@pytest.fixture
+def local_client():
+    """In-memory Qdrant with 2 000 points across three projects."""
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        "code-patterns",
+        vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE),
+    )
+    client.upsert(
+        "code-patterns",
+        points=[
+            models.PointStruct(
+                id=i,
+                vector=[1.0, 0.0],
+                payload={"group_id": f"proj-{i % 3}", "type": "implementation"},
+            )
+            for i in range(2000)
+        ],
+    )
+    return client
+
+
+def _info(points_count):
+    info = Mock()
+    info.points_count = points_count
+    info.indexed_vectors_count = points_count
+    info.segments_count = 1
+    return info
+
+
 class TestCollectionStatsDataclass:
     """Test CollectionStats dataclass initialization."""
 
@@ -238,3 +274,72 @@ class TestGetLastUpdated:
         last_updated = get_last_updated(mock_client, "code-patterns")
 
         assert last_updated is None
+
+
+class TestGetFieldCounts:
+    """Test get_field_counts() facet and scroll paths."""
+
+    def test_facet_counts_every_point(self, local_client):
+        """Facet counts are exact, not capped at one scroll page."""
+        counts = get_field_counts(local_client, "code-patterns", "group_id")
+
+        assert counts == {"proj-0": 667, "proj-1": 667, "proj-2": 666}
+        assert get_field_counts(
+            local_client, "code-patterns", "type", group_id="proj-2"
+        ) == {"implementation": 666}
+
+    def test_scroll_fallback_pages_through_collection(self):
+        """Without facet support, every scroll page is counted."""
+        mock_client = Mock()
+        mock_client.facet.side_effect = Exception("404 Not Found")
+        mock_client.scroll.side_effect = [
+            ([Mock(payload={"group_id": "proj-a"})] * 2, "next-page"),
+            ([Mock(payload={"group_id": "proj-b"}), Mock(payload={})], None),
+        ]
+
+        counts = get_field_counts(mock_client, "code-patterns", "group_id")
+
+        assert counts == {"proj-a": 2, "proj-b": 1}
+        assert mock_client.scroll.call_args_list[1].kwargs["offset"] == "next-page"
+        assert mock_client.scroll.call_args.kwargs["with_vectors"] is False
+
+
+class TestCollectionStatsCache:
+    """Test get_collection_stats() caching by write generation."""
+
+    def test_facet_stats_without_per_project_counts(self, local_client):
+        """Per-project breakdown comes from one facet request."""
+        stats = get_collection_stats(local_client, "code-patterns")
+
+        assert stats.total_points == 2000
+        assert stats.projects == ["proj-0", "proj-1", "proj-2"]
+        assert sum(stats.points_by_project.values()) == 2000
+
+    def test_unchanged_generation_reuses_counts(self):
+        """Same point count and latest timestamp: no facet request."""
+        mock_client = Mock()
+        mock_client.get_collection.return_value = _info(5)
+        mock_client.scroll.return_value = ([Mock(payload={"timestamp": "t1"})], None)
+        mock_client.facet.return_value = Mock(hits=[Mock(value="proj-a", count=5)])
+
+        first = get_collection_stats(mock_client, "code-patterns")
+        first.points_by_project["proj-a"] = 0  # caller mutation stays local
+        second = get_collection_stats(mock_client, "code-patterns")
+
+        assert mock_client.facet.call_count == 1
+        assert second.points_by_project == {"proj-a": 5}
+
+    def test_write_invalidates_cached_counts(self):
+        """A new point count or latest timestamp recomputes the breakdown."""
+        mock_client = Mock()
+        mock_client.get_collection.return_value = _info(5)
+        mock_client.scroll.return_value = ([Mock(payload={"timestamp": "t1"})], None)
+        mock_client.facet.return_value = Mock(hits=[Mock(value="proj-a", count=5)])
+        get_collection_stats(mock_client, "code-patterns")
+
+        mock_client.scroll.return_value = ([Mock(payload={"timestamp": "t2"})], None)
+        mock_client.facet.return_value = Mock(hits=[Mock(value="proj-a", count=6)])
+        stats = get_collection_stats(mock_client, "code-patterns")
+
+        assert mock_client.facet.call_count == 2
+        assert stats.points_by_project == {"proj-a": 6}
@@ -4,14 +4,14 @@ Tests MemoryStorage with mocked dependencies (Qdrant, embedding service).
 Implements Story 1.5 Task 5.
 """
 
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from src.memory.embeddings import EmbeddingError
 from src.memory.models import MemoryType
 from src.memory.qdrant_client import QdrantUnavailable
-from src.memory.storage import MemoryStorage
+from src.memory.storage import MemoryStorage, store_best_practice
 
 
 @pytest.fixture(autouse=True)
@@ -214,6 +214,32 @@ def test_store_memories_batch(mock_config, mock_qdrant_client, mock_embedding_cl
     mock_qdrant_client.upsert.assert_called_once()
 
 
+def test_store_memories_batch_keeps_extra_fields(
+    mock_config, mock_qdrant_client, mock_embedding_client
+):
+    """Extra fields reach the payload as in store_memory(); reserved keys do not."""
+    memories = [
+        {
+            "content": "def f(): pass",
+            "group_id": "owner/repo",
+            "type": MemoryType.GITHUB_CODE_BLOB.value,
+            "source_hook": "github_code_sync",
+            "session_id": "batch-1",
+            "file_path": "src/f.py",
+            "blob_hash": "abc123",
+            "timestamp": "caller-supplied",
+        }
+    ]
+
+    storage = MemoryStorage()
+    storage.store_memories_batch(memories, collection="github")
+
+    payload = mock_qdrant_client.upsert.call_args.kwargs["points"][0].payload
+    assert payload["file_path"] == "src/f.py"
+    assert payload["blob_hash"] == "abc123"
+    assert payload["timestamp"] != "caller-supplied"
+
+
 def test_store_memories_batch_mixed_content_types(
     mock_config, mock_qdrant_client, mock_embedding_client
 ):
@@ -437,6 +463,107 @@ def test_store_memories_batch_passes_source_type(
     )
 
 
+def test_store_memories_batch_embeds_chunked_memories_once(
+    mock_config, mock_qdrant_client, mock_embedding_client
+):
+    """Chunked types are embedded per chunk only, not whole and then per chunk."""
+    embedded = []
+
+    def embed(texts, model=None):
+        embedded.extend(texts)
+        return [[0.1] * 768 for _ in texts]
+
+    mock_embedding_client.embed.side_effect = embed
+
+    memories = [
+        {
+            "content": f"Comment {i}: the deploy failed after the schema migration",
+            "group_id": "proj",
+            "type": MemoryType.JIRA_COMMENT.value,
+            "source_hook": "jira_sync",
+            "session_id": "sess",
+        }
+        for i in range(3)
+    ]
+
+    storage = MemoryStorage()
+    results = storage.store_memories_batch(
+        memories, collection="jira-data", force_ner=False
+    )
+
+    assert len(results) == 3
+    assert len(embedded) == 3
+
+
+def test_store_memories_batch_chunk_embedding_failure_marks_pending(
+    mock_config, mock_qdrant_client, mock_embedding_client
+):
+    """Chunks that fail to embed are stored as pending, not complete."""
+    mock_embedding_client.embed.side_effect = EmbeddingError("Service down")
+
+    memories = [
+        {
+            "content": "Comment: the deploy failed after the schema migration",
+            "group_id": "proj",
+            "type": MemoryType.JIRA_COMMENT.value,
+            "source_hook": "jira_sync",
+            "session_id": "sess",
+        },
+    ]
+
+    storage = MemoryStorage()
+    results = storage.store_memories_batch(memories, collection="jira-data")
+
+    assert [r["embedding_status"] for r in results] == ["pending"]
+    points = mock_qdrant_client.upsert.call_args[1]["points"]
+    assert all(p.payload["embedding_status"] == "pending" for p in points)
+
+
+def test_store_memories_batch_forwards_force_ner(
+    mock_config, mock_qdrant_client, mock_embedding_client
+):
+    """force_ner=False matches the masking store_memory() applies."""
+    storage = MemoryStorage()
+    mock_scanner = MagicMock()
+    mock_scan_result = MagicMock()
+    mock_scan_result.action.__eq__ = lambda self, other: False
+    mock_scan_result.content = "Batch content"
+    mock_scanner.scan.return_value = mock_scan_result
+    storage._scanner = mock_scanner
+
+    memories = [
+        {
+            "content": "Batch content",
+            "group_id": "proj",
+            "type": MemoryType.IMPLEMENTATION.value,
+            "source_hook": "jira_sync",
+            "session_id": "sess",
+        },
+    ]
+
+    storage.store_memories_batch(memories, force_ner=False)
+
+    mock_scanner.scan.assert_called_once_with(
+        "Batch content", force_ner=False, source_type="user_session"
+    )
+
+
+@pytest.mark.parametrize("snapshot_enabled", [True, False])
+def test_store_best_practice_marks_conventions_snapshot_stale(
+    mock_config, mock_qdrant_client, mock_embedding_client, snapshot_enabled
+):
+    """A stored best practice invalidates the local conventions replica."""
+    mock_config.conventions_snapshot_enabled = snapshot_enabled
+
+    with (
+        patch.object(MemoryStorage, "store_memory", return_value={"status": "stored"}),
+        patch("src.memory.vector_snapshot.mark_snapshot_stale") as mark_stale,
+    ):
+        store_best_practice("Prefer explicit imports", session_id="sess")
+
+    assert mark_stale.called is snapshot_enabled
+
+
 def test_github_content_not_double_blocked(
     mock_config, mock_qdrant_client, mock_embedding_client, tmp_path, monkeypatch
 ):
@@ -629,3 +756,54 @@ class TestMemoryStorageStats:
         result = storage.get_last_updated("code-patterns")
 
         assert result is None
+
+
+class TestUpdatePointPayloadsAsync:
+    """Batched payload write-back for the classification worker."""
+
+    @pytest.mark.asyncio
+    async def test_identical_updates_share_one_operation(
+        self, mock_config, monkeypatch
+    ):
+        from unittest.mock import AsyncMock
+
+        from src.memory.storage import update_point_payloads_async
+
+        client = Mock()
+        client.batch_update_points = AsyncMock()
+        monkeypatch.setattr(
+            "src.memory.storage.get_async_qdrant_client", lambda cfg: client
+        )
+
+        applied = await update_point_payloads_async(
+            "discussions",
+            {
+                "p1": {"type": "decision"},
+                "p2": {"type": "decision"},
+                "p3": {"type": "blocker"},
+            },
+        )
+
+        assert applied is True
+        client.batch_update_points.assert_awaited_once()
+        operations = client.batch_update_points.await_args.kwargs["update_operations"]
+        assert [
+            (op.set_payload.payload, op.set_payload.points) for op in operations
+        ] == [({"type": "decision"}, ["p1", "p2"]), ({"type": "blocker"}, ["p3"])]
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_false(self, mock_config, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        from src.memory.storage import update_point_payloads_async
+
+        client = Mock()
+        client.batch_update_points = AsyncMock(side_effect=ConnectionError("down"))
+        monkeypatch.setattr(
+            "src.memory.storage.get_async_qdrant_client", lambda cfg: client
+        )
+
+        assert (
+            await update_point_payloads_async("discussions", {"p1": {"type": "x"}})
+            is False
+        )
@@ -1,7 +1,7 @@
 """Unit tests for trace_buffer.py (SPEC-020 §9.1).
 
 Tests:
-1. test_emit_writes_valid_json — file contains parseable JSON with all required fields
+1. test_emit_writes_valid_json — spool line contains parseable JSON with all required fields
 2. test_emit_atomic_write — no .tmp_* files left after write
 3. test_emit_disabled — LANGFUSE_ENABLED=false → no file created, returns False
 4. test_emit_includes_project_id — project_id from AI_MEMORY_PROJECT_ID env in event
@@ -16,12 +16,23 @@ import memory.trace_buffer as tb
 from memory.trace_buffer import emit_trace_event
 
 
+def _spooled_events(buf_dir):
+    """All events appended to the spool segments in buf_dir."""
+    return [
+        json.loads(line)
+        for segment in sorted(buf_dir.glob("*.jsonl"))
+        for line in segment.read_text().splitlines()
+    ]
+
+
 def _enable_tracing(monkeypatch, tmp_path):
     """Helper: set env vars and buffer dir for a test."""
     monkeypatch.setenv("LANGFUSE_ENABLED", "true")
     monkeypatch.setenv("LANGFUSE_TRACE_HOOKS", "true")
     monkeypatch.setattr(tb, "TRACE_BUFFER_DIR", tmp_path / "trace_buffer")
     monkeypatch.setattr(tb, "_buffer_size_bytes", -1)
+    monkeypatch.setattr(tb, "_calibrated_at", time.monotonic())
+    monkeypatch.setattr(tb, "_writer", None)
 
 
 def test_emit_writes_valid_json(monkeypatch, tmp_path):
@@ -37,10 +48,10 @@ def test_emit_writes_valid_json(monkeypatch, tmp_path):
 
     assert result is True
     buf_dir = tmp_path / "trace_buffer"
-    files = list(buf_dir.glob("*.json"))
-    assert len(files) == 1
+    events = _spooled_events(buf_dir)
+    assert len(events) == 1
 
-    event = json.loads(files[0].read_text())
+    event = events[0]
     assert event["event_type"] == "1_capture"
     assert event["trace_id"] == "traceabc"  # hyphens stripped for OTel compat
     assert event["span_id"] == "span-xyz"
@@ -70,7 +81,7 @@ def test_emit_disabled(monkeypatch, tmp_path):
 
     assert result is False
     buf_dir = tmp_path / "trace_buffer"
-    assert not buf_dir.exists() or list(buf_dir.glob("*.json")) == []
+    assert not buf_dir.exists() or list(buf_dir.iterdir()) == []
 
 
 def test_emit_includes_project_id(monkeypatch, tmp_path):
@@ -81,10 +92,10 @@ def test_emit_includes_project_id(monkeypatch, tmp_path):
     emit_trace_event(event_type="1_capture", data={})
 
     buf_dir = tmp_path / "trace_buffer"
-    files = list(buf_dir.glob("*.json"))
-    assert len(files) == 1
+    events = _spooled_events(buf_dir)
+    assert len(events) == 1
 
-    event = json.loads(files[0].read_text())
+    event = events[0]
     assert event["project_id"] == "proj-test-123"
 
 
@@ -101,7 +112,7 @@ def test_buffer_overflow_guard(monkeypatch, tmp_path):
 
     assert result is False
     buf_dir = tmp_path / "trace_buffer"
-    assert not buf_dir.exists() or list(buf_dir.glob("*.json")) == []
+    assert not buf_dir.exists() or _spooled_events(buf_dir) == []
 
 
 def test_emit_performance(monkeypatch, tmp_path):
@@ -113,3 +124,34 @@ def test_emit_performance(monkeypatch, tmp_path):
     elapsed_ms = (time.perf_counter() - start) * 1000
 
     assert elapsed_ms < 10, f"emit took {elapsed_ms:.1f}ms, expected <10ms"
+
+
+def test_events_from_one_process_share_a_segment(monkeypatch, tmp_path):
+    """Many spans from one process append to one segment, one line each."""
+    _enable_tracing(monkeypatch, tmp_path)
+
+    for step in ("1_capture", "5_chunk", "7_store"):
+        assert emit_trace_event(event_type=step, data={}) is True
+
+    buf_dir = tmp_path / "trace_buffer"
+    assert len(list(buf_dir.glob("*.jsonl"))) == 1
+    assert [e["event_type"] for e in _spooled_events(buf_dir)] == [
+        "1_capture",
+        "5_chunk",
+        "7_store",
+    ]
+
+
+def test_calibrates_from_published_spool_size(monkeypatch, tmp_path):
+    """The overflow guard reads the worker-published size, not the directory."""
+    _enable_tracing(monkeypatch, tmp_path)
+    monkeypatch.setattr(tb, "BUFFER_MAX_MB", 1)
+    buf_dir = tmp_path / "trace_buffer"
+    buf_dir.mkdir()
+    (buf_dir / ".spool_size").write_text(str(2 * 1024 * 1024))
+
+    assert emit_trace_event(event_type="1_capture", data={}) is False
+
+    (buf_dir / ".spool_size").write_text("0")
+    monkeypatch.setattr(tb, "_buffer_size_bytes", -1)
+    assert emit_trace_event(event_type="1_capture", data={}) is True
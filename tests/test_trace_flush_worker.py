@@ -1,4 +1,4 @@
-"""Unit tests for memory.trace_flush_worker — SPEC-020 §9.1 (9 test cases)."""
+"""Unit tests for memory.trace_flush_worker — SPEC-020 §9.1 (11 test cases)."""
 
 import hashlib
 import json
@@ -264,3 +264,72 @@ def test_buffer_size_metric_reflects_post_eviction_size(tmp_path, monkeypatch):
 
     size_after = sum(f.stat().st_size for f in buffer_dir.glob("*.json"))
     assert size_after < size_before
+
+
+# ---------------------------------------------------------------------------
+# Test 10 — spool segments are consumed once via the cursor
+# ---------------------------------------------------------------------------
+
+
+def test_processes_spool_segments_once(tmp_path, monkeypatch):
+    mod, buffer_dir = _load_module(tmp_path, monkeypatch)
+    from memory.trace_spool import SegmentWriter
+
+    writer = SegmentWriter(buffer_dir)
+    for name in ("seg1", "seg2"):
+        event = json.loads(_write_event(buffer_dir, name).read_text())
+        (buffer_dir / f"{name}.json").unlink()
+        writer.append((json.dumps(event) + "\n").encode())
+    writer.append(b"{not valid json\n")
+    _write_event(buffer_dir, "legacy")  # pre-spool file still drained
+
+    mock_langfuse = MagicMock()
+    mock_langfuse.start_observation.return_value = MagicMock()
+
+    assert mod.process_buffer_files(mock_langfuse) == (3, 1)
+    assert mod.process_buffer_files(mock_langfuse) == (0, 0)
+    assert mock_langfuse.start_observation.call_count == 3
+    assert not (buffer_dir / "legacy.json").exists()
+    assert mod.buffer_size_bytes() > 0  # active segment kept until sealed
+
+
+# ---------------------------------------------------------------------------
+# Test 11 — a backlog is exported in bounded batches without idling
+# ---------------------------------------------------------------------------
+
+
+def test_main_drains_backlog_in_batches(tmp_path, monkeypatch):
+    mod, buffer_dir = _load_module(tmp_path, monkeypatch)
+    from memory.trace_spool import SegmentWriter
+
+    writer = SegmentWriter(buffer_dir)
+    for n in range(5):
+        event = json.loads(_write_event(buffer_dir, f"batch{n}").read_text())
+        (buffer_dir / f"batch{n}.json").unlink()
+        writer.append((json.dumps(event) + "\n").encode())
+    monkeypatch.setattr(mod, "FLUSH_MAX_BATCH", 2)
+
+    mock_langfuse = MagicMock()
+    mock_langfuse.start_observation.return_value = MagicMock()
+    mock_push = MagicMock()
+    monkeypatch.setattr(mod, "push_metrics_fn", mock_push)
+    monkeypatch.setattr(mod, "shutdown_requested", False)
+    waits = []
+
+    def stop_on_idle(_watcher):
+        waits.append(mock_langfuse.flush.call_count)
+        mod.shutdown_requested = True
+
+    monkeypatch.setattr(mod, "_wait_for_events", stop_on_idle)
+    with patch(
+        "memory.trace_flush_worker.get_langfuse_client", return_value=mock_langfuse
+    ):
+        mod.main()
+
+    # Batches of 2, 2, 1 — each flushed — before the first idle wait
+    assert waits == [3]
+    assert mock_langfuse.start_observation.call_count == 5
+    call_kwargs = mock_push.call_args_list[0][1]
+    assert call_kwargs["events_processed"] == 2
+    assert call_kwargs["backlog_age_seconds"] > 0
+    assert call_kwargs["drain_rate"] > 0
@@ -0,0 +1,189 @@
+"""Unit tests for memory.trace_spool — segmented append-only trace buffer."""
+
+import json
+import os
+import time
+
+import pytest
+
+import memory.trace_spool as spool
+from memory.trace_spool import (
+    SegmentWriter,
+    SpoolReader,
+    SpoolWatcher,
+    read_spool_size,
+)
+
+
+def _line(n: int) -> bytes:
+    return (json.dumps({"event_type": f"evt{n}"}) + "\n").encode()
+
+
+def _age_segments(directory, seconds: float) -> None:
+    """Rename segments as if they had been created `seconds` ago."""
+    for path in directory.glob("*.jsonl"):
+        created_ns, rest = path.name.split("-", 1)
+        older = int(created_ns) - int(seconds * 1e9)
+        path.rename(directory / f"{older}-{rest}")
+
+
+def _drain(reader: SpoolReader) -> list[str]:
+    reader.refresh()
+    names = [event["event_type"] for _, event in reader.events()]
+    reader.commit()
+    return names
+
+
+def test_writer_rotates_on_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(spool, "SEGMENT_MAX_BYTES", len(_line(0)) * 2)
+    writer = SegmentWriter(tmp_path)
+
+    for n in range(5):
+        writer.append(_line(n))
+
+    assert len(list(tmp_path.glob("*.jsonl"))) == 3
+
+
+def test_writer_reopens_evicted_segment(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+    for path in tmp_path.glob("*.jsonl"):
+        path.unlink()
+
+    writer.append(_line(1))
+
+    assert _drain(SpoolReader(tmp_path)) == ["evt1"]
+
+
+def test_reader_resumes_from_cursor(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+    writer.append(_line(1))
+    assert _drain(SpoolReader(tmp_path)) == ["evt0", "evt1"]
+
+    writer.append(_line(2))
+
+    # A restarted consumer picks up only the new line
+    assert _drain(SpoolReader(tmp_path)) == ["evt2"]
+
+
+def test_partial_line_waits_for_writer(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+    segment = next(tmp_path.glob("*.jsonl"))
+    with open(segment, "ab") as f:
+        f.write(b'{"event_type": "ev')
+    reader = SpoolReader(tmp_path)
+
+    assert _drain(reader) == ["evt0"]
+
+    with open(segment, "ab") as f:
+        f.write(b't1"}\n')
+    assert _drain(reader) == ["evt1"]
+
+
+def test_consumed_segment_deleted_once_sealed(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+    writer.close()
+    reader = SpoolReader(tmp_path)
+
+    _drain(reader)
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1  # writer may still append
+
+    _age_segments(tmp_path, spool.SEGMENT_MAX_AGE + spool.SEGMENT_SEAL_GRACE + 1)
+    _drain(reader)
+    assert list(tmp_path.glob("*.jsonl")) == []
+    assert json.loads((tmp_path / ".cursor").read_text()) == {}
+
+
+def test_evict_drops_oldest_whole_segments(tmp_path):
+    old = SegmentWriter(tmp_path)
+    for n in range(3):
+        old.append(_line(n))
+    old.close()
+    _age_segments(tmp_path, 10)
+    SegmentWriter(tmp_path).append(_line(3))
+    reader = SpoolReader(tmp_path)
+    reader.refresh()
+
+    evicted = reader.evict(max_bytes=len(_line(3)))
+
+    assert evicted == 3
+    assert _drain(reader) == ["evt3"]
+
+
+def test_commit_publishes_spool_size(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+    reader = SpoolReader(tmp_path)
+
+    _drain(reader)
+
+    assert read_spool_size(tmp_path) == len(_line(0))
+
+
+def test_forked_child_gets_its_own_segment(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    writer.append(_line(0))
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child
+        try:
+            writer.append(_line(1))
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    time.sleep(0.01)
+
+    assert len(list(tmp_path.glob("*.jsonl"))) == 2
+    assert sorted(_drain(SpoolReader(tmp_path))) == ["evt0", "evt1"]
+
+
+def test_events_stop_at_batch_limits(tmp_path):
+    writer = SegmentWriter(tmp_path)
+    for n in range(5):
+        writer.append(_line(n))
+    reader = SpoolReader(tmp_path)
+    reader.refresh()
+
+    first = [event["event_type"] for _, event in reader.events(max_events=2)]
+    assert first == ["evt0", "evt1"]
+    assert reader.truncated is True
+    assert reader.backlog_age() > 0
+
+    second = [e["event_type"] for _, e in reader.events(max_bytes=len(_line(0)))]
+    assert second == ["evt2"]
+
+    rest = [event["event_type"] for _, event in reader.events(max_events=10)]
+    assert rest == ["evt3", "evt4"]
+    assert reader.truncated is False
+    assert reader.backlog_age() == 0.0
+
+
+def test_chunk_with_malformed_line_decodes_per_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(spool, "DECODE_CHUNK", 3)
+    writer = SegmentWriter(tmp_path)
+    for line in (_line(0), b"{not valid json\n", b"[1, 2]\n", b"\n", _line(1)):
+        writer.append(line)
+    reader = SpoolReader(tmp_path)
+    reader.refresh()
+
+    events = [event for _, event in reader.events()]
+
+    assert events == [{"event_type": "evt0"}, None, None, {"event_type": "evt1"}]
+
+
+def test_watcher_wakes_on_segment_write_only(tmp_path):
+    watcher = SpoolWatcher(tmp_path)
+    if not watcher.available:
+        pytest.skip("inotify unavailable")
+    try:
+        (tmp_path / ".cursor").write_text("{}")  # consumer's own file
+        assert watcher.wait(0.05) is False
+
+        SegmentWriter(tmp_path).append(_line(0))
+        assert watcher.wait(1.0) is True
+        assert watcher.wait(0.05) is False
+    finally:
+        watcher.close()
@@ -0,0 +1,207 @@
+"""Unit tests for the local conventions vector snapshot.
+
+Uses QdrantClient(":memory:") — no external services required.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from memory.search import MemorySearch
+from memory.vector_snapshot import VectorSnapshot
+
+DIM = 8
+
+
+def _vec(*hot: int) -> list[float]:
+    v = [0.0] * DIM
+    for i in hot:
+        v[i] = 1.0
+    return v
+
+
+def _payload(content: str, memory_type: str = "guideline", days_old: int = 0) -> dict:
+    ts = (datetime.now(timezone.utc) - timedelta(days=days_old)).isoformat()
+    return {
+        "content": content,
+        "group_id": "shared",
+        "type": memory_type,
+        "timestamp": ts,
+        "stored_at": ts,
+        "embedding_model": "not-exported",
+    }
+
+
+@pytest.fixture(autouse=True)
+def last_updated(monkeypatch):
+    """Collection change marker (local mode cannot order_by a dict spec)."""
+    marker = {"value": "2026-01-01T00:00:00+00:00"}
+    monkeypatch.setattr(
+        "memory.vector_snapshot.get_last_updated",
+        lambda client, collection: marker["value"],
+    )
+    return marker
+
+
+@pytest.fixture
+def qdrant():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        "conventions", vectors_config=VectorParams(size=DIM, distance=Distance.COSINE)
+    )
+    client.upsert(
+        "conventions",
+        points=[
+            PointStruct(id=1, vector=_vec(0), payload=_payload("use type hints")),
+            PointStruct(id=2, vector=_vec(1), payload=_payload("snake_case", "rule")),
+            PointStruct(id=3, vector=_vec(0, 1), payload=_payload("mixed")),
+            # Pending embedding (zero vector) must not be exported
+            PointStruct(id=4, vector=[0.0] * DIM, payload=_payload("pending")),
+        ],
+    )
+    return client
+
+
+@pytest.fixture
+def snapshot(qdrant, tmp_path):
+    return VectorSnapshot("conventions", tmp_path, client=qdrant, refresh_interval=300)
+
+
+class TestExport:
+    def test_export_writes_normalized_memmap_and_sidecar(self, snapshot, tmp_path):
+        assert snapshot.export() == 3
+        assert snapshot.meta_path.exists()
+        assert snapshot.ensure_fresh()
+        assert len(snapshot) == 3
+
+        vectors = snapshot._vectors
+        assert isinstance(vectors, np.memmap)
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-6)
+
+    def test_sidecar_payloads_are_compact(self, snapshot):
+        snapshot.export()
+        snapshot.ensure_fresh()
+        payload = snapshot._meta["payloads"][0]
+        assert "content" in payload
+        assert "embedding_model" not in payload
+
+    def test_reexport_removes_previous_generation(self, snapshot, tmp_path):
+        snapshot.export()
+        snapshot.export()
+        assert len(list(tmp_path.glob("conventions.*.f32"))) == 1
+
+
+class TestSearch:
+    def test_top_k_cosine_order(self, snapshot):
+        snapshot.ensure_fresh()
+        hits = snapshot.search(_vec(0), limit=2)
+        assert [h[0] for h in hits] == ["1", "3"]
+        assert hits[0][1] == pytest.approx(1.0)
+
+    def test_score_threshold_and_type_filters(self, snapshot):
+        snapshot.ensure_fresh()
+        assert [h[0] for h in snapshot.search(_vec(0), 5, score_threshold=0.9)] == ["1"]
+        assert [h[0] for h in snapshot.search(_vec(1), 5, memory_types=["rule"])] == [
+            "2"
+        ]
+        hits = snapshot.search(_vec(1), 5, must_not_types=["rule"])
+        assert "2" not in [h[0] for h in hits]
+
+    def test_dimension_mismatch_returns_empty(self, snapshot):
+        snapshot.ensure_fresh()
+        assert snapshot.search([1.0, 0.0], limit=3) == []
+
+
+class TestRefresh:
+    def test_no_network_within_refresh_interval(self, qdrant, tmp_path):
+        snapshot = VectorSnapshot("conventions", tmp_path, client=qdrant)
+        snapshot.ensure_fresh()
+
+        offline = VectorSnapshot("conventions", tmp_path, client=Mock())
+        assert offline.ensure_fresh()
+        offline.client.scroll.assert_not_called()
+
+    def test_reexports_when_collection_changes(self, qdrant, snapshot, last_updated):
+        snapshot.ensure_fresh()
+        qdrant.upsert(
+            "conventions",
+            points=[PointStruct(id=5, vector=_vec(2), payload=_payload("new rule"))],
+        )
+        last_updated["value"] = "2026-01-02T00:00:00+00:00"
+        snapshot.mark_stale()
+        assert snapshot.ensure_fresh()
+        assert len(snapshot) == 4
+
+    def test_unchanged_collection_only_bumps_check(self, snapshot):
+        snapshot.ensure_fresh()
+        generation = snapshot._meta["generation"]
+        snapshot.mark_stale()
+        time.sleep(0.01)
+        assert snapshot.ensure_fresh()
+        assert snapshot._meta["generation"] == generation
+
+    def test_serves_stale_snapshot_when_qdrant_down(
+        self, qdrant, tmp_path, last_updated
+    ):
+        VectorSnapshot("conventions", tmp_path, client=qdrant).ensure_fresh()
+        last_updated["value"] = None  # get_last_updated() swallows errors -> None
+
+        broken = Mock()
+        broken.scroll.side_effect = ConnectionError("qdrant down")
+        snapshot = VectorSnapshot("conventions", tmp_path, client=broken)
+        snapshot.mark_stale()
+        assert snapshot.ensure_fresh()
+        assert [h[0] for h in snapshot.search(_vec(0), 1)] == ["1"]
+
+    def test_no_snapshot_and_no_qdrant(self, tmp_path):
+        broken = Mock()
+        broken.scroll.side_effect = ConnectionError("qdrant down")
+        assert not VectorSnapshot("conventions", tmp_path, client=broken).ensure_fresh()
+
+
+class TestMemorySearchIntegration:
+    def test_shared_conventions_search_skips_qdrant(self, snapshot, monkeypatch):
+        snapshot.ensure_fresh()
+        search = MemorySearch.__new__(MemorySearch)
+        search.config = Mock(decay_enabled=False, max_retrievals=5)
+        search.client = Mock()
+        search.embedding_client = Mock()
+        search.embedding_client.embed.return_value = [_vec(1)]
+        search._conventions_snapshot = snapshot
+        monkeypatch.setattr("memory.search.emit_trace_event", None)
+
+        results = search.search(
+            "naming", collection="conventions", score_threshold=0.5, limit=3
+        )
+
+        search.client.query_points.assert_not_called()
+        assert results[0]["id"] == "2"
+        assert results[0]["collection"] == "conventions"
+        assert results[0]["search_mode"] == "local_snapshot"
+        assert results[0]["attribution"] == "[conventions:rule] (100%)"
+
+    def test_with_vectors_attaches_cached_vectors(self, snapshot, monkeypatch):
+        snapshot.ensure_fresh()
+        search = MemorySearch.__new__(MemorySearch)
+        search.config = Mock(decay_enabled=False, max_retrievals=5)
+        search.client = Mock()
+        search.embedding_client = Mock()
+        search.embedding_client.embed.return_value = [_vec(0)]
+        search._conventions_snapshot = snapshot
+        monkeypatch.setattr("memory.search.emit_trace_event", None)
+
+        results = search.search(
+            "hints",
+            collection="conventions",
+            score_threshold=0.0,
+            limit=2,
+            with_vectors=True,
+        )
+
+        assert results[0]["vector"] == pytest.approx(_vec(0))
+        assert len(results[1]["vector"]) == DIM
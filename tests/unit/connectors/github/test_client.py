@@ -348,6 +348,27 @@ class TestRateLimiting:
 
         assert github_client._secondary_points_used == 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_keep_min_delay(self):
+        """Concurrent callers are paced one after another, not in a burst."""
+        import asyncio
+        import itertools
+
+        client = GitHubClient(token="ghp_test", repo="owner/repo", min_delay_ms=50)
+        sent_at = []
+
+        async def _request(*args, **kwargs):
+            sent_at.append(time.monotonic())
+            return _mock_response(json_data={"sha": "x"})
+
+        with patch.object(client._client, "request", new=_request):
+            await asyncio.gather(*(client.get_blob(f"sha{i}") for i in range(4)))
+
+        gaps = [b - a for a, b in itertools.pairwise(sent_at)]
+        assert len(sent_at) == 4
+        assert min(gaps) >= 0.045
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_rate_limit_backoff_on_403(self, github_client):
         """403 with remaining=0 triggers wait-and-retry."""
@@ -549,6 +570,27 @@ class TestETagCaching:
         # 304 should not add points (subtracts the cost back)
         assert points_after_second == points_after_first
 
+    @pytest.mark.asyncio
+    async def test_shared_budget_charged_and_etag_hits_recorded(self):
+        """Requests are charged to a shared budget with conditional outcomes."""
+        from src.memory.connectors.github.scheduler import RequestBudget
+
+        budget = RequestBudget(max_requests=100, min_delay_ms=0)
+        client = GitHubClient("ghp_test", "owner/repo", min_delay_ms=0, budget=budget)
+        resp1 = _mock_response(json_data={"id": 1}, headers={"ETag": '"abc"'})
+        resp2 = _mock_response(status_code=304)
+
+        with patch.object(
+            client._client, "request", new=AsyncMock(side_effect=[resp1, resp2])
+        ):
+            await client._request("GET", "/user")
+            await client._request("GET", "/user")
+
+        usage = budget.usage("owner/repo")
+        assert (usage.requests, usage.conditional, usage.not_modified) == (2, 1, 1)
+        status = client.get_rate_limit_status()
+        assert (status["conditional_requests"], status["not_modified"]) == (1, 1)
+
 
 # =============================================================================
 # Error Handling Tests
@@ -1093,6 +1135,205 @@ class TestEndpoints:
         assert result[0]["title"] == "Fix bug"
 
 
+# =============================================================================
+# GraphQL Bulk PR Fetch Tests
+# =============================================================================
+
+
+def _graphql_pr(number, updated_at, files=None, reviews=None, truncated=()):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": "desc",
+        "state": "MERGED",
+        "url": f"https://github.com/owner/repo/pull/{number}",
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+        "closedAt": updated_at,
+        "mergedAt": updated_at,
+        "baseRefName": "main",
+        "headRefName": "feat",
+        "headRefOid": "abc123",
+        "author": {"login": "dev"},
+        "labels": {"nodes": [{"name": "bug"}]},
+        "files": {
+            "pageInfo": {"hasNextPage": "files" in truncated},
+            "nodes": files or [],
+        },
+        "reviews": {
+            "pageInfo": {"hasNextPage": "reviews" in truncated},
+            "nodes": reviews or [],
+        },
+    }
+
+
+def _graphql_page(nodes, has_next=False, cursor="c1", remaining=4990):
+    return _mock_response(
+        json_data={
+            "data": {
+                "rateLimit": {
+                    "cost": 1,
+                    "remaining": remaining,
+                    "resetAt": "2026-02-14T01:00:00Z",
+                },
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                        "nodes": nodes,
+                    }
+                },
+            }
+        },
+        headers={"X-RateLimit-Resource": "graphql", "X-RateLimit-Remaining": "4990"},
+    )
+
+
+class TestGraphQLPullRequests:
+    """Test list_pull_requests_with_details() GraphQL bulk fetch."""
+
+    @pytest.mark.asyncio
+    async def test_converts_to_rest_shapes(self, github_client):
+        """PR, file, and review nodes are mapped to the REST dict shapes."""
+        node = _graphql_pr(
+            7,
+            "2026-02-01T00:00:00Z",
+            files=[
+                {"path": "a.py", "additions": 3, "deletions": 1, "changeType": "ADDED"}
+            ],
+            reviews=[
+                {
+                    "databaseId": 99,
+                    "state": "APPROVED",
+                    "body": "lgtm",
+                    "url": "https://github.com/owner/repo/pull/7#r99",
+                    "submittedAt": "2026-02-01T00:00:00Z",
+                    "author": None,
+                }
+            ],
+        )
+        with patch.object(
+            github_client._client,
+            "request",
+            new=AsyncMock(return_value=_graphql_page([node])),
+        ) as mock_request:
+            details = await github_client.list_pull_requests_with_details()
+
+        assert mock_request.call_args.args[:2] == ("POST", "/graphql")
+        variables = mock_request.call_args.kwargs["json"]["variables"]
+        assert (variables["owner"], variables["name"]) == ("owner", "repo")
+        [detail] = details
+        pr = detail["pr"]
+        assert pr["state"] == "closed"
+        assert pr["merged_at"] == "2026-02-01T00:00:00Z"
+        assert pr["html_url"] == "https://github.com/owner/repo/pull/7"
+        assert pr["base"] == {"ref": "main"} and pr["head"] == {"ref": "feat"}
+        assert pr["labels"] == [{"name": "bug"}]
+        assert detail["files"] == [
+            {
+                "filename": "a.py",
+                "status": "added",
+                "additions": 3,
+                "deletions": 1,
+                "blob_url": "https://github.com/owner/repo/blob/abc123/a.py",
+            }
+        ]
+        review = detail["reviews"][0]
+        assert review["id"] == 99
+        assert review["state"] == "APPROVED"
+        assert review["user"] is None
+
+    @pytest.mark.asyncio
+    async def test_pages_until_older_than_since(self, github_client):
+        """Incremental fetch stops at the first PR updated before since."""
+        page1 = _graphql_page(
+            [_graphql_pr(3, "2026-03-03T00:00:00Z")], has_next=True, cursor="p1"
+        )
+        page2 = _graphql_page(
+            [
+                _graphql_pr(2, "2026-03-02T00:00:00Z"),
+                _graphql_pr(1, "2026-01-01T00:00:00Z"),
+            ],
+            has_next=True,
+            cursor="p2",
+        )
+        with patch.object(
+            github_client._client,
+            "request",
+            new=AsyncMock(side_effect=[page1, page2]),
+        ) as mock_request:
+            details = await github_client.list_pull_requests_with_details(
+                since="2026-03-01T00:00:00Z"
+            )
+
+        assert [d["pr"]["number"] for d in details] == [3, 2]
+        assert mock_request.call_count == 2
+        second_vars = mock_request.call_args_list[1].kwargs["json"]["variables"]
+        assert second_vars["cursor"] == "p1"
+
+    @pytest.mark.asyncio
+    async def test_truncated_connection_falls_back_to_rest(self, github_client):
+        """PRs with more files than one query returns use the REST endpoint."""
+        node = _graphql_pr(5, "2026-02-01T00:00:00Z", truncated=("files",))
+        github_client.get_pr_files = AsyncMock(return_value=[{"filename": "x.py"}])
+        with patch.object(
+            github_client._client,
+            "request",
+            new=AsyncMock(return_value=_graphql_page([node])),
+        ):
+            [detail] = await github_client.list_pull_requests_with_details()
+
+        github_client.get_pr_files.assert_awaited_once_with(5)
+        assert detail["files"] == [{"filename": "x.py"}]
+
+    @pytest.mark.asyncio
+    async def test_graphql_budget_tracked_separately(self, github_client):
+        """GraphQL responses update the GraphQL budget, not the REST limit."""
+        github_client._rate_limit_remaining = 4321
+        with patch.object(
+            github_client._client,
+            "request",
+            new=AsyncMock(return_value=_graphql_page([], remaining=1234)),
+        ):
+            await github_client.list_pull_requests_with_details()
+
+        assert github_client._rate_limit_remaining == 4321
+        assert github_client._graphql_remaining == 1234
+        assert github_client._secondary_points_used == GitHubClient.GRAPHQL_POINT_COST
+
+    @pytest.mark.asyncio
+    async def test_errors_only_response_raises(self, github_client):
+        """A GraphQL response with errors and no data raises GitHubClientError."""
+        resp = _mock_response(json_data={"errors": [{"message": "Bad query"}]})
+        with (
+            patch.object(
+                github_client._client, "request", new=AsyncMock(return_value=resp)
+            ),
+            pytest.raises(GitHubClientError, match="Bad query"),
+        ):
+            await github_client.list_pull_requests_with_details()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_error_raises_rate_limit_exceeded(self, github_client):
+        """RATE_LIMITED GraphQL errors surface as RateLimitExceeded."""
+        resp = _mock_response(
+            json_data={"errors": [{"type": "RATE_LIMITED", "message": "limit"}]}
+        )
+        with (
+            patch.object(
+                github_client._client, "request", new=AsyncMock(return_value=resp)
+            ),
+            pytest.raises(RateLimitExceeded),
+        ):
+            await github_client.list_pull_requests_with_details()
+
+    def test_enterprise_graphql_path(self):
+        """GHES serves GraphQL at /api/graphql beside /api/v3."""
+        client = GitHubClient(
+            "ghp_test", "owner/repo", base_url="https://ghe.example.com/api/v3"
+        )
+        assert client._graphql_path == "https://ghe.example.com/api/graphql"
+
+
 # =============================================================================
 # Metrics Tests
 # =============================================================================
@@ -320,6 +320,12 @@ def _make_sync_instance():
     from memory.classifier.circuit_breaker import CircuitBreaker
 
     sync._circuit_breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+
+    # Concurrent pipeline sizing required by sync_code_blobs
+    sync._concurrency = 4
+    sync._batch_size = 64
+    sync._fetch_slots = None
+    sync._writer = None
     return sync
 
 
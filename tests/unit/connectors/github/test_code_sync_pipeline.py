@@ -0,0 +1,273 @@
+"""Unit tests for the concurrent code blob sync pipeline (fetch -> chunk -> batch store)."""
+
+import asyncio
+import base64
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from memory.connectors.github.code_sync import CodeBlobSync, _ChunkBatchWriter
+
+
+class FakeGitHub:
+    """In-memory stand-in for GitHubClient with per-request latency."""
+
+    def __init__(self, files: dict[str, str], latency: float = 0.0):
+        self.files = files
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+        self.fetched = 0
+
+    async def get_tree(self, tree_sha, recursive=True):
+        return [
+            {"path": path, "sha": f"sha-{path}", "size": len(body), "type": "blob"}
+            for path, body in self.files.items()
+        ]
+
+    async def get_blob(self, blob_sha):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            self.fetched += 1
+            body = self.files[blob_sha.removeprefix("sha-")]
+            return {"content": base64.b64encode(body.encode()).decode()}
+        finally:
+            self.active -= 1
+
+
+class RecordingStorage:
+    """Records store_memories_batch() calls; optionally slow or failing."""
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        error: Exception | None = None,
+        blocked: set[int] | None = None,
+    ):
+        self.delay = delay
+        self.error = error
+        self.blocked = blocked or set()
+        self.batches: list[list[dict]] = []
+        self.scan_flags: list[bool] = []
+        self._lock = threading.Lock()
+
+    def store_memories_batch(self, memories, collection, source_type, scan=True):
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        with self._lock:
+            self.batches.append(list(memories))
+            self.scan_flags.append(scan)
+        # Blocked results come first and carry their input index
+        results = [
+            {"status": "blocked", "index": i}
+            for i in range(len(memories))
+            if i in self.blocked
+        ]
+        results += [
+            {"memory_id": str(i), "status": "stored"}
+            for i in range(len(memories))
+            if i not in self.blocked
+        ]
+        return results
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    """Reset config singleton between tests."""
+    from memory.config import reset_config
+
+    reset_config()
+    yield
+    reset_config()
+
+
+def _python_files(count: int) -> dict[str, str]:
+    return {
+        f"src/mod{i}.py": f"def func_{i}():\n    return {i}\n" for i in range(count)
+    }
+
+
+def _make_sync(client, storage, concurrency=4, batch_size=64):
+    config = MagicMock()
+    config.github_branch = "main"
+    config.github_repo = "owner/repo"
+    config.github_code_blob_max_size = 102400
+    config.github_code_blob_exclude = ""
+    config.github_sync_total_timeout = 300
+    config.github_sync_per_file_timeout = 30
+    config.github_sync_circuit_breaker_threshold = 5
+    config.github_sync_circuit_breaker_reset = 60
+    config.github_code_sync_concurrency = concurrency
+    config.github_code_sync_batch_size = batch_size
+    config.security_scanning_enabled = False
+
+    with (
+        patch("memory.connectors.github.code_sync.MemoryStorage"),
+        patch("memory.connectors.github.code_sync.get_qdrant_client"),
+    ):
+        sync = CodeBlobSync(client, config)
+
+    sync.storage = storage
+    sync._get_stored_blob_map = MagicMock(return_value={})
+    sync._detect_deleted_files = AsyncMock(return_value=0)
+    sync._push_metrics = MagicMock()
+    return sync
+
+
+class TestPipeline:
+    """Concurrency, batching, and backpressure of sync_code_blobs()."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently_up_to_limit(self):
+        client = FakeGitHub(_python_files(12), latency=0.02)
+        sync = _make_sync(client, RecordingStorage(), concurrency=3)
+
+        result = await sync.sync_code_blobs("batch-1")
+
+        assert result.files_synced == 12
+        assert result.errors == 0
+        assert client.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_chunks_from_many_files_share_batches(self):
+        client = FakeGitHub(_python_files(12), latency=0.01)
+        storage = RecordingStorage(delay=0.05)
+        sync = _make_sync(client, storage, concurrency=4)
+
+        result = await sync.sync_code_blobs("batch-1")
+
+        stored = [m for batch in storage.batches for m in batch]
+        assert result.chunks_created == len(stored) == 12
+        assert len(storage.batches) < 12
+        assert all(len(batch) <= 64 for batch in storage.batches)
+        first = next(m for m in stored if m["file_path"] == "src/mod0.py")
+        assert first["blob_hash"] == "sha-src/mod0.py"
+        assert first["type"] == "github_code_blob"
+        assert first["session_id"] == "batch-1"
+
+    @pytest.mark.asyncio
+    async def test_batch_size_caps_chunks_per_store(self):
+        client = FakeGitHub(_python_files(10))
+        storage = RecordingStorage(delay=0.02)
+        sync = _make_sync(client, storage, concurrency=8, batch_size=2)
+
+        await sync.sync_code_blobs("batch-1")
+
+        # A single file's chunks are never split, so 1-chunk files cap at 2
+        assert max(len(batch) for batch in storage.batches) <= 2
+
+    @pytest.mark.asyncio
+    async def test_slow_storage_applies_backpressure(self):
+        client = FakeGitHub(_python_files(16))
+        storage = RecordingStorage(delay=0.03)
+        sync = _make_sync(client, storage, concurrency=2, batch_size=1)
+
+        task = asyncio.create_task(sync.sync_code_blobs("batch-1"))
+        await asyncio.sleep(0.04)
+        fetched_early = client.fetched
+        result = await task
+
+        assert result.files_synced == 16
+        # Fetching stalls behind the store stage instead of racing ahead
+        assert fetched_early <= 2 * 2 + 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_counts_every_file(self):
+        client = FakeGitHub(_python_files(3))
+        storage = RecordingStorage(error=RuntimeError("embedding failed"))
+        sync = _make_sync(client, storage, concurrency=4)
+
+        result = await sync.sync_code_blobs("batch-1")
+
+        assert result.files_synced == 0
+        assert result.errors == 3
+        assert all("embedding failed" in d for d in result.error_details)
+
+    @pytest.mark.asyncio
+    async def test_old_blobs_superseded_before_store(self):
+        client = FakeGitHub(_python_files(1))
+        storage = RecordingStorage()
+        sync = _make_sync(client, storage)
+        sync._get_stored_blob_map = MagicMock(return_value={"src/mod0.py": "old"})
+        calls = []
+        sync._supersede_old_blobs = MagicMock(
+            side_effect=lambda path: calls.append(("supersede", len(storage.batches)))
+        )
+
+        await sync.sync_code_blobs("batch-1")
+
+        assert calls == [("supersede", 0)]
+        assert len(storage.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_store_skips_rescanning_chunks(self):
+        client = FakeGitHub(_python_files(3))
+        storage = RecordingStorage()
+        sync = _make_sync(client, storage)
+
+        await sync.sync_code_blobs("batch-1")
+
+        # _prepare_file_memories already scanned each file
+        assert storage.scan_flags and not any(storage.scan_flags)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_files_drop_queued_and_count_landed_chunks(self):
+        client = FakeGitHub(_python_files(2))
+        storage = RecordingStorage(delay=0.2)
+        sync = _make_sync(client, storage, concurrency=1, batch_size=1)
+        sync.config.github_sync_per_file_timeout = 0.05
+
+        result = await sync.sync_code_blobs("batch-1")
+
+        # mod0 was already being stored when it timed out; mod1 was queued
+        stored = [m["file_path"] for batch in storage.batches for m in batch]
+        assert stored == ["src/mod0.py"]
+        assert result.files_synced == 1
+        assert result.chunks_created == 1
+        assert result.errors == 1
+        assert result.error_details == ["src/mod1.py: per_file_timeout (0.05s)"]
+
+
+class TestChunkBatchWriter:
+    """Per-file accounting of the batched store stage."""
+
+    @pytest.mark.asyncio
+    async def test_stored_counts_follow_the_owning_file(self):
+        storage = RecordingStorage(delay=0.05, blocked={0})
+        writer = _ChunkBatchWriter(storage, batch_size=64, max_pending=4)
+        writer.start()
+        first = [{"file_path": "a.py"}] * 2
+        second = [{"file_path": "b.py"}] * 3
+
+        counts = await asyncio.gather(writer.submit(first), writer.submit(second))
+        await writer.close()
+
+        # Input index 0 is the first chunk of a.py
+        assert len(storage.batches) == 1
+        assert counts == [1, 3]
+
+
+class TestThroughput:
+    """Pipelined sync against a fake GitHub with request latency."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sync_faster_than_sequential(self):
+        files = _python_files(20)
+
+        async def timed(concurrency):
+            client = FakeGitHub(files, latency=0.03)
+            sync = _make_sync(client, RecordingStorage(delay=0.01), concurrency)
+            started = time.monotonic()
+            result = await sync.sync_code_blobs("batch-1")
+            assert result.files_synced == 20
+            return time.monotonic() - started
+
+        sequential = await timed(1)
+        pipelined = await timed(4)
+
+        assert pipelined * 2 < sequential
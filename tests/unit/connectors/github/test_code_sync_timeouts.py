@@ -44,6 +44,8 @@ def _make_sync(
     config.github_sync_per_file_timeout = per_file_timeout
     config.github_sync_circuit_breaker_threshold = cb_threshold
     config.github_sync_circuit_breaker_reset = cb_reset
+    config.github_code_sync_concurrency = 4
+    config.github_code_sync_batch_size = 64
     config.security_scanning_enabled = False
     config.github_token = MagicMock()
     config.github_token.get_secret_value.return_value = "ghp_test"
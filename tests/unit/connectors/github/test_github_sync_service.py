@@ -19,10 +19,20 @@ def _reset_shutdown_flag():
 # -- run_sync_cycle Tests -----------------------------------------------
 
 
+def _cycle_config(tmp_path):
+    """MagicMock config with the fields SyncScheduler reads."""
+    config = MagicMock()
+    config.install_dir = tmp_path
+    config.github_sync_max_workers = 4
+    config.github_sync_api_budget = 2500
+    config.github_sync_interval = 1800
+    return config
+
+
 @pytest.mark.asyncio
-async def test_run_sync_cycle_both_engines():
+async def test_run_sync_cycle_both_engines(tmp_path):
     """Both GitHubSyncEngine and CodeBlobSync called in sequence."""
-    config = MagicMock()
+    config = _cycle_config(tmp_path)
     config.github_code_blob_enabled = True
     config.github_token.get_secret_value.return_value = "ghp_test"
     config.github_repo = "owner/repo"
@@ -85,9 +95,9 @@ async def test_run_sync_cycle_both_engines():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_code_disabled():
+async def test_run_sync_cycle_code_disabled(tmp_path):
     """CodeBlobSync skipped when github_code_blob_enabled=False."""
-    config = MagicMock()
+    config = _cycle_config(tmp_path)
     config.github_code_blob_enabled = False
 
     mock_engine = AsyncMock()
@@ -122,9 +132,9 @@ async def test_run_sync_cycle_code_disabled():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_engine_failure_continues():
+async def test_run_sync_cycle_engine_failure_continues(tmp_path):
     """Engine failure doesn't prevent code blob sync."""
-    config = MagicMock()
+    config = _cycle_config(tmp_path)
     config.github_code_blob_enabled = True
     config.github_token.get_secret_value.return_value = "ghp_test"
     config.github_repo = "owner/repo"
@@ -170,6 +180,49 @@ async def test_run_sync_cycle_engine_failure_continues():
     )
 
 
+@pytest.mark.asyncio
+async def test_run_sync_cycle_clients_share_request_budget(tmp_path):
+    """Engine and code sync clients of all projects share one RequestBudget."""
+    from memory.connectors.github.scheduler import RequestBudget
+
+    config = _cycle_config(tmp_path)
+    config.github_code_blob_enabled = True
+    engines = []
+
+    def make_engine(cfg, repo=None, branch=None):
+        engine = AsyncMock()
+        engine.client = MagicMock()
+        engine.sync.return_value = MagicMock(total_synced=1)
+        engines.append(engine)
+        return engine
+
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=False)
+    projects = {}
+    for name in ("a", "b"):
+        project = MagicMock()
+        project.github_enabled = True
+        project.github_repo = f"org/{name}"
+        projects[name] = project
+
+    with (
+        patch("memory.config.discover_projects", create=True, return_value=projects),
+        patch.object(github_sync_service, "GitHubSyncEngine", side_effect=make_engine),
+        patch.object(github_sync_service, "GitHubClient") as mock_client_cls,
+        patch.object(github_sync_service, "CodeBlobSync", return_value=AsyncMock()),
+        patch("memory.connectors.github.scheduler.SyncScheduler._push_metrics"),
+    ):
+        mock_client_cls.return_value = mock_client
+        result = await run_sync_cycle(config)
+
+    assert result is True
+    budgets = {id(e.client.budget) for e in engines}
+    budgets |= {id(c.kwargs["budget"]) for c in mock_client_cls.call_args_list}
+    assert len(budgets) == 1
+    assert isinstance(engines[0].client.budget, RequestBudget)
+
+
 # -- Signal Handling Tests -----------------------------------------------
 
 
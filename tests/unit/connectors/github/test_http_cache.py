@@ -0,0 +1,207 @@
+"""Unit tests for the persistent GitHub conditional-request cache."""
+
+import sqlite3
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from memory.config import MemoryConfig
+from memory.connectors.github.client import GitHubClient
+from memory.connectors.github.http_cache import PersistentHTTPCache, open_http_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PersistentHTTPCache(tmp_path / "http_cache.db")
+    yield cache
+    cache.close()
+
+
+def _response(status_code=200, json_data=None, headers=None):
+    resp = Mock(spec=httpx.Response)
+    resp.status_code = status_code
+    resp.json.return_value = json_data if json_data is not None else {}
+    resp.headers = {
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        **(headers or {}),
+    }
+    return resp
+
+
+def _client(cache):
+    return GitHubClient("ghp_test", "owner/repo", min_delay_ms=0, http_cache=cache)
+
+
+class TestPersistentHTTPCache:
+    def test_roundtrip(self, cache):
+        cache.put("k", {"items": [1, 2]}, etag='"e1"', link='<u>; rel="next"')
+
+        entry = cache.get("k")
+
+        assert entry == {
+            "etag": '"e1"',
+            "last_modified": None,
+            "link": '<u>; rel="next"',
+            "data": {"items": [1, 2]},
+        }
+        assert cache.get("missing") is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "http_cache.db"
+        first = PersistentHTTPCache(path)
+        first.put("k", [1], last_modified="Wed, 14 Feb 2026 00:00:00 GMT")
+        first.close()
+
+        entry = PersistentHTTPCache(path).get("k")
+
+        assert entry["data"] == [1]
+        assert entry["last_modified"] == "Wed, 14 Feb 2026 00:00:00 GMT"
+
+    def test_evicts_least_recently_used_beyond_size_bound(self, cache):
+        payload = [f"{i}-x" * 40 for i in range(400)]
+        cache.put("a", payload)
+        entry_size = cache.total_bytes()
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+        cache.put("b", payload)
+        cache.get("a")  # a is now more recent than b
+
+        cache.put("c", payload)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.total_bytes() <= cache.max_bytes
+
+    def test_get_defers_access_time_until_flush(self, cache):
+        cache.put("k", {"a": 1})
+        conn = sqlite3.connect(str(cache.path))
+        (stored_at,) = conn.execute("SELECT accessed_at FROM entries").fetchone()
+
+        with patch("memory.connectors.github.http_cache.time.time") as mock_time:
+            mock_time.return_value = stored_at + 60
+            assert cache.get("k") is not None
+        assert not cache._conn.in_transaction
+        assert conn.execute("SELECT accessed_at FROM entries").fetchone()[0] == (
+            stored_at
+        )
+
+        cache.flush()
+
+        assert conn.execute("SELECT accessed_at FROM entries").fetchone()[0] == (
+            stored_at + 60
+        )
+        conn.close()
+
+    def test_pop_removes_entry(self, cache):
+        cache.put("k", {"a": 1})
+        cache.pop("k")
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_unusable_database_fails_open(self, tmp_path):
+        path = tmp_path / "http_cache.db"
+        path.write_bytes(b"not a sqlite database" * 100)
+        cache = PersistentHTTPCache(path)
+
+        cache.put("k", {"a": 1})
+
+        assert cache.get("k") is None
+
+    def test_corrupt_body_is_miss(self, cache):
+        cache.put("k", {"a": 1})
+        conn = sqlite3.connect(str(cache.path))
+        conn.execute("UPDATE entries SET body = ?", (b"garbage",))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("k") is None
+
+
+class TestOpenHTTPCache:
+    def test_disabled_returns_none(self, tmp_path):
+        config = MemoryConfig(install_dir=tmp_path, github_http_cache_enabled=False)
+
+        assert open_http_cache(config) is None
+
+    def test_located_under_install_dir(self, tmp_path):
+        config = MemoryConfig(install_dir=tmp_path, github_http_cache_max_mb=2)
+
+        cache = open_http_cache(config)
+
+        assert cache.path == tmp_path / "cache" / "github" / "http_cache.db"
+        assert cache.max_bytes == 2 * 1024 * 1024
+
+
+class TestClientPersistence:
+    """Validators persisted by one client are used by a fresh client."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_client_revalidates_from_persistent_cache(self, cache):
+        first = _client(cache)
+        with patch.object(
+            first._client,
+            "request",
+            new=AsyncMock(
+                return_value=_response(json_data={"id": 1}, headers={"ETag": '"v1"'})
+            ),
+        ):
+            await first._request("GET", "/repos/owner/repo")
+
+        second = _client(cache)
+        with patch.object(
+            second._client,
+            "request",
+            new=AsyncMock(return_value=_response(status_code=304)),
+        ) as mock_request:
+            data = await second._request("GET", "/repos/owner/repo")
+
+        assert data == {"id": 1}
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert second._secondary_points_used == 0
+
+    @pytest.mark.asyncio
+    async def test_paginated_pages_served_from_cache_on_304(self, cache):
+        link = '<https://api.github.com/repos/owner/repo/issues?page=2>; rel="next"'
+        first = _client(cache)
+        with patch.object(
+            first._client,
+            "request",
+            new=AsyncMock(
+                side_effect=[
+                    _response(
+                        json_data=[{"id": 1}],
+                        headers={"ETag": '"p1"', "Link": link},
+                    ),
+                    _response(json_data=[{"id": 2}], headers={"ETag": '"p2"'}),
+                ]
+            ),
+        ):
+            assert len(await first._paginate("/repos/owner/repo/issues")) == 2
+
+        second = _client(cache)
+        with patch.object(
+            second._client,
+            "request",
+            new=AsyncMock(return_value=_response(status_code=304)),
+        ) as mock_request:
+            items = await second._paginate("/repos/owner/repo/issues")
+
+        assert items == [{"id": 1}, {"id": 2}]
+        sent = [c.kwargs["headers"] for c in mock_request.call_args_list]
+        assert [h["If-None-Match"] for h in sent] == ['"p1"', '"p2"']
+
+    @pytest.mark.asyncio
+    async def test_stale_304_clears_persistent_entry(self, cache):
+        client = _client(cache)
+        client._etag_cache["k"] = {"etag": '"x"', "last_modified": None, "data": 1}
+        cache.put(client._persistent_key("k"), 1, etag='"x"')
+
+        await client._forget_cache("k")
+
+        assert "k" not in client._etag_cache
+        assert cache.get(client._persistent_key("k")) is None
@@ -34,13 +34,17 @@ def _reset_shutdown_flag():
 
 
 def _make_config(tmp_path: Path | None = None, repo: str = "owner/repo") -> MagicMock:
-    """Create a minimal MemoryConfig mock for GitHubSyncEngine init."""
+    """Create a minimal MemoryConfig mock for GitHubSyncEngine and run_sync_cycle."""
     config = MagicMock()
     config.github_sync_enabled = True
     config.github_repo = repo
     config.github_token.get_secret_value.return_value = "ghp_test"
     config.security_scanning_enabled = False
     config.project_path = str(tmp_path) if tmp_path else "/tmp/test"
+    config.install_dir = tmp_path
+    config.github_sync_max_workers = 4
+    config.github_sync_api_budget = 2500
+    config.github_sync_interval = 1800
     return config
 
 
@@ -251,9 +255,9 @@ async def test_run_sync_cycle_no_projects_returns_true():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_iterates_all_github_projects():
+async def test_run_sync_cycle_iterates_all_github_projects(tmp_path):
     """run_sync_cycle spawns one GitHubSyncEngine per enabled project."""
-    config = MagicMock()
+    config = _make_config(tmp_path)
     config.github_code_blob_enabled = False
 
     projects = {
@@ -283,9 +287,9 @@ async def test_run_sync_cycle_iterates_all_github_projects():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_skips_github_disabled_projects():
+async def test_run_sync_cycle_skips_github_disabled_projects(tmp_path):
     """Projects with github_enabled=False are skipped entirely."""
-    config = MagicMock()
+    config = _make_config(tmp_path)
     config.github_code_blob_enabled = False
 
     projects = {
@@ -315,9 +319,9 @@ async def test_run_sync_cycle_skips_github_disabled_projects():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_code_blobs_per_project():
+async def test_run_sync_cycle_code_blobs_per_project(tmp_path):
     """Code blob sync runs per-project with the project-specific repo."""
-    config = MagicMock()
+    config = _make_config(tmp_path)
     config.github_code_blob_enabled = True
     config.github_token.get_secret_value.return_value = "ghp_test"
 
@@ -366,9 +370,9 @@ async def test_run_sync_cycle_code_blobs_per_project():
 
 
 @pytest.mark.asyncio
-async def test_run_sync_cycle_partial_failure_continues():
+async def test_run_sync_cycle_partial_failure_continues(tmp_path):
     """A sync failure for one project marks result False but continues others."""
-    config = MagicMock()
+    config = _make_config(tmp_path)
     config.github_code_blob_enabled = False
 
     projects = {
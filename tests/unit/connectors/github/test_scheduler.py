@@ -0,0 +1,220 @@
+"""Tests for the multi-project GitHub sync scheduler."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from memory.connectors.github.scheduler import (
+    ProjectOutcome,
+    RequestBudget,
+    SyncScheduler,
+    schedule_state_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_pushgateway():
+    with patch.object(SyncScheduler, "_push_metrics"):
+        yield
+
+
+def _scheduler(sync, workers=4, budget=2500, state_file=None):
+    return SyncScheduler(
+        _config(workers, budget), sync, state_file=state_file, min_delay_ms=0
+    )
+
+
+def _config(workers=4, budget=2500):
+    return SimpleNamespace(
+        github_sync_max_workers=workers,
+        github_sync_api_budget=budget,
+        github_sync_interval=1800,
+    )
+
+
+def _project(repo, enabled=True):
+    return SimpleNamespace(
+        github_repo=repo, github_branch="main", github_enabled=enabled
+    )
+
+
+class FakeSync:
+    """Records concurrency and makes ``requests`` budgeted requests per project."""
+
+    def __init__(self, requests=1, delay=0.01, fail=()):
+        self.requests = requests
+        self.delay = delay
+        self.fail = set(fail)
+        self.order: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, pid, project, budget):
+        self.order.append(pid)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for _ in range(self.requests):
+                await budget.acquire(project.github_repo)
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return ProjectOutcome(ok=pid not in self.fail, items_changed=3)
+
+
+class TestRequestBudget:
+    @pytest.mark.asyncio
+    async def test_paces_requests_across_repos(self):
+        budget = RequestBudget(max_requests=100, min_delay_ms=20)
+        started = time.monotonic()
+
+        await asyncio.gather(*(budget.acquire(f"org/r{i}") for i in range(4)))
+
+        assert time.monotonic() - started >= 0.06
+        assert budget.used == 4
+        assert budget.usage("org/r0").requests == 1
+
+    def test_etag_hit_ratio(self):
+        budget = RequestBudget(max_requests=100)
+        budget.record_conditional("org/r", not_modified=True)
+        budget.record_conditional("org/r", not_modified=False)
+
+        assert budget.usage("org/r").etag_hit_ratio == 0.5
+        assert budget.usage("org/other").etag_hit_ratio == 0.0
+
+
+class TestRunCycle:
+    @pytest.mark.asyncio
+    async def test_runs_projects_concurrently_up_to_worker_cap(self):
+        fake = FakeSync(delay=0.02)
+        scheduler = _scheduler(fake, workers=3)
+        projects = {f"p{i}": _project(f"org/r{i}") for i in range(7)}
+
+        ok = await scheduler.run_cycle(projects)
+
+        assert ok is True
+        assert sorted(fake.order) == sorted(projects)
+        assert fake.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_skips_disabled_and_reports_failures(self):
+        fake = FakeSync(fail={"bad"})
+        scheduler = _scheduler(fake)
+        projects = {
+            "good": _project("org/good"),
+            "bad": _project("org/bad"),
+            "off": _project("org/off", enabled=False),
+            "norepo": _project(None),
+        }
+
+        ok = await scheduler.run_cycle(projects)
+
+        assert ok is False
+        assert sorted(fake.order) == ["bad", "good"]
+
+    @pytest.mark.asyncio
+    async def test_exception_in_project_does_not_stop_others(self):
+        async def sync(pid, project, budget):
+            if pid == "boom":
+                raise RuntimeError("boom")
+            return ProjectOutcome()
+
+        scheduler = _scheduler(sync, workers=1)
+
+        ok = await scheduler.run_cycle({"boom": _project("o/a"), "ok": _project("o/b")})
+
+        assert ok is False
+        assert scheduler._state["ok"]["last_success"]
+        assert "last_success" not in scheduler._state["boom"]
+
+    @pytest.mark.asyncio
+    async def test_budget_defers_lowest_priority_projects(self):
+        fake = FakeSync(requests=60, delay=0)
+        scheduler = _scheduler(fake, workers=1, budget=100)
+        now = time.time()
+        scheduler._state = {
+            "busy": {"last_success": now - 3600, "items_changed": 50, "requests": 60},
+            "quiet": {"last_success": now - 3600, "items_changed": 0, "requests": 60},
+        }
+
+        await scheduler.run_cycle({"quiet": _project("o/q"), "busy": _project("o/b")})
+
+        assert fake.order == ["busy"]
+        assert scheduler._state["quiet"]["last_success"] == pytest.approx(now - 3600)
+
+    @pytest.mark.asyncio
+    async def test_stop_requested_stops_dispatch(self):
+        fake = FakeSync()
+        scheduler = _scheduler(fake, workers=1)
+
+        await scheduler.run_cycle(
+            {"a": _project("o/a"), "b": _project("o/b")},
+            stop_requested=lambda: len(fake.order) >= 1,
+        )
+
+        assert len(fake.order) == 1
+
+
+class TestPriority:
+    def test_never_synced_first(self):
+        scheduler = SyncScheduler(_config(), FakeSync())
+        scheduler._state = {"old": {"last_success": time.time() - 86400}}
+
+        assert scheduler.prioritize(["old", "new"]) == ["new", "old"]
+
+    def test_change_rate_and_lag_raise_priority(self):
+        scheduler = SyncScheduler(_config(), FakeSync())
+        now = time.time()
+        scheduler._state = {
+            "quiet": {"last_success": now - 3600, "items_changed": 0},
+            "busy": {"last_success": now - 3600, "items_changed": 30},
+            "stale": {"last_success": now - 20 * 3600, "items_changed": 0},
+        }
+
+        assert scheduler.prioritize(["quiet", "busy", "stale"]) == [
+            "busy",
+            "stale",
+            "quiet",
+        ]
+
+    def test_high_etag_hit_ratio_lowers_priority(self):
+        scheduler = SyncScheduler(_config(), FakeSync())
+        now = time.time()
+        base = {"last_success": now - 3600, "items_changed": 10}
+        scheduler._state = {
+            "cached": {**base, "etag_hit_ratio": 1.0},
+            "fresh": {**base, "etag_hit_ratio": 0.0},
+        }
+
+        assert scheduler.priority("fresh", now) == 2 * scheduler.priority("cached", now)
+
+
+class TestState:
+    @pytest.mark.asyncio
+    async def test_state_persisted_with_cost_and_hit_ratio(self, tmp_path):
+        state_file = tmp_path / "sync_schedule.json"
+
+        async def sync(pid, project, budget):
+            await budget.acquire(project.github_repo)
+            budget.record_conditional(project.github_repo, not_modified=True)
+            return ProjectOutcome(items_changed=7)
+
+        await _scheduler(sync, state_file=state_file).run_cycle({"p": _project("o/p")})
+        entry = json.loads(state_file.read_text())["p"]
+
+        assert entry["repo"] == "o/p"
+        assert entry["requests"] == 1
+        assert entry["items_changed"] == 7
+        assert entry["etag_hit_ratio"] == 1.0
+        assert _scheduler(sync, state_file=state_file).priority("p") < 1
+
+    def test_schedule_state_file_under_install_dir(self, tmp_path):
+        config = SimpleNamespace(install_dir=tmp_path)
+
+        assert schedule_state_file(config) == (
+            tmp_path / "cache" / "github" / "sync_schedule.json"
+        )
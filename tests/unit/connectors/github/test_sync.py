@@ -1,6 +1,9 @@
 """Tests for GitHub sync engine (SPEC-006 Sections 3.1-3.2)."""
 
+import asyncio
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -76,6 +79,7 @@ def _make_engine():
     config.github_repo = "owner/repo"
     config.github_token.get_secret_value.return_value = "ghp_test"
     config.github_branch = "main"
+    config.github_sync_detail_concurrency = 4
     config.project_path = "/tmp/test-project"
     config.get_qdrant_url.return_value = "http://localhost:6333"
     config.qdrant_api_key = None
@@ -440,6 +444,95 @@ async def test_sync_prs_fetches_files():
     assert result.prs_synced == 1
 
 
+@pytest.mark.asyncio
+async def test_sync_prs_graphql_mode_uses_bulk_details():
+    """GraphQL fetch mode takes files and reviews from the bulk response."""
+    engine = _make_engine()
+    engine._pr_fetch_mode = "graphql"
+    pr = {
+        "number": 10,
+        "title": "Test PR",
+        "body": "desc",
+        "state": "open",
+        "merged_at": None,
+        "html_url": "https://github.com/test/pull/10",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "labels": [],
+        "base": {"ref": "main"},
+        "head": {"ref": "feat"},
+    }
+    engine.client.list_pull_requests_with_details = AsyncMock(
+        return_value=[
+            {
+                "pr": pr,
+                "files": [{"filename": "file.py", "status": "modified"}],
+                "reviews": [{"id": 1, "state": "APPROVED", "body": "ok"}],
+            }
+        ]
+    )
+    engine._store_github_memory = AsyncMock(return_value=True)
+
+    result = SyncResult()
+    await engine._sync_pull_requests("2025-12-01T00:00:00Z", "batch-1", result)
+
+    engine.client.list_pull_requests_with_details.assert_awaited_once_with(
+        since="2025-12-01T00:00:00Z"
+    )
+    engine.client.list_pull_requests.assert_not_awaited()
+    engine.client.get_pr_files.assert_not_awaited()
+    engine.client.get_pr_reviews.assert_not_awaited()
+    assert (result.prs_synced, result.reviews_synced, result.diffs_synced) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sync_prs_flags_diffs_without_patch(caplog):
+    """Diff memories stored without patch text are flagged and counted."""
+    engine = _make_engine()
+    engine._pr_fetch_mode = "graphql"
+    pr = {
+        "number": 11,
+        "title": "Test PR",
+        "body": "desc",
+        "state": "open",
+        "merged_at": None,
+        "html_url": "https://github.com/test/pull/11",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "labels": [],
+        "base": {"ref": "main"},
+        "head": {"ref": "feat"},
+    }
+    engine.client.list_pull_requests_with_details = AsyncMock(
+        return_value=[
+            {
+                "pr": pr,
+                "files": [
+                    {"filename": "a.py", "status": "modified"},
+                    {"filename": "b.py", "status": "modified", "patch": "@@ -1 +1 @@"},
+                ],
+                "reviews": [],
+            }
+        ]
+    )
+    engine._store_github_memory = AsyncMock(return_value=True)
+
+    with caplog.at_level("WARNING", logger="ai_memory.github.sync"):
+        await engine._sync_pull_requests(None, "batch-1", SyncResult())
+
+    diff_payloads = {
+        c.kwargs["extra_payload"]["file_path"]: c.kwargs["extra_payload"]
+        for c in engine._store_github_memory.call_args_list
+        if "file_path" in c.kwargs["extra_payload"]
+    }
+    assert diff_payloads["a.py"]["has_patch"] is False
+    assert diff_payloads["b.py"]["has_patch"] is True
+    [record] = [
+        r for r in caplog.records if r.getMessage() == "pr_diffs_stored_without_patch"
+    ]
+    assert record.count == 1
+
+
 @pytest.mark.asyncio
 async def test_sync_prs_includes_reviews():
     """PR sync fetches and stores reviews."""
@@ -705,6 +798,105 @@ async def test_sync_commits_fallback_to_summary():
     assert result.commits_synced == 1  # Still stores using summary
 
 
+def _commit_summary(sha):
+    return {
+        "sha": sha,
+        "html_url": f"https://github.com/commit/{sha}",
+        "commit": {
+            "message": sha,
+            "author": {"name": "Dev"},
+            "committer": {"date": "2026-01-01T00:00:00Z"},
+        },
+        "author": {"login": "dev"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_commits_fetch_concurrently_store_in_order():
+    """Commit details are fetched concurrently but stored in list order."""
+    import asyncio
+
+    engine = _make_engine()
+    engine._detail_concurrency = 3
+    shas = [f"sha{i:02d}" for i in range(9)]
+    engine.client.list_commits = AsyncMock(
+        return_value=[_commit_summary(s) for s in shas]
+    )
+    active = {"now": 0, "max": 0}
+
+    async def get_commit(sha):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        # Later commits finish first
+        await asyncio.sleep(0.001 * (10 - int(sha[3:])))
+        active["now"] -= 1
+        return {**_commit_summary(sha), "files": [{"filename": f"{sha}.py"}]}
+
+    engine.client.get_commit = get_commit
+    engine._store_github_memory = AsyncMock(return_value=True)
+
+    result = SyncResult()
+    count = await engine._sync_commits(None, "batch-1", result)
+
+    assert count == 9
+    assert active["max"] == 3
+    stored = [c.kwargs["sub_id"] for c in engine._store_github_memory.call_args_list]
+    assert stored == shas
+    files = [
+        c.kwargs["extra_payload"]["files_changed"]
+        for c in engine._store_github_memory.call_args_list
+    ]
+    assert files == [[f"{sha}.py"] for sha in shas]
+
+
+@pytest.mark.asyncio
+async def test_sync_issues_comment_fetch_failure_is_per_issue():
+    """A failed comment fetch only affects its own issue."""
+    from memory.connectors.github.client import GitHubClientError
+
+    engine = _make_engine()
+    engine.client.list_issues = AsyncMock(
+        return_value=[
+            {
+                "number": n,
+                "title": f"Issue {n}",
+                "body": "",
+                "state": "open",
+                "html_url": f"https://github.com/test/issues/{n}",
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:00Z",
+                "labels": [],
+                "assignees": [],
+            }
+            for n in (1, 2, 3)
+        ]
+    )
+
+    async def get_issue_comments(number, since=None):
+        if number == 2:
+            raise GitHubClientError("502")
+        return [
+            {
+                "id": number * 10,
+                "body": "comment",
+                "html_url": f"https://github.com/test/issues/{number}#c",
+                "created_at": "2026-01-01T00:00:00Z",
+                "user": {"login": "dev"},
+            }
+        ]
+
+    engine.client.get_issue_comments = get_issue_comments
+    engine._store_github_memory = AsyncMock(return_value=True)
+
+    result = SyncResult()
+    count = await engine._sync_issues(None, "batch-1", result)
+
+    assert count == 3
+    assert result.issues_synced == 3
+    assert result.comments_synced == 2
+    assert result.errors == 0
+
+
 # -- CI Results Tests -------------------------------------------------
 
 
@@ -1194,3 +1386,232 @@ async def test_dedup_commits_use_sha_as_sub_id():
     # Verify sub_ids differ in the stored payloads
     sub_ids = [call[1]["sub_id"] for call in engine.storage.store_memory.call_args_list]
     assert sub_ids == ["abc123", "def456"]
+
+
+# -- Version Index Tests ---------------------------------------------
+
+
+def _indexed_point(point_id, github_id, content_hash, version=1, sub_id=None):
+    point = MagicMock()
+    point.id = point_id
+    point.payload = {
+        "type": "github_issue",
+        "github_id": github_id,
+        "sub_id": sub_id,
+        "content_hash": content_hash,
+        "version": version,
+    }
+    return point
+
+
+def _engine_with_index(points):
+    engine = _make_engine()
+    engine.qdrant = MagicMock()
+    engine.qdrant.scroll.return_value = (points, None)
+    engine._version_index = engine._load_version_index()
+    engine.qdrant.scroll.reset_mock()
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_version_index_replaces_per_item_scroll():
+    """With the index loaded, dedup needs no scroll and defers last_synced."""
+    from memory.connectors.github.schema import compute_content_hash
+    from memory.models import MemoryType
+
+    engine = _engine_with_index(
+        [
+            _indexed_point(f"p{i}", i, compute_content_hash(f"Issue {i}"))
+            for i in range(3)
+        ]
+    )
+
+    for i in range(3):
+        stored = await engine._store_github_memory(
+            content=f"Issue {i}",
+            memory_type=MemoryType.GITHUB_ISSUE,
+            github_id=i,
+            batch_id="batch-1",
+            url="",
+            timestamp="2026-01-01T00:00:00Z",
+        )
+        assert stored is False
+
+    engine.qdrant.scroll.assert_not_called()
+    engine.qdrant.set_payload.assert_not_called()
+
+    engine._flush_version_index()
+
+    engine.qdrant.set_payload.assert_called_once()
+    call = engine.qdrant.set_payload.call_args[1]
+    assert "last_synced" in call["payload"]
+    assert call["points"] == ["p0", "p1", "p2"]
+    assert engine._version_index is None
+
+
+@pytest.mark.asyncio
+async def test_version_index_batches_supersede_after_store():
+    """Changed items queue all old chunk points for one is_current=False update."""
+    from memory.models import MemoryType
+
+    engine = _engine_with_index(
+        [
+            _indexed_point("old-a", 1, "old-hash", version=2),
+            _indexed_point("old-b", 1, "old-hash", version=2),
+            _indexed_point("old-c", 2, "old-hash"),
+        ]
+    )
+    engine.storage.store_memory = MagicMock(
+        side_effect=[
+            {"status": "stored", "memory_id": "new-1"},
+            {"status": "stored", "memory_id": "new-2"},
+        ]
+    )
+
+    for github_id in (1, 2):
+        await engine._store_github_memory(
+            content=f"Changed {github_id}",
+            memory_type=MemoryType.GITHUB_ISSUE,
+            github_id=github_id,
+            batch_id="batch-1",
+            url="",
+            timestamp="2026-01-01T00:00:00Z",
+        )
+
+    first_store = engine.storage.store_memory.call_args_list[0][1]
+    assert first_store["version"] == 3
+    assert first_store["supersedes"] == "old-a"
+    engine.qdrant.set_payload.assert_not_called()
+
+    engine._flush_version_index()
+
+    engine.qdrant.set_payload.assert_called_once()
+    call = engine.qdrant.set_payload.call_args[1]
+    assert call["payload"] == {"is_current": False}
+    assert call["points"] == ["old-a", "old-b", "old-c"]
+
+
+@pytest.mark.asyncio
+async def test_version_index_failed_store_keeps_old_current():
+    """A failed store must not supersede the previous version."""
+    from memory.models import MemoryType
+
+    engine = _engine_with_index([_indexed_point("old-a", 1, "old-hash")])
+    engine.storage.store_memory = MagicMock(side_effect=RuntimeError("qdrant down"))
+
+    stored = await engine._store_github_memory(
+        content="Changed",
+        memory_type=MemoryType.GITHUB_ISSUE,
+        github_id=1,
+        batch_id="batch-1",
+        url="",
+        timestamp="2026-01-01T00:00:00Z",
+    )
+    engine._flush_version_index()
+
+    assert stored is False
+    engine.qdrant.set_payload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_version_index_load_repairs_interrupted_supersede():
+    """Older versions left current by an interrupted sync are superseded."""
+    from memory.connectors.github.schema import compute_content_hash
+    from memory.models import MemoryType
+
+    engine = _engine_with_index(
+        [
+            _indexed_point("v1-a", 1, "old-hash", version=1),
+            _indexed_point("v2-a", 1, compute_content_hash("Issue 1"), version=2),
+            _indexed_point("v2-b", 1, compute_content_hash("Issue 1"), version=2),
+            _indexed_point("v1-b", 1, "old-hash", version=1),
+        ]
+    )
+
+    stored = await engine._store_github_memory(
+        content="Issue 1",
+        memory_type=MemoryType.GITHUB_ISSUE,
+        github_id=1,
+        batch_id="batch-1",
+        url="",
+        timestamp="2026-01-01T00:00:00Z",
+    )
+    engine._flush_version_index()
+
+    assert stored is False
+    calls = [c[1] for c in engine.qdrant.set_payload.call_args_list]
+    assert calls[0]["payload"] == {"is_current": False}
+    assert calls[0]["points"] == ["v1-a", "v1-b"]
+    assert "last_synced" in calls[1]["payload"]
+    assert calls[1]["points"] == ["v2-a", "v2-b"]
+
+
+@pytest.mark.asyncio
+async def test_sync_loads_index_once_and_flushes():
+    """sync() builds the index before per-type syncs and flushes it afterwards."""
+    engine = _make_engine()
+    engine.qdrant = MagicMock()
+    engine.qdrant.scroll.return_value = ([], None)
+    seen_index = []
+
+    async def mock_sync_prs(*args, **kwargs):
+        seen_index.append(engine._version_index)
+        return 0
+
+    engine._sync_pull_requests = mock_sync_prs
+    engine._sync_issues = AsyncMock(return_value=0)
+    engine._sync_commits = AsyncMock(return_value=0)
+    engine._sync_ci_results = AsyncMock(return_value=0)
+    engine._push_metrics = MagicMock()
+    engine._load_state = MagicMock(return_value={})
+    engine._save_state = MagicMock()
+
+    await engine.sync()
+
+    assert engine.qdrant.scroll.call_count == 1
+    assert seen_index[0] is not None
+    assert engine._version_index is None
+
+
+@pytest.mark.asyncio
+async def test_sync_index_load_does_not_block_other_projects():
+    """Loading one project's index runs off the loop; other syncs proceed."""
+    other_started = threading.Event()
+
+    def slow_scroll(*args, **kwargs):
+        # Only returns early if the other engine ran while this one loads
+        other_started.wait(timeout=2)
+        return ([], None)
+
+    async def other_sync_prs(*args, **kwargs):
+        other_started.set()
+        return 0
+
+    engines = [_make_engine(), _make_engine()]
+    for engine in engines:
+        engine.qdrant = MagicMock()
+        engine.qdrant.scroll.return_value = ([], None)
+        engine._sync_pull_requests = AsyncMock(return_value=0)
+        engine._sync_issues = AsyncMock(return_value=0)
+        engine._sync_commits = AsyncMock(return_value=0)
+        engine._sync_ci_results = AsyncMock(return_value=0)
+        engine._push_metrics = MagicMock()
+        engine._load_state = MagicMock(return_value={})
+        engine._save_state = MagicMock()
+    engines[0].qdrant.scroll.side_effect = slow_scroll
+    engines[1]._sync_pull_requests = other_sync_prs
+
+    started = time.monotonic()
+    await asyncio.gather(*(engine.sync() for engine in engines))
+
+    assert other_started.is_set()
+    assert time.monotonic() - started < 1.5
+
+
+def test_version_index_load_failure_falls_back():
+    """If the index cannot be built, dedup falls back to per-item scrolls."""
+    engine = _make_engine()
+    engine.qdrant = MagicMock()
+    engine.qdrant.scroll.side_effect = Exception("Qdrant unavailable")
+
+    assert engine._load_version_index() is None
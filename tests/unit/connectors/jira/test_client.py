@@ -9,6 +9,7 @@ Tests JiraClient with:
 - Context manager support
 """
 
+import asyncio
 import base64
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -716,8 +717,9 @@ class TestRateLimiting:
         ):
             await client.search_issues("PROJ")
 
-            # Verify sleep called with correct delay (100ms = 0.1s)
-            mock_sleep.assert_called_once_with(0.1)
+            # Second page waits for the next 100ms pacing slot
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args.args[0] == pytest.approx(0.1, abs=0.01)
 
     @pytest.mark.asyncio
     async def test_no_delay_on_last_page(self, jira_client):
@@ -736,3 +738,51 @@ class TestRateLimiting:
 
             # No sleep on last page
             mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_pacing_slots(self):
+        """Concurrent callers each get their own slot, delay_ms apart."""
+        client = JiraClient(
+            instance_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="token",
+            delay_ms=50,
+        )
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await asyncio.gather(*(client._pace() for _ in range(3)))
+
+        waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert waits == [
+            pytest.approx(0.05, abs=0.01),
+            pytest.approx(0.1, abs=0.01),
+        ]
+
+
+class TestIssuePageStreaming:
+    """Test iter_issue_pages() yields pages lazily."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_requested_only_when_consumed(self, jira_client):
+        """Page 2 is not fetched until the caller asks for it."""
+        responses = []
+        for data in (
+            {"issues": [{"key": "P-1"}], "isLast": False, "nextPageToken": "t1"},
+            {"issues": [{"key": "P-2"}], "isLast": True},
+        ):
+            resp = Mock()
+            resp.json.return_value = data
+            resp.raise_for_status = Mock()
+            responses.append(resp)
+
+        with patch.object(
+            jira_client.client, "get", new=AsyncMock(side_effect=responses)
+        ) as mock_get:
+            pages = jira_client.iter_issue_pages("PROJ")
+            first = await anext(pages)
+            assert mock_get.call_count == 1
+            rest = [page async for page in pages]
+
+        assert first == [{"key": "P-1"}]
+        assert rest == [[{"key": "P-2"}]]
+        assert mock_get.call_args.kwargs["params"]["nextPageToken"] == "t1"
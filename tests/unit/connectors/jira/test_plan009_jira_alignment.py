@@ -35,6 +35,8 @@ def _make_config(
     config.jira_api_token.get_secret_value.return_value = "test-token"
     config.jira_projects = ["PROJ"] if jira_projects is None else jira_projects
     config.jira_sync_delay_ms = 0
+    config.jira_sync_concurrency = 4
+    config.jira_sync_batch_size = 32
     config.install_dir = tmp_path or Path("/tmp/test-jira")
     return config
 
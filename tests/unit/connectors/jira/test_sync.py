@@ -3,13 +3,16 @@
 Tests JiraSyncEngine with:
 - Full vs incremental sync modes
 - Per-issue error recovery (fail-open)
-- Comment update pattern (delete + insert)
+- Streaming, bounded-concurrency ingestion with batched comment writes
+- Comment update pattern (diff by comment_id + updated)
 - Content hash deduplication via MemoryStorage
 - Sync state persistence
 - group_id extraction from instance URL
 """
 
 import json
+import threading
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -21,6 +24,16 @@ from src.memory.connectors.jira.sync import JiraSyncEngine, SyncResult
 # =============================================================================
 
 
+def _issue_pages(*pages):
+    """Stand-in for JiraClient.iter_issue_pages yielding the given pages."""
+
+    async def iter_issue_pages(project_key, updated_since=None):
+        for page in pages:
+            yield page
+
+    return Mock(side_effect=iter_issue_pages)
+
+
 @pytest.fixture
 def mock_config(tmp_path):
     """Mock MemoryConfig with Jira settings."""
@@ -32,6 +45,8 @@ def mock_config(tmp_path):
     config.jira_api_token.get_secret_value.return_value = "test-token"
     config.jira_projects = ["PROJ"]
     config.jira_sync_delay_ms = 0
+    config.jira_sync_concurrency = 1  # deterministic store order
+    config.jira_sync_batch_size = 32
     config.install_dir = tmp_path
     config.similarity_threshold = 0.7
     config.hnsw_ef_accurate = 128
@@ -42,7 +57,7 @@ def mock_config(tmp_path):
 def mock_jira_client():
     """Mock JiraClient."""
     client = AsyncMock()
-    client.search_issues = AsyncMock(return_value=[])
+    client.iter_issue_pages = _issue_pages([])
     client.get_comments = AsyncMock(return_value=[])
     client.close = AsyncMock()
     return client
@@ -55,6 +70,11 @@ def mock_storage():
     storage.store_memory = Mock(
         return_value={"status": "stored", "memory_id": "mem-123"}
     )
+    storage.store_memories_batch = Mock(
+        side_effect=lambda memories, **kwargs: [
+            {"status": "stored", "memory_id": f"mem-{i}"} for i in range(len(memories))
+        ]
+    )
     return storage
 
 
@@ -146,7 +166,7 @@ class TestSyncModes:
             patch("src.memory.connectors.jira.sync.get_qdrant_client"),
         ):
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=[])
+            mock_client.iter_issue_pages = _issue_pages([])
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
 
@@ -259,7 +279,7 @@ class TestPerIssueErrorRecovery:
 
         with patch("src.memory.connectors.jira.sync.JiraClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=issues)
+            mock_client.iter_issue_pages = _issue_pages(issues)
             mock_client.get_comments = AsyncMock(return_value=[])
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
@@ -328,7 +348,7 @@ class TestPerIssueErrorRecovery:
 
         with patch("src.memory.connectors.jira.sync.JiraClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=issues)
+            mock_client.iter_issue_pages = _issue_pages(issues)
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
 
@@ -394,7 +414,7 @@ class TestCommentUpdate:
 
         with patch("src.memory.connectors.jira.sync.JiraClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=issues)
+            mock_client.iter_issue_pages = _issue_pages(issues)
             mock_client.get_comments = AsyncMock(return_value=comments)
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
@@ -464,7 +484,7 @@ class TestCommentUpdate:
 
         with patch("src.memory.connectors.jira.sync.JiraClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=issues)
+            mock_client.iter_issue_pages = _issue_pages(issues)
             mock_client.get_comments = AsyncMock(return_value=comments)
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
@@ -474,6 +494,9 @@ class TestCommentUpdate:
             ) as mock_storage_cls:
                 mock_storage = Mock()
                 mock_storage.store_memory = Mock(return_value={"status": "stored"})
+                mock_storage.store_memories_batch = Mock(
+                    return_value=[{"status": "stored"}, {"status": "stored"}]
+                )
                 mock_storage_cls.return_value = mock_storage
 
                 with (
@@ -533,7 +556,7 @@ class TestCommentUpdate:
 
         with patch("src.memory.connectors.jira.sync.JiraClient") as mock_client_cls:
             mock_client = AsyncMock()
-            mock_client.search_issues = AsyncMock(return_value=issues)
+            mock_client.iter_issue_pages = _issue_pages(issues)
             mock_client.get_comments = AsyncMock(return_value=comments)
             mock_client.close = AsyncMock()
             mock_client_cls.return_value = mock_client
@@ -542,14 +565,15 @@ class TestCommentUpdate:
                 "src.memory.connectors.jira.sync.MemoryStorage"
             ) as mock_storage_cls:
                 mock_storage = Mock()
-                # First comment fails, second succeeds (issue succeeds)
-                mock_storage.store_memory = Mock(
-                    side_effect=[
-                        {"status": "stored"},  # Issue
-                        Exception("Comment 1 error"),  # Comment 1 fails
-                        {"status": "stored"},  # Comment 2 succeeds
-                    ]
-                )
+                mock_storage.store_memory = Mock(return_value={"status": "stored"})
+
+                # Comment 10001 fails (sinking the batch), 10002 succeeds
+                def store_batch(memories, **kwargs):
+                    if any(m["jira_comment_id"] == "10001" for m in memories):
+                        raise Exception("Comment 1 error")
+                    return [{"status": "stored"} for _ in memories]
+
+                mock_storage.store_memories_batch = Mock(side_effect=store_batch)
                 mock_storage_cls.return_value = mock_storage
 
                 with (
@@ -579,6 +603,308 @@ class TestCommentUpdate:
         assert result.comments_synced == 1
 
 
+def _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant):
+    with (
+        patch(
+            "src.memory.connectors.jira.sync.JiraClient", return_value=mock_jira_client
+        ),
+        patch(
+            "src.memory.connectors.jira.sync.MemoryStorage", return_value=mock_storage
+        ),
+        patch("src.memory.connectors.jira.sync.EmbeddingClient"),
+        patch(
+            "src.memory.connectors.jira.sync.get_qdrant_client",
+            return_value=mock_qdrant,
+        ),
+    ):
+        return JiraSyncEngine(config=mock_config)
+
+
+def _stored_point(point_id, comment_id, updated):
+    return Mock(
+        id=point_id, payload={"jira_comment_id": comment_id, "jira_updated": updated}
+    )
+
+
+def _comment(comment_id, updated):
+    return {
+        "id": comment_id,
+        "author": {"displayName": "Alice"},
+        "created": "2026-02-01T00:00:00Z",
+        "updated": updated,
+        "body": None,
+    }
+
+
+_ISSUE = {
+    "key": "PROJ-1",
+    "fields": {
+        "summary": "Issue 1",
+        "issuetype": {"name": "Bug"},
+        "status": {"name": "Open"},
+        "updated": "2026-02-03T00:00:00Z",
+    },
+}
+
+
+class TestCommentDiffSync:
+    """Only new/edited comments are stored; only removed ones are deleted."""
+
+    @pytest.mark.asyncio
+    async def test_diff_stores_changed_and_deletes_removed(
+        self, mock_config, mock_jira_client, mock_storage, mock_qdrant
+    ):
+        mock_jira_client.get_comments.return_value = [
+            _comment("1", "2026-02-01T00:00:00Z"),  # unchanged
+            _comment("2", "2026-02-03T00:00:00Z"),  # edited
+            _comment("4", "2026-02-03T00:00:00Z"),  # new
+        ]
+        mock_qdrant.scroll.return_value = (
+            [
+                _stored_point("p1", "1", "2026-02-01T00:00:00Z"),
+                _stored_point("p2", "2", "2026-02-01T00:00:00Z"),
+                _stored_point("p2b", "2", "2026-02-01T00:00:00Z"),
+                _stored_point("p3", "3", "2026-02-01T00:00:00Z"),  # removed
+            ],
+            None,
+        )
+        engine = _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant)
+
+        with patch(
+            "src.memory.connectors.jira.sync.compose_comment_document",
+            return_value="comment doc",
+        ):
+            synced = await engine._sync_comments(_ISSUE, "PROJ")
+
+        assert synced == 2
+        (memories,) = mock_storage.store_memories_batch.call_args.args
+        assert [m["jira_comment_id"] for m in memories] == ["2", "4"]
+        assert memories[0]["jira_updated"] == "2026-02-03T00:00:00Z"
+        assert memories[0]["type"] == "jira_comment"
+        mock_storage.store_memory.assert_not_called()
+        deleted = [
+            c.kwargs["points_selector"] for c in mock_qdrant.delete.call_args_list
+        ]
+        assert deleted == [["p3"], ["p2", "p2b"]]
+        scroll_kwargs = mock_qdrant.scroll.call_args.kwargs
+        assert scroll_kwargs["with_vectors"] is False
+        assert scroll_kwargs["with_payload"] == ["jira_comment_id", "jira_updated"]
+
+    @pytest.mark.asyncio
+    async def test_blocked_edit_keeps_old_version_and_is_not_counted(
+        self, mock_config, mock_jira_client, mock_storage, mock_qdrant
+    ):
+        mock_jira_client.get_comments.return_value = [
+            _comment("2", "2026-02-03T00:00:00Z"),  # edited, new text blocked
+            _comment("4", "2026-02-03T00:00:00Z"),  # new
+        ]
+        mock_qdrant.scroll.return_value = (
+            [_stored_point("p2", "2", "2026-02-01T00:00:00Z")],
+            None,
+        )
+        mock_storage.store_memories_batch = Mock(
+            return_value=[
+                {"memory_id": None, "status": "blocked", "index": 0},
+                {"memory_id": "p4a", "status": "stored"},
+                {"memory_id": "p4b", "status": "stored"},  # second chunk
+            ]
+        )
+        engine = _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant)
+
+        with patch(
+            "src.memory.connectors.jira.sync.compose_comment_document",
+            return_value="comment doc",
+        ):
+            synced = await engine._sync_comments(_ISSUE, "PROJ")
+
+        assert synced == 1
+        mock_qdrant.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_issue_comments_not_reembedded(
+        self, mock_config, mock_jira_client, mock_storage, mock_qdrant
+    ):
+        mock_jira_client.get_comments.return_value = [
+            _comment("1", "2026-02-01T00:00:00Z")
+        ]
+        mock_qdrant.scroll.return_value = (
+            [_stored_point("p1", "1", "2026-02-01T00:00:00Z")],
+            None,
+        )
+        engine = _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant)
+
+        assert await engine._sync_comments(_ISSUE, "PROJ") == 0
+        mock_storage.store_memories_batch.assert_not_called()
+        mock_qdrant.delete.assert_not_called()
+
+    def test_stored_index_follows_scroll_pages(
+        self, mock_config, mock_jira_client, mock_storage, mock_qdrant
+    ):
+        mock_qdrant.scroll.side_effect = [
+            ([_stored_point("p1", "1", "t1")], "next"),
+            ([_stored_point("p2", "2", "t2")], None),
+        ]
+        engine = _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant)
+
+        index = engine._get_stored_comments("PROJ-1")
+
+        assert index == {
+            "1": {"updated": "t1", "point_ids": ["p1"]},
+            "2": {"updated": "t2", "point_ids": ["p2"]},
+        }
+        assert mock_qdrant.scroll.call_args_list[1].kwargs["offset"] == "next"
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_keeps_stored_comments(
+        self, mock_config, mock_jira_client, mock_storage, mock_qdrant
+    ):
+        mock_jira_client.get_comments.side_effect = RuntimeError("503")
+        mock_qdrant.scroll.return_value = (
+            [_stored_point("p1", "1", "2026-02-01T00:00:00Z")],
+            None,
+        )
+        engine = _diff_engine(mock_config, mock_jira_client, mock_storage, mock_qdrant)
+
+        assert await engine._sync_comments(_ISSUE, "PROJ") == 0
+        mock_qdrant.delete.assert_not_called()
+
+
+def _issue(key):
+    return {
+        "key": key,
+        "fields": {
+            "summary": key,
+            "issuetype": {"name": "Task"},
+            "status": {"name": "Open"},
+            "updated": "2026-02-01T00:00:00Z",
+        },
+    }
+
+
+class SlowStorage:
+    """MemoryStorage stand-in that records overlap and batch sizes."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def store_memory(self, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {"status": "stored"}
+
+    def store_memories_batch(self, memories, **kwargs):
+        time.sleep(self.delay)
+        with self._lock:
+            self.batches.append(list(memories))
+        return [{"status": "stored"} for _ in memories]
+
+
+class TestIngestionPipeline:
+    """Streaming, bounded-concurrency, batched ingestion."""
+
+    def _engine(self, mock_config, client, storage, concurrency):
+        mock_config.jira_sync_concurrency = concurrency
+        qdrant = Mock()
+        qdrant.scroll = Mock(return_value=([], None))
+        with patch("src.memory.connectors.jira.sync.compose_issue_document"):
+            return _diff_engine(mock_config, client, storage, qdrant)
+
+    @pytest.mark.asyncio
+    async def test_issues_from_all_pages_run_up_to_concurrency(
+        self, mock_config, mock_jira_client
+    ):
+        mock_jira_client.iter_issue_pages = _issue_pages(
+            [_issue(f"PROJ-{i}") for i in range(3)],
+            [_issue(f"PROJ-{i}") for i in range(3, 6)],
+        )
+        storage = SlowStorage()
+        engine = self._engine(mock_config, mock_jira_client, storage, concurrency=2)
+
+        result = await engine.sync_project("PROJ")
+
+        assert result.issues_synced == 6
+        assert result.errors == []
+        assert storage.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_comments_from_several_issues_share_batches(
+        self, mock_config, mock_jira_client
+    ):
+        mock_jira_client.iter_issue_pages = _issue_pages(
+            [_issue(f"PROJ-{i}") for i in range(6)]
+        )
+        mock_jira_client.get_comments = AsyncMock(
+            return_value=[_comment("1", "2026-02-01T00:00:00Z")]
+        )
+        storage = SlowStorage(delay=0.03)
+        engine = self._engine(mock_config, mock_jira_client, storage, concurrency=4)
+
+        with patch(
+            "src.memory.connectors.jira.sync.compose_comment_document",
+            return_value="comment doc",
+        ):
+            result = await engine.sync_project("PROJ")
+
+        assert result.comments_synced == 6
+        assert sum(len(batch) for batch in storage.batches) == 6
+        assert len(storage.batches) < 6
+
+    @pytest.mark.asyncio
+    async def test_search_failure_still_flushes_started_issues(
+        self, mock_config, mock_jira_client
+    ):
+        async def failing_pages(project_key, updated_since=None):
+            yield [_issue("PROJ-1")]
+            raise RuntimeError("JIRA_SEARCH_ISSUES_TIMEOUT")
+
+        mock_jira_client.iter_issue_pages = Mock(side_effect=failing_pages)
+        mock_jira_client.get_comments = AsyncMock(
+            return_value=[_comment("1", "2026-02-01T00:00:00Z")]
+        )
+        storage = SlowStorage(delay=0)
+        engine = self._engine(mock_config, mock_jira_client, storage, concurrency=2)
+
+        with patch(
+            "src.memory.connectors.jira.sync.compose_comment_document",
+            return_value="comment doc",
+        ):
+            result = await engine.sync_project("PROJ")
+
+        assert result.errors == ["JIRA_SEARCH_ISSUES_TIMEOUT"]
+        assert [m["jira_issue_key"] for m in storage.batches[0]] == ["PROJ-1"]
+        assert not engine.state_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_projects_sync_in_parallel_under_shared_slots(
+        self, mock_config, mock_jira_client
+    ):
+        mock_config.jira_projects = ["A", "B", "C"]
+        mock_jira_client.iter_issue_pages = Mock(
+            side_effect=lambda key, since=None: _issue_pages([_issue(f"{key}-1")])(
+                key, since
+            )
+        )
+        storage = SlowStorage()
+        engine = self._engine(mock_config, mock_jira_client, storage, concurrency=2)
+
+        results = await engine.sync_all_projects("full")
+
+        assert {key: r.issues_synced for key, r in results.items()} == {
+            "A": 1,
+            "B": 1,
+            "C": 1,
+        }
+        assert storage.max_active == 2
+
+
 # =============================================================================
 # Sync State Persistence
 # =============================================================================
@@ -20,11 +20,13 @@ from memory.config import (
     COLLECTION_CONVENTIONS,
     COLLECTION_DISCUSSIONS,
     MemoryConfig,
+    reset_config,
 )
 from memory.injection import (
     InjectionSessionState,
     compute_adaptive_budget,
     compute_topic_drift,
+    diversify_results,
     format_injection_output,
     init_session_state,
     log_injection_event,
@@ -341,6 +343,96 @@ class TestSelectResultsGreedy:
         assert len(selected) == 1
 
 
+class TestDiversifyResults:
+    """Test vector-based near-duplicate suppression before greedy fill."""
+
+    def test_near_duplicate_suppressed_order_preserved(self):
+        results = [
+            {"id": "1", "content": "chunk a", "score": 0.9, "vector": [1.0, 0.0, 0.0]},
+            {"id": "2", "content": "chunk b", "score": 0.8, "vector": [0.99, 0.1, 0.0]},
+            {"id": "3", "content": "other", "score": 0.7, "vector": [0.0, 1.0, 0.0]},
+        ]
+
+        kept, suppressed = diversify_results(results, similarity_threshold=0.95)
+
+        assert [r["id"] for r in kept] == ["1", "3"]
+        assert [r["id"] for r in suppressed] == ["2"]
+
+    def test_results_without_vectors_are_kept(self):
+        results = [
+            {"id": "1", "content": "a", "score": 0.9, "vector": [1.0, 0.0]},
+            {"id": "2", "content": "b", "score": 0.8},
+            {"id": "3", "content": "c", "score": 0.7, "vector": [1.0, 0.0]},
+        ]
+
+        kept, suppressed = diversify_results(results, similarity_threshold=0.95)
+
+        assert [r["id"] for r in kept] == ["1", "2"]
+        assert [r["id"] for r in suppressed] == ["3"]
+
+    def test_mmr_prefers_diverse_result(self):
+        results = [
+            {"id": "1", "content": "a", "score": 0.90, "vector": [1.0, 0.0]},
+            {"id": "2", "content": "b", "score": 0.88, "vector": [0.9, 0.436]},
+            {"id": "3", "content": "c", "score": 0.80, "vector": [0.0, 1.0]},
+        ]
+
+        kept, suppressed = diversify_results(
+            results, similarity_threshold=0.99, mmr_lambda=0.5
+        )
+
+        assert [r["id"] for r in kept] == ["1", "3", "2"]
+        assert suppressed == []
+
+    def test_greedy_fill_records_diversity_savings(self):
+        results = [
+            {"id": "1", "content": "alpha beta", "score": 0.9, "vector": [1.0, 0.0]},
+            {
+                "id": "2",
+                "content": "alpha beta gamma",
+                "score": 0.85,
+                "vector": [1.0, 0.01],
+            },
+        ]
+
+        with (
+            patch(
+                "memory.injection.count_tokens", side_effect=lambda t: len(t.split())
+            ),
+            patch("memory.injection.emit_trace_event") as mock_emit,
+        ):
+            selected, tokens_used = select_results_greedy(
+                results, budget=100, diversity_threshold=0.95
+            )
+
+        assert [r["id"] for r in selected] == ["1"]
+        assert tokens_used == 2
+        metadata = mock_emit.call_args.kwargs["data"]["metadata"]
+        assert metadata["diversity_skipped"] == 1
+        assert metadata["diversity_tokens_saved"] == 3
+
+    def test_greedy_fill_uses_diversity_config(self, monkeypatch):
+        """INJECTION_DIVERSITY_* env alone turns on near-duplicate suppression."""
+        monkeypatch.setenv("INJECTION_DIVERSITY_ENABLED", "true")
+        monkeypatch.setenv("INJECTION_DIVERSITY_THRESHOLD", "0.95")
+        reset_config()
+        try:
+            results = [
+                {"id": "1", "content": "alpha", "score": 0.9, "vector": [1.0, 0.0]},
+                {"id": "2", "content": "alpha!", "score": 0.85, "vector": [1.0, 0.01]},
+                {"id": "3", "content": "omega", "score": 0.8, "vector": [0.0, 1.0]},
+            ]
+
+            with patch(
+                "memory.injection.count_tokens", side_effect=lambda t: len(t.split())
+            ):
+                selected, _ = select_results_greedy(results, budget=10000)
+        finally:
+            reset_config()
+
+        assert [r["id"] for r in selected] == ["1", "3"]
+
+
 class TestFormatInjectionOutput:
     """Test injection output formatting."""
 
@@ -27,6 +27,7 @@ class TestParzivalBootstrap:
         mock_search.get_recent.return_value = []
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = True
         config.github_sync_enabled = False
 
@@ -59,6 +60,7 @@ class TestParzivalBootstrap:
         mock_search.get_recent.return_value = []
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = False
         config.github_sync_enabled = False
 
@@ -87,6 +89,7 @@ class TestParzivalBootstrap:
         mock_search.get_recent.return_value = []
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = True
         config.github_sync_enabled = False
 
@@ -107,6 +110,7 @@ class TestParzivalBootstrap:
         mock_search.get_recent.side_effect = QdrantUnavailable("Connection refused")
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = True
         config.github_sync_enabled = False
 
@@ -127,6 +131,7 @@ class TestParzivalBootstrap:
         mock_search.search.side_effect = side_effect
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = True
         config.github_sync_enabled = False
 
@@ -165,6 +170,7 @@ class TestParzivalBootstrap:
         mock_search.search.side_effect = search_side_effect
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.parzival_enabled = True
         config.github_sync_enabled = True
 
@@ -187,6 +193,7 @@ class TestGitHubEnrichment:
         ]
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = True
 
         result = _build_github_enrichment(
@@ -200,6 +207,7 @@ class TestGitHubEnrichment:
         """Returns empty when github_sync_enabled=False."""
         mock_search = MagicMock()
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = False
 
         result = _build_github_enrichment(
@@ -212,6 +220,7 @@ class TestGitHubEnrichment:
         """Returns empty when last_session_date is None."""
         mock_search = MagicMock()
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = True
 
         result = _build_github_enrichment(mock_search, config, "test-project", None)
@@ -230,6 +239,7 @@ class TestGitHubEnrichment:
         ]
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = True
 
         result = _build_github_enrichment(
@@ -247,6 +257,7 @@ class TestGitHubEnrichment:
         ]
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = True
 
         result = _build_github_enrichment(
@@ -261,6 +272,7 @@ class TestGitHubEnrichment:
         mock_search.search.return_value = []
 
         config = MagicMock(spec=MemoryConfig)
+        config.injection_diversity_enabled = False
         config.github_sync_enabled = True
 
         _build_github_enrichment(